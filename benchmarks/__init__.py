@@ -0,0 +1,7 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks package
+
+Performance benchmarks for SignifyPy client hot paths
+"""
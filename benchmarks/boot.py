@@ -0,0 +1,93 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks.boot module
+
+Measures cold connect latency of SignifyClient, construction plus connect, against canned agent state.  The
+legacy client reproduces the second Controller derivation connect performed before the controller signers
+were reused.
+
+    $ python -m benchmarks.boot --count 10
+"""
+import argparse
+import time
+
+from keri.core import coring, eventing, signing
+from keri.core.coring import Tiers
+
+from signify.app.clienting import SignifyClient
+from signify.core import authing
+from signify.signifying import SignifyState
+
+BRAN = "0123456789abcdefghijk"
+URL = "http://127.0.0.1:3901"
+
+
+def makeState(bran=BRAN, tier=Tiers.low):
+    """ Create agent and controller state as returned by the agent once delegation is approved """
+    ctrl = authing.Controller(bran=bran, tier=tier)
+
+    signer = signing.Signer(transferable=True)
+    nsigner = signing.Signer(transferable=True)
+    dip = eventing.delcept(keys=[signer.verfer.qb64], delpre=ctrl.pre,
+                           ndigs=[coring.Diger(ser=nsigner.verfer.qb64b).qb64])
+    agent = authing.Agent(state=dip.ked)
+    ixn, _ = ctrl.approveDelegation(agent)
+
+    state = SignifyState()
+    state.agent = dip.ked
+    state.controller = dict(state=dict(i=ctrl.pre, s="1"), ee=ixn.ked)
+    state.pidx = 0
+    return state
+
+
+class Client(SignifyClient):
+    """ SignifyClient answering the agent state request from canned state """
+
+    State = None
+
+    def states(self):
+        return self.State
+
+
+class LegacyClient(Client):
+    """ Client repeating the full Controller derivation in connect """
+
+    def connect(self, url):
+        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier)
+        super(LegacyClient, self).connect(url)
+
+
+def measure(klas, count, tier):
+    start = time.perf_counter()
+    for _ in range(count):
+        klas(passcode=BRAN, url=URL, tier=tier)
+    return (time.perf_counter() - start) / count
+
+
+def run(count=10, tier=Tiers.low):
+    """ Measure cold connect latency with and without controller signer reuse
+
+    Parameters:
+        count (int): number of clients to boot per measurement
+        tier (Tiers): passcode stretching security tier
+
+    Returns:
+        dict: per connect seconds for 'legacy' and 'fast'
+
+    """
+    Client.State = makeState(tier=tier)
+    return dict(legacy=measure(LegacyClient, count, tier), fast=measure(Client, count, tier))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure SignifyClient cold connect latency")
+    parser.add_argument("--count", "-c", type=int, default=10, help="number of clients to boot per measurement")
+    args = parser.parse_args()
+
+    result = run(count=args.count)
+    print(f"cold connect   legacy {result['legacy'] * 1e3:9.2f} ms   fast {result['fast'] * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks.issuing module
+
+Measures Credentials.create_many throughput against an in process agency whose responses are delayed by a round
+trip latency, and how much of the wall time is spent building ACDCs and TEL events under the GIL.  The build share
+bounds what moving the build step out of the worker threads, for example to a process pool, could save.
+
+    $ python -m benchmarks.issuing --count 256 --latency 0.02
+"""
+import argparse
+import functools
+import threading
+import time
+
+from signify.app.agenting import Agency, AgencyAdapter
+from signify.app.clienting import SignifyClient
+from signify.app.credentialing import Credentials
+
+BRAN = "0123456789abcdefghijk"
+SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+
+class LatentAdapter(AgencyAdapter):
+    """ AgencyAdapter waiting out latency seconds per request, releasing the GIL as a socket read does """
+
+    def __init__(self, agency, latency):
+        super(LatentAdapter, self).__init__(agency)
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        time.sleep(self.latency)
+        return super(LatentAdapter, self).send(request, **kwargs)
+
+
+def run(count=256, latency=0.02, workers=(1, 8, 64)):
+    """ Issue count credentials with create_many for each of workers
+
+    Parameters:
+        count (int): number of credentials issued per measurement
+        latency (float): seconds added to every agent round trip
+        workers (tuple): create_many worker counts to measure
+
+    Returns:
+        dict: workers to (seconds, build seconds) of issuing count credentials
+
+    """
+    agency = Agency(verify=False)
+    client = SignifyClient(passcode=BRAN, adapter=LatentAdapter(agency, latency))
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    client.identifiers().create("issuer")
+    hab = client.identifiers().get("issuer")
+    client.registries().create(hab, "reg")
+
+    build = [0.0]
+    lock = threading.Lock()
+    make = Credentials.makeIssuance
+
+    @functools.wraps(make)
+    def timed(*args, **kwargs):
+        start = time.thread_time()
+        try:
+            return make(*args, **kwargs)
+        finally:
+            with lock:
+                build[0] += time.thread_time() - start
+
+    results = dict()
+    Credentials.makeIssuance = staticmethod(timed)
+    try:
+        for n in workers:
+            registry = client.registries().get("issuer", "reg")
+            items = (dict(data=dict(LEI=f"{n}-{i}"), recipient=hab["prefix"]) for i in range(count))
+            build[0] = 0.0
+            start = time.perf_counter()
+            for issuage in client.credentials().create_many(hab, registry, items, schema=SCHEMA, workers=n):
+                if issuage.error is not None:
+                    raise issuage.error
+            results[n] = (time.perf_counter() - start, build[0])
+    finally:
+        Credentials.makeIssuance = staticmethod(make)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Credentials.create_many throughput and build share")
+    parser.add_argument("--count", "-c", type=int, default=256, help="number of credentials issued per measurement")
+    parser.add_argument("--latency", "-l", type=float, default=0.02, help="seconds added to every agent round trip")
+    args = parser.parse_args()
+
+    for n, (seconds, build) in run(count=args.count, latency=args.latency).items():
+        print(f"workers {n:3d}   {args.count / seconds:9.1f} credentials/s   build {build / seconds:6.1%} of wall time")
+
+
+if __name__ == "__main__":
+    main()
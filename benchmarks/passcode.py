@@ -0,0 +1,127 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks.passcode module
+
+Compares the per call cost of keeper backed domain calls when every keeper stretches the passcode against a
+client wide Manager that derives the passcode encryption material once and shares it with all keepers.
+
+    $ python -m benchmarks.passcode --count 20
+"""
+import argparse
+import time
+
+from keri.app.keeping import Algos
+from keri.core import coring, eventing, signing
+from keri.core.coring import Tiers
+
+from signify.app.aiding import Identifiers
+from signify.app.credentialing import Registries
+from signify.core import keeping
+from signify.peer.exchanging import Exchanges
+
+BRAN = "0123456789abcdefghijk"
+
+
+class PerKeeperManager(keeping.Manager):
+    """ Manager reproducing the previous behaviour where every keeper stretched the passcode itself """
+
+    def get(self, aid, **kwargs):
+        return keeping.SaltyKeeper(salter=self.salter, **aid[Algos.salty])
+
+
+class Response:
+    """ Minimal stand-in for requests.Response returning canned JSON """
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class Client:
+    """ Minimal stand-in for SignifyClient serving one identifier without network I/O """
+
+    def __init__(self, manager, hab):
+        self.manager = manager
+        self.hab = hab
+
+    def get(self, path, **_):
+        return Response(self.hab)
+
+    def post(self, path, json, **_):
+        return Response(dict(name=f"op.{path}", done=True, response=json))
+
+
+def makeHab(salter, name="aid1"):
+    """ Incept a salty AID and return the identifier dict as the agent would store it """
+    manager = keeping.Manager(salter=salter)
+    keeper = manager.new(Algos.salty, 0)
+    keys, ndigs = keeper.incept(transferable=True)
+
+    serder = eventing.incept(keys=keys, isith="1", nsith="1", ndigs=ndigs, code=coring.MtrDex.Blake3_256)
+
+    params = keeper.params()
+    params["sxlt"] = manager.encrypter.encrypt(prim=coring.Matter(qb64=keeper.creator.salt)).qb64
+    return dict(name=name, prefix=serder.pre, salty=params,
+                state=dict(s="0", d=serder.said, k=keys, n=ndigs))
+
+
+def operations(client):
+    """ Return the keeper backed domain calls to measure, keyed by name """
+    ids = Identifiers(client=client)
+    registries = Registries(client=client)
+    exchanges = Exchanges(client=client)
+
+    return {
+        "Identifiers.interact": lambda: ids.interact(client.hab["name"], data=[]),
+        "Registries.create": lambda: registries.create(client.hab, "reg", nonce=coring.randomNonce()),
+        "Exchanges.createExchangeMessage": lambda: exchanges.createExchangeMessage(
+            sender=client.hab, route="/bench", payload=dict(a=1), embeds=None),
+    }
+
+
+def measure(fn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count
+
+
+def run(count=10, tier=Tiers.low):
+    """ Run each operation with keepers that stretch the passcode and with keepers sharing the Manager's material
+
+    Parameters:
+        count (int): number of calls per measurement
+        tier (Tiers): passcode stretching security tier
+
+    Returns:
+        dict: operation name to dict of per call seconds for 'perkeeper' and 'shared'
+
+    """
+    salter = signing.Salter(qb64=coring.MtrDex.Salt_128 + 'A' + BRAN, tier=tier)
+    hab = makeHab(salter)
+
+    perkeeper = operations(Client(PerKeeperManager(salter=salter), hab))
+    shared = operations(Client(keeping.Manager(salter=salter), hab))
+
+    results = dict()
+    for name in shared:
+        results[name] = dict(perkeeper=measure(perkeeper[name], count), shared=measure(shared[name], count))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure passcode stretching cost of keeper backed calls")
+    parser.add_argument("--count", "-c", type=int, default=10, help="number of calls per measurement")
+    args = parser.parse_args()
+
+    for name, result in run(count=args.count).items():
+        print(f"{name:36} per keeper {result['perkeeper'] * 1e3:9.2f} ms/call   "
+              f"shared {result['shared'] * 1e3:9.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks.signing module
+
+Compares per request cost of signing request headers over Authenticater.DefaultFields through the structured
+field path of keri.end.ending against the precomputed signature base fast path of Authenticater.signDefault, and
+per response cost of verifying agent signatures with repeated structured field parsing against the single parse
+path of Authenticater.verifysig.
+
+    $ python -m benchmarks.signing --count 5000
+"""
+import argparse
+import time
+
+from keri import kering
+from keri.core.coring import Tiers
+from keri.end import ending
+from requests.structures import CaseInsensitiveDict
+
+from signify.core import authing
+
+BRAN = "0123456789abcdefghijk"
+
+
+class StructuredAuthenticater(authing.Authenticater):
+    """ Authenticater signing every request through ending.siginput and ending.signature """
+
+    def sign(self, headers, method, path, fields=None):
+        fields = fields if fields is not None else self.DefaultFields
+        header, qsig = ending.siginput("signify", method, path, headers, fields=fields, signers=[self.ctrl.signer],
+                                       alg="ed25519", keyid=self.ctrl.pre)
+        for key, val in header.items():
+            headers[key] = val
+
+        signage = ending.Signage(markers=dict(signify=qsig), indexed=False, signer=None, ordinal=None, digest=None,
+                                 kind=None)
+        for key, val in ending.signature([signage]).items():
+            headers[key] = val
+
+        return headers
+
+    def verifysig(self, headers, method, path):
+        inputs = ending.desiginput(headers["SIGNATURE-INPUT"].encode("utf-8"))
+        inputs = [i for i in inputs if i.name == "signify"]
+
+        for inputage in inputs:
+            items = []
+            for field in inputage.fields:
+                if field.startswith("@"):
+                    if field == "@method":
+                        items.append(f'"{field}": {method}')
+                    elif field == "@path":
+                        items.append(f'"{field}": {path}')
+
+                else:
+                    key = field.upper()
+                    field = field.lower()
+                    if key not in headers:
+                        continue
+
+                    value = ending.normalize(headers[key])
+                    items.append(f'"{field}": {value}')
+
+            values = [f"({' '.join(inputage.fields)})", f"created={inputage.created}"]
+            if inputage.keyid is not None:
+                values.append(f"keyid={inputage.keyid}")
+            if inputage.alg is not None:
+                values.append(f"alg={inputage.alg}")
+
+            params = ';'.join(values)
+
+            items.append(f'"@signature-params: {params}"')
+            ser = "\n".join(items).encode("utf-8")
+
+            signages = ending.designature(headers["SIGNATURE"])
+            cig = signages[0].markers[inputage.name]
+            if not self.agent.verfer.verify(sig=cig.raw, ser=ser):
+                raise kering.AuthNError(f"Signature for {inputage} invalid")
+
+        return True
+
+
+class Agent:
+    """ Agent stand-in verifying with the controller key so signed requests can be verified as responses """
+
+    def __init__(self, ctrl):
+        self.verfer = ctrl.signer.verfer
+
+
+def request(pre):
+    return CaseInsensitiveDict({
+        "Content-Length": "512",
+        "Signify-Resource": pre,
+        "Signify-Timestamp": "2024-01-01T00:00:00.000000+00:00",
+    })
+
+
+def measure(authn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        authn.sign(request(authn.ctrl.pre), "POST", "/identifiers/aid1/events")
+    return (time.perf_counter() - start) / count
+
+
+def measureVerify(authn, count):
+    headers = authn.sign(request(authn.ctrl.pre), "POST", "/identifiers/aid1/events")
+    start = time.perf_counter()
+    for _ in range(count):
+        authn.verifysig(headers, "POST", "/identifiers/aid1/events")
+    return (time.perf_counter() - start) / count
+
+
+def run(count=1000):
+    """ Measure request signing and response verification with the structured field path and the fast path
+
+    Parameters:
+        count (int): number of requests signed or verified per measurement
+
+    Returns:
+        dict: 'sign' and 'verify' dicts of per request seconds for 'structured' and 'fast'
+
+    """
+    ctrl = authing.Controller(bran=BRAN, tier=Tiers.low)
+    structured = StructuredAuthenticater(agent=Agent(ctrl), ctrl=ctrl)
+    fast = authing.Authenticater(agent=Agent(ctrl), ctrl=ctrl)
+
+    return dict(sign=dict(structured=measure(structured, count), fast=measure(fast, count)),
+                verify=dict(structured=measureVerify(structured, count), fast=measureVerify(fast, count)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure request header signing cost")
+    parser.add_argument("--count", "-c", type=int, default=1000,
+                        help="number of requests signed or verified per measurement")
+    args = parser.parse_args()
+
+    for name, result in run(count=args.count).items():
+        print(f"{name:8} structured {result['structured'] * 1e6:9.2f} us   fast {result['fast'] * 1e6:9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
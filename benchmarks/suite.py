@@ -0,0 +1,258 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+benchmarks.suite module
+
+Benchmark suite for the client hot paths.  Every case runs in process against canned agent state so results
+measure client side CPU cost only.  Results are written as JSON and may be compared against a stored baseline,
+exiting non zero when any case regresses by more than the threshold.
+
+    $ python -m benchmarks.suite --output bench.json
+    $ python -m benchmarks.suite --output new.json --baseline bench.json --threshold 0.1
+    $ python -m benchmarks.suite --select Keeper --count 50
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import keri
+from keri.app.keeping import Algos
+from keri.core import coring, signing
+from keri.core.coring import Tiers
+from keri.vdr import eventing
+from requests.structures import CaseInsensitiveDict
+
+import signify
+from signify.app.aiding import Identifiers
+from signify.app.credentialing import Credentials
+from signify.core import authing, keeping
+from signify.peer.exchanging import Exchanges
+
+from benchmarks.passcode import Client, makeHab
+
+BRAN = "0123456789abcdefghijk"
+SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+
+class Case:
+    """ Named benchmark case whose setup returns the zero argument callable to time """
+
+    def __init__(self, name, setup, warmup=True):
+        """
+
+        Parameters:
+            name (str): unique name of the case in results
+            setup (Callable): called once before timing, returns the callable to time
+            warmup (bool): False means skip the untimed warm up call, for cases that take seconds per call
+        """
+        self.name = name
+        self.setup = setup
+        self.warmup = warmup
+
+
+def controllerCase(tier):
+    return Case(f"Controller[{tier}]", lambda: lambda: authing.Controller(bran=BRAN, tier=tier), warmup=False)
+
+
+def keeperCases(salter):
+    manager = keeping.Manager(salter=salter)
+    cases = []
+    for algo in (Algos.salty, Algos.randy):
+        label = f"{algo.capitalize()}Keeper"
+
+        def incept(algo=algo):
+            pidx = iter(range(1_000_000))
+            return lambda: manager.new(algo, next(pidx)).incept(transferable=True)
+
+        def existing(algo=algo):
+            keeper = manager.new(algo, 0)
+            keys, ndigs = keeper.incept(transferable=True)
+            params = keeper.params()
+            if algo == Algos.salty:
+                params["sxlt"] = manager.encrypter.encrypt(prim=coring.Matter(qb64=keeper.creator.salt)).qb64
+            else:  # agents store only the encrypted keys, transferability comes from the prefix
+                params.pop("transferable")
+            return manager.get(dict(prefix="E" + "A" * 43, state=dict(k=keys), **{algo: params}))
+
+        def rotate(existing=existing):
+            keeper = existing()
+            return lambda: keeper.rotate(ncodes=[coring.MtrDex.Ed25519_Seed], transferable=True)
+
+        def sign(existing=existing):
+            keeper = existing()
+            ser = b"x" * 512
+            return lambda: keeper.sign(ser=ser)
+
+        cases.extend([Case(f"{label}.incept", incept), Case(f"{label}.rotate", rotate),
+                      Case(f"{label}.sign", sign)])
+
+    return cases
+
+
+def authenticaterCases():
+    ctrl = authing.Controller(bran=BRAN, tier=Tiers.low)
+
+    class Agent:
+        verfer = ctrl.signer.verfer
+
+    authn = authing.Authenticater(agent=Agent, ctrl=ctrl)
+    path = "/identifiers/aid1/events"
+
+    def request():
+        return CaseInsensitiveDict({"Content-Length": "512", "Signify-Resource": ctrl.pre,
+                                    "Signify-Timestamp": "2024-01-01T00:00:00.000000+00:00"})
+
+    def verifysig():
+        headers = authn.sign(request(), "POST", path)
+        return lambda: authn.verifysig(headers, "POST", path)
+
+    return [Case("Authenticater.sign", lambda: lambda: authn.sign(request(), "POST", path)),
+            Case("Authenticater.verifysig", verifysig)]
+
+
+def clientCases(salter):
+    hab = makeHab(salter)
+    client = Client(keeping.Manager(salter=salter), hab)
+    ids = Identifiers(client=client)
+    credentials = Credentials(client=client)
+    exchanges = Exchanges(client=client)
+
+    client.pidx = 1
+    regser = eventing.incept(hab["prefix"], baks=[], toad=0, nonce="", cnfg=["NB"], code=coring.MtrDex.Blake3_256)
+    registry = dict(regk=regser.pre, pre=hab["prefix"], state=dict(c=["NB"], s="0", d=regser.said))
+
+    hab["state"].update(b=[], kt="1")
+
+    return [
+        Case("Identifiers.create", lambda: lambda: ids.create("bench", transferable=True)),
+        Case("Identifiers.interact", lambda: lambda: ids.interact(hab["name"], data=[dict(a=1)])),
+        Case("Identifiers.rotate", lambda: lambda: ids.rotate(hab["name"])),
+        Case("Credentials.create", lambda: lambda: credentials.create(
+            hab, registry, data=dict(LEI="5493001KJTIIGC8Y1R17"), schema=SCHEMA, recipient=hab["prefix"])),
+        Case("Exchanges.createExchangeMessage", lambda: lambda: exchanges.createExchangeMessage(
+            sender=hab, route="/bench", payload=dict(a=1), embeds=None)),
+    ]
+
+
+def cases(tiers=(Tiers.low, Tiers.med)):
+    """ Returns list of all benchmark Cases, Controller construction is measured for each of tiers """
+    salter = signing.Salter(qb64=coring.MtrDex.Salt_128 + 'A' + BRAN, tier=Tiers.low)
+    return ([controllerCase(tier) for tier in tiers] + keeperCases(salter) + authenticaterCases() +
+            clientCases(salter))
+
+
+def measure(case, count=20, budget=2.0):
+    """ Time case up to count calls, stopping early once budget seconds have been spent after the first call
+
+    Returns:
+        dict: per call seconds statistics, mean, median, min, max, stdev and runs
+
+    """
+    fn = case.setup()
+    if case.warmup:
+        fn()
+
+    times = []
+    spent = 0.0
+    while len(times) < count and (not times or spent < budget):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        spent += times[-1]
+
+    return dict(mean=statistics.fmean(times), median=statistics.median(times), min=min(times), max=max(times),
+                stdev=statistics.stdev(times) if len(times) > 1 else 0.0, runs=len(times))
+
+
+def run(select=None, count=20, budget=2.0, tiers=(Tiers.low, Tiers.med)):
+    """ Run all benchmark cases whose name contains select
+
+    Parameters:
+        select (str): optional substring of case names to run
+        count (int): maximum calls timed per case
+        budget (float): seconds after which a case stops being timed
+        tiers (tuple): passcode stretching tiers to measure Controller construction for
+
+    Returns:
+        dict: meta describing the environment and results mapping case name to statistics
+
+    """
+    results = dict()
+    for case in cases(tiers=tiers):
+        if select is not None and select not in case.name:
+            continue
+        results[case.name] = measure(case, count=count, budget=budget)
+
+    meta = dict(signify=signify.__version__, keri=keri.__version__, python=platform.python_version(),
+                platform=platform.platform(), created=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()))
+    return dict(meta=meta, results=results)
+
+
+def compare(baseline, current, threshold=0.1):
+    """ Compare median per call time of every case present in both baseline and current
+
+    Parameters:
+        baseline (dict): results of a previous run
+        current (dict): results of this run
+        threshold (float): allowed relative slow down before a case counts as regressed
+
+    Returns:
+        list: (name, baseline median, current median, ratio, regressed) for each common case
+
+    """
+    rows = []
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        base = baseline["results"][name]["median"]
+        ratio = result["median"] / base if base else float("inf")
+        rows.append((name, base, result["median"], ratio, ratio > 1.0 + threshold))
+
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the client hot path benchmark suite")
+    parser.add_argument("--output", "-o", help="file to write JSON results to")
+    parser.add_argument("--baseline", "-b", help="JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", "-t", type=float, default=0.1,
+                        help="relative slow down of the median that counts as a regression")
+    parser.add_argument("--select", "-s", help="only run cases whose name contains this string")
+    parser.add_argument("--count", "-c", type=int, default=20, help="maximum calls timed per case")
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds after which a case stops being timed")
+    parser.add_argument("--tier", action="append", choices=[Tiers.low, Tiers.med, Tiers.high],
+                        help="passcode tiers to measure Controller construction for, defaults to low and med")
+    args = parser.parse_args(argv)
+
+    tiers = tuple(args.tier) if args.tier else (Tiers.low, Tiers.med)
+    current = run(select=args.select, count=args.count, budget=args.budget, tiers=tiers)
+
+    for name, result in current["results"].items():
+        print(f"{name:36} median {result['median'] * 1e3:10.3f} ms   min {result['min'] * 1e3:10.3f} ms   "
+              f"runs {result['runs']:4}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressed = False
+        print()
+        for name, base, median, ratio, slower in compare(baseline, current, threshold=args.threshold):
+            regressed = regressed or slower
+            print(f"{name:36} {base * 1e3:10.3f} ms -> {median * 1e3:10.3f} ms   x{ratio:5.2f}"
+                  f"{'   REGRESSED' if slower else ''}")
+
+        return 1 if regressed else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,6 @@ signify.app.clienting module
 
 Testing clienting with integration tests that require a running KERIA Cloud Agent
 """
-from time import sleep
 
 import requests
 from keri import kering
@@ -127,9 +126,7 @@ def create_aid(client, name, bran, pre):
     op = identifiers.create(name, bran=bran, wits=wits, toad="2")
     op = op[2]
 
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     icp = serdering.SerderKERI(sad=op["response"])
     print(icp.pre)
@@ -148,9 +145,7 @@ def oobi(client, alias, url):
     op = oobis.resolve(
         oobi=url,
         alias=alias)
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
 
@@ -5,7 +5,6 @@ signify.app.clienting module
 
 Testing clienting with integration tests that require a running KERIA Cloud Agent
 """
-from time import sleep
 
 from keri.core import serdering
 from keri.core.coring import Tiers
@@ -36,9 +35,7 @@ def create_aid():
     op = identifiers.create("BankUser", bran="0123456789abcdefghijk", wits=wits, toad="2")
     op = op[2]
 
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     icp = serdering.SerderKERI(sad=op["response"])
     assert icp.pre == "EBcIURLpxmVwahksgrsGW6_dUw0zBhyEHYFk17eWrZfk"
@@ -51,9 +48,7 @@ def create_aid():
         oobi="http://127.0.0.1:5642/oobi/EHOuGiHMxJShXHgSb6k_9pqxmRb8H-LT0R2hQouHp8pW/witness/BBilc4"
              "-L3tFUnfM_wJr4S4OJanAv_VmF_dJNN6vkf2Ha",
         alias="external")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("person resolving qvi...")
@@ -61,9 +56,7 @@ def create_aid():
         oobi="http://127.0.0.1:5642/oobi/EHMnCf8_nIemuPx-cUHaDQq8zSnQIFAurdEpwHpNbnvX/witness/BBilc4"
              "-L3tFUnfM_wJr4S4OJanAv_VmF_dJNN6vkf2Ha",
         alias="qvi")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("person resolving legal-entity...")
@@ -71,41 +64,31 @@ def create_aid():
         oobi="http://127.0.0.1:5642/oobi/EIitNxxiNFXC1HDcPygyfyv3KUlBfS_Zf-ZYOvwjpTuz/witness/BBilc4"
              "-L3tFUnfM_wJr4S4OJanAv_VmF_dJNN6vkf2Ha",
         alias="legal-entity")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("resolving schema EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao")
     op = oobis.resolve(
         oobi="http://127.0.0.1:7723/oobi/EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("resolving schema ENPXp1vQzRF6JwIuS-mp2U8Uf1MoADoP_GqQ62VsDZWY")
     op = oobis.resolve(
         oobi="http://127.0.0.1:7723/oobi/ENPXp1vQzRF6JwIuS-mp2U8Uf1MoADoP_GqQ62VsDZWY")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("resolving schema EH6ekLjSr8V32WyFbGe1zXjTzFs9PkTYmupJ9H65O14g")
     op = oobis.resolve(
         oobi="http://127.0.0.1:7723/oobi/EH6ekLjSr8V32WyFbGe1zXjTzFs9PkTYmupJ9H65O14g")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     print("resolving schema EEy9PkikFcANV1l7EHukCeXqrzT1hNZjGlUk7wuMO5jw")
     op = oobis.resolve(
         oobi="http://127.0.0.1:7723/oobi/EEy9PkikFcANV1l7EHukCeXqrzT1hNZjGlUk7wuMO5jw")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
 
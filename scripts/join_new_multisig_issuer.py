@@ -5,7 +5,6 @@ join new quadlet script
 
 """
 
-from time import sleep
 
 from keri.core import eventing, serdering, signing
 from keri.core.coring import Tiers
@@ -27,13 +26,9 @@ def join_new_quadlet():
     if not op1:
         raise ValueError("No op created for multisig1")
 
-    while not op2['done']:
-        sleep(1)
-        op2 = client2.operations().get(op2['name'])
+    op2 = client2.operations().wait(op2)
 
-    while not op1['done']:
-        sleep(1)
-        op1 = client1.operations().get(op1['name'])
+    op1 = client1.operations().wait(op1)
 
 
 def get_client(bran):
@@ -103,9 +98,7 @@ def resolve_oobi(client, alias, url):
                        alias=alias)
 
     print(f"resolving oobi for {alias}")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     print("... done")
     return op["response"]
@@ -5,7 +5,6 @@ join new quadlet script
 
 """
 
-from time import sleep
 
 from keri.core import eventing, coring, serdering, signing
 from keri.core.coring import Tiers
@@ -24,13 +23,9 @@ def join_new_quadlet():
     if not op1:
         raise ValueError("No op created for multisig1")
 
-    while not op2['done']:
-        sleep(1)
-        op2 = client2.operations().get(op2['name'])
+    op2 = client2.operations().wait(op2)
 
-    while not op1['done']:
-        sleep(1)
-        op1 = client1.operations().get(op1['name'])
+    op1 = client1.operations().wait(op1)
 
 
 def get_client(bran):
@@ -8,7 +8,7 @@ Testing clienting with integration tests that require a running KERIA Cloud Agen
 import json
 
 from keri.core.coring import Tiers
-from signify.app.clienting import SignifyClient
+from signify.app import daemoning
 
 
 def list_contacts():
@@ -16,7 +16,7 @@ def list_contacts():
     bran = b'0123456789abcdefghsaw'
     tier = Tiers.low
 
-    client = SignifyClient(passcode=bran, tier=tier, url=url)
+    client = daemoning.connect(url=url, passcode=bran, tier=tier)
     contacts = client.contacts()
 
     cons = contacts.list()
@@ -7,7 +7,7 @@ Testing clienting with integration tests that require a running KERIA Cloud Agen
 """
 from keri.core.coring import Tiers
 
-from signify.app.clienting import SignifyClient
+from signify.app import daemoning
 
 
 def list_ipex():
@@ -15,7 +15,7 @@ def list_ipex():
     bran = b'0123456789abcdefghijk'
     tier = Tiers.low
 
-    client = SignifyClient(passcode=bran, tier=tier, url=url)
+    client = daemoning.connect(url=url, passcode=bran, tier=tier)
     notificatons = client.notifications()
 
     notes = notificatons.list()
@@ -8,7 +8,7 @@ Testing clienting with integration tests that require a running KERIA Cloud Agen
 from keri.core import serdering
 from keri.core.coring import Tiers
 
-from signify.app.clienting import SignifyClient
+from signify.app import daemoning
 
 
 def list_credentials():
@@ -18,7 +18,7 @@ def list_credentials():
     bran = b'Pwt6yLXRSs7IjZ23tRHIV'
     tier = Tiers.low
 
-    client = SignifyClient(passcode=bran, tier=tier, url=url)
+    client = daemoning.connect(url=url, passcode=bran, tier=tier)
 
     identifiers = client.identifiers()
     res = identifiers.list()
@@ -5,7 +5,6 @@ signify.app.clienting module
 
 Testing clienting with integration tests that require a running KERIA Cloud Agent
 """
-from time import sleep
 
 import requests
 from keri import kering
@@ -70,9 +69,7 @@ def create_credential():
                        alias="multisig1")
 
     print("resolving oobi for multisig1")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     multisig1 = op["response"]
@@ -81,9 +78,7 @@ def create_credential():
                        alias="multisig2")
     print("... done")
 
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     multisig2 = op["response"]
 
     m3 = identifiers.get("multisig3")
@@ -115,9 +110,7 @@ def create_credential():
                    embeds=embeds, recipients=recp)
 
     print("waiting on multisig creation...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     gAid = op["response"]
     print(f"group multisig created {gAid}")
 
@@ -125,9 +118,7 @@ def create_credential():
                        alias="vc")
 
     print("resolving oobi for credential schema")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     m = identifiers.get("multisig")
@@ -146,9 +137,7 @@ def create_credential():
                    embeds=embeds, recipients=recp)
 
     print("waiting on credential registry creation...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     print("registry created")
 
@@ -178,9 +167,7 @@ def create_credential():
                    embeds=embeds, recipients=recp)
 
     print("waiting on credential creation...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     m = identifiers.get("multisig")
     grant, sigs, end = ipex.grant(m, recp="ELjSFdrTdCebJlmvbFNX9-TLhR2PO0_60al1kQp5_e6k", acdc=acdc,
@@ -73,9 +73,7 @@ def multisig_holder():
     client2.challenges().respond("holder2", holder1['i'], words)
 
     op = client1.challenges().verify("holder1", holder2['i'], words)
-    while not op["done"]:
-        op = client1.operations().get(op['name'])
-        sleep(1)
+    op = client1.operations().wait(op)
 
     exn = serdering.SerderKERI(sad=op["response"]['exn'])
     print(f"Challenge signed in {exn.said}")
@@ -103,13 +101,7 @@ def multisig_holder():
     add_end_role_multisig(client1, "holder", ghab1, member1, client2.agent.pre, stamp=stamp)
     op2 = add_end_role_multisig(client2, "holder", ghab2, member2, client2.agent.pre, stamp=stamp)
 
-    while not op1["done"]:
-        op1 = client1.operations().get(op1['name'])
-        sleep(1)
-
-    while not op2["done"]:
-        op2 = client1.operations().get(op2['name'])
-        sleep(1)
+    op1, op2 = client1.operations().wait_all([op1, op2])
 
     holder = resolve_oobi(client0, "holder", "http://127.0.0.1:3902/oobi/EH_axvx0v0gwQaCawqem5u8ZeDKx9TUWKsowTa_xj0yb")
 
@@ -196,9 +188,7 @@ def resolve_oobi(client, alias, url):
                        alias=alias)
 
     print(f"resolving oobi for {alias}")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     print("... done")
     return op["response"]
@@ -261,9 +251,7 @@ def get_aid(client, name):
 
 def wait_on_operation(client, op):
     operations = client.operations()
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     return op["response"]
 
@@ -314,9 +302,7 @@ def create_credential(client, holder):
 
     print("Creating vLEI Registry")
     _, _, _, op = registries.create(hab=issuer, registryName="vLEI")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... created")
 
     issuer = identifiers.get("issuer")
@@ -328,9 +314,7 @@ def create_credential(client, holder):
                                                         schema="EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao",
                                                         recipient=holder['i'])
     print(f"Creating credential {creder.said}")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... created")
 
     prefixer = coring.Prefixer(qb64=iserder.pre)
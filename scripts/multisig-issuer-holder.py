@@ -77,13 +77,7 @@ def multisig_holder():
     add_end_role_multisig(client0, "issuer", ighab1, member1, client1.agent.pre, stamp=stamp)
     op2 = add_end_role_multisig(client1, "issuer", ighab2, member2, client1.agent.pre, stamp=stamp)
 
-    while not op1["done"]:
-        op1 = client1.operations().get(op1['name'])
-        sleep(0.25)
-
-    while not op2["done"]:
-        op2 = client1.operations().get(op2['name'])
-        sleep(0.25)
+    op1, op2 = client1.operations().wait_all([op1, op2])
 
     print("\nCreating holder0 agent")
     hclient0 = create_agent(b'PoLT1X6fDQliXyCuzCVuv',
@@ -125,9 +119,7 @@ def multisig_holder():
     hclient1.challenges().respond("holder1", holder0['i'], words)
 
     op = hclient0.challenges().verify("holder0", holder1['i'], words)
-    while not op["done"]:
-        op = hclient0.operations().get(op['name'])
-        sleep(0.25)
+    op = hclient0.operations().wait(op)
 
     exn = serdering.SerderKERI(sad=op["response"]['exn'])
     print(f"\nChallenge signed in {exn.said}")
@@ -155,13 +147,7 @@ def multisig_holder():
     add_end_role_multisig(hclient0, "holder", ghab1, member1, hclient1.agent.pre, stamp=stamp)
     op2 = add_end_role_multisig(hclient1, "holder", ghab2, member2, hclient1.agent.pre, stamp=stamp)
 
-    while not op1["done"]:
-        op1 = hclient1.operations().get(op1['name'])
-        sleep(0.25)
-
-    while not op2["done"]:
-        op2 = hclient1.operations().get(op2['name'])
-        sleep(0.25)
+    op1, op2 = hclient1.operations().wait_all([op1, op2])
 
     resolve_oobi(client0, "holder", "http://127.0.0.1:3902/oobi/EH_axvx0v0gwQaCawqem5u8ZeDKx9TUWKsowTa_xj0yb")
     holder = resolve_oobi(client1, "holder", "http://127.0.0.1:3902/oobi/EH_axvx0v0gwQaCawqem5u8ZeDKx9TUWKsowTa_xj0yb")
@@ -174,13 +160,9 @@ def multisig_holder():
                           "AHSNDV3ABI6U8OIgKaj3aky91ZpNL54I5_7-qwtC6q2s")
     op2 = create_registry(client1, "issuer1", "issuer", [issuer0Pre], "vLEI",
                           "AHSNDV3ABI6U8OIgKaj3aky91ZpNL54I5_7-qwtC6q2s")
-    while not op1["done"]:
-        op1 = client0.operations().get(op1['name'])
-        sleep(0.25)
+    op1 = client0.operations().wait(op1)
 
-    while not op2["done"]:
-        op2 = client1.operations().get(op2['name'])
-        sleep(0.25)
+    op2 = client1.operations().wait(op2)
 
     print("\nCreating Credential from Multisig Issuer")
     stamp = helping.nowIso8601()
@@ -188,24 +170,16 @@ def multisig_holder():
                                                         [issuer1Pre], "vLEI", holder['i'], stamp)
     creder, iserder, anc, sigs, op2 = create_credential(client1, "issuer1", "issuer",
                                                         [issuer0Pre], "vLEI", holder['i'], stamp)
-    while not op1["done"]:
-        op1 = client0.operations().get(op1['name'])
-        sleep(0.25)
+    op1 = client0.operations().wait(op1)
 
-    while not op2["done"]:
-        op2 = client1.operations().get(op2['name'])
-        sleep(0.25)
+    op2 = client1.operations().wait(op2)
 
     print("\nSend GRANT from Multisig Issuer to Multisig Holder")
     op1 = create_grant(client0, "issuer0", "issuer", creder, iserder, anc, sigs, [issuer1Pre], holder['i'], stamp)
     op2 = create_grant(client1, "issuer1", "issuer", creder, iserder, anc, sigs, [issuer0Pre], holder['i'], stamp)
-    while not op1["done"]:
-        op1 = client0.operations().get(op1['name'])
-        sleep(0.25)
+    op1 = client0.operations().wait(op1)
 
-    while not op2["done"]:
-        op2 = client1.operations().get(op2['name'])
-        sleep(0.25)
+    op2 = client1.operations().wait(op2)
 
     notificatons = hclient0.notifications()
 
@@ -286,9 +260,7 @@ def resolve_oobi(client, alias, url):
                        alias=alias)
 
     print(f"resolving oobi for {alias}")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     print("... done")
     return op["response"]
@@ -351,9 +323,7 @@ def get_aid(client, name):
 
 def wait_on_operation(client, op):
     operations = client.operations()
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     return op["response"]
 
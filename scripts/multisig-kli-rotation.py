@@ -1,4 +1,3 @@
-from time import sleep
 
 import requests
 from keri import kering
@@ -56,9 +55,7 @@ def create_multisig():
                        alias="multisig1")
 
     print("resolving oobi for multisig1")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     print("... done")
 
     multisig1 = op["response"]
@@ -67,9 +64,7 @@ def create_multisig():
                        alias="multisig2")
     print("... done")
 
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     multisig2 = op["response"]
 
     m3 = identifiers.get("multisig3")
@@ -101,9 +96,7 @@ def create_multisig():
                    embeds=embeds, recipients=recp)
 
     print("waiting on multisig creation...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
     gid = op["response"]
     print(f"group multisig created {gid}")
 
@@ -120,9 +113,7 @@ def create_multisig():
                    embeds=embeds, recipients=recp)
 
     print("waiting for ixn to finish...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     ixn = serdering.SerderKERI(sad=op["response"])
     events = client.keyEvents()
@@ -144,18 +135,14 @@ def create_multisig():
 
     keyState = client.keyStates()
     op = keyState.query(pre="EJccSRTfXYF6wrUVuenAIHzwcx3hJugeiJsEKmndi5q1", sn=1)
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     multisig2 = op["response"]
     print(f"using key {multisig2['k'][0]}")
     print(f"using dig {multisig2['n'][0]}")
 
     op = keyState.query(pre="EKYLUMmNPZeEs77Zvclf0bSN5IN-mLfLpx2ySb-HDlk4", sn=1)
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
     multisig1 = op["response"]
     print(f"using key {multisig1['k'][0]}")
@@ -177,9 +164,7 @@ def create_multisig():
 
     print(rexn.pretty(size=5000))
     print("Waiting for multisig rotation...")
-    while not op["done"]:
-        op = operations.get(op["name"])
-        sleep(1)
+    op = operations.wait(op)
 
 
 if __name__ == "__main__":
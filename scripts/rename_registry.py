@@ -10,7 +10,7 @@ import sys
 from keri.core import serdering
 from keri.core.coring import Tiers
 
-from signify.app.clienting import SignifyClient
+from signify.app import daemoning
 
 
 def rename_registry(name, registryName, newName):
@@ -18,7 +18,7 @@ def rename_registry(name, registryName, newName):
     bran = b'0123456789abcdefghsec'
     tier = Tiers.low
 
-    client = SignifyClient(passcode=bran, tier=tier, url=url)
+    client = daemoning.connect(url=url, passcode=bran, tier=tier)
     identifiers = client.identifiers()
     registries = client.registries()
 
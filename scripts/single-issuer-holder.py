@@ -51,9 +51,7 @@ def create_identifier(client: SignifyClient, name: str):
     result = client.identifiers().create(name, toad=str(len(WITNESS_AIDS)), wits=WITNESS_AIDS)
     op = result[2]
 
-    while not op["done"]:
-        op = client.operations().get(op["name"])
-        sleep(1)
+    op = client.operations().wait(op)
 
     hab = client.identifiers().get(name)
 
@@ -69,18 +67,14 @@ def get_agent_oobi(client: SignifyClient, name: str):
 
 def resolve_oobi(client: SignifyClient, oobi: str, alias: str):
     op = client.oobis().resolve(oobi, alias)
-    while not op['done']:
-        op = client.operations().get(op["name"])
-        sleep(1)
+    op = client.operations().wait(op)
 
 
 def create_registry(client: SignifyClient, name: str, registry_name: str):
     hab = client.identifiers().get(name)
     result = client.registries().create(hab=hab, registryName=registry_name)
     op = result[3]
-    while not op['done']:
-        op = client.operations().get(op["name"])
-        sleep(1)
+    op = client.operations().wait(op)
 
     registry = client.registries().get(name=name, registryName=registry_name)
     return registry
@@ -92,10 +86,8 @@ def issue_credential(client: SignifyClient, name: str, registry_name: str, schem
     creder, iserder, anc, sigs, op = client.credentials().create(hab, registry=registry, data=data, schema=schema,
                                                                  recipient=recipient, timestamp=create_timestamp())
 
-    while not op['done']:
-        print(f"Waiting for creds... {op['name']}")
-        op = client.operations().get(op['name'])
-        sleep(1)
+    print(f"Waiting for creds... {op['name']}")
+    op = client.operations().wait(op)
 
     prefixer = coring.Prefixer(qb64=iserder.pre)
     seqner = coring.Seqner(sn=iserder.sn)
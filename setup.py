@@ -93,7 +93,11 @@ setup(
                 'responses>=0.25.6',
                 'coverage>=7.6.10',
                 'pytest>=8.3.4',
-                'mockito==1.5.3'
+                'mockito==1.5.3',
+                'httpx>=0.27.2'
+        ],
+        'async': [
+            'httpx>=0.27.2'
         ],
         'setup': [
             'setuptools==75.8.0'
@@ -103,7 +107,8 @@ setup(
         'responses>=0.25.6',
         'coverage>=7.6.10',
         'pytest>=8.3.4',
-        'mockito==1.5.3'
+        'mockito==1.5.3',
+        'httpx>=0.27.2'
     ],
     setup_requires=[
         'setuptools==75.8.0'
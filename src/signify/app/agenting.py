@@ -0,0 +1,964 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.agenting module
+
+In-process stand-in for a KERIA agency for load and latency testing of Signify clients without a network or a
+running KERIA.  An Agency boots one delegated Agent per controller AID, serves the agent endpoints SignifyClient
+uses from memory and signs every authenticated response with the agent key so Authenticater.verify passes
+exactly as it does against KERIA.
+
+    agency = Agency()
+    client = SignifyClient(passcode=bran, adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+
+AsyncSignifyClient takes agency.transport() instead of agency.adapter(), and the Agency itself is a WSGI
+application for serving clients in other processes, for example with wsgiref.simple_server.make_server.
+
+Events and requests are checked for correct signatures and sequence but witnessing, delegation approval,
+multisig thresholds and credential validation are not performed, operations complete immediately unless the
+agency is created with pending polls.
+
+"""
+import io
+import json
+import re
+import secrets
+import threading
+from types import SimpleNamespace
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+from keri import kering
+from keri.core import coring, counting, eventing, indexing, serdering, signing
+from keri.core.coring import Ilks, Tiers
+from keri.help import helping
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from signify.core import authing
+
+# words handed out for challenges, random choices of these are not meant to be secure
+Words = ("abandon", "ability", "absent", "absorb", "abstract", "absurd", "access", "account", "acid", "acoustic",
+         "acquire", "across", "action", "actor", "adapt", "address", "adjust", "admit", "adult", "advance",
+         "advice", "aerobic", "affair", "afford", "afraid", "again", "agent", "agree", "ahead", "aim", "air",
+         "airport")
+
+
+class HTTPError(Exception):
+    """ Error raised by request handlers, converted to an error response with a title and description """
+
+    def __init__(self, status, title, description=None):
+        self.status = status
+        self.title = title
+        self.description = description if description is not None else title
+        super(HTTPError, self).__init__(f"{status} {title}: {self.description}")
+
+
+class Request:
+    """ Agent request parsed from any of the supported front ends """
+
+    def __init__(self, method, url, headers, body):
+        """
+
+        Parameters:
+            method (str): HTTP method name
+            url (str): full URL or path with optional query string
+            headers (dict): request headers
+            body (bytes): request body, None or empty for no body
+        """
+        parts = urlsplit(url)
+        self.method = method.upper()
+        self.path = parts.path if parts.path else "/"
+        self.query = {key: vals[0] for key, vals in parse_qs(parts.query).items()}
+        self.queries = parse_qs(parts.query)
+        self.headers = CaseInsensitiveDict({key: str(val) for key, val in headers.items()})
+        self.body = body if body else b""
+
+    def json(self):
+        try:
+            return json.loads(self.body) if self.body else {}
+        except ValueError as ex:
+            raise HTTPError(400, "Malformed JSON", str(ex))
+
+    def range(self, typ, total):
+        """ Returns (start, end) of items requested with a Range header of typ, clipped to total items """
+        start, end = 0, 24
+        value = self.headers.get("Range")
+        if value is not None and value.startswith(f"{typ}="):
+            first, _, last = value[len(typ) + 1:].partition("-")
+            start = int(first) if first else 0
+            end = int(last) if last else total - 1
+
+        return start, min(end, total - 1)
+
+
+class Agent:
+    """ Delegated agent of one controller AID with all of the controller's resources held in memory """
+
+    def __init__(self, agency, icp, stem, pidx, tier):
+        """ Incept the agent delegated by the controller inception event icp
+
+        Parameters:
+            agency (Agency): agency hosting this agent
+            icp (dict): controller inception event
+            stem (str): stem of the controller salt
+            pidx (int): next prefix index of the controller key manager
+            tier (str): passcode stretching tier of the controller
+
+        """
+        self.agency = agency
+        self.stem = stem
+        self.pidx = pidx
+        self.tier = tier
+
+        cserder = serdering.SerderKERI(sad=icp)
+        self.caid = cserder.pre
+        self.cstate = keystate(cserder)
+        self.cevent = cserder.ked
+
+        self.signer = signing.Signer(transferable=True)
+        nsigner = signing.Signer(transferable=True)
+        self.serder = eventing.delcept(keys=[self.signer.verfer.qb64], delpre=self.caid,
+                                       ndigs=[coring.Diger(ser=nsigner.verfer.qb64b).qb64],
+                                       code=coring.MtrDex.Blake3_256)
+        self.pre = self.serder.pre
+        self.state = keystate(self.serder)
+
+        # The agent verifies requests signed by the controller and signs responses with its own key
+        self.authn = authing.Authenticater(
+            agent=SimpleNamespace(pre=self.caid, verfer=coring.Verfer(qb64=self.cstate["k"][0])),
+            ctrl=SimpleNamespace(pre=self.pre, signer=self.signer))
+
+        self.habs = dict()  # name to identifier
+        self.names = dict()  # prefix to name
+        self.kels = dict()  # prefix to list of events
+        self.ends = []
+        self.registries = dict()  # (name, registry name) to registry
+        self.creds = dict()  # said to credential
+        self.notes = dict()  # id to notification
+        self.exns = dict()  # said to exn
+        self.contacts = []
+        self.ops = dict()  # name to [operation, remaining polls]
+        self.salt = None  # old salt saved while a passcode rotation is unfinished
+
+    def operation(self, kind, oid, response=None, metadata=None):
+        """ Record and return a new long running operation, done once polled Agency.pending times """
+        op = dict(name=f"{kind}.{oid}", metadata=metadata if metadata is not None else dict(), done=False)
+        self.ops[op["name"]] = [op, self.agency.pending, response]
+        return self.poll(op["name"])
+
+    def poll(self, name):
+        if name not in self.ops:
+            raise HTTPError(404, "Not Found", f"long running operation {name} not found")
+
+        entry = self.ops[name]
+        op, remaining, response = entry
+        if remaining > 0:
+            entry[1] = remaining - 1
+            return dict(op)
+
+        op["done"] = True
+        if response is not None:
+            op["response"] = response
+        return dict(op)
+
+    def notify(self, route, **attrs):
+        """ Add an unread notification with route and attributes attrs, returns the notification """
+        rid = coring.Diger(ser=secrets.token_bytes(16)).qb64
+        note = dict(i=rid, dt=helping.nowIso8601(), r=False, a=dict(r=route, **attrs))
+        self.notes[rid] = note
+        return note
+
+    def rekey(self, keys):
+        """ Replace encrypted key material of AIDs with keys recrypted by a passcode rotation """
+        for pre, material in keys.items():
+            if pre not in self.names:
+                continue
+            hab = self.habs[self.names[pre]]
+            for algo in ("salty", "randy"):
+                if algo in hab:
+                    hab[algo].update(material)
+
+    def hab(self, name):
+        if name not in self.habs:
+            raise HTTPError(404, "Not Found", f"{name} is not a valid identifier name or prefix")
+        return self.habs[name]
+
+    def verifySigs(self, serder, sigs, keys):
+        """ Verify every indexed signature in sigs over serder against keys, thresholds are not evaluated """
+        if not self.agency.verify:
+            return
+
+        if not sigs:
+            raise HTTPError(400, "Invalid signatures", f"no signatures on event {serder.said}")
+
+        for sig in sigs:
+            siger = signing.Siger(qb64=sig)
+            if siger.index >= len(keys) or not coring.Verfer(qb64=keys[siger.index]).verify(siger.raw, serder.raw):
+                raise HTTPError(400, "Invalid signatures", f"invalid signature {sig} on event {serder.said}")
+
+    def event(self, pre, ked, sigs):
+        """ Validate and apply key event ked with signatures sigs to the identifier with prefix pre
+
+        Returns:
+            dict: new key state of the identifier
+
+        """
+        try:
+            serder = serdering.SerderKERI(sad=ked)
+        except (kering.KeriError, ValueError, KeyError) as ex:
+            raise HTTPError(400, "Invalid event", str(ex))
+
+        state = self.habs[self.names[pre]]["state"]
+        kel = self.kels[pre]
+        if serder.pre == pre and serder.sn < len(kel) and kel[serder.sn]["d"] == serder.said:
+            return state  # already accepted, as when submissions share one anchoring event
+
+        if serder.pre != pre or serder.sn != int(state["s"], 16) + 1 or serder.ked["p"] != state["d"]:
+            raise HTTPError(400, "Invalid event",
+                            f"event {serder.ilk} sn={serder.sn} of {serder.pre} does not follow {state['s']} "
+                            f"{state['d']}")
+
+        keys = serder.ked["k"] if serder.estive else state["k"]
+        self.verifySigs(serder, sigs, keys)
+
+        state = keystate(serder, state)
+        self.habs[self.names[pre]]["state"] = state
+        self.kels[pre].append(serder.ked)
+        return state
+
+    def identify(self, name, icp, sigs, body):
+        if name in self.habs:
+            raise HTTPError(400, "Conflict", f"AID with name {name} already incepted")
+
+        try:
+            serder = serdering.SerderKERI(sad=icp)
+        except (kering.KeriError, ValueError, KeyError) as ex:
+            raise HTTPError(400, "Invalid event", str(ex))
+
+        if serder.ilk not in (Ilks.icp, Ilks.dip) or serder.pre in self.names:
+            raise HTTPError(400, "Invalid event", f"invalid inception event for {serder.pre}")
+
+        self.verifySigs(serder, sigs, serder.ked["k"])
+
+        hab = dict(name=name, prefix=serder.pre, transferable=serder.ked["n"] != [], state=keystate(serder),
+                   windexes=[])
+        hab.update(params(body))
+
+        self.habs[name] = hab
+        self.names[serder.pre] = name
+        self.kels[serder.pre] = [serder.ked]
+        return serder
+
+    def states(self, pres):
+        states = []
+        for pre in pres:
+            if pre in self.names:
+                states.append(self.habs[self.names[pre]]["state"])
+            elif pre == self.pre:
+                states.append(self.state)
+            elif pre == self.caid:
+                states.append(self.cstate)
+        return states
+
+
+class Agency:
+    """ In-process KERIA stand-in hosting one Agent per controller AID
+
+    Attributes:
+        agents (dict): controller AID prefix to Agent
+        verify (bool): True means verify request signatures and event signatures like KERIA
+        pending (int): number of times a new operation is polled before it reports done
+        requests (int): count of requests handled
+
+    """
+
+    def __init__(self, verify=True, pending=0):
+        """ Create an agency
+
+        Parameters:
+            verify (bool): False means accept requests and events without checking their signatures
+            pending (int): number of polls of a new long running operation before it completes
+
+        """
+        self.agents = dict()
+        self.verify = verify
+        self.pending = pending
+        self.requests = 0
+        self.lock = threading.RLock()
+
+        self.routes = [(method, re.compile(f"^{path}$"), handler) for method, path, handler in (
+            ("POST", "/boot", self.onBoot),
+            ("GET", "/agent/(?P<caid>[^/]+)", self.onAgent),
+            ("PUT", "/agent/(?P<caid>[^/]+)", self.onAgentPut),
+            ("PUT", "/salt/(?P<caid>[^/]+)", self.onSaltPut),
+            ("DELETE", "/salt/(?P<caid>[^/]+)", self.onSaltDelete),
+            ("GET", "/identifiers", self.onIdentifiers),
+            ("POST", "/identifiers", self.onIdentifiersPost),
+            ("GET", "/identifiers/(?P<name>[^/]+)", self.onIdentifier),
+            ("PUT", "/identifiers/(?P<name>[^/]+)", self.onIdentifierPut),
+            ("DELETE", "/identifiers/(?P<name>[^/]+)", self.onIdentifierDelete),
+            ("POST", "/identifiers/(?P<name>[^/]+)/events", self.onEvents),
+            ("GET", "/identifiers/(?P<name>[^/]+)/endroles(?:/(?P<role>[^/]+))?", self.onEndRoles),
+            ("POST", "/identifiers/(?P<name>[^/]+)/endroles", self.onEndRolesPost),
+            ("GET", "/endroles/(?P<aid>[^/]+)(?:/(?P<role>[^/]+))?", self.onEndRoles),
+            ("GET", "/identifiers/(?P<name>[^/]+)/oobis", self.onOobis),
+            ("GET", "/identifiers/(?P<name>[^/]+)/members", self.onMembers),
+            ("POST", "/identifiers/(?P<name>[^/]+)/registries", self.onRegistriesPost),
+            ("GET", "/identifiers/(?P<name>[^/]+)/registries/(?P<registry>[^/]+)", self.onRegistry),
+            ("PUT", "/identifiers/(?P<name>[^/]+)/registries/(?P<registry>[^/]+)", self.onRegistryPut),
+            ("POST", "/identifiers/(?P<name>[^/]+)/credentials", self.onCredentialsPost),
+            ("POST", "/identifiers/(?P<name>[^/]+)/exchanges", self.onExchangesPost),
+            ("POST", "/identifiers/(?P<name>[^/]+)/ipex/(?P<route>grant|admit)", self.onIpex),
+            ("POST", "/identifiers/(?P<name>[^/]+)/multisig/request", self.onMultisigRequest),
+            ("POST", "/identifiers/(?P<name>[^/]+)/multisig/join", self.onMultisigJoin),
+            ("GET", "/multisig/request/(?P<said>[^/]+)", self.onMultisigRequests),
+            ("POST", "/credentials/query", self.onCredentialsQuery),
+            ("GET", "/credentials/(?P<said>[^/]+)", self.onCredential),
+            ("DELETE", "/identifiers/(?P<name>[^/]+)/credentials/(?P<said>[^/]+)", self.onCredentialDelete),
+            ("GET", "/operations/(?P<name>[^/]+)", self.onOperation),
+            ("POST", "/oobis", self.onOobisPost),
+            ("GET", "/states", self.onStates),
+            ("GET", "/events", self.onKEL),
+            ("POST", "/queries", self.onQueries),
+            ("GET", "/notifications", self.onNotifications),
+            ("PUT", "/notifications/(?P<nid>[^/]+)", self.onNotificationPut),
+            ("DELETE", "/notifications/(?P<nid>[^/]+)", self.onNotificationDelete),
+            ("GET", "/exchanges/(?P<said>[^/]+)", self.onExchange),
+            ("GET", "/challenges", self.onChallenges),
+            ("POST", "/challenges_verify/(?P<source>[^/]+)", self.onChallengesVerify),
+            ("PUT", "/challenges_verify/(?P<source>[^/]+)", self.onChallengesResponded),
+            ("GET", "/contacts", self.onContacts),
+            ("GET", "/escrows/rpy", self.onEscrows),
+        )]
+
+        # boot and agent state requests are sent before the client can sign or verify
+        self.unsigned = (self.onBoot, self.onAgent, self.onAgentPut, self.onSaltPut, self.onSaltDelete)
+
+    def boot(self, ctrl, pidx=0):
+        """ Boot the agent of Controller ctrl as a client would through the boot interface
+
+        Returns:
+            Agent: the delegated agent of the controller
+
+        """
+        serder, siger = ctrl.event()
+        return self.incept(icp=serder.ked, sig=siger.qb64, stem=ctrl.stem, pidx=pidx, tier=ctrl.tier)
+
+    def incept(self, icp, sig, stem, pidx=0, tier=Tiers.low):
+        """ Create the agent delegated to by the controller inception event icp signed with sig
+
+        Returns:
+            Agent: the delegated agent of the controller
+
+        """
+        with self.lock:
+            agent = Agent(self, icp=icp, stem=stem, pidx=pidx, tier=tier)
+            if agent.caid in self.agents:
+                raise HTTPError(400, "Conflict", f"agent already exists for controller {agent.caid}")
+
+            serder = serdering.SerderKERI(sad=icp)
+            siger = signing.Siger(qb64=sig)
+            if self.verify and not coring.Verfer(qb64=serder.ked["k"][0]).verify(siger.raw, serder.raw):
+                raise HTTPError(401, "Unauthorized", "invalid signature on controller inception event")
+
+            self.agents[agent.caid] = agent
+            return agent
+
+    def handle(self, method, url, headers, body=None):
+        """ Handle one agent request
+
+        Parameters:
+            method (str): HTTP method name
+            url (str): URL or path with optional query string of the request
+            headers (dict): request headers
+            body (bytes): request body
+
+        Returns:
+            (status, headers, body): tuple of int status code, response headers dict and bytes body
+
+        """
+        req = Request(method, url, headers, body)
+        try:
+            return self.dispatch(req)
+        except HTTPError as ex:
+            return self.respond(None, req, ex.status, dict(title=ex.title, description=ex.description))
+
+    def dispatch(self, req):
+        allowed = False
+        for method, rex, handler in self.routes:
+            match = rex.match(req.path)
+            if match is None:
+                continue
+            if method != req.method:
+                allowed = True
+                continue
+
+            params = {key: unquote(val) for key, val in match.groupdict().items() if val is not None}
+            if handler not in self.unsigned:
+                agent = self.authenticate(req)
+            else:  # connected clients verify every response so sign for any known controller
+                agent = self.agents.get(req.headers.get("Signify-Resource"))
+
+            # only handlers touch agent state, signature checks and signing run concurrently outside the lock
+            try:
+                with self.lock:
+                    self.requests += 1
+                    result = handler(agent, req, **params)
+            except HTTPError as ex:  # errors of authenticated requests are signed too
+                result = ex.status, dict(title=ex.title, description=ex.description)
+
+            status, data = result if isinstance(result, tuple) else (200, result)
+            return self.respond(agent, req, status, data)
+
+        if allowed:
+            raise HTTPError(405, "Method Not Allowed", f"{req.method} not allowed on {req.path}")
+        raise HTTPError(404, "Not Found", f"no route for {req.path}")
+
+    def authenticate(self, req):
+        """ Returns the agent of the controller that signed req, raising HTTPError if not properly signed """
+        caid = req.headers.get("Signify-Resource")
+        if caid is None or caid not in self.agents:
+            raise HTTPError(401, "Unauthorized", "unknown or missing Signify-Resource")
+
+        agent = self.agents[caid]
+        if self.verify:
+            try:
+                if not agent.authn.verifysig(req.headers, req.method, req.path):
+                    raise HTTPError(401, "Unauthorized", "missing request signature")
+            except kering.AuthNError as ex:
+                raise HTTPError(401, "Unauthorized", str(ex))
+
+        return agent
+
+    @staticmethod
+    def respond(agent, req, status, data):
+        headers = CaseInsensitiveDict()
+        if isinstance(data, tuple):
+            data, extra = data
+            headers.update(extra)
+
+        if data is None:
+            body = b""
+        elif isinstance(data, bytes):
+            body = data
+            headers.setdefault("Content-Type", "application/json+cesr")
+        else:
+            body = json.dumps(data).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+
+        headers["Content-Length"] = str(len(body))
+        if agent is not None:
+            headers["Signify-Resource"] = agent.pre
+            headers["Signify-Timestamp"] = helping.nowIso8601()
+            agent.authn.sign(headers, req.method, req.path)
+
+        return status, headers, body
+
+    def adapter(self):
+        """ Returns a requests transport adapter that sends every request to this agency """
+        return AgencyAdapter(self)
+
+    def transport(self):
+        """ Returns an httpx async transport that sends every request to this agency """
+        return AgencyTransport(self)
+
+    def __call__(self, environ, start_response):
+        """ WSGI application entry point """
+        size = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(size) if size else b""
+        headers = {key[5:].replace("_", "-"): val for key, val in environ.items() if key.startswith("HTTP_")}
+        if environ.get("CONTENT_TYPE"):
+            headers["Content-Type"] = environ["CONTENT_TYPE"]
+        if size:
+            headers["Content-Length"] = str(size)
+
+        url = environ.get("PATH_INFO", "/")
+        if environ.get("QUERY_STRING"):
+            url = f"{url}?{environ['QUERY_STRING']}"
+
+        status, headers, body = self.handle(environ["REQUEST_METHOD"], url, headers, body)
+        reason = requests.status_codes._codes.get(status, ("",))[0].replace("_", " ").title()
+        start_response(f"{status} {reason}", list(headers.items()))
+        return [body]
+
+    def agent(self, caid):
+        if caid not in self.agents:
+            raise HTTPError(404, "Not Found", f"no agent for controller {caid}")
+        return self.agents[caid]
+
+    def onBoot(self, _, req):
+        body = req.json()
+        try:
+            agent = self.incept(icp=body["icp"], sig=body["sig"], stem=body["stem"], pidx=body.get("pidx", 0),
+                                tier=body.get("tier", Tiers.low))
+        except (KeyError, kering.KeriError, ValueError) as ex:
+            raise HTTPError(400, "Invalid boot request", str(ex))
+
+        return 202, agent.state
+
+    def onAgent(self, _, req, caid):
+        agent = self.agent(caid)
+        body = dict(agent=agent.state, controller=dict(state=agent.cstate, ee=agent.cevent), pidx=agent.pidx)
+        if agent.salt is not None:
+            body["sxlt"] = agent.salt
+        return body
+
+    def onAgentPut(self, _, req, caid):
+        agent = self.agent(caid)
+        body = req.json()
+        if req.query.get("type") == "ixn":
+            serder = serdering.SerderKERI(sad=body["ixn"])
+            if serder.pre != agent.caid or serder.sn != int(agent.cstate["s"], 16) + 1:
+                raise HTTPError(400, "Invalid event", "delegation approval does not follow controller state")
+            agent.verifySigs(serder, body["sigs"], agent.cstate["k"])
+            agent.cstate = keystate(serder, agent.cstate)
+            agent.cevent = serder.ked
+            return 204, None
+
+        missing = [field for field in ("rot", "sigs", "sxlt", "keys") if field not in body]
+        if missing:
+            raise HTTPError(400, "Invalid request", f"passcode rotation requires {', '.join(missing)}")
+
+        serder = serdering.SerderKERI(sad=body["rot"])
+        if serder.pre != agent.caid or serder.ilk != Ilks.rot:
+            raise HTTPError(400, "Invalid event", "passcode rotation requires a controller rotation event")
+        agent.verifySigs(serder, body["sigs"], serder.ked["k"])
+
+        agent.cstate = keystate(serder, agent.cstate)
+        agent.cevent = serder.ked
+        agent.authn.agent.verfer = coring.Verfer(qb64=agent.cstate["k"][0])
+        agent.rekey(body.get("keys", dict()))
+        agent.salt = None  # KERIA deletes the old salt once the rotation is applied
+
+        return 204, None
+
+    def onSaltPut(self, _, req, caid):
+        self.agent(caid).salt = req.json().get("salt")
+        return 204, None
+
+    def onSaltDelete(self, _, req, caid):
+        self.agent(caid).salt = None
+        return 204, None
+
+    @staticmethod
+    def page(req, typ, items):
+        """ Returns the slice of items requested by the Range header with its Content-Range header """
+        total = len(items)
+        if total == 0:
+            return 200, ([], {"Content-Range": f"{typ} 0-0/0"})
+
+        start, end = req.range(typ, total)
+        items = items[start:end + 1]
+        return 206, (items, {"Content-Range": f"{typ} {start}-{start + max(len(items) - 1, 0)}/{total}"})
+
+    def onIdentifiers(self, agent, req):
+        return self.page(req, "aids", list(agent.habs.values()))
+
+    def onIdentifiersPost(self, agent, req):
+        body = req.json()
+        serder = agent.identify(body.get("name"), body.get("icp"), body.get("sigs"), body)
+        if "salty" in body or "randy" in body:
+            agent.pidx += 1
+
+        kind = "witness" if serder.ked["b"] else "done"
+        if serder.ked.get("di"):
+            kind = "delegation"
+        return 202, agent.operation(kind, serder.pre, response=serder.ked)
+
+    def onIdentifier(self, agent, req, name):
+        if name not in agent.habs and name in agent.names:
+            name = agent.names[name]
+        return agent.hab(name)
+
+    def onIdentifierPut(self, agent, req, name):
+        hab = agent.hab(name)
+        nname = req.json().get("name")
+        if not nname or nname in agent.habs:
+            raise HTTPError(400, "Invalid name", f"invalid new name {nname}")
+
+        del agent.habs[name]
+        hab["name"] = nname
+        agent.habs[nname] = hab
+        agent.names[hab["prefix"]] = nname
+        return hab
+
+    def onIdentifierDelete(self, agent, req, name):
+        hab = agent.habs.pop(agent.hab(name)["name"])
+        del agent.names[hab["prefix"]]
+        return 204, None
+
+    def onEvents(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        ked = body["rot"] if "rot" in body else body.get("ixn")
+        if ked is None:
+            raise HTTPError(400, "Invalid event", "request must contain rot or ixn")
+
+        agent.event(hab["prefix"], ked, body.get("sigs"))
+        hab.update(params(body))
+
+        return agent.operation("done", f"{hab['prefix']}.{ked['s']}", response=ked)
+
+    def onEndRoles(self, agent, req, name=None, aid=None, role=None):
+        pre = agent.hab(name)["prefix"] if name is not None else aid
+        return [end for end in agent.ends if end["cid"] == pre and (role is None or end["role"] == role)]
+
+    def onEndRolesPost(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        rpy = serdering.SerderKERI(sad=body["rpy"])
+        agent.verifySigs(rpy, body.get("sigs"), hab["state"]["k"])
+
+        data = rpy.ked["a"]
+        end = dict(cid=data["cid"], role=data["role"], eid=data.get("eid"))
+        if end not in agent.ends:
+            agent.ends.append(end)
+        return 202, agent.operation("endrole", f"{data['cid']}.{data['role']}.{data.get('eid')}",
+                                    response=rpy.ked)
+
+    def onOobis(self, agent, req, name):
+        hab = agent.hab(name)
+        role = req.query.get("role", "agent")
+        return dict(role=role, oobis=[f"http://127.0.0.1/oobi/{hab['prefix']}/{role}/{agent.pre}"])
+
+    def onMembers(self, agent, req, name):
+        hab = agent.hab(name)
+        if "group" not in hab:
+            raise HTTPError(400, "Invalid identifier", f"{name} is not a group identifier")
+
+        group = hab["group"]
+        return dict(signing=[dict(aid=pre) for pre in group.get("smids", [])],
+                    rotation=[dict(aid=pre) for pre in group.get("rmids", [])])
+
+    def onRegistriesPost(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        rname = body.get("name")
+        if (hab["name"], rname) in agent.registries:
+            raise HTTPError(400, "Conflict", f"registry name {rname} already in use")
+
+        vcp = body["vcp"]
+        agent.event(hab["prefix"], body["ixn"], body.get("sigs"))
+        state = dict(vn=[1, 0], i=vcp["i"], s="0", d=vcp["d"], ii=vcp["ii"], dt=helping.nowIso8601(), et=vcp["t"],
+                     bt=vcp["bt"], b=vcp["b"], c=vcp["c"])
+        agent.registries[(hab["name"], rname)] = dict(name=rname, regk=vcp["i"], pre=hab["prefix"], state=state)
+        return 202, agent.operation("registry", vcp["i"], response=vcp)
+
+    def onRegistry(self, agent, req, name, registry):
+        hab = agent.hab(name)
+        if (hab["name"], registry) not in agent.registries:
+            raise HTTPError(404, "Not Found", f"{registry} is not a valid reference to a credential registry")
+        return agent.registries[(hab["name"], registry)]
+
+    def onRegistryPut(self, agent, req, name, registry):
+        reg = self.onRegistry(agent, req, name, registry)
+        nname = req.json().get("name")
+        del agent.registries[(name, registry)]
+        reg["name"] = nname
+        agent.registries[(name, nname)] = reg
+        return reg
+
+    def onCredentialsPost(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        acdc, iss = body["acdc"], body["iss"]
+        if acdc["d"] in agent.creds:
+            raise HTTPError(400, "Conflict", f"credential {acdc['d']} already issued")
+
+        self.verifyRegistrySeal(agent, iss)
+        anc = body["ixn"]
+        agent.event(hab["prefix"], anc, body.get("sigs"))
+        status = dict(vn=[1, 0], i=iss["i"], s=iss["s"], d=iss["d"], ri=iss["ri"] if "ri" in iss else iss["ra"]["i"],
+                      a=dict(s=anc["s"], d=anc["d"]), dt=iss["dt"], et=iss["t"])
+        agent.creds[acdc["d"]] = dict(sad=acdc, pre=hab["prefix"], schema=dict(), chains=[], status=status,
+                                      anc=anc, iss=iss, atc="", raw=self.export(acdc, iss, anc, body.get("sigs")))
+        return 202, agent.operation("credential", acdc["d"], response=dict(ced=acdc))
+
+    def onCredentialDelete(self, agent, req, name, said):
+        hab = agent.hab(name)
+        if said not in agent.creds:
+            raise HTTPError(404, "Not Found", f"credential for said {said} not found")
+
+        cred = agent.creds[said]
+        body = req.json()
+        rev = body["rev"]
+        if rev["t"] not in (Ilks.rev, Ilks.brv) or rev["i"] != said or rev["p"] != cred["status"]["d"]:
+            raise HTTPError(400, "Invalid event", f"revocation does not follow issuance of {said}")
+
+        self.verifyRegistrySeal(agent, rev)
+        anc = body["ixn"]
+        agent.event(hab["prefix"], anc, body.get("sigs"))
+        cred["status"] = dict(cred["status"], s=rev["s"], d=rev["d"], a=dict(s=anc["s"], d=anc["d"]), dt=rev["dt"],
+                              et=rev["t"])
+        return agent.operation("credential", f"{said}.{rev['s']}", response=rev)
+
+    @staticmethod
+    def verifyRegistrySeal(agent, ked):
+        """ Reject backer issuances and revocations not sealing the latest management event of their registry """
+        if "ra" not in ked:
+            return
+
+        seal = ked["ra"]
+        state = next((reg["state"] for reg in agent.registries.values() if reg["regk"] == seal["i"]), None)
+        if state is None or seal != dict(i=state["i"], s=state["s"], d=state["d"]):
+            raise HTTPError(400, "Invalid event", f"stale registry seal {seal} of {ked['t']} event {ked['d']}")
+
+    @staticmethod
+    def export(acdc, iss, anc, sigs):
+        """ Returns the CESR export of a credential laid out as KERIA does
+
+        The anchoring KEL event with its signatures comes first, then the TEL issuance event with the seal source
+        couple of its anchor and last the credential with the seal source triple of its issuance event.
+
+        """
+        anc = serdering.SerderKERI(sad=anc)
+        iss = serdering.SerderKERI(sad=iss)
+        creder = serdering.SerderACDC(sad=acdc)
+
+        msg = eventing.messagize(anc, sigers=[indexing.Siger(qb64=sig) for sig in sigs or []])
+        msg.extend(iss.raw)
+        msg.extend(counting.Counter(code=counting.CtrDex_1_0.SealSourceCouples, count=1).qb64b)
+        msg.extend(coring.Seqner(sn=anc.sn).qb64b)
+        msg.extend(anc.said.encode("utf-8"))
+        msg.extend(creder.raw)
+        msg.extend(counting.Counter(code=counting.CtrDex_1_0.SealSourceTriples, count=1).qb64b)
+        msg.extend(iss.pre.encode("utf-8"))
+        msg.extend(coring.Seqner(sn=iss.sn).qb64b)
+        msg.extend(iss.said.encode("utf-8"))
+        return msg.decode("utf-8")
+
+    @staticmethod
+    def sadPath(sad, path):
+        """ Returns the value at SAD path, a - separated path such as -a-i, or None when missing """
+        value = sad
+        for field in path.split("-")[1:]:
+            if not isinstance(value, dict) or field not in value:
+                return None
+            value = value[field]
+        return value
+
+    def onCredentialsQuery(self, agent, req):
+        body = req.json()
+        filtr = body.get("filter") or dict()
+        skip = body.get("skip", 0)
+        limit = body.get("limit", body.get("limt", 25))
+
+        creds = []
+        for cred in agent.creds.values():
+            for path, cond in filtr.items():
+                value = self.sadPath(cred["sad"], path)
+                if isinstance(cond, dict):
+                    if "$eq" in cond and value != cond["$eq"]:
+                        break
+                    if "$in" in cond and value not in cond["$in"]:
+                        break
+                elif value != cond:
+                    break
+            else:
+                creds.append(cred)
+
+        for path in reversed(body.get("sort") or []):
+            creds.sort(key=lambda cred: str(self.sadPath(cred["sad"], path)))
+
+        return [{key: val for key, val in cred.items() if key != "raw"} for cred in creds[skip:skip + limit]]
+
+    def onCredential(self, agent, req, said):
+        if said not in agent.creds:
+            raise HTTPError(404, "Not Found", f"credential for said {said} not found")
+
+        cred = agent.creds[said]
+        if "application/json+cesr" in req.headers.get("Accept", ""):
+            return cred["raw"].encode("utf-8")
+        return {key: val for key, val in cred.items() if key != "raw"}
+
+    def onExchangesPost(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        exn = serdering.SerderKERI(sad=body["exn"])
+        agent.verifySigs(exn, body.get("sigs"), hab["state"]["k"])
+        agent.exns[exn.said] = dict(exn=exn.ked, pathed=[body.get("atc", "")], rec=body.get("rec", []))
+        return 202, exn.ked
+
+    def onIpex(self, agent, req, name, route):
+        exn = self.onExchangesPost(agent, req, name)[1]
+        return 202, agent.operation("exchange", exn["d"], response=exn)
+
+    def onMultisigRequest(self, agent, req, name):
+        hab = agent.hab(name)
+        body = req.json()
+        exn = body["exn"]
+        agent.exns[exn["d"]] = dict(exn=exn, pathed=[body.get("atc", "")], rec=[], sender=hab["prefix"])
+        return exn
+
+    def onMultisigRequests(self, agent, req, said):
+        exns = [exn for exn in agent.exns.values() if exn["exn"]["d"] == said or exn["exn"].get("e", {}).get("d")
+                == said]
+        if not exns:
+            raise HTTPError(404, "Not Found", f"multisig request {said} not found")
+        return exns
+
+    def onMultisigJoin(self, agent, req, name):
+        body = req.json()
+        rot = body["rot"]
+        return 202, agent.operation("group", rot["i"], response=rot)
+
+    def onOperation(self, agent, req, name):
+        return agent.poll(name)
+
+    def onOobisPost(self, agent, req):
+        body = req.json()
+        url = body.get("url", body.get("oobiurl"))
+        if url is None:
+            raise HTTPError(400, "Invalid OOBI", "request must contain url or oobiurl")
+
+        segments = urlsplit(url).path.strip("/").split("/")
+        pre = segments[1] if len(segments) > 1 and segments[0] == "oobi" else None
+        alias = body.get("oobialias")
+        if alias is not None and pre is not None:
+            agent.contacts.append(dict(id=pre, alias=alias, oobi=url))
+        return 202, agent.operation("oobi", url, metadata=dict(oobi=url), response=dict(i=pre))
+
+    def onStates(self, agent, req):
+        return agent.states(req.queries.get("pre", []))
+
+    def onKEL(self, agent, req):
+        pre = req.query.get("pre")
+        if pre not in agent.kels:
+            raise HTTPError(404, "Not Found", f"unknown AID {pre}")
+        return agent.kels[pre]
+
+    def onQueries(self, agent, req):
+        body = req.json()
+        pre = body.get("pre")
+        states = agent.states([pre])
+        return 202, agent.operation("query", pre, metadata=dict(pre=pre, sn=body.get("sn")),
+                                    response=states[0] if states else None)
+
+    def onNotifications(self, agent, req):
+        return self.page(req, "notes", list(agent.notes.values()))
+
+    def onNotificationPut(self, agent, req, nid):
+        if nid not in agent.notes:
+            raise HTTPError(404, "Not Found", f"notification {nid} not found")
+        agent.notes[nid]["r"] = True
+        return 202, None
+
+    def onNotificationDelete(self, agent, req, nid):
+        if agent.notes.pop(nid, None) is None:
+            raise HTTPError(404, "Not Found", f"notification {nid} not found")
+        return 202, None
+
+    def onExchange(self, agent, req, said):
+        if said not in agent.exns:
+            raise HTTPError(404, "Not Found", f"exchange message {said} not found")
+        return agent.exns[said]
+
+    def onChallenges(self, agent, req):
+        return dict(words=[secrets.choice(Words) for _ in range(int(req.query.get("strength", 12)))])
+
+    def onChallengesVerify(self, agent, req, source):
+        return 202, agent.operation("challenge", f"{source}.{secrets.token_hex(8)}",
+                                    response=dict(exn=dict(i=source, a=req.json())))
+
+    def onChallengesResponded(self, agent, req, source):
+        return 202, None
+
+    def onContacts(self, agent, req):
+        return agent.contacts
+
+    def onEscrows(self, agent, req):
+        return []
+
+
+def params(body):
+    """ Returns dict of the key manager parameters in request body as KERIA stores them with an identifier """
+    kwa = dict()
+    for algo in ("salty", "randy", "group", "extern"):
+        if algo in body:
+            kwa[algo] = body[algo]
+
+    if "randy" in kwa:  # transferability of randy keys follows from the prefix
+        kwa["randy"] = dict(prxs=kwa["randy"].get("prxs", []), nxts=kwa["randy"].get("nxts", []))
+
+    return kwa
+
+
+def keystate(serder, state=None):
+    """ Returns key state dict after applying event serder to prior key state dict state
+
+    Parameters:
+        serder (SerderKERI): key event
+        state (dict): key state before serder, None for an inception event
+
+    """
+    ked = serder.ked
+    nstate = dict(state) if state is not None else dict(vn=[1, 0], i=serder.pre, di=ked.get("di", ""),
+                                                        c=ked.get("c", []), b=ked.get("b", []))
+    nstate.update(s=ked["s"], d=serder.said, p=ked.get("p", ""), f=ked["s"], dt=helping.nowIso8601(),
+                  et=ked["t"])
+    if serder.estive:
+        wits = nstate["b"]
+        if ked["t"] in (Ilks.rot, Ilks.drt):
+            wits = [wit for wit in wits if wit not in ked["br"]] + ked["ba"]
+        nstate.update(kt=ked["kt"], k=ked["k"], nt=ked["nt"], n=ked["n"], bt=ked["bt"], b=wits,
+                      ee=dict(s=ked["s"], d=serder.said, br=ked.get("br", []), ba=ked.get("ba", [])))
+
+    return nstate
+
+
+class AgencyAdapter(BaseAdapter):
+    """ requests transport adapter handing requests to an Agency in process """
+
+    def __init__(self, agency):
+        super(AgencyAdapter, self).__init__()
+        self.agency = agency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        status, headers, content = self.agency.handle(request.method, request.url, request.headers, body)
+
+        res = requests.Response()
+        res.status_code = status
+        res.headers = headers
+        if stream:
+            res.raw = io.BytesIO(content)
+        else:
+            res._content = content
+            res._content_consumed = True
+        res.encoding = "utf-8"
+        res.url = request.url
+        res.request = request
+        res.reason = requests.status_codes._codes.get(status, ("",))[0]
+        return res
+
+    def close(self):
+        pass
+
+
+class AgencyTransport:
+    """ httpx async transport handing requests to an Agency in process """
+
+    def __init__(self, agency):
+        self.agency = agency
+
+    async def handle_async_request(self, request):
+        import httpx
+
+        body = await request.aread()
+        status, headers, content = self.agency.handle(request.method, str(request.url), request.headers, body)
+        return httpx.Response(status, headers=list(headers.items()), content=content, request=request)
+
+    async def aclose(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
@@ -4,23 +4,175 @@ SIGNIFY
 signify.app.aiding module
 
 """
+import functools
+import threading
+import time
+from collections import OrderedDict
 from math import ceil
 
 from keri import kering
 from keri.app.keeping import Algos
 from keri.core import eventing
-from keri.core.coring import MtrDex, Tholder
+from keri.core.coring import Ilks, MtrDex, Tholder
 from keri.kering import Roles
+from requests import HTTPError
 
 from signify.app.clienting import SignifyClient
 from signify.core import httping
 
 
+class IdentifierCache:
+    """
+    Bounded LRU cache of identifiers keyed by name and by prefix, so back to back events of one AID are built
+    without reading it from the agent first.  Identifiers are added when read and advanced from the events
+    submitted for them, and dropped when the agent rejects one of their events.  Entries expire after ttl seconds,
+    which bounds how long events submitted by other controllers or clients can go unnoticed.  An identifier never
+    replaces a cached one of a later sequence number.
+
+        client = SignifyClient(passcode=bran, identifier_cache=IdentifierCache())
+
+    """
+
+    def __init__(self, size=1024, ttl=60.0):
+        """ Create an identifier cache
+
+        Parameters:
+            size (int): maximum number of cached identifiers, least recently used identifiers are evicted first
+            ttl (float): number of seconds a cached identifier remains valid after it is added
+
+        """
+        if size < 1:
+            raise ValueError(f"invalid identifier cache size={size}, must be at least 1")
+
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._names = dict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name):
+        """ Return the cached identifier name or None if not present or expired """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, hab = entry
+            if expires <= time.monotonic():
+                self._remove(name)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(name)
+            self.hits += 1
+            return hab
+
+    def find(self, pre):
+        """ Return the cached identifier of prefix pre or None if not present or expired """
+        with self._lock:
+            name = self._names.get(pre)
+        return self.get(name) if name is not None else None
+
+    def put(self, hab):
+        """ Add identifier to the cache unless one of a later sequence number is already cached
+
+        Parameters:
+            hab (dict): identifier as returned by Identifiers.get
+
+        """
+        name = hab["name"]
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[1]["prefix"] == hab["prefix"] and \
+                    int(entry[1]["state"]["s"], 16) > int(hab["state"]["s"], 16):
+                return
+
+            if entry is not None:
+                self._remove(name)
+
+            self._entries[name] = (time.monotonic() + self.ttl, hab)
+            self._names[hab["prefix"]] = name
+            while len(self._entries) > self.size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, name=None, pre=None):
+        """ Remove the cached identifier name or of prefix pre """
+        with self._lock:
+            name = name if name is not None else self._names.get(pre)
+            if name in self._entries:
+                self._remove(name)
+
+    def notify(self, notes):
+        """ Drop identifiers changed by the events notifications are about, Notifications.list passes the notes it
+        reads.  Notes about multisig events do not name the group AID so they clear the cache. """
+        for note in notes:
+            route = note.get("a", dict()).get("r", "")
+            if route.startswith("/multisig/"):
+                self.clear()
+                return
+
+    def clear(self):
+        """ Remove all cached identifiers """
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+
+    def stats(self):
+        """ Get cache statistics
+
+        Returns:
+            dict: size, hits, misses and evictions of this cache
+
+        """
+        with self._lock:
+            return dict(size=len(self._entries), hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+    def _remove(self, name):
+        _, hab = self._entries.pop(name)
+        if self._names.get(hab["prefix"]) == name:
+            del self._names[hab["prefix"]]
+
+    @staticmethod
+    def advance(hab, serder, json):
+        """ Returns identifier hab as it is once the agent accepted event serder submitted with request body json,
+        or None when its key manager parameters can not be followed locally """
+        ked = serder.ked
+        state = dict(hab["state"], s=ked["s"], d=serder.said, p=ked["p"], et=ked["t"])
+        if "f" in state:
+            state["f"] = f"{int(state['f'], 16) + 1:x}"
+        hab = dict(hab, state=state)
+        if ked["t"] not in (Ilks.rot, Ilks.drt):
+            return hab
+
+        if Algos.salty in json:
+            hab[Algos.salty] = json[Algos.salty]
+        elif Algos.randy in json:
+            hab[Algos.randy] = dict(prxs=json[Algos.randy]["prxs"], nxts=json[Algos.randy]["nxts"])
+        else:
+            return None
+
+        wits = [wit for wit in state["b"] if wit not in ked["br"]] + ked["ba"]
+        state.update(k=ked["k"], kt=ked["kt"], n=ked["n"], nt=ked["nt"], b=wits, bt=ked["bt"],
+                     ee=dict(s=ked["s"], d=serder.said, br=ked["br"], ba=ked["ba"]))
+        return hab
+
+
 class Identifiers:
     """ Domain class for accessing, creating and rotating KERI Autonomic IDentifiers (AIDs) """
 
     def __init__(self, client: SignifyClient):
         self.client = client
+        self.cache = getattr(client, "identifier_cache", None)
 
     def list(self, start=0, end=24):
         headers = dict(Range=f"aids={start}-{end}")
@@ -31,19 +183,188 @@ class Identifiers:
 
         return dict(start=start, end=end, total=total, aids=res.json())
 
+    def iter(self, size=100, prefetch=True):
+        """ Lazily iterate over all identifiers, fetching size identifiers per request
+
+        Parameters:
+            size (int): number of identifiers requested per page
+            prefetch (bool): True means fetch the next page in the background while the current one is consumed
+
+        Returns:
+            Paginator: iterable of identifier dicts
+
+        """
+        return httping.Paginator(functools.partial(self.client.get, "/identifiers"), "aids", size=size,
+                                 prefetch=prefetch)
+
+    def list_all(self, size=100):
+        """ Returns list of all identifiers, see iter """
+        return list(self.iter(size=size))
+
     def get(self, name):
         res = self.client.get(f"/identifiers/{name}")
-        return res.json()
-    
+        hab = res.json()
+        if self.cache is not None:
+            self.cache.put(hab)
+        return hab
+
+    def current(self, name):
+        """ Returns identifier name from the identifier cache of the client, read from the agent when not cached """
+        hab = self.cache.get(name) if self.cache is not None else None
+        return hab if hab is not None else self.get(name)
+
+    def cached(self, name, attempt):
+        """ Returns attempt called with the current identifier name
+
+        When the agent rejects the event attempt built from a cached identifier, the identifier is read again and
+        attempt called once more if the cached one was stale.  Identifiers are dropped from the cache whenever attempt
+        fails, since the agent may have accepted the event before a connection error or timeout.
+
+        """
+        hab = self.cache.get(name) if self.cache is not None else None
+        if hab is None:
+            return self.attempt(name, attempt, self.get(name))
+
+        try:
+            return attempt(hab)
+        except Exception as ex:
+            # the agent may have accepted the event before a connection error or timeout
+            self.cache.invalidate(name)
+            if not self.rejected(ex):
+                raise
+
+            fresh = self.get(name)
+            if fresh["state"]["d"] == hab["state"]["d"]:
+                raise
+
+        return self.attempt(name, attempt, fresh)
+
+    @staticmethod
+    def rejected(ex):
+        """ Returns True when ex is the agent rejecting a request, as it does events built from a stale state """
+        return isinstance(ex, HTTPError) and ex.response is not None and 400 <= ex.response.status_code < 500
+
+    def attempt(self, name, attempt, hab):
+        try:
+            return attempt(hab)
+        except Exception:
+            if self.cache is not None:
+                self.cache.invalidate(name)
+            raise
+
+    def advance(self, hab, serder, json):
+        """ Advance the cached identifier hab past event serder accepted by the agent """
+        if self.cache is None:
+            return
+
+        hab = self.cache.advance(hab, serder, json)
+        if hab is not None:
+            self.cache.put(hab)
+        else:
+            self.cache.invalidate(pre=serder.pre)
+
     def rename(self, name, newName):
         res = self.client.put(f"/identifiers/{name}", json={"name": newName})
+        if self.cache is not None:
+            self.cache.invalidate(name)
         return res.json()
 
     def create(self, name, transferable=True, isith="1", nsith="1", wits=None, toad="0", proxy=None, delpre=None,
                dcode=MtrDex.Blake3_256, data=None, algo=Algos.salty, estOnly=False, DnD=False, **kwargs):
 
+        serder, sigs, json = self.makeInception(name, self.client.pidx, transferable=transferable, isith=isith,
+                                                nsith=nsith, wits=wits, toad=toad, proxy=proxy, delpre=delpre,
+                                                dcode=dcode, data=data, algo=algo, estOnly=estOnly, DnD=DnD,
+                                                **kwargs)
+
+        self.client.pidx = self.client.pidx + 1
+
+        res = self.client.post("/identifiers", json=json)
+        return serder, sigs, res.json()
+
+    def update(self, name, typ, **kwas):
+        if typ == "interact":
+            self.interact(name, **kwas)
+        elif typ == "rotate":
+            self.rotate(name, **kwas)
+        else:
+            raise kering.KeriError(f"{typ} invalid identifier update type, only 'rotate' or 'interact' allowed")
+
+        pass
+
+    def delete(self, name):
+        self.client.delete(f"/identifiers/{name}")
+        if self.cache is not None:
+            self.cache.invalidate(name)
+
+    def interact(self, name, data=None):
+        def attempt(hab):
+            serder, sigs, json = self.makeInteraction(hab, data=data)
+
+            res = self.client.post(f"/identifiers/{name}/events", json=json)
+            self.advance(hab, serder, json)
+            return serder, sigs, res.json()
+
+        return self.cached(name, attempt)
+
+    def rotate(self, name, *, transferable=True, nsith=None, toad=None, cuts=None, adds=None,
+               data=None, ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, states=None, rstates=None):
+        def attempt(hab):
+            serder, sigs, json = self.makeRotation(hab, transferable=transferable, nsith=nsith, toad=toad,
+                                                   cuts=cuts, adds=adds, data=data, ncode=ncode, ncount=ncount,
+                                                   ncodes=ncodes, states=states, rstates=rstates)
+
+            res = self.client.post(f"/identifiers/{name}/events", json=json)
+            self.advance(hab, serder, json)
+            return serder, sigs, res.json()
+
+        return self.cached(name, attempt)
+
+    def addEndRole(self, name, *, role=Roles.agent, eid=None, stamp=None):
+        def attempt(hab):
+            rpy, sigs = self.makeEndRoleAuthorization(hab, role=role, eid=eid, stamp=stamp)
+            json = dict(
+                rpy=rpy.ked,
+                sigs=sigs
+            )
+
+            res = self.client.post(f"/identifiers/{name}/endroles", json=json)
+            return rpy, sigs, res.json()
+
+        return self.cached(name, attempt)
+
+    def sign(self, name, ser):
+        hab = self.current(name)
+        return self.signWith(hab, ser)
+
+    def members(self, name):
+        res = self.client.get(f"/identifiers/{name}/members")
+        return res.json()
+
+    @staticmethod
+    def makeEndRole(pre, role=Roles.agent, eid=None, stamp=None):
+        data = dict(cid=pre, role=role)
+        if eid is not None:
+            data['eid'] = eid
+
+        route = "/end/role/add"
+        return eventing.reply(route=route, data=data, stamp=stamp)
+
+    def makeInception(self, name, pidx, transferable=True, isith="1", nsith="1", wits=None, toad="0", proxy=None,
+                      delpre=None, dcode=MtrDex.Blake3_256, data=None, algo=Algos.salty, estOnly=False, DnD=False,
+                      **kwargs):
+        """ Create and sign the inception event for a new identifier without sending it
+
+        Parameters:
+            name (str): human readable alias for the new identifier
+            pidx (int): key index reserved for this identifier in the client key manager
+
+        Returns:
+            (serder, sigs, json): tuple of inception event, signatures and request body for KERIA
+
+        """
         # Get the algo specific key params
-        keeper = self.client.manager.new(algo, self.client.pidx, **kwargs)
+        keeper = self.client.manager.new(algo, pidx, **kwargs)
 
         keys, ndigs = keeper.incept(transferable=transferable)
 
@@ -92,26 +413,19 @@ class Identifiers:
         if 'rstates' in kwargs:
             json['rmids'] = [state['i'] for state in kwargs['rstates']]
 
-        self.client.pidx = self.client.pidx + 1
+        return serder, sigs, json
 
-        res = self.client.post("/identifiers", json=json)
-        return serder, sigs, res.json()
+    def makeInteraction(self, hab, data=None):
+        """ Create and sign the next interaction event for hab without sending it
 
-    def update(self, name, typ, **kwas):
-        if typ == "interact":
-            self.interact(name, **kwas)
-        elif typ == "rotate":
-            self.rotate(name, **kwas)
-        else:
-            raise kering.KeriError(f"{typ} invalid identifier update type, only 'rotate' or 'interact' allowed")
-
-        pass
+        Parameters:
+            hab (dict): Identifier dict from identifiers.get
+            data (list|dict): seals or data to anchor in the event
 
-    def delete(self, name):
-        self.client.delete(f"/identifiers/{name}")
+        Returns:
+            (serder, sigs, json): tuple of interaction event, signatures and request body for KERIA
 
-    def interact(self, name, data=None):
-        hab = self.get(name)
+        """
         pre = hab["prefix"]
 
         state = hab["state"]
@@ -129,12 +443,19 @@ class Identifiers:
             sigs=sigs)
         json[keeper.algo] = keeper.params()
 
-        res = self.client.post(f"/identifiers/{name}/events", json=json)
-        return serder, sigs, res.json()
+        return serder, sigs, json
 
-    def rotate(self, name, *, transferable=True, nsith=None, toad=None, cuts=None, adds=None,
-               data=None, ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, states=None, rstates=None):
-        hab = self.get(name)
+    def makeRotation(self, hab, *, transferable=True, nsith=None, toad=None, cuts=None, adds=None,
+                     data=None, ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, states=None, rstates=None):
+        """ Create and sign the next rotation event for hab without sending it
+
+        Parameters:
+            hab (dict): Identifier dict from identifiers.get
+
+        Returns:
+            (serder, sigs, json): tuple of rotation event, signatures and request body for KERIA
+
+        """
         pre = hab["prefix"]
 
         state = hab["state"]
@@ -192,40 +513,181 @@ class Identifiers:
         if rstates is not None:
             json['rmids'] = [state['i'] for state in rstates]
 
-        res = self.client.post(f"/identifiers/{name}/events", json=json)
-        return serder, sigs, res.json()
+        return serder, sigs, json
 
-    def addEndRole(self, name, *, role=Roles.agent, eid=None, stamp=None):
-        hab = self.get(name)
-        pre = hab["prefix"]
+    def makeEndRoleAuthorization(self, hab, *, role=Roles.agent, eid=None, stamp=None):
+        """ Create and sign an end role authorization reply for hab without sending it
 
-        rpy = self.makeEndRole(pre, role, eid, stamp)
-        keeper = self.client.manager.get(aid=hab)
-        sigs = keeper.sign(ser=rpy.raw)
-        json = dict(
-            rpy=rpy.ked,
-            sigs=sigs
-        )
+        Returns:
+            (rpy, sigs): tuple of reply message and signatures over it
 
-        res = self.client.post(f"/identifiers/{name}/endroles", json=json)
-        return rpy, sigs, res.json()
+        """
+        rpy = self.makeEndRole(hab["prefix"], role, eid, stamp)
+        sigs = self.signWith(hab, rpy)
+        return rpy, sigs
 
-    def sign(self, name, ser):
-        hab = self.get(name)
+    def signWith(self, hab, ser):
+        """ Sign the raw bytes of ser with the current keys of hab
+
+        Parameters:
+            hab (dict): Identifier dict from identifiers.get
+            ser (Serder): event or message to sign
+
+        Returns:
+            list: qb64 signatures
+
+        """
         keeper = self.client.manager.get(aid=hab)
-        sigs = keeper.sign(ser=ser.raw)
+        return keeper.sign(ser=ser.raw)
 
-        return sigs
 
-    def members(self, name):
-        res = self.client.get(f"/identifiers/{name}/members")
+class AsyncIdentifiers(Identifiers):
+    """ Asyncio domain class for accessing, creating and rotating KERI AIDs with an AsyncSignifyClient
+
+    Key derivation and event signing run in a worker thread so they do not block the event loop.
+
+    """
+
+    async def list(self, start=0, end=24):
+        headers = dict(Range=f"aids={start}-{end}")
+        res = await self.client.get("/identifiers", headers=headers)
+
+        cr = res.headers["content-range"]
+        start, end, total = httping.parseRangeHeader(cr, "aids")
+
+        return dict(start=start, end=end, total=total, aids=res.json())
+
+    def iter(self, size=100, prefetch=True):
+        """ Lazily iterate over all identifiers with async for, see Identifiers.iter """
+        return httping.AsyncPaginator(functools.partial(self.client.get, "/identifiers"), "aids", size=size,
+                                      prefetch=prefetch)
+
+    async def list_all(self, size=100):
+        return [aid async for aid in self.iter(size=size)]
+
+    async def get(self, name):
+        res = await self.client.get(f"/identifiers/{name}")
+        hab = res.json()
+        if self.cache is not None:
+            self.cache.put(hab)
+        return hab
+
+    async def current(self, name):
+        hab = self.cache.get(name) if self.cache is not None else None
+        return hab if hab is not None else await self.get(name)
+
+    async def cached(self, name, attempt):
+        hab = self.cache.get(name) if self.cache is not None else None
+        if hab is None:
+            return await self.attempt(name, attempt, await self.get(name))
+
+        try:
+            return await attempt(hab)
+        except Exception as ex:
+            self.cache.invalidate(name)
+            if not self.rejected(ex):
+                raise
+
+            fresh = await self.get(name)
+            if fresh["state"]["d"] == hab["state"]["d"]:
+                raise
+
+        return await self.attempt(name, attempt, fresh)
+
+    async def attempt(self, name, attempt, hab):
+        try:
+            return await attempt(hab)
+        except Exception:
+            if self.cache is not None:
+                self.cache.invalidate(name)
+            raise
+
+    async def rename(self, name, newName):
+        res = await self.client.put(f"/identifiers/{name}", json={"name": newName})
+        if self.cache is not None:
+            self.cache.invalidate(name)
         return res.json()
 
-    @staticmethod
-    def makeEndRole(pre, role=Roles.agent, eid=None, stamp=None):
-        data = dict(cid=pre, role=role)
-        if eid is not None:
-            data['eid'] = eid
+    async def create(self, name, transferable=True, isith="1", nsith="1", wits=None, toad="0", proxy=None,
+                     delpre=None, dcode=MtrDex.Blake3_256, data=None, algo=Algos.salty, estOnly=False, DnD=False,
+                     **kwargs):
+        import asyncio
 
-        route = "/end/role/add"
-        return eventing.reply(route=route, data=data, stamp=stamp)
+        # Reserve the key index before yielding so concurrent creates never share one
+        pidx = self.client.pidx
+        self.client.pidx = pidx + 1
+
+        serder, sigs, json = await asyncio.to_thread(self.makeInception, name, pidx, transferable=transferable,
+                                                     isith=isith, nsith=nsith, wits=wits, toad=toad, proxy=proxy,
+                                                     delpre=delpre, dcode=dcode, data=data, algo=algo,
+                                                     estOnly=estOnly, DnD=DnD, **kwargs)
+
+        res = await self.client.post("/identifiers", json=json)
+        return serder, sigs, res.json()
+
+    async def update(self, name, typ, **kwas):
+        if typ == "interact":
+            await self.interact(name, **kwas)
+        elif typ == "rotate":
+            await self.rotate(name, **kwas)
+        else:
+            raise kering.KeriError(f"{typ} invalid identifier update type, only 'rotate' or 'interact' allowed")
+
+    async def delete(self, name):
+        await self.client.delete(f"/identifiers/{name}")
+        if self.cache is not None:
+            self.cache.invalidate(name)
+
+    async def interact(self, name, data=None):
+        import asyncio
+
+        async def attempt(hab):
+            serder, sigs, json = await asyncio.to_thread(self.makeInteraction, hab, data=data)
+
+            res = await self.client.post(f"/identifiers/{name}/events", json=json)
+            self.advance(hab, serder, json)
+            return serder, sigs, res.json()
+
+        return await self.cached(name, attempt)
+
+    async def rotate(self, name, *, transferable=True, nsith=None, toad=None, cuts=None, adds=None,
+                     data=None, ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, states=None, rstates=None):
+        import asyncio
+
+        async def attempt(hab):
+            serder, sigs, json = await asyncio.to_thread(self.makeRotation, hab, transferable=transferable,
+                                                         nsith=nsith, toad=toad, cuts=cuts, adds=adds, data=data,
+                                                         ncode=ncode, ncount=ncount, ncodes=ncodes, states=states,
+                                                         rstates=rstates)
+
+            res = await self.client.post(f"/identifiers/{name}/events", json=json)
+            self.advance(hab, serder, json)
+            return serder, sigs, res.json()
+
+        return await self.cached(name, attempt)
+
+    async def addEndRole(self, name, *, role=Roles.agent, eid=None, stamp=None):
+        import asyncio
+
+        async def attempt(hab):
+            rpy, sigs = await asyncio.to_thread(self.makeEndRoleAuthorization, hab, role=role, eid=eid,
+                                                stamp=stamp)
+            json = dict(
+                rpy=rpy.ked,
+                sigs=sigs
+            )
+
+            res = await self.client.post(f"/identifiers/{name}/endroles", json=json)
+            return rpy, sigs, res.json()
+
+        return await self.cached(name, attempt)
+
+    async def sign(self, name, ser):
+        import asyncio
+
+        hab = await self.current(name)
+        return await asyncio.to_thread(self.signWith, hab, ser)
+
+    async def members(self, name):
+        res = await self.client.get(f"/identifiers/{name}/members")
+        return res.json()
@@ -0,0 +1,307 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.anchoring module
+
+Coalescing of seals from many registry inceptions and credential issuances into shared interaction events
+
+"""
+import threading
+import time
+
+from keri.core.eventing import interact
+
+from signify.app.clienting import SignifyClient
+
+
+class Anchorer:
+    """ Coalescing anchor queue for one AID
+
+    Seals added within window seconds of each other, up to size of them, are anchored by one interaction event
+    signed once.  The first caller of a batch waits out the window and then anchors it, later callers just wait for
+    their result, so no background threads are needed.  The submissions sharing the event are then sent, the first
+    one alone so the agent accepts the event before the rest are sent concurrently, and each caller gets back the
+    event, its signatures and the result of its own submission.
+
+    The key state of the AID is advanced locally after each event so batches follow each other without reading the
+    AID.  It is read again from the agent when the first submission of a batch fails, so a stale key state or one
+    bad submission costs only a new event rather than failing every caller of the batch.
+
+        anchorer = client.anchorer(hab)
+        regser, ixn, sigs, op = client.registries().create(hab, "reg", anchorer=anchorer)
+
+    """
+
+    def __init__(self, client: SignifyClient, hab, window=0.01, size=64, workers=8):
+        """ Create anchor queue for the AID of hab
+
+        Parameters:
+            client (SignifyClient): client used to read the AID and sign its events
+            hab (dict): identifier as returned by Identifiers.get
+            window (float): seconds the first seal of a batch waits for more seals
+            size (int): maximum number of seals anchored by one event, a full batch is anchored at once
+            workers (int): maximum number of submissions sent concurrently for one event
+
+        """
+        if size < 1:
+            raise ValueError(f"invalid anchor batch size={size}, must be at least 1")
+
+        self.client = client
+        self.hab = hab
+        self.window = window
+        self.size = size
+        self.workers = workers
+        self.state = hab.get("state")
+        self.events = 0
+
+        self.batch = []
+        self.cond = threading.Condition()
+        self.anchoring = threading.Lock()
+
+    def anchor(self, seal, submit):
+        """ Anchor seal in the next interaction event of the AID and submit with the signed event
+
+        Parameters:
+            seal (dict): seal of the event to anchor
+            submit (Callable): called with the interaction event and its signatures once signed, its result is
+                               returned
+
+        Returns:
+            tuple: (ixn, sigs, result) of the anchoring event, its signatures and the result of submit
+
+        """
+        from concurrent import futures
+
+        fut = futures.Future()
+        with self.cond:
+            batch = self.batch
+            batch.append((seal, submit, fut))
+            lead = len(batch) == 1
+            full = len(batch) >= self.size
+            if full:
+                self.batch = []
+                self.cond.notify_all()
+
+        if lead and not full:
+            deadline = time.monotonic() + self.window
+            with self.cond:
+                while self.batch is batch and (left := deadline - time.monotonic()) > 0:
+                    self.cond.wait(left)
+                full = self.batch is batch
+                if full:
+                    self.batch = []
+
+        if full:
+            self.flush(batch)
+
+        return fut.result()
+
+    def flush(self, batch):
+        """ Anchor the seals of batch in one interaction event and send their submissions
+
+        The first submission is sent alone.  When it fails the key state of the AID is read again to tell whether
+        the agent took the event, see judge, and the other callers of batch only fail when the key state can not be
+        read or the event can not be signed.
+
+        """
+        with self.anchoring:
+            pending, retried = batch, False
+            while pending:
+                try:
+                    ixn, sigs = self.sign([seal for seal, _, _ in pending])
+                except Exception as ex:
+                    self.fail(pending, ex)
+                    return
+
+                _, submit, fut = pending[0]
+                try:
+                    fut.set_result((ixn, sigs, submit(ixn, sigs)))
+                    break
+                except Exception as ex:
+                    signed = self.state
+                    try:
+                        self.refresh()
+                    except Exception:
+                        self.fail(pending, ex)
+                        return
+
+                    verdict = self.judge(ixn, signed, retried)
+                    retried = retried or verdict == "stale"
+                    if verdict != "stale":
+                        self.reject(fut, ex)
+                    if verdict == "accepted":
+                        break
+                    if verdict == "rejected":
+                        pending = pending[1:]
+            else:
+                return
+
+            self.state = dict(self.state, s=f"{ixn.sn:x}", d=ixn.said)
+            self.events += 1
+
+        if len(pending) > 1:
+            from concurrent import futures
+
+            with futures.ThreadPoolExecutor(max_workers=min(len(pending) - 1, self.workers)) as pool:
+                for _, submit, fut in pending[1:]:
+                    pool.submit(self.send, submit, ixn, sigs, fut)
+
+    def judge(self, ixn, signed, retried):
+        """ Returns how the agent took ixn, signed after key state signed, once its first submission failed
+
+        Returns:
+            str: "accepted" when the current key state is ixn, so only the submission failed, "stale" when the
+                 key state moved on since ixn was signed and it was not yet signed again, so every seal is anchored
+                 again after the current state, otherwise "rejected", the submission is at fault and the remaining
+                 seals are anchored by a new event
+
+        """
+        if self.state["d"] == ixn.said:
+            return "accepted"
+        if not retried and self.state["d"] != signed["d"]:
+            return "stale"
+        return "rejected"
+
+    def fail(self, batch, ex):
+        """ Fail every caller of batch with ex, the key state is read again for the next batch """
+        self.state = None
+        for _, _, fut in batch:
+            self.reject(fut, ex)
+
+    @staticmethod
+    def reject(fut, ex):
+        """ Set exception ex of fut unless it is already done """
+        if not fut.done():
+            fut.set_exception(ex)
+
+    @staticmethod
+    def send(submit, ixn, sigs, fut):
+        try:
+            fut.set_result((ixn, sigs, submit(ixn, sigs)))
+        except Exception as ex:
+            fut.set_exception(ex)
+
+    def refresh(self):
+        """ Read the key state of the AID from the agent """
+        self.hab = self.client.identifiers().get(self.hab["name"])
+        self.state = self.hab["state"]
+
+    def sign(self, seals):
+        """ Returns (ixn, sigs) of the interaction event anchoring seals after the current state of the AID """
+        if self.state is None:
+            self.refresh()
+
+        ixn = interact(self.hab["prefix"], sn=int(self.state["s"], 16) + 1, data=seals, dig=self.state["d"])
+        keeper = self.client.manager.get(aid=self.hab)
+        return ixn, keeper.sign(ser=ixn.raw)
+
+
+class AsyncAnchorer(Anchorer):
+    """ Coalescing anchor queue for one AID of an AsyncSignifyClient, see Anchorer
+
+    submit is a coroutine function and submissions sharing an event after the first are gathered.  Batches are
+    anchored by tasks of the queue rather than of the callers, so cancelling a caller never strands the seals
+    batched with its own.
+
+    """
+
+    def __init__(self, client, hab, window=0.01, size=64, workers=8):
+        super(AsyncAnchorer, self).__init__(client=client, hab=hab, window=window, size=size, workers=workers)
+        self.timer = None
+        self.lock = None
+        self.tasks = set()
+
+    async def anchor(self, seal, submit):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+
+        fut = loop.create_future()
+        batch = self.batch
+        batch.append((seal, submit, fut))
+
+        if len(batch) >= self.size:
+            if self.timer is not None:
+                self.timer.cancel()
+            self.expire(batch)
+        elif len(batch) == 1:
+            self.timer = loop.call_later(self.window, self.expire, batch)
+
+        return await fut
+
+    def expire(self, batch):
+        """ Anchor batch in a task of the queue unless it was already taken """
+        import asyncio
+
+        if self.batch is not batch:
+            return
+
+        self.batch = []
+        self.timer = None
+        task = asyncio.ensure_future(self.flush(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def flush(self, batch):
+        import asyncio
+
+        async with self.lock:
+            pending, retried = batch, False
+            while pending:
+                try:
+                    if self.state is None:
+                        await self.refresh()
+                    ixn, sigs = await asyncio.to_thread(self.sign, [seal for seal, _, _ in pending])
+                except Exception as ex:
+                    self.fail(pending, ex)
+                    return
+
+                _, submit, fut = pending[0]
+                try:
+                    self.settle(fut, (ixn, sigs, await submit(ixn, sigs)))
+                    break
+                except Exception as ex:
+                    signed = self.state
+                    try:
+                        await self.refresh()
+                    except Exception:
+                        self.fail(pending, ex)
+                        return
+
+                    verdict = self.judge(ixn, signed, retried)
+                    retried = retried or verdict == "stale"
+                    if verdict != "stale":
+                        self.reject(fut, ex)
+                    if verdict == "accepted":
+                        break
+                    if verdict == "rejected":
+                        pending = pending[1:]
+            else:
+                return
+
+            self.state = dict(self.state, s=f"{ixn.sn:x}", d=ixn.said)
+            self.events += 1
+
+        await asyncio.gather(*[self.send(submit, ixn, sigs, fut) for _, submit, fut in pending[1:]])
+
+    async def refresh(self):
+        self.hab = await self.client.identifiers().get(self.hab["name"])
+        self.state = self.hab["state"]
+
+    @staticmethod
+    def settle(fut, result):
+        """ Set result of fut unless its caller was cancelled """
+        if not fut.done():
+            fut.set_result(result)
+
+    @staticmethod
+    async def send(submit, ixn, sigs, fut):
+        try:
+            result = await submit(ixn, sigs)
+        except Exception as ex:
+            AsyncAnchorer.reject(fut, ex)
+            return
+
+        AsyncAnchorer.settle(fut, (ixn, sigs, result))
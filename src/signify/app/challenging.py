@@ -32,7 +32,7 @@ class Challenges:
         return resp["words"]
 
     def respond(self, name, recp, words):
-        hab = self.client.identifiers().get(name)
+        hab = self.client.identifiers().current(name)
         exchanges = self.client.exchanges()
 
         _, _, res = exchanges.send(name, "challenge", sender=hab, route="/challenge/response",
@@ -73,3 +73,38 @@ class Challenges:
 
         self.client.put(f"/challenges_verify/{source}", json=json)
         return True
+
+
+class AsyncChallenges(Challenges):
+    """ Asyncio challenges domain object, see Challenges for parameters and results """
+
+    async def generate(self):
+        res = await self.client.get("/challenges")
+        resp = res.json()
+        return resp["words"]
+
+    async def respond(self, name, recp, words):
+        hab = await self.client.identifiers().current(name)
+        exchanges = self.client.exchanges()
+
+        _, _, res = await exchanges.send(name, "challenge", sender=hab, route="/challenge/response",
+                                         payload=dict(words=words),
+                                         embeds=dict(), recipients=[recp])
+
+        return res
+
+    async def verify(self, source, words):
+        json = dict(
+            words=words
+        )
+
+        res = await self.client.post(f"/challenges_verify/{source}", json=json)
+        return res.json()
+
+    async def responded(self, source, said):
+        json = dict(
+            said=said
+        )
+
+        await self.client.put(f"/challenges_verify/{source}", json=json)
+        return True
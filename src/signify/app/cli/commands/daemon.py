@@ -0,0 +1,34 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.cli.commands.daemon module
+
+"""
+import argparse
+
+parser = argparse.ArgumentParser(description='Run a sigpy daemon keeping connected clients warm for other commands')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--socket', '-s', help='Unix socket path, defaults to $SIGPY_SOCK or sigpy.sock in a per user '
+                                           'runtime directory', default=None)
+
+
+def handler(args):
+    daemon(args)
+
+
+def daemon(args):
+    """ Command line daemon handler, serves until interrupted or sent a stop request
+
+    Prints the shell command exporting the socket path for other commands, like ssh-agent.
+
+    """
+    from signify.app.daemoning import Daemon, SockEnv
+
+    server = Daemon(path=args.socket)
+    print(f"{SockEnv}={server.path}; export {SockEnv};", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
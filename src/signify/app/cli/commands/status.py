@@ -7,14 +7,7 @@ keri.kli.commands module
 import argparse
 import sys
 
-from hio.base import doing
-from keri import help
 from keri.app.cli.common import terming
-from keri.core.coring import Tiers
-
-from signify.app import clienting
-
-logger = help.ogler.getLogger()
 
 parser = argparse.ArgumentParser(description='View status of a local AID')
 parser.set_defaults(handler=lambda args: handler(args),
@@ -26,26 +19,29 @@ parser.add_argument('--passcode', '-p', help='22 character encryption passcode f
                     dest="bran", default=None)  # passcode => bran
 
 parser.add_argument("--verbose", "-V", help="print JSON of all current events", action="store_true")
+parser.add_argument('--socket', '-s', help='sigpy daemon socket to run through, defaults to $SIGPY_SOCK when set',
+                    default=None)
 
 
 def handler(args):
-    kwa = dict(args=args)
-    return [doing.doify(status, **kwa)]
+    status(args)
 
 
-def status(tymth, tock=0.0, **opts):
+def status(args):
     """ Command line status handler
 
+    Client and key libraries are imported here rather than with the module so building the parser for any command
+    stays fast.  With a sigpy daemon socket the request runs in the daemon's already connected client.
+
     """
-    _ = (yield tock)
-    args = opts["args"]
+    from signify.app import daemoning
+
     alias = args.alias
     bran = args.bran
 
     url = args.url
-    tier = Tiers.low
 
-    client = clienting.SignifyClient(passcode=bran, tier=tier, url=url)
+    client = daemoning.connect(url=url, passcode=bran, path=args.socket)
     identifiers = client.identifiers()
 
     aid = identifiers.get(alias)
@@ -4,13 +4,9 @@ keri.kli.commands module
 
 """
 import multicommand
-from keri import help
-from keri.app import directing
 
 from signify.app.cli import commands
 
-logger = help.ogler.getLogger()
-
 
 def main():
     parser = multicommand.create_parser(commands)
@@ -21,8 +17,11 @@ def main():
         return
 
     try:
+        # Commands run directly, hio doers returned by a handler are run to completion
         doers = args.handler(args)
-        directing.runController(doers=doers, expire=0.0)
+        if doers:
+            from keri.app import directing
+            directing.runController(doers=doers, expire=0.0)
 
     except Exception as ex:
         import os
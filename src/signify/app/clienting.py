@@ -4,27 +4,44 @@ Signify
 signify.app.clienting module
 
 """
-from urllib.parse import urlparse, urljoin, urlsplit
+from urllib.parse import urlparse, urljoin
 
-import requests
-import sseclient
-from keri import kering
-from keri.core.coring import Tiers
-from keri.help import helping
-from requests import HTTPError
-from requests.auth import AuthBase
-
-from signify.core import keeping, authing
+from signify.core import tracing
 from signify.signifying import SignifyState
 
 
+def __getattr__(name):
+    """ Resolves SignifyAdapter and SignifyAuth on first use so importing this module does not load requests """
+    if name in ("SignifyAdapter", "SignifyAuth"):
+        from signify.core import adapting
+        return getattr(adapting, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class SignifyClient:
     """
     An edge signing client representing a delegator AID connected to the delegated agent in a KERA
     instance.
-    """
 
-    def __init__(self, passcode, url=None, tier=Tiers.low, extern_modules=None):
+    Class Attributes:
+        Timeouts (dict): default (connect, read) timeouts in seconds per request class, one of get, post, put,
+                         delete or stream.  A read timeout of None waits forever, as needed by event streams.
+        Retries (dict): urllib3 Retry arguments of the default retry policy, only retries requests that never
+                        reached the agent
+    """
+    Timeouts = dict(
+        get=(3.05, 30.0),
+        post=(3.05, 60.0),
+        put=(3.05, 60.0),
+        delete=(3.05, 30.0),
+        stream=(3.05, None),
+    )
+    Retries = dict(total=3, connect=3, read=0, status=0, backoff_factor=0.1, raise_on_status=False)
+
+    def __init__(self, passcode, url=None, tier="low", extern_modules=None, signer_cache=None,
+                 pool_connections=10, pool_maxsize=10, keep_alive=True, timeouts=None, retries=None, adapter=None, tracer=None,
+                 state_cache=None, kel_store=None, identifier_cache=None):
         """
         Create a new SignifyClient. Connects to the KERIA instance and delegates from the local
         Signify Client AID (caid) to the KERIA Agent AID with a delegated inception event.
@@ -39,12 +56,39 @@ class SignifyClient:
             url (str): Boot interface URL of the KERIA instance to connect to
             tier (Tiers): tier of the controller (low, med, high)
             extern_modules (dict): external key management modules such as for Google KMS, Trezor, etc.
+            signer_cache (SignerCache): optional cache of derived AID signers shared by all keepers
+            pool_connections (int): number of per host connection pools to cache
+            pool_maxsize (int): maximum number of connections kept open to each host
+            keep_alive (bool): False means close the connection after every request
+            timeouts (dict): (connect, read) timeouts or single timeout in seconds per request class, merged over
+                             Timeouts
+            retries (int | Retry | dict): retry policy for failed requests or Retry arguments, defaults to Retries
+            adapter (HTTPAdapter): transport adapter mounted instead of the pooled SignifyAdapter, for example
+                                   agenting.Agency.adapter() to talk to an in-process agent
+            tracer (Tracer): records the phase latencies of every request, None means requests are not timed
+            state_cache (KeyStateCache): optional cache of key states shared by all KeyStates, None disables caching
+            kel_store (KelStore): optional local store of key events fetched by KeyEvents.sync
+            identifier_cache (IdentifierCache): optional cache of identifiers updated from the events submitted for
+                                                them, None means identifiers are read before every event
 
         Attributes:
             bran (str | bytes): 21 character passphrase for the local controller (passcode)
             pidx (int): prefix index for this keypair sequence
             tier (Tiers): tier of the controller (low, med, high)
             extern_modules (dict): external key management modules such as for Google KMS, Trezor, etc.
+            signer_cache (SignerCache): optional cache of derived AID signers shared by all keepers
+            pool_connections (int): number of per host connection pools to cache
+            pool_maxsize (int): maximum number of connections kept open to each host
+            keep_alive (bool): False means close the connection after every request
+            timeouts (dict): timeouts per request class
+            retries (int | Retry | dict): retry policy for failed requests or Retry arguments
+            adapter (HTTPAdapter): transport adapter to mount instead of SignifyAdapter, None means SignifyAdapter
+            tracer (Tracer): request phase latency recorder, None means requests are not timed
+            state_cache (KeyStateCache): cache of key states by prefix, None means key states are always fetched
+            kel_store (KelStore): local store of key events, None means KeyEvents.sync and local are not available
+            identifier_cache (IdentifierCache): cache of identifiers by name and prefix, None means identifiers are
+                                                always read
+            anchorers (dict): coalescing anchor queues by AID prefix, see anchorer
             mgr (Manager): key manager for the controller; performs signing and rotation
             session (requests.Session): HTTP session for the client
             agent (Agent): Agent representing the KERIA Agent AID
@@ -53,6 +97,9 @@ class SignifyClient:
             ctrl (Controller): Controller representing the local controller AID
         """
 
+        from keri import kering
+        from signify.core import authing
+
         if len(passcode) < 21:
             raise kering.ConfigurationError(f"bran of length {len(passcode)} is too short, must be 21 characters")
 
@@ -60,6 +107,18 @@ class SignifyClient:
         self.pidx = 0
         self.tier = tier
         self.extern_modules = extern_modules
+        self.signer_cache = signer_cache
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeouts = dict(self.Timeouts, **(timeouts if timeouts is not None else {}))
+        self.retries = retries if retries is not None else self.Retries
+        self.adapter = adapter
+        self.tracer = tracer
+        self.state_cache = state_cache
+        self.kel_store = kel_store
+        self.identifier_cache = identifier_cache
+        self.anchorers = dict()
 
         self.mgr = None
         self.session = None
@@ -71,23 +130,48 @@ class SignifyClient:
         if url is not None:
             self.connect(url)
 
-    def connect(self, url):
+    def connect(self, url, pool_connections=None, pool_maxsize=None, keep_alive=None, timeouts=None, retries=None):
+        """ Connect to the KERIA agent at url, approving the delegation of the agent if needed
+
+        The remaining parameters override those given to the constructor, see SignifyClient.
+
+        """
+        import requests
+        from keri import kering
+        from urllib3.util.retry import Retry
+        from signify.core import adapting, authing, keeping
+
         up = urlparse(url)
         if up.scheme not in kering.Schemes:
             raise kering.ConfigurationError(f"invalid scheme {up.scheme} for SignifyClient")
 
         self.base = url
+        self.configure(pool_connections=pool_connections, pool_maxsize=pool_maxsize, keep_alive=keep_alive,
+                       timeouts=timeouts, retries=retries)
 
         self.session = requests.Session()
+        adapter = self.adapter
+        if adapter is None:
+            retries = Retry(**self.retries) if isinstance(self.retries, dict) else self.retries
+            adapter = adapting.SignifyAdapter(timeouts=self.timeouts, pool_connections=self.pool_connections,
+                                              pool_maxsize=self.pool_maxsize, max_retries=retries)
+        else:  # proxy settings from the environment mean nothing to a custom transport, skip looking them up
+            self.session.trust_env = False
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not self.keep_alive:
+            self.session.headers["Connection"] = "close"
+
         state = self.states()
         self.pidx = state.pidx
 
         # Create agent representing the AID of the cloud agent
         self.agent = authing.Agent(state=state.agent)
 
-        # Create controller representing local auth AID
-        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier, state=state.controller)
-        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules)
+        # Update controller representing local auth AID, reusing the signers derived at construction
+        self.ctrl.restate(state.controller)
+        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules,
+                                   cache=self.signer_cache)
 
         if self.agent.delpre != self.ctrl.pre:
             raise kering.ConfigurationError("commitment to controller AID missing in agent inception event")
@@ -96,8 +180,21 @@ class SignifyClient:
             self.approveDelegation()
 
         self.authn = authing.Authenticater(agent=self.agent, ctrl=self.ctrl)
-        self.session.auth = SignifyAuth(self.authn)
-        self.session.hooks = dict(response=self.authn.verify)
+        self.session.auth = adapting.SignifyAuth(self.authn)
+        self.session.hooks = dict(response=self.authn.verify if self.tracer is None else self.verify)
+
+    def configure(self, pool_connections=None, pool_maxsize=None, keep_alive=None, timeouts=None, retries=None):
+        """ Update HTTP connection options, None leaves the current value.  Takes effect on the next connect """
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+        if timeouts is not None:
+            self.timeouts = dict(self.timeouts, **timeouts)
+        if retries is not None:
+            self.retries = retries
 
     def approveDelegation(self):
         serder, sigs = self.ctrl.approveDelegation(self.agent)
@@ -124,9 +221,30 @@ class SignifyClient:
     def manager(self):
         return self.mgr
 
+    def trace(self, method, path):
+        """ Returns the context manager timing a request of method to path, a shared null context when untraced """
+        if self.tracer is None:
+            return tracing.Untraced
+
+        return self.tracer.span(method, path)
+
+    def verify(self, rep, **kwargs):
+        """ requests response hook of traced clients verifying the agent signature and timing the verification """
+        span = tracing.current()
+        if span is None:
+            return self.authn.verify(rep, **kwargs)
+
+        span.mark("send")
+        span.respond(rep)
+        self.authn.verify(rep, **kwargs)
+        span.mark("verify")
+
     def states(self):
+        from keri import kering
+
         caid = self.ctrl.pre
-        res = self.session.get(url=urljoin(self.base, f"/agent/{caid}"))
+        with self.trace("GET", f"/agent/{caid}"):
+            res = self.session.get(url=urljoin(self.base, f"/agent/{caid}"))
         if res.status_code == 404:
             raise kering.ConfigurationError(f"agent does not exist for controller {caid}")
 
@@ -135,6 +253,7 @@ class SignifyClient:
         state.controller = data["controller"]
         state.agent = data["agent"]
         state.pidx = data["pidx"] if "pidx" in data else 0
+        state.sxlt = data.get("sxlt")
 
         return state
 
@@ -149,7 +268,9 @@ class SignifyClient:
         res = self.delete(f"/salt/{caid}")
         return res.status_code == 204
 
-    def get(self, path, params=None, headers=None, body=None):
+    def get(self, path, params=None, headers=None, body=None, stream=False):
+        """ GET path, stream True returns once the headers are verified leaving the body to be read with
+        iter_content and the response to be closed by the caller """
         url = urljoin(self.base, path)
 
         kwargs = dict()
@@ -162,7 +283,12 @@ class SignifyClient:
         if body is not None:
             kwargs["json"] = body
 
-        res = self.session.get(url, **kwargs)
+        if stream:
+            # downloads keep the read timeout of get rather than the unbounded one of event streams
+            kwargs.update(stream=True, timeout=self.timeouts.get("get"))
+
+        with self.trace("GET", path):
+            res = self.session.get(url, **kwargs)
         if not res.ok:
             self.raiseForStatus(res)
 
@@ -181,21 +307,26 @@ class SignifyClient:
         if body is not None:
             kwargs["json"] = body
 
+        import sseclient
         client = sseclient.SSEClient(url, session=self.session, **kwargs)
         for event in client:
             yield event
 
-    def delete(self, path, params=None, headers=None):
+    def delete(self, path, params=None, headers=None, json=None):
         url = urljoin(self.base, path)
 
         kwargs = dict()
         if params is not None:
             kwargs["params"] = params
 
+        if json is not None:
+            kwargs["json"] = json
+
         if headers is not None:
             kwargs["headers"] = headers
 
-        res = self.session.delete(url, **kwargs)
+        with self.trace("DELETE", path):
+            res = self.session.delete(url, **kwargs)
         if not res.ok:
             self.raiseForStatus(res)
 
@@ -211,7 +342,8 @@ class SignifyClient:
         if headers is not None:
             kwargs["headers"] = headers
 
-        res = self.session.post(url, **kwargs)
+        with self.trace("POST", path):
+            res = self.session.post(url, **kwargs)
         if not res.ok:
             self.raiseForStatus(res)
 
@@ -227,7 +359,8 @@ class SignifyClient:
         if headers is not None:
             kwargs["headers"] = headers
 
-        res = self.session.put(url, **kwargs)
+        with self.trace("PUT", path):
+            res = self.session.put(url, **kwargs)
         if not res.ok:
             self.raiseForStatus(res)
 
@@ -293,8 +426,22 @@ class SignifyClient:
         from signify.app.contacting import Contacts
         return Contacts(client=self)
 
+    def passcodes(self):
+        from signify.app.passcoding import Passcodes
+        return Passcodes(client=self)
+
+    def anchorer(self, hab, window=0.01, size=64, workers=8):
+        """ Returns the coalescing anchor queue of the AID of hab, created with window, size and workers on first
+        use """
+        if hab["prefix"] not in self.anchorers:
+            from signify.app.anchoring import Anchorer
+            self.anchorers[hab["prefix"]] = Anchorer(client=self, hab=hab, window=window, size=size, workers=workers)
+        return self.anchorers[hab["prefix"]]
+
     @staticmethod
     def raiseForStatus(res):
+        from requests import HTTPError
+
         try:
             body = res.json()
 
@@ -320,26 +467,403 @@ class SignifyClient:
         raise HTTPError(http_error_msg, response=res)
 
 
-class SignifyAuth(AuthBase):
+class AsyncSignifyClient(SignifyClient):
+    """
+    An asyncio edge signing client representing a delegator AID connected to the delegated agent in a KERIA
+    instance.  Requests are sent with an httpx.AsyncClient so many agent calls can share one event loop.  Requests
+    are signed and responses verified exactly as with SignifyClient.
+
+    Construction does not connect, use ``await client.connect(url)`` or ``async with client.connected(url)``.
+    Domain objects returned from this client expose the same methods as their synchronous counterparts as
+    coroutines.  Key derivation and event signing are run in worker threads so they do not stall the event loop.
+
+    """
+
+    def __init__(self, passcode, url=None, tier="low", extern_modules=None, signer_cache=None,
+                 pool_connections=10, pool_maxsize=10, keep_alive=True, timeouts=None, retries=None, adapter=None, tracer=None,
+                 state_cache=None, kel_store=None, identifier_cache=None):
+        """
+        Create a new AsyncSignifyClient.  See SignifyClient for parameters.  When url is provided it is only
+        recorded and used by connect() when called without a url.  adapter is an httpx async transport used
+        instead of the pooled httpx.AsyncHTTPTransport, for example agenting.Agency.transport().
+
+        """
+        super(AsyncSignifyClient, self).__init__(passcode=passcode, url=None, tier=tier,
+                                                 extern_modules=extern_modules, signer_cache=signer_cache,
+                                                 pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                                 keep_alive=keep_alive, timeouts=timeouts, retries=retries,
+                                                 adapter=adapter, tracer=tracer, state_cache=state_cache,
+                                                 kel_store=kel_store, identifier_cache=identifier_cache)
+        self.url = url
+
+    async def connect(self, url=None, pool_connections=None, pool_maxsize=None, keep_alive=None, timeouts=None,
+                      retries=None):
+        from keri import kering
+        from urllib3.util.retry import Retry
+        from signify.core import authing, keeping
+
+        try:
+            import httpx
+        except ImportError:
+            raise kering.ConfigurationError("httpx is required for AsyncSignifyClient, install signifypy[async]")
+
+        url = url if url is not None else self.url
+        up = urlparse(url)
+        if up.scheme not in kering.Schemes:
+            raise kering.ConfigurationError(f"invalid scheme {up.scheme} for SignifyClient")
+
+        self.base = url
+        self.configure(pool_connections=pool_connections, pool_maxsize=pool_maxsize, keep_alive=keep_alive,
+                       timeouts=timeouts, retries=retries)
+
+        if self.session is not None:
+            await self.session.aclose()
+
+        # httpx pools per client rather than per host and only retries failed connects
+        if isinstance(self.retries, dict):
+            retries = self.retries.get("connect")
+        elif isinstance(self.retries, Retry):
+            retries = self.retries.connect
+        else:
+            retries = self.retries
+        limits = httpx.Limits(max_connections=self.pool_connections * self.pool_maxsize,
+                              max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0)
+        transport = self.adapter
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(limits=limits, retries=retries or 0)
+        self.session = httpx.AsyncClient(transport=transport, timeout=self.timeout("get"))
+        state = await self.states()
+        self.pidx = state.pidx
+
+        # Create agent representing the AID of the cloud agent
+        self.agent = authing.Agent(state=state.agent)
+
+        # Update controller representing local auth AID, reusing the signers derived at construction
+        self.ctrl.restate(state.controller)
+        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules,
+                                   cache=self.signer_cache)
+
+        if self.agent.delpre != self.ctrl.pre:
+            raise kering.ConfigurationError("commitment to controller AID missing in agent inception event")
+
+        if self.ctrl.serder.sn == 0:
+            await self.approveDelegation()
+
+        self.authn = authing.Authenticater(agent=self.agent, ctrl=self.ctrl)
+        self.session.auth = AsyncSignifyAuth(self.authn)
+        self.session.event_hooks = dict(response=[self.verify])
+
+    def timeout(self, rclass):
+        """ httpx.Timeout for request class rclass from the configured timeouts """
+        import httpx
+
+        timeout = self.timeouts.get(rclass)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+
+        return httpx.Timeout(timeout)
+
+    def connected(self, url=None):
+        """ Async context manager that connects on entry and closes the HTTP session on exit """
+        return _Connection(self, url)
+
+    async def close(self):
+        """ Close the underlying HTTP session and release pooled connections """
+        if self.session is not None:
+            await self.session.aclose()
+            self.session = None
+
+    async def verify(self, rep):
+        """ httpx response hook verifying the agent signature on every response """
+        span = tracing.current()
+        if span is None:
+            self.authn.verify(rep)
+            return
+
+        span.mark("send")
+        span.respond(rep)
+        self.authn.verify(rep)
+        span.mark("verify")
+
+    async def approveDelegation(self):
+        serder, sigs = self.ctrl.approveDelegation(self.agent)
+        data = dict(ixn=serder.ked, sigs=sigs)
+        await self.put(path=f"/agent/{self.controller}?type=ixn", json=data)
+
+    async def rotate(self, nbran, aids):
+        import asyncio
+        data = await asyncio.to_thread(self.ctrl.rotate, nbran=nbran, aids=aids)
+        await self.put(path=f"/agent/{self.controller}", json=data)
+
+    async def states(self):
+        from keri import kering
+
+        caid = self.ctrl.pre
+        with self.trace("GET", f"/agent/{caid}"):
+            res = await self.session.get(url=urljoin(self.base, f"/agent/{caid}"))
+        if res.status_code == 404:
+            raise kering.ConfigurationError(f"agent does not exist for controller {caid}")
+
+        data = res.json()
+        state = SignifyState()
+        state.controller = data["controller"]
+        state.agent = data["agent"]
+        state.pidx = data["pidx"] if "pidx" in data else 0
+        state.sxlt = data.get("sxlt")
+
+        return state
+
+    async def _save_old_salt(self, salt):
+        caid = self.ctrl.pre
+        body = dict(salt=salt)
+        res = await self.put(f"/salt/{caid}", json=body)
+        return res.status_code == 204
+
+    async def _delete_old_salt(self):
+        caid = self.ctrl.pre
+        res = await self.delete(f"/salt/{caid}")
+        return res.status_code == 204
+
+    async def get(self, path, params=None, headers=None, body=None, stream=False):
+        """ GET path, stream True returns once the headers are verified leaving the body to be read with
+        aiter_bytes and the response to be closed with aclose by the caller """
+        url = urljoin(self.base, path)
+
+        kwargs = dict()
+        if params is not None:
+            kwargs["params"] = params
+
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        if body is not None:
+            kwargs["json"] = body
+
+        with self.trace("GET", path):
+            if stream:
+                req = self.session.build_request("GET", url, timeout=self.timeout("get"), **kwargs)
+                res = await self.session.send(req, stream=True)
+            else:
+                res = await self.session.request("GET", url, timeout=self.timeout("get"), **kwargs)
+        if not res.is_success:
+            if stream:
+                await res.aread()
+                await res.aclose()
+            self.raiseForStatus(res)
+
+        return res
+
+    async def stream(self, path, params=None, headers=None, body=None):
+        """ Async generator of server sent events from path, yields sseclient.Event instances """
+        import sseclient
+
+        url = urljoin(self.base, path)
+
+        kwargs = dict()
+        if params is not None:
+            kwargs["params"] = params
+
+        headers = dict(headers) if headers is not None else dict()
+        headers.setdefault("Accept", "text/event-stream")
+        headers.setdefault("Cache-Control", "no-cache")
+        kwargs["headers"] = headers
+
+        if body is not None:
+            kwargs["json"] = body
+
+        async with self.session.stream("GET", url, timeout=self.timeout("stream"), **kwargs) as res:
+            if not res.is_success:
+                await res.aread()
+                self.raiseForStatus(res)
+
+            fields = dict()
+            async for line in res.aiter_lines():
+                if line == "":
+                    if "data" in fields:
+                        yield sseclient.Event(**fields)
+                    fields = dict()
+                    continue
+
+                if line.startswith(":"):
+                    continue
+
+                name, _, value = line.partition(":")
+                if value.startswith(" "):
+                    value = value[1:]
+
+                if name == "data" and "data" in fields:
+                    fields["data"] = f"{fields['data']}\n{value}"
+                elif name in ("data", "event", "id", "retry"):
+                    fields[name] = value
+
+    async def delete(self, path, params=None, headers=None, json=None):
+        url = urljoin(self.base, path)
+
+        kwargs = dict()
+        if params is not None:
+            kwargs["params"] = params
+
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        if json is not None:
+            kwargs["json"] = json  # httpx only takes a body for DELETE through request
+
+        with self.trace("DELETE", path):
+            res = await self.session.request("DELETE", url, timeout=self.timeout("delete"), **kwargs)
+        if not res.is_success:
+            self.raiseForStatus(res)
+
+        return res
+
+    async def post(self, path, json, params=None, headers=None):
+        url = urljoin(self.base, path)
+
+        kwargs = dict(json=json)
+        if params is not None:
+            kwargs["params"] = params
+
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        with self.trace("POST", path):
+            res = await self.session.post(url, timeout=self.timeout("post"), **kwargs)
+        if not res.is_success:
+            self.raiseForStatus(res)
+
+        return res
+
+    async def put(self, path, json, params=None, headers=None):
+        url = urljoin(self.base, path)
+
+        kwargs = dict(json=json)
+        if params is not None:
+            kwargs["params"] = params
+
+        if headers is not None:
+            kwargs["headers"] = headers
+
+        with self.trace("PUT", path):
+            res = await self.session.put(url, timeout=self.timeout("put"), **kwargs)
+        if not res.is_success:
+            self.raiseForStatus(res)
+
+        return res
+
+    def identifiers(self):
+        from signify.app.aiding import AsyncIdentifiers
+        return AsyncIdentifiers(client=self)
+
+    def operations(self):
+        from signify.app.coring import AsyncOperations
+        return AsyncOperations(client=self)
+
+    def oobis(self):
+        from signify.app.coring import AsyncOobis
+        return AsyncOobis(client=self)
+
+    def credentials(self):
+        from signify.app.credentialing import AsyncCredentials
+        return AsyncCredentials(client=self)
+
+    def keyStates(self):
+        from signify.app.coring import AsyncKeyStates
+        return AsyncKeyStates(client=self)
+
+    def keyEvents(self):
+        from signify.app.coring import AsyncKeyEvents
+        return AsyncKeyEvents(client=self)
+
+    def escrows(self):
+        from signify.app.escrowing import AsyncEscrows
+        return AsyncEscrows(client=self)
+
+    def endroles(self):
+        from signify.app.ending import AsyncEndRoleAuthorizations
+        return AsyncEndRoleAuthorizations(client=self)
+
+    def notifications(self):
+        from signify.app.notifying import AsyncNotifications
+        return AsyncNotifications(client=self)
+
+    def groups(self):
+        from signify.app.grouping import AsyncGroups
+        return AsyncGroups(client=self)
+
+    def registries(self):
+        from signify.app.credentialing import AsyncRegistries
+        return AsyncRegistries(client=self)
+
+    def exchanges(self):
+        from signify.peer.exchanging import AsyncExchanges
+        return AsyncExchanges(client=self)
+
+    def ipex(self):
+        from signify.app.credentialing import AsyncIpex
+        return AsyncIpex(client=self)
+
+    def challenges(self):
+        from signify.app.challenging import AsyncChallenges
+        return AsyncChallenges(client=self)
+
+    def contacts(self):
+        from signify.app.contacting import AsyncContacts
+        return AsyncContacts(client=self)
+
+    def passcodes(self):
+        from signify.app.passcoding import AsyncPasscodes
+        return AsyncPasscodes(client=self)
+
+    def anchorer(self, hab, window=0.01, size=64, workers=8):
+        if hab["prefix"] not in self.anchorers:
+            from signify.app.anchoring import AsyncAnchorer
+            self.anchorers[hab["prefix"]] = AsyncAnchorer(client=self, hab=hab, window=window, size=size,
+                                                          workers=workers)
+        return self.anchorers[hab["prefix"]]
+
+
+class _Connection:
+    """ Async context manager returned by AsyncSignifyClient.connected """
+
+    def __init__(self, client, url):
+        self.client = client
+        self.url = url
+
+    async def __aenter__(self):
+        await self.client.connect(self.url)
+        return self.client
+
+    async def __aexit__(self, *exc):
+        await self.client.close()
+
+
+class AsyncSignifyAuth:
+    """ httpx request auth callable adding Signify request signature headers """
 
     def __init__(self, authn):
         """
 
         Args:
-            authn(Authenticater): Provides request signing for AuthBase
+            authn(Authenticater): Provides request signing for httpx requests
         """
 
         self.authn = authn
 
     def __call__(self, req):
+        from keri.help import helping
+
+        span = tracing.current()
+        if span is not None:
+            span.mark("serialize")
+
         headers = req.headers
         headers['Signify-Resource'] = self.authn.ctrl.pre
         headers['Signify-Timestamp'] = helping.nowIso8601()
 
-        if "Content-Length" not in headers and req.body:
-            headers["Content-Length"] = len(req.body)
+        path = req.url.path if req.url.path else "/"
+        self.authn.sign(headers, req.method, path)
 
-        p = urlsplit(req.url)
-        path = p.path if p.path else "/"
-        req.headers = self.authn.sign(headers, req.method, path)
+        if span is not None:
+            span.mark("sign")
         return req
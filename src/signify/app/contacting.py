@@ -32,3 +32,13 @@ class Contacts:
         contacts = res.json()
         return dict(start=0, end=len(contacts), total=len(contacts), contacts=contacts)
 
+
+class AsyncContacts(Contacts):
+    """ Asyncio domain class for accessing contacts, see Contacts for parameters and results """
+
+    async def list(self, start=0, end=24):
+        headers = dict(Range=f"contacts={start}-{end}")
+        res = await self.client.get("/contacts", headers=headers)
+
+        contacts = res.json()
+        return dict(start=0, end=len(contacts), total=len(contacts), contacts=contacts)
@@ -4,11 +4,30 @@ SIGNIFY
 signify.app.coring module
 
 """
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from keri import kering
+
 from signify.app.clienting import SignifyClient
 
 
 class Operations:
-    """ Domain class for accessing long running operations"""
+    """ Domain class for accessing long running operations
+
+    Class Attributes:
+        Interval (float): seconds to wait before the first poll of a pending operation
+        MaxInterval (float): upper bound in seconds on the wait between polls
+        Backoff (float): multiplier applied to the wait after each poll that finds the operation pending
+        Workers (int): maximum number of operations polled concurrently by wait_all
+
+    """
+    Interval = 0.05
+    MaxInterval = 2.0
+    Backoff = 2.0
+    Workers = 8
 
     def __init__(self, client: SignifyClient):
         self.client = client
@@ -17,6 +36,91 @@ class Operations:
         res = self.client.get(f"/operations/{name}")
         return res.json()
 
+    def wait(self, op, timeout=None, interval=None, maxInterval=None):
+        """ Poll a long running operation until it is done
+
+        Polls back off exponentially with jitter starting at interval seconds up to maxInterval seconds, so
+        fast operations return within milliseconds without hammering the agent for slow ones.
+
+        Parameters:
+            op (dict): operation as returned by the agent, returned unchanged if already done
+            timeout (float): seconds to wait before giving up, None waits forever
+            interval (float): seconds before the first poll, defaults to Interval
+            maxInterval (float): maximum seconds between polls, defaults to MaxInterval
+
+        Returns:
+            dict: the completed operation
+
+        Raises:
+            TimeoutError: when the operation is not done before timeout expires
+
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        return self._poll(op, deadline, interval, maxInterval)
+
+    def wait_all(self, ops, timeout=None, interval=None, maxInterval=None):
+        """ Poll many long running operations concurrently until they are all done
+
+        Each pending operation is polled on its own backoff schedule and stops being polled as soon as the agent
+        reports it done.  The deadline is shared by all operations.
+
+        Parameters:
+            ops (list): operations as returned by the agent
+            timeout (float): seconds to wait for all operations, None waits forever
+            interval (float): seconds before the first poll, defaults to Interval
+            maxInterval (float): maximum seconds between polls, defaults to MaxInterval
+
+        Returns:
+            list: completed operations in the same order as ops
+
+        Raises:
+            TimeoutError: when any operation is not done before timeout expires
+
+        """
+        ops = list(ops)
+        pending = [idx for idx, op in enumerate(ops) if not op["done"]]
+        if not pending:
+            return ops
+
+        from concurrent import futures
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with futures.ThreadPoolExecutor(max_workers=min(len(pending), self.Workers)) as pool:
+            waits = {pool.submit(self._poll, ops[idx], deadline, interval, maxInterval): idx for idx in pending}
+            for fut in futures.as_completed(waits):
+                ops[waits[fut]] = fut.result()
+
+        return ops
+
+    def _poll(self, op, deadline, interval, maxInterval):
+        interval = interval if interval is not None else self.Interval
+        maxInterval = maxInterval if maxInterval is not None else self.MaxInterval
+
+        delay = interval
+        while not op["done"]:
+            time.sleep(self.pause(op, delay, deadline))
+            op = self.get(op["name"])
+            delay = min(delay * self.Backoff, maxInterval)
+
+        return op
+
+    @staticmethod
+    def pause(op, delay, deadline=None):
+        """ Jittered pause in seconds before the next poll of op, clipped to the deadline
+
+        Raises:
+            TimeoutError: when the deadline has already passed
+
+        """
+        pause = random.uniform(delay / 2, delay)
+        if deadline is not None:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f"operation {op['name']} not done before deadline")
+            pause = min(pause, left)
+
+        return pause
+
 
 class Oobis:
     """ Domain class for accessing OOBIs"""
@@ -41,22 +145,185 @@ class Oobis:
         return res.json()
 
 
+class KeyStateCache:
+    """
+    Bounded LRU cache of key states keyed by prefix, so repeated lookups of the same counterparties are answered
+    without a round trip to the agent.  Entries expire after ttl seconds.  A state never replaces a cached state of
+    a later sequence number, so slow concurrent fetches cannot roll the cache back, and invalidating with the
+    sequence number of a newly learned event only drops states that predate it.
+
+    """
+
+    def __init__(self, size=1024, ttl=60.0):
+        """ Create a key state cache
+
+        Parameters:
+            size (int): maximum number of cached states, least recently used states are evicted first
+            ttl (float): number of seconds a cached state remains valid after it is added
+
+        """
+        if size < 1:
+            raise ValueError(f"invalid key state cache size={size}, must be at least 1")
+
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, pre, sn=None):
+        """ Return the cached key state of pre or None if not present, expired or before sequence number sn
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): lowest acceptable sequence number of the state, None accepts any
+
+        Returns:
+            dict: key state of pre or None
+
+        """
+        with self._lock:
+            entry = self._entries.get(pre)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, state = entry
+            if expires <= time.monotonic():
+                del self._entries[pre]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            if sn is not None and int(state["s"], 16) < sn:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(pre)
+            self.hits += 1
+            return state
+
+    def put(self, state):
+        """ Add key state to the cache unless a state of a later sequence number is already cached
+
+        Parameters:
+            state (dict): key state as returned by the agent
+
+        """
+        pre = state["i"]
+        with self._lock:
+            entry = self._entries.get(pre)
+            if entry is not None and int(entry[1]["s"], 16) > int(state["s"], 16):
+                return
+
+            self._entries[pre] = (time.monotonic() + self.ttl, state)
+            self._entries.move_to_end(pre)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, pre, sn=None):
+        """ Remove the cached key state of pre, only if it is before sequence number sn when sn is provided
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): sequence number of an event known to exist, None removes the state unconditionally
+
+        """
+        with self._lock:
+            entry = self._entries.get(pre)
+            if entry is not None and (sn is None or int(entry[1]["s"], 16) < sn):
+                del self._entries[pre]
+
+    def clear(self):
+        """ Remove all cached states """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """ Get cache statistics
+
+        Returns:
+            dict: size, hits, misses and evictions of this cache
+
+        """
+        with self._lock:
+            return dict(size=len(self._entries), hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+
 class KeyStates:
-    """ Domain class for accessing KeyStates"""
+    """ Domain class for accessing KeyStates
+
+    Class Attributes:
+        MaxQuery (int): maximum length of the query string of one states request, larger prefix lists are split
+        Workers (int): maximum number of states requests sent concurrently by list
+
+    """
+    MaxQuery = 2048
+    Workers = 8
 
     def __init__(self, client: SignifyClient):
         self.client = client
+        self.cache = getattr(client, "state_cache", None)
 
     def get(self, pre):
+        if self.cache is not None:
+            state = self.cache.get(pre)
+            if state is not None:
+                return [state]
+
         res = self.client.get(f"/states?pre={pre}")
-        return res.json()
+        return self.remember(res.json())
 
     def list(self, pres):
+        """ Get the key states of many prefixes
+
+        Cached states are returned without asking the agent.  The remaining prefixes are split into requests whose
+        query strings stay under MaxQuery characters, which are sent concurrently.
+
+        Parameters:
+            pres (list): qb64 identifier prefixes
+
+        Returns:
+            list: key states in the order of pres, unknown prefixes are left out
+
+        """
+        pres = list(dict.fromkeys(pres))
+        states, missing = self.cached(pres)
+
+        chunks = self.chunk(missing)
+        if len(chunks) == 1 and not states:
+            return self.fetch(chunks[0])
+
+        if len(chunks) == 1:
+            self.found(states, self.fetch(chunks[0]))
+        elif chunks:
+            from concurrent import futures
+
+            with futures.ThreadPoolExecutor(max_workers=min(len(chunks), self.Workers)) as pool:
+                for found in pool.map(self.fetch, chunks):
+                    self.found(states, found)
+
+        return [states[pre] for pre in pres if pre in states]
+
+    def fetch(self, pres):
         args = "&".join([f"pre={pre}" for pre in pres])
         res = self.client.get(f"/states?{args}")
-        return res.json()
+        return self.remember(res.json())
 
     def query(self, pre, sn=None, anchor=None):
+        """ Ask the agent to query witnesses for the KEL of pre, up to sn or the event with anchor
+
+        Cached states of pre before sn, or any cached state of pre when sn is not given, are dropped and the new
+        state of a query completed immediately is cached.
+
+        """
         json = dict(
             pre=pre
         )
@@ -67,8 +334,55 @@ class KeyStates:
         if anchor is not None:
             json["anchor"] = anchor
 
+        if self.cache is not None:
+            self.cache.invalidate(pre, sn=sn)
+
         res = self.client.post(f"/queries", json=json)
-        return res.json()
+        return self.learn(res.json())
+
+    def cached(self, pres):
+        """ Returns (states, missing) of the cached states by prefix and the prefixes not cached """
+        if self.cache is None:
+            return dict(), pres
+
+        states = dict()
+        for pre in pres:
+            state = self.cache.get(pre)
+            if state is not None:
+                states[pre] = state
+
+        return states, [pre for pre in pres if pre not in states]
+
+    def chunk(self, pres):
+        """ Returns pres split into lists whose states query strings are at most MaxQuery characters """
+        chunks, chunk, size = [], [], 0
+        for pre in pres:
+            if chunk and size + len(pre) + 5 > self.MaxQuery:
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(pre)
+            size += len(pre) + 5  # pre= and &
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def found(states, found):
+        for state in found:
+            states.setdefault(state["i"], state)
+
+    def remember(self, states):
+        if self.cache is not None:
+            for state in states:
+                self.cache.put(state)
+        return states
+
+    def learn(self, op):
+        if self.cache is not None and op.get("done") and isinstance(op.get("response"), dict) \
+                and "i" in op["response"]:
+            self.cache.put(op["response"])
+        return op
 
 
 class KeyEvents:
@@ -76,10 +390,210 @@ class KeyEvents:
 
     def __init__(self, client: SignifyClient):
         self.client = client
+        self.store = getattr(client, "kel_store", None)
 
-    def get(self, pre):
+    def get(self, pre, sn=None):
+        """ Get the key event log of pre, only its events from sequence number sn on when sn is provided
+
+        KERIA has no way to fetch part of a log, /events always returns the full log of pre.  With sn the full log
+        is still downloaded and only trimmed here, so sn saves no bandwidth.
+
+        """
         res = self.client.get(f"/events?pre={pre}")
+        return res.json() if sn is None else self.since(res.json(), sn)
+
+    def sync(self, pre):
+        """ Bring the local store up to date with the key event log of pre held by the agent
+
+        The key state of pre, always read from the agent even with a state cache, tells whether any events are
+        new, so an up to date log costs one states request.  Otherwise the full log is downloaded, see get, and only
+        the events after the stored ones are kept.  When the agent log no longer extends the stored one, as after a
+        recovery rotation, the stored log of pre is replaced.
+
+        Returns:
+            list: events of pre fetched and stored by this sync
+
+        """
+        store = self.local_store()
+        states = KeyStates(client=self.client).fetch([pre])  # never a cached state, it may miss new events
+        if not states:
+            return []
+
+        last = store.last(pre)
+        sn = self.plan(last, states[0])
+        if sn is None:
+            return []
+
+        return self.save(pre, self.select(last, self.get(pre), sn))
+
+    def local(self, pre, sn=0):
+        """ Returns the events of pre from sequence number sn on held in the local store, without asking the agent """
+        return self.local_store().events(pre, sn=sn)
+
+    def local_store(self):
+        if self.store is None:
+            raise kering.ConfigurationError("no local key event store, create the client with a kel_store")
+        return self.store
+
+    @staticmethod
+    def ked(event):
+        """ Returns the key event dict of event, agents return bare events or {"ked", "atc"} maps """
+        return event["ked"] if "ked" in event else event
+
+    @classmethod
+    def since(cls, events, sn):
+        return [event for event in events if int(cls.ked(event)["s"], 16) >= sn]
+
+    @classmethod
+    def plan(cls, last, state):
+        """ Returns the sequence number to fetch events from, 0 for the whole log or None when up to date """
+        if last is None:
+            return 0
+
+        last = cls.ked(last)
+        sn, lsn = int(state["s"], 16), int(last["s"], 16)
+        if sn == lsn and state["d"] == last["d"]:
+            return None
+
+        return lsn + 1 if sn > lsn else 0
+
+    @classmethod
+    def select(cls, last, kel, sn):
+        """ Returns the events of the full log kel from sn on, or all of kel when those do not follow last """
+        events = cls.since(kel, sn)
+        return events if cls.follows(last, events) else kel
+
+    @classmethod
+    def follows(cls, last, events):
+        """ Returns True when events are a whole log or start with the event following last """
+        if last is None or not events:
+            return True
+
+        first = cls.ked(events[0])
+        return first["s"] == "0" or first.get("p") == cls.ked(last)["d"]
+
+    def save(self, pre, events):
+        if events and self.ked(events[0])["s"] == "0":
+            self.store.remove(pre)
+
+        self.store.put(pre, events)
+        return events
+
+
+class AsyncOperations(Operations):
+    """ Asyncio domain class for accessing long running operations"""
+
+    async def get(self, name):
+        res = await self.client.get(f"/operations/{name}")
+        return res.json()
+
+    async def wait(self, op, timeout=None, interval=None, maxInterval=None):
+        """ Poll a long running operation until it is done, see Operations.wait """
+        import asyncio
+
+        interval = interval if interval is not None else self.Interval
+        maxInterval = maxInterval if maxInterval is not None else self.MaxInterval
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        delay = interval
+        while not op["done"]:
+            await asyncio.sleep(self.pause(op, delay, deadline))
+            op = await self.get(op["name"])
+            delay = min(delay * self.Backoff, maxInterval)
+
+        return op
+
+    async def wait_all(self, ops, timeout=None, interval=None, maxInterval=None):
+        """ Poll many long running operations concurrently until they are all done, see Operations.wait_all """
+        import asyncio
+
+        return list(await asyncio.gather(*[self.wait(op, timeout, interval, maxInterval) for op in ops]))
+
+
+class AsyncOobis(Oobis):
+    """ Asyncio domain class for accessing OOBIs"""
+
+    async def get(self, name, role="agent"):
+        res = await self.client.get(f"/identifiers/{name}/oobis?role={role}")
         return res.json()
 
+    async def resolve(self, oobi, alias=None):
+
+        json = dict(
+            url=oobi
+        )
+
+        if alias is not None:
+            json["oobialias"] = alias
+
+        res = await self.client.post("/oobis", json=json)
+        return res.json()
+
+
+class AsyncKeyStates(KeyStates):
+    """ Asyncio domain class for accessing KeyStates"""
+
+    async def get(self, pre):
+        if self.cache is not None:
+            state = self.cache.get(pre)
+            if state is not None:
+                return [state]
+
+        res = await self.client.get(f"/states?pre={pre}")
+        return self.remember(res.json())
+
+    async def list(self, pres):
+        """ Get the key states of many prefixes, see KeyStates.list """
+        import asyncio
+
+        pres = list(dict.fromkeys(pres))
+        states, missing = self.cached(pres)
+
+        for found in await asyncio.gather(*[self.fetch(chunk) for chunk in self.chunk(missing)]):
+            self.found(states, found)
+
+        return [states[pre] for pre in pres if pre in states]
+
+    async def fetch(self, pres):
+        args = "&".join([f"pre={pre}" for pre in pres])
+        res = await self.client.get(f"/states?{args}")
+        return self.remember(res.json())
+
+    async def query(self, pre, sn=None, anchor=None):
+        json = dict(
+            pre=pre
+        )
+
+        if sn is not None:
+            json["sn"] = sn
+
+        if anchor is not None:
+            json["anchor"] = anchor
+
+        if self.cache is not None:
+            self.cache.invalidate(pre, sn=sn)
+
+        res = await self.client.post("/queries", json=json)
+        return self.learn(res.json())
+
+
+class AsyncKeyEvents(KeyEvents):
+    """ Asyncio domain class for accessing KeyEvents"""
+
+    async def get(self, pre, sn=None):
+        res = await self.client.get(f"/events?pre={pre}")
+        return res.json() if sn is None else self.since(res.json(), sn)
+
+    async def sync(self, pre):
+        """ Bring the local store up to date with the key event log of pre held by the agent, see KeyEvents.sync """
+        store = self.local_store()
+        states = await AsyncKeyStates(client=self.client).fetch([pre])
+        if not states:
+            return []
 
+        last = store.last(pre)
+        sn = self.plan(last, states[0])
+        if sn is None:
+            return []
 
+        return self.save(pre, self.select(last, await self.get(pre), sn))
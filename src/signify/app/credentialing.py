@@ -4,8 +4,15 @@ SIGNIFY
 signify.app.credentialing module
 
 """
+import contextlib
+import functools
+import os
+import threading
+import time
 from collections import namedtuple
 
+import requests
+from keri import kering
 from keri.core import coring, counting
 from keri.core.eventing import TraitDex, interact
 from keri.help import helping
@@ -13,11 +20,18 @@ from keri.vc import proving
 from keri.vdr import eventing
 
 from signify.app.clienting import SignifyClient
+from signify.core import httping
 
 CredentialTypeage = namedtuple("CredentialTypeage", 'issued received')
 
 CredentialTypes = CredentialTypeage(issued='issued', received='received')
 
+# Outcome of one credential of Credentials.create_many, result is the create tuple or None when error was raised
+Issuage = namedtuple("Issuage", "index result error")
+
+# Outcome of one credential of Credentials.revoke_many, result is the revoke tuple or None when error was raised
+Revokage = namedtuple("Revokage", "said result error")
+
 
 class Registries:
 
@@ -34,41 +48,80 @@ class Registries:
         res = self.client.get(f"/identifiers/{name}/registries/{registryName}")
         return res.json()
 
-    def create(self, hab, registryName, noBackers=True, estOnly=False, baks=None, toad=0, nonce=None):
-        baks = baks if baks is not None else []
+    def create(self, hab, registryName, noBackers=True, estOnly=False, baks=None, toad=0, nonce=None,
+               anchorer=None):
+        """ Create and submit a registry, anchored by its own interaction event or by a shared one of anchorer """
+        if anchorer is not None:
+            regser = self.makeInception(hab, noBackers=noBackers, estOnly=estOnly, baks=baks, toad=toad, nonce=nonce)
+            serder, sigs, op = anchorer.anchor(self.seal(regser), functools.partial(self.submitInception, hab,
+                                                                                    registryName, regser))
+            return regser, serder, sigs, op
 
-        pre = hab["prefix"]
+        regser, serder, sigs = self.makeRegistry(hab, noBackers=noBackers, estOnly=estOnly, baks=baks, toad=toad,
+                                                 nonce=nonce)
 
-        cnfg = []
-        if noBackers:
-            cnfg.append(TraitDex.NoRegistrarBackers)
-        if estOnly:
-            cnfg.append(TraitDex.EstOnly)
+        op = self.create_from_events(hab=hab, registryName=registryName, vcp=regser.ked, ixn=serder.ked, sigs=sigs)
 
-        regser = eventing.incept(pre,
-                                 baks=baks,
-                                 toad=toad,
-                                 nonce=nonce,
-                                 cnfg=cnfg,
-                                 code=coring.MtrDex.Blake3_256)
+        return regser, serder, sigs, op
+
+    def submitInception(self, hab, registryName, regser, ixn, sigs):
+        return self.create_from_events(hab=hab, registryName=registryName, vcp=regser.ked, ixn=ixn.ked, sigs=sigs)
+
+    def makeRegistry(self, hab, noBackers=True, estOnly=False, baks=None, toad=0, nonce=None):
+        """ Create registry inception event and the signed anchoring interaction event without sending them
+
+        Returns:
+            (regser, serder, sigs): tuple of vcp event, anchoring ixn event and signatures over the ixn
+
+        """
+        regser = self.makeInception(hab, noBackers=noBackers, estOnly=estOnly, baks=baks, toad=toad, nonce=nonce)
 
         state = hab["state"]
         sn = int(state["s"], 16)
         dig = state["d"]
 
-        rseal = dict(i=regser.pre, s="0", d=regser.pre)
-        data = [rseal]
+        data = [self.seal(regser)]
 
-        serder = interact(pre, sn=sn + 1, data=data, dig=dig)
+        serder = interact(hab["prefix"], sn=sn + 1, data=data, dig=dig)
 
         keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=serder.raw)
 
-        op = self.create_from_events(hab=hab, registryName=registryName, vcp=regser.ked, ixn=serder.ked, sigs=sigs)
+        return regser, serder, sigs
 
-        return regser, serder, sigs, op
+    @staticmethod
+    def makeInception(hab, noBackers=True, estOnly=False, baks=None, toad=0, nonce=None):
+        """ Returns the registry inception event for the AID of hab """
+        baks = baks if baks is not None else []
+
+        pre = hab["prefix"]
+
+        cnfg = []
+        if noBackers:
+            cnfg.append(TraitDex.NoRegistrarBackers)
+        if estOnly:
+            cnfg.append(TraitDex.EstOnly)
+
+        return eventing.incept(pre,
+                               baks=baks,
+                               toad=toad,
+                               nonce=nonce,
+                               cnfg=cnfg,
+                               code=coring.MtrDex.Blake3_256)
+
+    @staticmethod
+    def seal(regser):
+        """ Returns the seal anchoring registry inception event regser """
+        return dict(i=regser.pre, s="0", d=regser.pre)
 
     def create_from_events(self, hab, registryName, vcp, ixn, sigs):
+        name = hab["name"]
+        body = self.registryBody(hab, registryName, vcp, ixn, sigs)
+
+        resp = self.client.post(path=f"/identifiers/{name}/registries", json=body)
+        return resp.json()
+
+    def registryBody(self, hab, registryName, vcp, ixn, sigs):
         body = dict(
             name=registryName,
             vcp=vcp,
@@ -77,10 +130,8 @@ class Registries:
         )
         keeper = self.client.manager.get(aid=hab)
         body[keeper.algo] = keeper.params()
-        name = hab["name"]
 
-        resp = self.client.post(path=f"/identifiers/{name}/registries", json=body)
-        return resp.json()
+        return body
 
     @staticmethod
     def serialize(serder, anc):
@@ -110,6 +161,129 @@ class Registries:
         return resp.json()
 
 
+class RegistryTracker:
+    """ Local state of a credential registry shared by pipelined issuances and revocations
+
+    The issuances and revocations of a registry with backers seal its latest management event (vcp or vrt), which
+    issuances and revocations leave unchanged, so one read of the registry serves any number of them.  The state is
+    advanced locally from the events the tracker is given and reconciled with the agent when an event built from it
+    is rejected, as happens after the backers were rotated elsewhere, and once a pipeline of events completes.
+
+        tracker = RegistryTracker(client, hab, client.registries().get("aid1", "reg"))
+        for issuage in client.credentials().create_many(hab, tracker, items, schema=schema):
+            ...
+
+    """
+
+    def __init__(self, client: SignifyClient, hab, registry):
+        """ Track registry from its state as read from the agent
+
+        Parameters:
+            client (SignifyClient): client used to read the registry again
+            hab (dict): identifier of the issuer as returned by Identifiers.get
+            registry (dict): registry as returned by Registries.get
+
+        """
+        self.client = client
+        self.hab = hab
+        self.registry = registry
+        self.events = 0
+        self.reads = 0
+        self.lock = threading.Lock()
+
+    @property
+    def regk(self):
+        return self.registry["regk"]
+
+    @property
+    def backers(self):
+        """ True when the events of the registry seal its latest management event """
+        cnfg = self.registry["state"]["c"]
+        return not (TraitDex.NoRegistrarBackers in cnfg or "NB" in cnfg)
+
+    def advance(self, serder):
+        """ Advance the local state past TEL event serder of the registry once the agent accepted it """
+        with self.lock:
+            self.events += 1
+            state = self.registry["state"]
+            if serder.ilk in (coring.Ilks.vcp, coring.Ilks.vrt) and int(serder.ked["s"], 16) > int(state["s"], 16):
+                state = dict(state, s=serder.ked["s"], d=serder.said, et=serder.ilk)
+                self.registry = dict(self.registry, state=state)
+
+    def stale(self, registry):
+        """ Returns True when the local state moved on from the state of registry """
+        return registry["state"]["d"] != self.registry["state"]["d"]
+
+    def reconcile(self, registry=None):
+        """ Read the registry from the agent
+
+        Parameters:
+            registry (dict): registry an event rejected by the agent was built from, the agent is not read again
+                             when the local state already moved on from it
+
+        Returns:
+            bool: True when the state changed from that of registry
+
+        """
+        with self.lock:
+            if registry is not None and self.stale(registry):
+                return True
+
+            registry = registry if registry is not None else self.registry
+            self.registry = self.client.registries().get(self.hab["name"], self.registry["name"])
+            self.reads += 1
+            return self.stale(registry)
+
+    def track(self, attempt):
+        """ Returns attempt called with the tracked registry, called once more with the state of the agent when the
+        agent rejected the event built from a state it had moved on from """
+        registry = self.registry
+        try:
+            return attempt(registry)
+        except requests.HTTPError:
+            if not self.backers or not self.reconcile(registry):
+                raise
+
+        return attempt(self.registry)
+
+
+class AsyncRegistryTracker(RegistryTracker):
+    """ Local state of a credential registry of an AsyncSignifyClient, see RegistryTracker
+
+    attempt is a coroutine function.
+
+    """
+
+    def __init__(self, client, hab, registry):
+        super(AsyncRegistryTracker, self).__init__(client=client, hab=hab, registry=registry)
+        self.alock = None
+
+    async def reconcile(self, registry=None):
+        import asyncio
+
+        if self.alock is None:
+            self.alock = asyncio.Lock()
+
+        async with self.alock:
+            if registry is not None and self.stale(registry):
+                return True
+
+            registry = registry if registry is not None else self.registry
+            self.registry = await self.client.registries().get(self.hab["name"], self.registry["name"])
+            self.reads += 1
+            return self.stale(registry)
+
+    async def track(self, attempt):
+        registry = self.registry
+        try:
+            return await attempt(registry)
+        except requests.HTTPError:
+            if not self.backers or not await self.reconcile(registry):
+                raise
+
+        return await attempt(self.registry)
+
+
 class Credentials:
     """ Domain class for accessing, presenting, issuing and revoking credentials """
 
@@ -135,19 +309,78 @@ class Credentials:
             list: list of dicts representing the listed credentials
 
         """
+        json = self.makeQuery(filtr=filtr, sort=sort, skip=skip, limit=limit)
+
+        res = self.client.post("/credentials/query", json=json)
+        return res.json()
+
+    @staticmethod
+    def makeQuery(filtr=None, sort=None, skip=None, limit=None):
+        """ Build the credential query request body, see list for parameters """
         filtr = filtr if filtr is not None else {}
         sort = sort if sort is not None else []
         skip = skip if skip is not None else 0
         limit = limit if limit is not None else 25
 
-        json = dict(
+        return dict(
             filter=filtr,
             sort=sort,
             skip=skip,
-            limt=limit
+            limit=limit
         )
 
-        res = self.client.post(f"/credentials/query", json=json)
+    def query(self, filtr=None, sort=None, skip=None, limit=None):
+        """ Returns the response to a credential query, see list for parameters """
+        return self.client.post("/credentials/query", json=self.makeQuery(filtr=filtr, sort=sort, skip=skip,
+                                                                          limit=limit))
+
+    def iter_query(self, filtr=None, sort=None, page_size=100, fields=None, prefetch=True):
+        """ Lazily iterate over every credential matching filtr, page_size credentials per request
+
+        The next page is requested, decoded and projected in a background thread while the current one is consumed
+        so only two pages are held in memory whatever the number of credentials.
+
+        Parameters:
+            filtr (dict): Credential filter dict
+            sort (list): list of SAD Path field references to sort by, keeps pages stable while iterating
+            page_size (int): number of credentials requested per page
+            fields (list): SAD paths such as -d or -a-i to project each credential onto, None means whole credentials
+            prefetch (bool): True means fetch the next page in the background
+
+        Returns:
+            QueryPaginator: iterable of credential dicts, or of dicts of each path in fields to its value in the SAD
+
+        """
+        fetch = functools.partial(self.query, filtr, sort)
+        transform = functools.partial(self.project, fields=fields) if fields is not None else None
+        return httping.QueryPaginator(fetch, size=page_size, prefetch=prefetch, transform=transform)
+
+    @staticmethod
+    def project(cred, fields):
+        """ Returns dict of each SAD path in fields to its value in the SAD of cred, None when missing """
+        sad = cred["sad"]
+        values = dict()
+        for path in fields:
+            value = sad
+            for field in path.split("-")[1:]:
+                if not isinstance(value, dict) or field not in value:
+                    value = None
+                    break
+                value = value[field]
+            values[path] = value
+
+        return values
+
+    def get(self, said):
+        """
+
+        Parameters:
+            said (str): SAID of credential
+        Returns:
+            credential (dict): credential with its status and anchors as stored by the agent
+
+        """
+        res = self.client.get(f"/credentials/{said}")
         return res.json()
 
     def export(self, said):
@@ -164,8 +397,101 @@ class Credentials:
         res = self.client.get(f"/credentials/{said}", headers=headers)
         return res.content
 
+    def export_many(self, saids, sink, workers=8, chunk_size=65536):
+        """ Export the CESR streams of many credentials into one sink
+
+        Up to workers credentials are requested concurrently.  Each response body is streamed into sink in
+        chunk_size pieces without being held in memory, one credential at a time so the streams of credentials
+        never interleave.  Credentials are written in the order their responses arrive.  A credential the agent
+        fails to return is reported rather than ending the export and any part of it already written to a seekable
+        sink is truncated away.
+
+        Parameters:
+            saids (Iterable): SAIDs of the credentials to export, consumed lazily
+            sink (str | PathLike | BinaryIO): path of the file to write, or a binary file like object with write
+            workers (int): number of concurrent requests
+            chunk_size (int): number of bytes read from a response and written to sink at a time
+
+        Returns:
+            dict: count of credentials and bytes written, failed dict of SAID to error, seconds taken and
+                  throughput in bytes_per_second and credentials_per_second
+
+        """
+        from concurrent import futures
+
+        stats = dict(count=0, bytes=0, failed=dict())
+        saids = iter(saids)
+        pick = threading.Lock()
+        write = threading.Lock()
+
+        def work(out):
+            while True:
+                with pick:
+                    said = next(saids, None)
+                if said is None:
+                    return
+
+                try:
+                    written = self.exportTo(said, out, write, chunk_size)
+                except requests.RequestException as ex:
+                    with write:
+                        stats["failed"][said] = str(ex)
+                    continue
+
+                with write:
+                    stats["count"] += 1
+                    stats["bytes"] += written
+
+        start = time.perf_counter()
+        with self.sink(sink) as out, futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            for fut in [pool.submit(work, out) for _ in range(workers)]:
+                fut.result()
+
+        return self.throughput(stats, time.perf_counter() - start)
+
+    def exportTo(self, said, out, lock, chunk_size):
+        """ Stream the CESR of credential said into out while holding lock, returns number of bytes written """
+        headers = dict(accept="application/json+cesr")
+
+        res = self.client.get(f"/credentials/{said}", headers=headers, stream=True)
+        try:
+            with lock:
+                return self.drain(res.iter_content(chunk_size=chunk_size), out)
+        finally:
+            res.close()
+
+    @staticmethod
+    def drain(chunks, out):
+        pos = out.tell() if out.seekable() else None
+        written = 0
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+                written += len(chunk)
+        except Exception:
+            if pos is not None:
+                out.seek(pos)
+                out.truncate()
+            raise
+
+        return written
+
+    @staticmethod
+    def sink(sink):
+        """ Returns context manager of the binary file like object for sink, opening and closing paths """
+        if isinstance(sink, (str, os.PathLike)):
+            return open(sink, "wb")
+        return contextlib.nullcontext(sink)
+
+    @staticmethod
+    def throughput(stats, seconds):
+        stats["seconds"] = seconds
+        stats["bytes_per_second"] = stats["bytes"] / seconds if seconds > 0 else 0.0
+        stats["credentials_per_second"] = stats["count"] / seconds if seconds > 0 else 0.0
+        return stats
+
     def create(self, hab, registry, data, schema, recipient=None, edges=None, rules=None, private=False,
-               timestamp=None):
+               timestamp=None, anchorer=None):
         """ Create and submit a credential
 
         Parameters:
@@ -178,12 +504,256 @@ class Credentials:
             rules:
             private:
             timestamp:
+            anchorer (Anchorer): anchor queue of the AID of hab sharing one interaction event among many
+                                 issuances, None means the issuance is anchored by its own event
 
         Returns:
 
         """
-        pre = hab["prefix"]
+        if anchorer is not None:
+            creder, iserder = self.makeIssuance(registry, data, schema, recipient=recipient, edges=edges,
+                                                rules=rules, private=private, timestamp=timestamp)
+            anc, sigs, res = anchorer.anchor(self.seal(iserder), functools.partial(self.submitIssuance, hab, creder,
+                                                                                   iserder))
+            return creder, iserder, anc, sigs, res.json()
+
+        creder, iserder, anc, sigs = self.makeCredential(hab, registry, data, schema, recipient=recipient,
+                                                         edges=edges, rules=rules, private=private,
+                                                         timestamp=timestamp)
+
+        res = self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad,
+                                      sigs=sigs)
+
+        return creder, iserder, anc, sigs, res.json()
+
+    def submitIssuance(self, hab, creder, iserder, anc, sigs, keeper=None):
+        return self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad, sigs=sigs,
+                                       keeper=keeper)
+
+    def create_many(self, hab, registry, items, schema=None, workers=64, batch=64, window=0.05):
+        """ Issue many credentials, anchoring them in batches and yielding each outcome as it completes
+
+        Each of up to workers threads builds the ACDC and TEL issuance event of an item, adds its seal to the anchor
+        queue of the AID, client.anchorer(hab), and submits the credential once its batch is anchored, so an
+        interaction event anchors up to min(batch, workers) credentials.  Sharing the queue of the AID keeps these
+        events in sequence with anchors added elsewhere, batch, window and workers only apply when the AID has no
+        queue yet.  Items are read lazily and at most workers of them are in
+        flight, so any number of credentials can be issued in bounded memory.  The threads overlap agent round
+        trips, building the events holds the GIL for only a few percent of the time, see benchmarks.issuing.
+
+        Parameters:
+            hab (dict): issuer identifier as returned by Identifiers.get
+            registry (dict | RegistryTracker): registry as returned by Registries.get or tracker of its state, the
+                                               registry is read again once all items are issued when it has backers
+            items (Iterable): dicts of create keyword arguments (data, schema, recipient, edges, rules, private,
+                              timestamp), one per credential
+            schema (str): schema SAID of items without one
+            workers (int): maximum number of credentials built and submitted concurrently
+            batch (int): maximum number of credentials anchored by one interaction event
+            window (float): seconds a batch waits for more credentials before it is anchored
+
+        Returns:
+            Iterator[Issuage]: (index, result, error) of each item in order of completion
+
+        """
+        hab = self.client.identifiers().get(hab["name"])
+        anchorer = self.client.anchorer(hab, window=window, size=min(batch, workers), workers=workers)
+        keeper = self.client.manager.get(aid=hab)
+        tracker = registry if isinstance(registry, RegistryTracker) else RegistryTracker(self.client, hab, registry)
+
+        work = functools.partial(self.issue, hab=hab, tracker=tracker, schema=schema, anchorer=anchorer,
+                                 keeper=keeper)
+        yield from self.pipeline(work, enumerate(items), workers)
+
+        if tracker.backers:
+            tracker.reconcile()
+
+    @staticmethod
+    def pipeline(work, args, workers):
+        """ Generator of the results of work called with each tuple of args by up to workers threads, in order of
+        completion.  args are read lazily and at most workers calls are in flight. """
+        from concurrent import futures
+
+        pending = set()
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            def fill():
+                for arg in args:
+                    pending.add(pool.submit(work, *arg))
+                    if len(pending) >= workers:
+                        break
+
+            fill()
+            while pending:
+                done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+                fill()
+
+    def issue(self, idx, item, hab, tracker, schema, anchorer, keeper):
+        """ Returns the Issuage of credential item idx issued through anchorer """
+        item = dict(item)
+        data = item.pop("data")
+        schema = item.pop("schema", schema)
+
+        def attempt(registry):
+            creder, iserder = self.makeIssuance(registry, dict(data), schema, **item)
+            anc, sigs, res = anchorer.anchor(self.seal(iserder), functools.partial(self.submitIssuance, hab, creder,
+                                                                                   iserder, keeper=keeper))
+            tracker.advance(iserder)
+            return creder, iserder, anc, sigs, res.json()
+
+        try:
+            return Issuage(idx, tracker.track(attempt), None)
+        except Exception as ex:
+            return Issuage(idx, None, ex)
+
+    def revoke(self, hab, said, registry=None, timestamp=None, anchorer=None):
+        """ Revoke a credential issued by hab
+
+        Parameters:
+            hab (dict): issuer identifier as returned by Identifiers.get
+            said (str): SAID of credential to revoke
+            registry (dict): registry of the credential as returned by Registries.get, required for registries with
+                             backers whose revocations anchor their latest registry event
+            timestamp (str): ISO 8601 datetime of the revocation, None means now
+            anchorer (Anchorer): anchor queue of the AID of hab sharing one interaction event among many
+                                 revocations, None means the revocation is anchored by its own event
+
+        Returns:
+            (rserder, anc, sigs, op): tuple of TEL revocation event, ixn anchor, signatures over anchor and
+                                      long running operation of the revocation
+
+        """
+        cred = self.get(said)
+        rserder = self.makeRevocation(cred, registry=registry, timestamp=timestamp)
+        if anchorer is not None:
+            anc, sigs, res = anchorer.anchor(self.seal(rserder), functools.partial(self.submitRevocation, hab,
+                                                                                   rserder))
+            return rserder, anc, sigs, res.json()
+
+        state = hab["state"]
+        anc = interact(hab["prefix"], sn=int(state["s"], 16) + 1, data=[self.seal(rserder)], dig=state["d"])
+        keeper = self.client.manager.get(aid=hab)
+        sigs = keeper.sign(ser=anc.raw)
+
+        res = self.revoke_from_events(hab=hab, said=said, rev=rserder.sad, anc=anc.sad, sigs=sigs, keeper=keeper)
+        return rserder, anc, sigs, res.json()
+
+    def submitRevocation(self, hab, rserder, anc, sigs, keeper=None):
+        return self.revoke_from_events(hab=hab, said=rserder.ked["i"], rev=rserder.sad, anc=anc.sad, sigs=sigs,
+                                       keeper=keeper)
+
+    def revoke_many(self, hab, saids, registries=None, workers=64, batch=64, window=0.05, timestamp=None):
+        """ Revoke many credentials, anchoring them in batches and yielding each outcome as it completes
+
+        Works as create_many does, up to workers threads read each credential, build its TEL revocation event and
+        add its seal to the anchor queue of the AID, client.anchorer(hab), so revocations submitted together,
+        whatever their registries, are anchored by one interaction event and sent concurrently.
+
+        Parameters:
+            hab (dict): issuer identifier as returned by Identifiers.get
+            saids (Iterable): SAIDs of the credentials to revoke
+            registries (Iterable): registries as returned by Registries.get or trackers of their state, required
+                                   for the credentials of registries with backers
+            workers (int): maximum number of credentials revoked concurrently
+            batch (int): maximum number of revocations anchored by one interaction event
+            window (float): seconds a batch waits for more revocations before it is anchored
+            timestamp (str): ISO 8601 datetime of the revocations, None means now
+
+        Returns:
+            Iterator[Revokage]: (said, result, error) of each credential in order of completion
+
+        """
+        hab = self.client.identifiers().get(hab["name"])
+        anchorer = self.client.anchorer(hab, window=window, size=min(batch, workers), workers=workers)
+        keeper = self.client.manager.get(aid=hab)
+        trackers = dict()
+        for registry in registries or []:
+            tracker = registry if isinstance(registry, RegistryTracker) else RegistryTracker(self.client, hab,
+                                                                                              registry)
+            trackers[tracker.regk] = tracker
+
+        work = functools.partial(self.revocation, hab=hab, trackers=trackers, timestamp=timestamp,
+                                 anchorer=anchorer, keeper=keeper)
+        yield from self.pipeline(work, ((said,) for said in saids), workers)
+
+    def revocation(self, said, hab, trackers, timestamp, anchorer, keeper):
+        """ Returns the Revokage of credential said revoked through anchorer """
+        def attempt(registry):
+            rserder = self.makeRevocation(cred, registry=registry, timestamp=timestamp)
+            anc, sigs, res = anchorer.anchor(self.seal(rserder), functools.partial(self.submitRevocation, hab,
+                                                                                   rserder, keeper=keeper))
+            return rserder, anc, sigs, res.json()
+
+        try:
+            cred = self.get(said)
+            tracker = trackers.get(cred["status"]["ri"])
+            result = tracker.track(attempt) if tracker is not None else attempt(None)
+            return Revokage(said, result, None)
+        except Exception as ex:
+            return Revokage(said, None, ex)
+
+    @staticmethod
+    def makeRevocation(cred, registry=None, timestamp=None):
+        """ Create the TEL revocation event of a credential
+
+        Parameters:
+            cred (dict): credential as returned by get
+            registry (dict): registry of the credential, required when it has backers
+            timestamp (str): ISO 8601 datetime of the revocation, None means now
+
+        Returns:
+            rserder (SerderKERI): rev event for registries without backers, brv event for registries with them
+
+        """
+        status = cred["status"]
+        said = cred["sad"]["d"]
+        if status["et"] not in (coring.Ilks.iss, coring.Ilks.bis):
+            raise kering.ValidationError(f"credential {said} is not issued, its status is {status['et']}")
+
+        dt = timestamp if timestamp is not None else helping.nowIso8601()
+        regk = status["ri"]
+        if status["et"] == coring.Ilks.iss:
+            return eventing.revoke(vcdig=said, regk=regk, dig=status["d"], dt=dt)
+
+        if registry is None or registry["regk"] != regk:
+            raise kering.ConfigurationError(f"registry {regk} with backers is required to revoke credential {said}")
 
+        return eventing.backerRevoke(vcdig=said, regk=regk, regsn=int(registry["state"]["s"], 16),
+                                     regd=registry["state"]["d"], dig=status["d"], dt=dt)
+
+    def makeCredential(self, hab, registry, data, schema, recipient=None, edges=None, rules=None, private=False,
+                       timestamp=None):
+        """ Create credential, issuance event and signed anchoring interaction event without sending them
+
+        Returns:
+            (creder, iserder, anc, sigs): tuple of ACDC, TEL issuance event, ixn anchor and signatures over anchor
+
+        """
+        creder, iserder = self.makeIssuance(registry, data, schema, recipient=recipient, edges=edges, rules=rules,
+                                            private=private, timestamp=timestamp)
+
+        data = [self.seal(iserder)]
+
+        state = hab["state"]
+        sn = int(state["s"], 16)
+        dig = state["d"]
+        anc = interact(hab["prefix"], sn=sn + 1, data=data, dig=dig)
+
+        keeper = self.client.manager.get(aid=hab)
+        sigs = keeper.sign(ser=anc.raw)
+
+        return creder, iserder, anc, sigs
+
+    @staticmethod
+    def makeIssuance(registry, data, schema, recipient=None, edges=None, rules=None, private=False,
+                     timestamp=None):
+        """ Create credential and its TEL issuance event
+
+        Returns:
+            (creder, iserder): tuple of ACDC and TEL issuance event
+
+        """
         if recipient is None:
             recp = None
         else:
@@ -203,46 +773,59 @@ class Credentials:
                                     status=regk)
 
         dt = creder.attrib["dt"] if "dt" in creder.attrib else helping.nowIso8601()
-        noBackers = 'NB' in registry['state']['c']
+        cnfg = registry['state']['c']
+        noBackers = TraitDex.NoRegistrarBackers in cnfg or 'NB' in cnfg  # NB from registries incepted by older keri
         if noBackers:
             iserder = eventing.issue(vcdig=creder.said, regk=regk, dt=dt)
         else:
-            regi = registry['state']['s']
+            regi = int(registry['state']['s'], 16)
             regd = registry['state']['d']
             iserder = eventing.backerIssue(vcdig=creder.said, regk=regk, regsn=regi, regd=regd, dt=dt)
 
-        vcid = iserder.ked["i"]
-        rseq = coring.Seqner(snh=iserder.ked["s"])
-        rseal = eventing.SealEvent(vcid, rseq.snh, iserder.said)
-        rseal = dict(i=rseal.i, s=rseal.s, d=rseal.d)
+        return creder, iserder
 
-        data = [rseal]
-
-        state = hab["state"]
-        sn = int(state["s"], 16)
-        dig = state["d"]
-        anc = interact(pre, sn=sn + 1, data=data, dig=dig)
-
-        keeper = self.client.manager.get(aid=hab)
-        sigs = keeper.sign(ser=anc.raw)
-
-        res = self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad,
-                                      sigs=sigs)
+    @staticmethod
+    def seal(serder):
+        """ Returns the seal anchoring TEL event serder """
+        vcid = serder.ked["i"]
+        rseq = coring.Seqner(snh=serder.ked["s"])
+        rseal = eventing.SealEvent(vcid, rseq.snh, serder.said)
+        return dict(i=rseal.i, s=rseal.s, d=rseal.d)
+
+    def create_from_events(self, hab, creder, iss, anc, sigs, keeper=None):
+        name = hab["name"]
+        body = self.credentialBody(hab, creder, iss, anc, sigs, keeper=keeper)
 
-        return creder, iserder, anc, sigs, res.json()
+        return self.client.post(f"/identifiers/{name}/credentials", json=body)
 
-    def create_from_events(self, hab, creder, iss, anc, sigs):
+    def credentialBody(self, hab, creder, iss, anc, sigs, keeper=None):
         body = dict(
             acdc=creder,
             iss=iss,
             ixn=anc,
             sigs=sigs
         )
-        keeper = self.client.manager.get(aid=hab)
+        keeper = keeper if keeper is not None else self.client.manager.get(aid=hab)
         body[keeper.algo] = keeper.params()
+
+        return body
+
+    def revoke_from_events(self, hab, said, rev, anc, sigs, keeper=None):
         name = hab["name"]
+        body = self.revocationBody(hab, rev, anc, sigs, keeper=keeper)
 
-        return self.client.post(f"/identifiers/{name}/credentials", json=body)
+        return self.client.delete(f"/identifiers/{name}/credentials/{said}", json=body)
+
+    def revocationBody(self, hab, rev, anc, sigs, keeper=None):
+        body = dict(
+            rev=rev,
+            ixn=anc,
+            sigs=sigs
+        )
+        keeper = keeper if keeper is not None else self.client.manager.get(aid=hab)
+        body[keeper.algo] = keeper.params()
+
+        return body
 
 
 class Ipex:
@@ -340,3 +923,341 @@ class Ipex:
         res = self.client.post(f"/identifiers/{name}/ipex/admit", json=body)
         return res.json()
 
+
+class AsyncRegistries(Registries):
+    """ Asyncio domain class for credential registries, see Registries for parameters and results
+
+    Event signing runs in a worker thread so it does not block the event loop.
+
+    """
+
+    async def get(self, name, registryName):
+        res = await self.client.get(f"/identifiers/{name}/registries/{registryName}")
+        return res.json()
+
+    async def create(self, hab, registryName, noBackers=True, estOnly=False, baks=None, toad=0, nonce=None,
+                     anchorer=None):
+        import asyncio
+
+        if anchorer is not None:
+            regser = self.makeInception(hab, noBackers=noBackers, estOnly=estOnly, baks=baks, toad=toad, nonce=nonce)
+            serder, sigs, op = await anchorer.anchor(self.seal(regser), functools.partial(self.submitInception, hab,
+                                                                                          registryName, regser))
+            return regser, serder, sigs, op
+
+        regser, serder, sigs = await asyncio.to_thread(self.makeRegistry, hab, noBackers=noBackers,
+                                                       estOnly=estOnly, baks=baks, toad=toad, nonce=nonce)
+
+        op = await self.create_from_events(hab=hab, registryName=registryName, vcp=regser.ked, ixn=serder.ked,
+                                           sigs=sigs)
+
+        return regser, serder, sigs, op
+
+    async def create_from_events(self, hab, registryName, vcp, ixn, sigs):
+        name = hab["name"]
+        body = self.registryBody(hab, registryName, vcp, ixn, sigs)
+
+        resp = await self.client.post(path=f"/identifiers/{name}/registries", json=body)
+        return resp.json()
+
+    async def rename(self, hab, registryName, newName):
+        name = hab["name"]
+        body = dict(name=newName)
+        resp = await self.client.put(path=f"/identifiers/{name}/registries/{registryName}", json=body)
+        return resp.json()
+
+
+class AsyncCredentials(Credentials):
+    """ Asyncio domain class for credentials, see Credentials for parameters and results
+
+    Event signing runs in a worker thread so it does not block the event loop.
+
+    """
+
+    async def list(self, filtr=None, sort=None, skip=None, limit=None):
+        json = self.makeQuery(filtr=filtr, sort=sort, skip=skip, limit=limit)
+
+        res = await self.client.post("/credentials/query", json=json)
+        return res.json()
+
+    async def query(self, filtr=None, sort=None, skip=None, limit=None):
+        return await self.client.post("/credentials/query", json=self.makeQuery(filtr=filtr, sort=sort, skip=skip,
+                                                                                limit=limit))
+
+    def iter_query(self, filtr=None, sort=None, page_size=100, fields=None, prefetch=True):
+        """ Lazily iterate over every matching credential with async for, see Credentials.iter_query """
+        fetch = functools.partial(self.query, filtr, sort)
+        transform = functools.partial(self.project, fields=fields) if fields is not None else None
+        return httping.AsyncQueryPaginator(fetch, size=page_size, prefetch=prefetch, transform=transform)
+
+    async def get(self, said):
+        res = await self.client.get(f"/credentials/{said}")
+        return res.json()
+
+    async def export(self, said):
+        headers = dict(accept="application/json+cesr")
+
+        res = await self.client.get(f"/credentials/{said}", headers=headers)
+        return res.content
+
+    async def export_many(self, saids, sink, workers=8, chunk_size=65536):
+        """ Export the CESR streams of many credentials into one sink with concurrent requests on the event loop,
+        see Credentials.export_many """
+        import asyncio
+        import httpx
+
+        stats = dict(count=0, bytes=0, failed=dict())
+        saids = iter(saids)
+        write = asyncio.Lock()
+
+        async def work(out):
+            for said in saids:
+                try:
+                    written = await self.exportTo(said, out, write, chunk_size)
+                except (httpx.HTTPError, requests.HTTPError) as ex:
+                    stats["failed"][said] = str(ex)
+                    continue
+
+                stats["count"] += 1
+                stats["bytes"] += written
+
+        start = time.perf_counter()
+        with self.sink(sink) as out:
+            await asyncio.gather(*[work(out) for _ in range(workers)])
+
+        return self.throughput(stats, time.perf_counter() - start)
+
+    async def exportTo(self, said, out, lock, chunk_size):
+        headers = dict(accept="application/json+cesr")
+
+        res = await self.client.get(f"/credentials/{said}", headers=headers, stream=True)
+        try:
+            async with lock:
+                pos = out.tell() if out.seekable() else None
+                written = 0
+                try:
+                    async for chunk in res.aiter_bytes(chunk_size=chunk_size):
+                        out.write(chunk)
+                        written += len(chunk)
+                except Exception:
+                    if pos is not None:
+                        out.seek(pos)
+                        out.truncate()
+                    raise
+
+                return written
+        finally:
+            await res.aclose()
+
+    async def create(self, hab, registry, data, schema, recipient=None, edges=None, rules=None, private=False,
+                     timestamp=None, anchorer=None):
+        import asyncio
+
+        if anchorer is not None:
+            creder, iserder = await asyncio.to_thread(self.makeIssuance, registry, data, schema, recipient=recipient,
+                                                      edges=edges, rules=rules, private=private, timestamp=timestamp)
+            anc, sigs, res = await anchorer.anchor(self.seal(iserder), functools.partial(self.submitIssuance, hab,
+                                                                                         creder, iserder))
+            return creder, iserder, anc, sigs, res.json()
+
+        creder, iserder, anc, sigs = await asyncio.to_thread(self.makeCredential, hab, registry, data, schema,
+                                                             recipient=recipient, edges=edges, rules=rules,
+                                                             private=private, timestamp=timestamp)
+
+        res = await self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad,
+                                            sigs=sigs)
+
+        return creder, iserder, anc, sigs, res.json()
+
+    async def create_from_events(self, hab, creder, iss, anc, sigs, keeper=None):
+        name = hab["name"]
+        body = self.credentialBody(hab, creder, iss, anc, sigs, keeper=keeper)
+
+        return await self.client.post(f"/identifiers/{name}/credentials", json=body)
+
+    async def create_many(self, hab, registry, items, schema=None, workers=64, batch=64, window=0.05):
+        """ Issue many credentials as tasks of the running loop, see Credentials.create_many
+
+        Returns:
+            AsyncIterator[Issuage]: (index, result, error) of each item in order of completion
+
+        """
+        hab = await self.client.identifiers().get(hab["name"])
+        anchorer = self.client.anchorer(hab, window=window, size=min(batch, workers), workers=workers)
+        keeper = self.client.manager.get(aid=hab)
+        tracker = registry if isinstance(registry, RegistryTracker) else AsyncRegistryTracker(self.client, hab,
+                                                                                               registry)
+
+        work = functools.partial(self.issue, hab=hab, tracker=tracker, schema=schema, anchorer=anchorer,
+                                 keeper=keeper)
+        async for issuage in self.pipeline(work, enumerate(items), workers):
+            yield issuage
+
+        if tracker.backers:
+            await tracker.reconcile()
+
+    @staticmethod
+    async def pipeline(work, args, workers):
+        """ Async generator of the results of coroutine function work called with each tuple of args as up to
+        workers tasks, in order of completion.  args are read lazily and at most workers calls are in flight, as
+        in Credentials.pipeline. """
+        import asyncio
+
+        pending = set()
+
+        def fill():
+            for arg in args:
+                pending.add(asyncio.ensure_future(work(*arg)))
+                if len(pending) >= workers:
+                    break
+
+        fill()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    yield task.result()
+                fill()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def issue(self, idx, item, hab, tracker, schema, anchorer, keeper):
+        import asyncio
+
+        item = dict(item)
+        data = item.pop("data")
+        schema = item.pop("schema", schema)
+
+        async def attempt(registry):
+            creder, iserder = await asyncio.to_thread(self.makeIssuance, registry, dict(data), schema, **item)
+            anc, sigs, res = await anchorer.anchor(self.seal(iserder), functools.partial(self.submitIssuance, hab,
+                                                                                         creder, iserder,
+                                                                                         keeper=keeper))
+            tracker.advance(iserder)
+            return creder, iserder, anc, sigs, res.json()
+
+        try:
+            return Issuage(idx, await tracker.track(attempt), None)
+        except Exception as ex:
+            return Issuage(idx, None, ex)
+
+    async def revoke(self, hab, said, registry=None, timestamp=None, anchorer=None):
+        import asyncio
+
+        cred = await self.get(said)
+        rserder = self.makeRevocation(cred, registry=registry, timestamp=timestamp)
+        if anchorer is not None:
+            anc, sigs, res = await anchorer.anchor(self.seal(rserder), functools.partial(self.submitRevocation, hab,
+                                                                                         rserder))
+            return rserder, anc, sigs, res.json()
+
+        state = hab["state"]
+        anc = interact(hab["prefix"], sn=int(state["s"], 16) + 1, data=[self.seal(rserder)], dig=state["d"])
+        keeper = self.client.manager.get(aid=hab)
+        sigs = await asyncio.to_thread(keeper.sign, ser=anc.raw)
+
+        res = await self.revoke_from_events(hab=hab, said=said, rev=rserder.sad, anc=anc.sad, sigs=sigs,
+                                            keeper=keeper)
+        return rserder, anc, sigs, res.json()
+
+    async def revoke_from_events(self, hab, said, rev, anc, sigs, keeper=None):
+        name = hab["name"]
+        body = self.revocationBody(hab, rev, anc, sigs, keeper=keeper)
+
+        return await self.client.delete(f"/identifiers/{name}/credentials/{said}", json=body)
+
+    async def revoke_many(self, hab, saids, registries=None, workers=64, batch=64, window=0.05, timestamp=None):
+        """ Revoke many credentials as tasks of the running loop, see Credentials.revoke_many
+
+        Returns:
+            AsyncIterator[Revokage]: (said, result, error) of each credential in order of completion
+
+        """
+        hab = await self.client.identifiers().get(hab["name"])
+        anchorer = self.client.anchorer(hab, window=window, size=min(batch, workers), workers=workers)
+        keeper = self.client.manager.get(aid=hab)
+        trackers = dict()
+        for registry in registries or []:
+            tracker = registry if isinstance(registry, RegistryTracker) else AsyncRegistryTracker(self.client, hab,
+                                                                                                   registry)
+            trackers[tracker.regk] = tracker
+
+        work = functools.partial(self.revocation, hab=hab, trackers=trackers, timestamp=timestamp,
+                                 anchorer=anchorer, keeper=keeper)
+        async for revokage in self.pipeline(work, ((said,) for said in saids), workers):
+            yield revokage
+
+    async def revocation(self, said, hab, trackers, timestamp, anchorer, keeper):
+        async def attempt(registry):
+            rserder = self.makeRevocation(cred, registry=registry, timestamp=timestamp)
+            anc, sigs, res = await anchorer.anchor(self.seal(rserder), functools.partial(self.submitRevocation, hab,
+                                                                                         rserder, keeper=keeper))
+            return rserder, anc, sigs, res.json()
+
+        try:
+            cred = await self.get(said)
+            tracker = trackers.get(cred["status"]["ri"])
+            result = await tracker.track(attempt) if tracker is not None else await attempt(None)
+            return Revokage(said, result, None)
+        except Exception as ex:
+            return Revokage(said, None, ex)
+
+
+class AsyncIpex(Ipex):
+    """ Asyncio domain class for IPEX grant and admit messages, see Ipex for parameters and results """
+
+    async def grant(self, hab, recp, message, acdc, iss, anc, agree=None, dt=None):
+        exchanges = self.client.exchanges()
+        data = dict(
+            m=message,
+            i=recp,
+        )
+
+        embeds = dict(
+            acdc=acdc,
+            iss=iss,
+            anc=anc
+        )
+
+        grant, gsigs, end = await exchanges.createExchangeMessage(sender=hab, route="/ipex/grant",
+                                                                  payload=data, embeds=embeds, dt=dt)
+
+        return grant, gsigs, end
+
+    async def submitGrant(self, name, exn, sigs, atc, recp):
+        body = dict(
+            exn=exn.ked,
+            sigs=sigs,
+            atc=atc,
+            rec=recp
+        )
+
+        res = await self.client.post(f"/identifiers/{name}/ipex/grant", json=body)
+        return res.json()
+
+    async def admit(self, hab, message, grant, dt=None):
+        if not grant:
+            raise ValueError(f"invalid grant={grant}")
+
+        exchanges = self.client.exchanges()
+        data = dict(
+            m=message,
+        )
+
+        admit, asigs, end = await exchanges.createExchangeMessage(sender=hab, route="/ipex/admit",
+                                                                  payload=data, embeds=None, dt=dt, dig=grant)
+
+        return admit, asigs, end
+
+    async def submitAdmit(self, name, exn, sigs, atc, recp):
+        body = dict(
+            exn=exn.ked,
+            sigs=sigs,
+            atc=atc,
+            rec=recp
+        )
+
+        res = await self.client.post(f"/identifiers/{name}/ipex/admit", json=body)
+        return res.json()
@@ -0,0 +1,366 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.daemoning module
+
+Local daemon keeping connected SignifyClients warm for short lived processes, in the manner of ssh-agent
+
+Only the standard library is imported with this module so processes talking to a daemon start quickly, keri and the
+client are imported by the daemon when it connects clients.
+
+"""
+import base64
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+
+# Environment variable holding the daemon socket path, like SSH_AUTH_SOCK
+SockEnv = "SIGPY_SOCK"
+
+# Client domain factories callable through the daemon
+Domains = ("identifiers", "operations", "oobis", "credentials", "keyStates", "keyEvents", "escrows", "endroles",
+           "notifications", "groups", "registries", "exchanges", "ipex", "challenges", "contacts")
+
+
+def sockpath(path=None):
+    """ Returns the daemon socket path, path when given else SIGPY_SOCK else sigpy.sock in a per user directory """
+    if path is not None:
+        return path
+
+    path = os.getenv(SockEnv)
+    if path:
+        return path
+
+    base = os.getenv("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"sigpy-{os.getuid()}")
+    return os.path.join(base, "sigpy.sock")
+
+
+def connect(url, passcode, tier=None, path=None):
+    """ Returns a client for url and passcode, run through the sigpy daemon when a socket path is given or
+    SIGPY_SOCK is set and otherwise a SignifyClient connected in this process
+
+    Parameters:
+        url (str): KERIA agent URL
+        passcode (str | bytes): 21 character passcode of the controller
+        tier (Tiers): tier of the controller, None means Tiers.low
+        path (str): daemon socket path, None means SIGPY_SOCK
+
+    Returns:
+        DaemonClient | SignifyClient: client whose domain methods take and return JSON values
+
+    """
+    path = path if path is not None else os.getenv(SockEnv)
+    if path:
+        return DaemonClient(path=path, url=url, passcode=passcode, tier=tier)
+
+    from signify.app.clienting import SignifyClient
+    return SignifyClient(passcode=passcode, tier=tier if tier is not None else "low", url=url)
+
+
+def pack(value):
+    """ Returns value converted to JSON serializable form
+
+    Serders are replaced by their field maps, primitives by their qb64, responses by their JSON body, bytes by a
+    {"__bytes__": base64} map and any other iterable by a list.
+
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__bytes__": base64.b64encode(bytes(value)).decode("ascii")}
+
+    if isinstance(value, dict):
+        return {key: pack(val) for key, val in value.items()}
+
+    if hasattr(value, "ked") and hasattr(value, "raw"):
+        return pack(value.ked)
+
+    if hasattr(value, "qb64"):
+        return value.qb64
+
+    if hasattr(value, "status_code") and hasattr(value, "json"):
+        return pack(value.json()) if value.content else None
+
+    return [pack(val) for val in value]
+
+
+def unpack(value):
+    """ Returns value with the {"__bytes__": base64} maps of pack restored to bytes """
+    if isinstance(value, list):
+        return [unpack(val) for val in value]
+
+    if isinstance(value, dict):
+        if len(value) == 1 and "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+        return {key: unpack(val) for key, val in value.items()}
+
+    return value
+
+
+class Daemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ Unix domain socket server holding connected SignifyClients for local processes
+
+    Each connection carries newline delimited JSON requests answered in order by JSON replies.  Clients are
+    connected on first use with the passcode of a request and afterwards found by their controller AID, so their
+    stretched passcode, derived signers and pooled HTTP connections outlive the processes using them.  Requests for
+    one client are run one at a time, requests for different clients run concurrently.
+
+    Requests:
+        {"op": "add", "url": url, "passcode": passcode, "tier": tier}  connects a client, replies {"caid", "agent"}
+        {"op": "call", "caid": caid, "domain": domain, "method": method, "args": [], "kwargs": {}}  calls
+            client.domain().method(*args, **kwargs), replies {"result"}.  url and passcode may replace caid.
+        {"op": "list"}  replies {"clients": [{"caid", "url"}]}
+        {"op": "remove", "caid": caid}  forgets a client
+        {"op": "stop"}  shuts the daemon down
+
+    Failures reply {"error": message, "type": exception class name} with the HTTP "status" of agent errors.
+
+    The socket is created in a directory only readable by the user running the daemon, as any process that can
+    connect may use the clients it holds.
+
+    """
+    daemon_threads = True
+
+    def __init__(self, path=None, factory=None):
+        """
+
+        Parameters:
+            path (str): socket path, see sockpath
+            factory (Callable): called with url, passcode and tier, returns a connected SignifyClient, defaults to
+                                constructing SignifyClient with url
+        """
+        from keri import kering
+
+        self.path = sockpath(path)
+        self.factory = factory if factory is not None else self.connect
+        self.clients = dict()
+        self.keys = dict()
+        self.locks = dict()
+        self.lock = threading.Lock()
+
+        base = os.path.dirname(self.path)
+        if base:
+            os.makedirs(base, mode=0o700, exist_ok=True)
+
+        if os.path.exists(self.path):
+            if self.live(self.path):
+                raise kering.ConfigurationError(f"sigpy daemon already listening on {self.path}")
+            os.unlink(self.path)
+
+        umask = os.umask(0o177)
+        try:
+            super(Daemon, self).__init__(self.path, Handler)
+        finally:
+            os.umask(umask)
+
+    @staticmethod
+    def connect(url, passcode, tier):
+        from signify.app.clienting import SignifyClient
+        return SignifyClient(passcode=passcode, tier=tier, url=url)
+
+    @staticmethod
+    def live(path):
+        """ Returns True when a daemon accepts connections on path """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+    def server_close(self):
+        super(Daemon, self).server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def client(self, req):
+        """ Returns (caid, client) for request req, connecting a client for its url and passcode when needed """
+        from keri import kering
+        from keri.core.coring import Tiers
+
+        caid = req.get("caid")
+        if caid is None:
+            passcode = req.get("passcode")
+            if passcode is None:
+                raise kering.ConfigurationError("request names no client, give caid or url and passcode")
+
+            url = req.get("url")
+            tier = req.get("tier") or Tiers.low
+            key = (url, hashlib.sha256(passcode.encode("utf-8")).hexdigest(), tier)
+            with self.lock:
+                caid = self.keys.get(key)
+                if caid is None:
+                    lock = self.locks.setdefault(key, threading.Lock())
+
+            if caid is None:
+                with lock:
+                    caid = self.keys.get(key)
+                    if caid is None:
+                        client = self.factory(url, passcode, tier)
+                        caid = client.controller
+                        with self.lock:
+                            self.clients[caid] = (url, client, threading.Lock())
+                            self.keys[key] = caid
+
+        with self.lock:
+            if caid not in self.clients:
+                raise kering.ConfigurationError(f"no client for controller {caid}")
+            return caid, self.clients[caid]
+
+    def handle(self, req):
+        """ Returns the reply to request req """
+        from keri import kering
+
+        op = req.get("op")
+        if op == "add":
+            caid, (_, client, _) = self.client(req)
+            return dict(caid=caid, agent=client.agent.pre)
+
+        if op == "call":
+            return dict(result=self.call(req))
+
+        if op == "list":
+            with self.lock:
+                return dict(clients=[dict(caid=caid, url=url) for caid, (url, _, _) in self.clients.items()])
+
+        if op == "remove":
+            with self.lock:
+                self.clients.pop(req.get("caid"), None)
+                self.keys = {key: caid for key, caid in self.keys.items() if caid in self.clients}
+            return dict()
+
+        if op == "stop":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return dict()
+
+        raise kering.ConfigurationError(f"invalid daemon op {op}")
+
+    def call(self, req):
+        from keri import kering
+
+        domain, method = req.get("domain"), req.get("method")
+        if domain not in Domains:
+            raise kering.ConfigurationError(f"invalid client domain {domain}")
+        if not isinstance(method, str) or method.startswith("_"):
+            raise kering.ConfigurationError(f"invalid {domain} method {method}")
+
+        _, (_, client, lock) = self.client(req)
+        with lock:
+            func = getattr(getattr(client, domain)(), method, None)
+            if not callable(func):
+                raise kering.ConfigurationError(f"invalid {domain} method {method}")
+
+            return pack(func(*unpack(req.get("args", [])), **unpack(req.get("kwargs", {}))))
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """ Answers the newline delimited JSON requests of one daemon connection """
+
+    def handle(self):
+        from requests import HTTPError
+
+        for line in self.rfile:
+            try:
+                rep = self.server.handle(json.loads(line))
+            except HTTPError as ex:
+                status = ex.response.status_code if ex.response is not None else None
+                rep = dict(error=str(ex), type=type(ex).__name__, status=status)
+            except Exception as ex:
+                rep = dict(error=str(ex), type=type(ex).__name__)
+
+            self.wfile.write(json.dumps(rep).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class DaemonClient:
+    """ Stand in for SignifyClient running domain calls in a sigpy daemon
+
+    Domain factories return proxies whose methods are called in the daemon with JSON serializable arguments, see
+    pack for how results are converted.  Methods returning serders return their field maps.  Agent errors are raised
+    as requests.HTTPError without a response, other daemon failures as kering.KeriError.
+
+        client = DaemonClient(url="http://localhost:3901", passcode=bran)
+        aid = client.identifiers().get("aid1")
+
+    """
+
+    def __init__(self, path=None, url=None, passcode=None, tier=None, caid=None):
+        """ Connect to the daemon at path and add the client for url and passcode, or use the one of caid
+
+        Parameters:
+            path (str): socket path, see sockpath
+            url (str): KERIA agent URL
+            passcode (str | bytes): 21 character passcode of the controller
+            tier (Tiers): tier of the controller, None means Tiers.low
+            caid (str): controller AID of a client already held by the daemon, instead of url and passcode
+
+        """
+        self.path = sockpath(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+        self.file = self.sock.makefile("rwb")
+        self.lock = threading.Lock()
+
+        self.caid = caid
+        if caid is None:
+            passcode = passcode.decode("utf-8") if isinstance(passcode, bytes) else passcode
+            self.caid = self.send(dict(op="add", url=url, passcode=passcode, tier=tier))["caid"]
+
+    @property
+    def controller(self):
+        return self.caid
+
+    def send(self, req):
+        """ Returns the reply of the daemon to request req """
+        with self.lock:
+            self.file.write(json.dumps(req).encode("utf-8") + b"\n")
+            self.file.flush()
+            line = self.file.readline()
+
+        if not line:
+            from keri import kering
+            raise kering.KeriError(f"sigpy daemon at {self.path} closed the connection")
+
+        rep = json.loads(line)
+        if "error" in rep:
+            if "status" in rep:
+                from requests import HTTPError
+                raise HTTPError(rep["error"])
+
+            from keri import kering
+            raise kering.KeriError(f"{rep['type']}: {rep['error']}")
+        return rep
+
+    def call(self, domain, method, *args, **kwargs):
+        rep = self.send(dict(op="call", caid=self.caid, domain=domain, method=method, args=pack(list(args)),
+                             kwargs=pack(kwargs)))
+        return unpack(rep["result"])
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __getattr__(self, name):
+        if name in Domains:
+            return lambda: DomainProxy(self, name)
+        raise AttributeError(name)
+
+
+class DomainProxy:
+    """ Client domain object whose methods are called in the daemon """
+
+    def __init__(self, client, domain):
+        self.client = client
+        self.domain = domain
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self.client.call(self.domain, name, *args, **kwargs)
@@ -14,6 +14,12 @@ class EndRoleAuthorizations:
         self.client = client
 
     def list(self, name=None, aid=None, role=None):
+        path = self.path(name=name, aid=aid, role=role)
+        res = self.client.get(path)
+        return res.json()
+
+    @staticmethod
+    def path(name=None, aid=None, role=None):
         if name is not None:
             path = f"/identifiers/{name}/endroles"
         elif aid is not None:
@@ -24,6 +30,13 @@ class EndRoleAuthorizations:
         if role is not None:
             path = path + f"/{role}"
 
-        res = self.client.get(path)
-        return res.json()
+        return path
+
 
+class AsyncEndRoleAuthorizations(EndRoleAuthorizations):
+    """ Asyncio domain class for accessing Endpoint Role Authorizations """
+
+    async def list(self, name=None, aid=None, role=None):
+        path = self.path(name=name, aid=aid, role=role)
+        res = await self.client.get(path)
+        return res.json()
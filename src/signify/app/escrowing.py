@@ -20,3 +20,15 @@ class Escrows:
 
         res = self.client.get(f"/escrows/rpy", params=params)
         return res.json()
+
+
+class AsyncEscrows(Escrows):
+    """ Asyncio domain class for accessing event escrows in your Agent """
+
+    async def getEscrowReply(self, route=None):
+        params = {}
+        if route is not None:
+            params['route'] = route
+
+        res = await self.client.get("/escrows/rpy", params=params)
+        return res.json()
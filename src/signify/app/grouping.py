@@ -85,3 +85,34 @@ class Groups:
 
         res = self.client.post(f"/identifiers/{name}/multisig/join", json=body)
         return res.json()
+
+
+class AsyncGroups(Groups):
+    """ Asyncio domain class for multisig group AIDs, see Groups for parameters and results """
+
+    async def get_request(self, said):
+        res = await self.client.get(f"/multisig/request/{said}")
+        return res.json()
+
+    async def send_request(self, name, exn, sigs, atc):
+        body = dict(
+            exn=exn,
+            sigs=sigs,
+            atc=atc.decode("utf-8")
+        )
+
+        res = await self.client.post(f"/identifiers/{name}/multisig/request", json=body)
+        return res.json()
+
+    async def join(self, name, rot, sigs, gid, smids, rmids):
+        body = dict(
+            tpc='multisig',
+            rot=rot.ked,
+            sigs=sigs,
+            gid=gid,
+            smids=smids,
+            rmids=rmids,
+        )
+
+        res = await self.client.post(f"/identifiers/{name}/multisig/join", json=body)
+        return res.json()
@@ -4,6 +4,8 @@ SIGNIFY
 signify.app.notifying module
 
 """
+import functools
+
 from signify.app.clienting import SignifyClient
 from signify.core import httping
 
@@ -29,8 +31,29 @@ class Notifications:
         res = self.client.get(f"/notifications", headers=headers)
         cr = res.headers["content-range"]
         start, end, total = httping.parseRangeHeader(cr, "notes")
+        notes = res.json()
+        if getattr(self.client, "identifier_cache", None) is not None:
+            self.client.identifier_cache.notify(notes)
+
+        return dict(start=start, end=end, total=total, notes=notes)
+
+    def iter(self, size=100, prefetch=True):
+        """ Lazily iterate over all notifications, fetching size notifications per request
 
-        return dict(start=start, end=end, total=total, notes=res.json())
+        Parameters:
+            size (int): number of notifications requested per page
+            prefetch (bool): True means fetch the next page in the background while the current one is consumed
+
+        Returns:
+            Paginator: iterable of notification dicts
+
+        """
+        return httping.Paginator(functools.partial(self.client.get, "/notifications"), "notes", size=size,
+                                 prefetch=prefetch)
+
+    def list_all(self, size=100):
+        """ Returns list of all notifications, see iter """
+        return list(self.iter(size=size))
 
     def markAsRead(self, nid):
         """ Mark notification as read
@@ -57,3 +80,34 @@ class Notifications:
         """
         res = self.client.delete(path=f"/notifications/{nid}")
         return res.status_code == 202
+
+
+class AsyncNotifications(Notifications):
+    """ Asyncio domain class for accessing notifications, see Notifications for parameters and results """
+
+    async def list(self, start=0, end=24):
+        headers = dict(Range=f"notes={start}-{end}")
+        res = await self.client.get("/notifications", headers=headers)
+        cr = res.headers["content-range"]
+        start, end, total = httping.parseRangeHeader(cr, "notes")
+        notes = res.json()
+        if getattr(self.client, "identifier_cache", None) is not None:
+            self.client.identifier_cache.notify(notes)
+
+        return dict(start=start, end=end, total=total, notes=notes)
+
+    def iter(self, size=100, prefetch=True):
+        """ Lazily iterate over all notifications with async for, see Notifications.iter """
+        return httping.AsyncPaginator(functools.partial(self.client.get, "/notifications"), "notes", size=size,
+                                      prefetch=prefetch)
+
+    async def list_all(self, size=100):
+        return [note async for note in self.iter(size=size)]
+
+    async def markAsRead(self, nid):
+        res = await self.client.put(f"/notifications/{nid}", json={})
+        return res.status_code == 202
+
+    async def delete(self, nid):
+        res = await self.client.delete(path=f"/notifications/{nid}")
+        return res.status_code == 202
@@ -0,0 +1,282 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.passcoding module
+
+"""
+import asyncio
+import functools
+import itertools
+import multiprocessing
+import os
+from concurrent import futures
+
+from keri import kering
+from keri.core import coring, signing
+
+from signify.app.clienting import SignifyClient
+from signify.core import keeping
+from signify.core.authing import Controller
+
+# (decrypter, encrypter, ndecrypter) of the rotation run by this worker process, see initialize
+material = None
+
+
+def initialize(decrypter, encrypter, ndecrypter):
+    """ Process pool initializer creating the passcode crypt material of a rotation from qb64 """
+    global material
+    material = (signing.Decrypter(qb64=decrypter), signing.Encrypter(qb64=encrypter),
+                signing.Decrypter(qb64=ndecrypter))
+
+
+def recrypt(aid, crypt=None):
+    """ Returns (prefix, recrypted key material or None) of aid
+
+    Parameters:
+        aid (dict): identifier from the agent
+        crypt (tuple): (decrypter, encrypter, ndecrypter) of the rotation, defaults to that of this worker process
+
+    """
+    decrypter, encrypter, ndecrypter = crypt if crypt is not None else material
+    return aid["prefix"], Controller.recryptAid(aid, decrypter, encrypter, ndecrypter=ndecrypter)
+
+
+class Passcodes:
+    """ Domain class for rotating the passcode of the controller and recrypting the key material of every AID
+
+    Passcode rotation follows the steps of Controller.rotate.  AIDs are fetched a page at a time and validated and
+    recrypted in a process pool since every salty AID is stretched through argon2 to check its public keys.  The
+    next page is fetched and recrypted while the results of the previous one are collected.  The agent takes the
+    key material of every AID in the single request rotating the controller, so it is only sent once all AIDs are
+    recrypted.  The old salt, encrypted with the new passcode, is saved with the agent first, its presence in the
+    agent state marks a rotation to resume.
+
+    """
+
+    def __init__(self, client: SignifyClient):
+        self.client = client
+
+    def rotate(self, nbran, size=100, workers=None):
+        """ Rotate the passcode of the controller to nbran and recrypt the key material of every AID
+
+        Parameters:
+            nbran (str): new 21 character passcode
+            size (int): number of AIDs fetched and recrypted per page
+            workers (int): number of worker processes, defaults to the CPU count, 0 recrypts in this process
+
+        Returns:
+            dict: counts of AIDs recrypted and skipped and pages fetched
+
+        """
+        ctrl = self.client.ctrl
+
+        # The saved old salt is the checkpoint of an unfinished rotation
+        self.client._save_old_salt(ctrl.sxlt(ctrl.encrypter(nbran)))
+
+        keys, stats = self.recrypt(self.crypt(ctrl.decrypter(), nbran), size=size, workers=workers)
+
+        data, _, _, update = ctrl.rotation(nbran)
+        data["keys"] = keys
+        self.client.put(f"/agent/{self.client.controller}", json=data)
+        ctrl.commit(update)
+
+        self.finish()
+        return stats
+
+    def resume(self, nbran=None, size=100, workers=None):
+        """ Finish an interrupted passcode rotation
+
+        A client reconnected after the interruption is created with the old passcode, since the controller AID
+        derives from it, and is given the new passcode nbran.  A client whose controller already holds the new
+        passcode recovers the old one from the saved salt and needs no nbran.  When the rotation never reached the
+        agent it is started again.  Otherwise the agent took every recrypted key with the controller rotation, so
+        the AIDs are only checked and the saved salt deleted.
+
+        Parameters:
+            nbran (str): new passcode of the interrupted rotation, None when the controller already holds it
+            size (int): number of AIDs fetched and checked per page
+            workers (int): number of worker processes, defaults to the CPU count, 0 checks in this process
+
+        Returns:
+            dict: counts of AIDs recrypted and skipped and pages fetched, None when there is no rotation to resume
+
+        Raises:
+            ValidationError: when key material of an AID is still encrypted with the old passcode
+
+        """
+        state = self.client.states()
+        if state.sxlt is None:
+            return None
+
+        if nbran is None:
+            decrypter = self.client.ctrl.recover(state.sxlt)
+        else:
+            decrypter = self.client.ctrl.resume(nbran)
+            if decrypter is None:
+                return self.rotate(nbran, size=size, workers=workers)
+
+        keys, stats = self.recrypt(self.crypt(decrypter), size=size, workers=workers)
+        self.check(keys)
+
+        self.client._delete_old_salt()
+        self.finish()
+        return stats
+
+    @staticmethod
+    def check(keys):
+        if keys:
+            raise kering.ValidationError(f"key material of {len(keys)} AIDs is still encrypted with the old "
+                                         f"passcode after the controller rotation")
+
+    def crypt(self, decrypter, nbran=None):
+        """ Returns (decrypter, encrypter, ndecrypter) of the old passcode and of nbran, or of the current passcode
+        of the controller when nbran is None """
+        if nbran is None:
+            salter = self.client.ctrl.salter
+        else:
+            salter = signing.Salter(qb64=coring.MtrDex.Salt_128 + 'A' + nbran[:21])
+
+        signer = salter.signer(transferable=False)
+        return decrypter, signing.Encrypter(verkey=signer.verfer.qb64), signing.Decrypter(seed=signer.qb64)
+
+    @staticmethod
+    def executor(crypt, workers):
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            return None
+
+        # spawned rather than forked since page prefetching runs in a thread of this process
+        return futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                           initializer=initialize, initargs=tuple(matter.qb64 for matter in crypt))
+
+    def recrypt(self, crypt, size=100, workers=None):
+        """ Recrypt the key material of every AID with crypt, steps 3 to 5 of Controller.rotate
+
+        Returns:
+            (keys, stats): recrypted key material by AID prefix and counts of AIDs recrypted and skipped and pages
+                           fetched
+
+        """
+        keys = dict()
+        stats = dict(recrypted=0, skipped=0, pages=0)
+
+        aids = iter(self.client.identifiers().iter(size=size))
+        pool = self.executor(crypt, workers)
+        try:
+            pending = None
+            while page := list(itertools.islice(aids, size)):
+                if pool is not None:
+                    results = pool.map(recrypt, page)
+                else:
+                    results = [recrypt(aid, crypt) for aid in page]
+
+                if pending is not None:
+                    self.collect(pending, keys, stats)
+                pending = results
+
+            if pending is not None:
+                self.collect(pending, keys, stats)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return keys, stats
+
+    @staticmethod
+    def collect(results, keys, stats):
+        """ Add the recrypted key material of one page of results to keys """
+        for pre, recrypted in results:
+            if recrypted is None:
+                stats["skipped"] += 1
+            else:
+                keys[pre] = recrypted
+                stats["recrypted"] += 1
+        stats["pages"] += 1
+
+    def finish(self):
+        """ Replace the key manager of the client with one for the current passcode """
+        self.client.mgr = keeping.Manager(salter=self.client.ctrl.salter, extern_modules=self.client.extern_modules,
+                                          cache=self.client.signer_cache)
+
+
+class AsyncPasscodes(Passcodes):
+    """ Asyncio domain class for passcode rotation, see Passcodes for parameters and results
+
+    Recryption runs in the process pool, or a worker thread when workers is 0, so it does not block the event loop.
+
+    """
+
+    async def rotate(self, nbran, size=100, workers=None):
+        ctrl = self.client.ctrl
+
+        sxlt = await asyncio.to_thread(lambda: ctrl.sxlt(ctrl.encrypter(nbran)))
+        await self.client._save_old_salt(sxlt)
+
+        crypt = await asyncio.to_thread(lambda: self.crypt(ctrl.decrypter(), nbran))
+        keys, stats = await self.recrypt(crypt, size=size, workers=workers)
+
+        data, _, _, update = await asyncio.to_thread(ctrl.rotation, nbran)
+        data["keys"] = keys
+        await self.client.put(f"/agent/{self.client.controller}", json=data)
+        ctrl.commit(update)
+
+        self.finish()
+        return stats
+
+    async def resume(self, nbran=None, size=100, workers=None):
+        state = await self.client.states()
+        if state.sxlt is None:
+            return None
+
+        if nbran is None:
+            decrypter = await asyncio.to_thread(self.client.ctrl.recover, state.sxlt)
+        else:
+            decrypter = await asyncio.to_thread(self.client.ctrl.resume, nbran)
+            if decrypter is None:
+                return await self.rotate(nbran, size=size, workers=workers)
+
+        crypt = await asyncio.to_thread(self.crypt, decrypter)
+        keys, stats = await self.recrypt(crypt, size=size, workers=workers)
+        self.check(keys)
+
+        await self.client._delete_old_salt()
+        self.finish()
+        return stats
+
+    async def recrypt(self, crypt, size=100, workers=None):
+        keys = dict()
+        stats = dict(recrypted=0, skipped=0, pages=0)
+        loop = asyncio.get_running_loop()
+
+        pool = self.executor(crypt, workers)
+        work = recrypt
+        if pool is None:
+            pool = futures.ThreadPoolExecutor(max_workers=1)
+            work = functools.partial(recrypt, crypt=crypt)
+        try:
+            pending = None
+            page = []
+            async for aid in self.client.identifiers().iter(size=size):
+                page.append(aid)
+                if len(page) < size:
+                    continue
+
+                results = asyncio.gather(*[loop.run_in_executor(pool, work, aid) for aid in page])
+                if pending is not None:
+                    self.collect(await pending, keys, stats)
+                pending, page = results, []
+
+            if page:
+                results = asyncio.gather(*[loop.run_in_executor(pool, work, aid) for aid in page])
+                if pending is not None:
+                    self.collect(await pending, keys, stats)
+                pending = results
+
+            if pending is not None:
+                self.collect(await pending, keys, stats)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        return keys, stats
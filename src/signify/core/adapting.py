@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.adapting module
+
+requests transport adapter and auth of SignifyClient, kept apart so importing signify.app.clienting does not load
+requests
+"""
+from urllib.parse import urlsplit
+
+from keri.help import helping
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+
+from signify.core import tracing
+
+
+class SignifyAdapter(HTTPAdapter):
+    """ Pooled HTTP adapter applying a default timeout per request class to requests sent without one """
+
+    def __init__(self, timeouts, **kwargs):
+        """
+
+        Args:
+            timeouts (dict): timeouts per request class, keyed by lower case method name or stream
+            **kwargs: HTTPAdapter pooling and retry arguments
+        """
+        self.timeouts = timeouts
+        super(SignifyAdapter, self).__init__(**kwargs)
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeouts.get("stream" if stream else request.method.lower())
+
+        return super(SignifyAdapter, self).send(request, stream=stream, timeout=timeout, **kwargs)
+
+
+class SignifyAuth(AuthBase):
+
+    def __init__(self, authn):
+        """
+
+        Args:
+            authn(Authenticater): Provides request signing for AuthBase
+        """
+
+        self.authn = authn
+
+    def __call__(self, req):
+        span = tracing.current()
+        if span is not None:
+            span.mark("serialize")
+
+        headers = req.headers
+        headers['Signify-Resource'] = self.authn.ctrl.pre
+        headers['Signify-Timestamp'] = helping.nowIso8601()
+
+        if "Content-Length" not in headers and req.body:
+            headers["Content-Length"] = len(req.body)
+
+        p = urlsplit(req.url)
+        path = p.path if p.path else "/"
+        req.headers = self.authn.sign(headers, req.method, path)
+
+        if span is not None:
+            span.mark("sign")
+        return req
@@ -4,12 +4,15 @@ SIGNIFY
 signify.core.authing module
 
 """
+import re
+import time
+from collections import namedtuple
 from urllib.parse import urlparse
 
 from keri import kering
 from keri.app import keeping
 from keri.core import coring, eventing, serdering, signing
-from keri.end import ending
+from keri.help import helping
 
 from signify.signifying import SignifyState
 
@@ -114,6 +117,19 @@ class Controller:
                                    wits=[])
         elif type(state) is SignifyState:
             return serdering.SerderKERI(sad=state.controller['ee'])
+        else:
+            return serdering.SerderKERI(sad=state['ee'])
+
+    def restate(self, state):
+        """ Update the controller key event from state without stretching the passcode again.  The signing and
+        next signing keys are derived from the passcode alone so a Controller created before the agent state was
+        known can be brought up to date with the state returned at connect.
+
+        Parameters:
+            state (dict | SignifyState): controller inception event state
+
+        """
+        self.serder = self.derive(state)
 
     def approveDelegation(self, agent):
         seqner = coring.Seqner(sn=agent.sn)
@@ -155,10 +171,37 @@ class Controller:
 
         """
 
+        data, decrypter, encrypter, update = self.rotation(nbran)
+        self.commit(update)
+
+        # Now recrypt all salts and saved keys after verifying they are decrypting correctly
+        keys = dict()
+        for aid in aids:
+            recrypted = self.recryptAid(aid, decrypter, encrypter)
+            if recrypted is not None:
+                keys[aid["prefix"]] = recrypted
+
+        data["keys"] = keys
+        return data
+
+    def rotation(self, nbran):
+        """ Rotate the controller AID to passcode nbran without recrypting any AID key material, steps 1 and 2
+        of rotate.  The Controller is left unchanged, pass update to commit once the agent accepted the rotation.
+
+        Parameters:
+            nbran (str):  new passcode to use for re-encryption
+
+        Returns:
+            (data, decrypter, encrypter, update): agent request body with the controller rotation event rot, its
+                signatures sigs and the old salt encrypted with the new passcode sxlt, the Decrypter of the old
+                passcode, the Encrypter of the new passcode and the new controller material for commit
+
+        """
         # First we create the new salter and then use it to encrypted the OLD salt
         nbran = coring.MtrDex.Salt_128 + 'A' + nbran[:21]  # qb64 salt for seed
         nsalter = signing.Salter(qb64=nbran)
-        nsigner = self.salter.signer(transferable=False)
+        osigner = self.salter.signer(transferable=False)
+        nsigner = nsalter.signer(transferable=False)
 
         # This is the previous next signer so it will be used to sign the rotation and then have 0 signing authority
         #here
@@ -166,81 +209,174 @@ class Controller:
         signer = creator.create(ridx=0 + 1, tier=self.tier).pop()
 
         ncreator = keeping.SaltyCreator(salt=nsalter.qb64, stem=self.stem, tier=self.tier)
-        self.signer = ncreator.create(ridx=0, tier=self.tier).pop()
-        self.nsigner = ncreator.create(ridx=0 + 1, tier=self.tier).pop()
+        csigner = ncreator.create(ridx=0, tier=self.tier).pop()
+        cnsigner = ncreator.create(ridx=0 + 1, tier=self.tier).pop()
 
-        self.keys = [self.signer.verfer.qb64, signer.verfer.qb64]
-        self.ndigs = [coring.Diger(ser=self.nsigner.verfer.qb64b).qb64]
+        keys = [csigner.verfer.qb64, signer.verfer.qb64]
+        ndigs = [coring.Diger(ser=cnsigner.verfer.qb64b).qb64]
 
         # Now rotate the controller AID to authenticate the passcode rotation
         rot = eventing.rotate(pre=self.serder.pre,
-                              keys=self.keys,
+                              keys=keys,
                               dig=self.serder.ked['d'],
                               isith=["1", "0"],
                               nsith="1",
-                              ndigs=self.ndigs)
+                              ndigs=ndigs)
 
-        sigs = [signer.sign(ser=rot.raw, index=1, ondex=0).qb64, self.signer.sign(ser=rot.raw, index=0).qb64]
+        sigs = [signer.sign(ser=rot.raw, index=1, ondex=0).qb64, csigner.sign(ser=rot.raw, index=0).qb64]
 
         encrypter = signing.Encrypter(verkey=nsigner.verfer.qb64)  # encrypter for new salt
-        decrypter = signing.Decrypter(seed=nsigner.qb64)  # decrypter with old salt
+        decrypter = signing.Decrypter(seed=osigner.qb64)  # decrypter with old salt
 
         # First encrypt and save old Salt in case we need a recovery
-        sxlt = encrypter.encrypt(prim=coring.Matter(qb64b=self.bran)).qb64
+        sxlt = self.sxlt(encrypter)
 
         data = dict(
             rot=rot.ked,
             sigs=sigs,
             sxlt=sxlt,
         )
+        update = dict(signer=csigner, nsigner=cnsigner, keys=keys, ndigs=ndigs, serder=rot, bran=nbran,
+                      salter=nsalter)
 
-        # Not recrypt all salts and saved keys after verifying they are decrypting correctly
-        keys = dict()
-        for aid in aids:
-            pre = aid["prefix"]
-            if "salty" in aid:
-                salty = aid["salty"]
-                cipher = signing.Cipher(qb64=salty["sxlt"])
-                dnxt = decrypter.decrypt(cipher=cipher).qb64
-
-                # Now we have the AID salt, use it to verify against the current public keys
-                acreator = keeping.SaltyCreator(dnxt, stem=salty["stem"], tier=salty["tier"])
-                signers = acreator.create(codes=salty["icodes"], pidx=salty["pidx"], kidx=salty["kidx"],
-                                          transferable=salty["transferable"])
-                pubs = aid["state"]["k"]
-                if pubs != [signer.verfer.qb64 for signer in signers]:
-                    raise kering.ValidationError(f"unable to rotate, validation of salt to public keys {pubs} failed")
-
-                asxlt = encrypter.encrypt(prim=coring.Matter(qb64=dnxt)).qb64
-                keys[pre] = dict(
-                    sxlt=asxlt
-                )
-
-            elif "randy" in aid:
-                randy = aid["randy"]
-                prxs = randy["prxs"]
-                nxts = randy["nxts"]
-
-                nprxs = []
-                signers = []
-                for prx in prxs:
-                    cipher = signing.Cipher(qb64=prx)
-                    dsigner = decrypter.decrypt(cipher=cipher, transferable=True)
-                    signers.append(dsigner)
-                    nprxs.append(encrypter.encrypt(prim=coring.Matter(qb64=dsigner.qb64)).qb64)
-
-                pubs = aid["state"]["k"]
-                if pubs != [signer.verfer.qb64 for signer in signers]:
-                    raise kering.ValidationError(f"unable to rotate, validation of encrypted public keys {pubs} failed")
-
-                nnxts = []
-                for nxt in nxts:
-                    nnxts.append(self.recrypt(nxt, decrypter, encrypter))
-
-                keys[pre] = dict(prxs=nprxs, nxts=nxts)
+        return data, decrypter, encrypter, update
 
-        data["keys"] = keys
-        return data
+    def commit(self, update):
+        """ Take on the new passcode material update returned by rotation, once the agent accepted the rotation """
+        self.signer = update["signer"]
+        self.nsigner = update["nsigner"]
+        self.keys = update["keys"]
+        self.ndigs = update["ndigs"]
+        self.serder = update["serder"]
+        self.bran = update["bran"]
+        self.salter = update["salter"]
+
+    def sxlt(self, encrypter):
+        """ Returns the current salt encrypted with encrypter, see encrypter for the encrypter of a new passcode """
+        return encrypter.encrypt(prim=coring.Matter(qb64b=self.bran)).qb64
+
+    @staticmethod
+    def encrypter(bran):
+        """ Returns the Encrypter of key material for passcode bran """
+        salter = signing.Salter(qb64=coring.MtrDex.Salt_128 + 'A' + bran[:21])
+        return signing.Encrypter(verkey=salter.signer(transferable=False).verfer.qb64)
+
+    def decrypter(self):
+        """ Returns the Decrypter of key material for the current passcode """
+        return signing.Decrypter(seed=self.salter.signer(transferable=False).qb64)
+
+    def resume(self, nbran):
+        """ Take on passcode nbran that the controller AID was already rotated to by an unfinished rotation, when
+        this Controller was created with the old passcode to reconnect to the agent
+
+        Parameters:
+            nbran (str):  new passcode of the interrupted rotation
+
+        Returns:
+            Decrypter: decrypter of the old passcode, None when the controller AID was not rotated to nbran
+
+        """
+        nbran = coring.MtrDex.Salt_128 + 'A' + nbran[:21]  # qb64 salt for seed
+        nsalter = signing.Salter(qb64=nbran)
+        ncreator = keeping.SaltyCreator(salt=nsalter.qb64, stem=self.stem, tier=self.tier)
+        signer = ncreator.create(ridx=0, tier=self.tier).pop()
+        if self.serder.ked.get("k", [None])[0] != signer.verfer.qb64:
+            return None
+
+        decrypter = self.decrypter()
+        self.signer = signer
+        self.nsigner = ncreator.create(ridx=0 + 1, tier=self.tier).pop()
+        self.keys = self.serder.ked["k"]
+        self.ndigs = self.serder.ked["n"]
+        self.bran = nbran
+        self.salter = nsalter
+
+        return decrypter
+
+    def recover(self, sxlt):
+        """ Returns the Decrypter of the old passcode from the old salt sxlt saved by rotation, encrypted with the
+        current passcode of this Controller """
+        osalter = signing.Salter(qb64=self.decrypter().decrypt(cipher=signing.Cipher(qb64=sxlt)).qb64)
+        return signing.Decrypter(seed=osalter.signer(transferable=False).qb64)
+
+    @staticmethod
+    def recryptAid(aid, decrypter: signing.Decrypter, encrypter: signing.Encrypter,
+                   ndecrypter: signing.Decrypter = None):
+        """ Validate and recrypt the key material of one AID from the old to the new passcode, steps 4 and 5 of
+        rotate
+
+        Parameters:
+            aid (dict): identifier from the agent
+            decrypter (Decrypter): decrypter of the old passcode
+            encrypter (Encrypter): encrypter of the new passcode
+            ndecrypter (Decrypter): decrypter of the new passcode, when provided key material that already decrypts
+                                    with it is skipped, as needed when recovering an interrupted rotation
+
+        Returns:
+            dict: recrypted key material of the AID, None when there is nothing to recrypt
+
+        Raises:
+            ValidationError: when the decrypted key material does not match the public keys of the AID
+
+        """
+        if "salty" in aid:
+            salty = aid["salty"]
+            cipher = signing.Cipher(qb64=salty["sxlt"])
+            if ndecrypter is not None and Controller.decrypts(ndecrypter, cipher):
+                return None
+
+            dnxt = decrypter.decrypt(cipher=cipher).qb64
+
+            # Now we have the AID salt, use it to verify against the current public keys
+            acreator = keeping.SaltyCreator(dnxt, stem=salty["stem"], tier=salty["tier"])
+            signers = acreator.create(codes=salty["icodes"], pidx=salty["pidx"], kidx=salty["kidx"],
+                                      transferable=salty["transferable"])
+            pubs = aid["state"]["k"]
+            if pubs != [signer.verfer.qb64 for signer in signers]:
+                raise kering.ValidationError(f"unable to rotate, validation of salt to public keys {pubs} failed")
+
+            asxlt = encrypter.encrypt(prim=coring.Matter(qb64=dnxt)).qb64
+            return dict(
+                sxlt=asxlt
+            )
+
+        elif "randy" in aid:
+            randy = aid["randy"]
+            prxs = randy["prxs"]
+            nxts = randy["nxts"]
+
+            if ndecrypter is not None and prxs and Controller.decrypts(ndecrypter, signing.Cipher(qb64=prxs[0]),
+                                                                       transferable=True):
+                return None
+
+            nprxs = []
+            signers = []
+            for prx in prxs:
+                cipher = signing.Cipher(qb64=prx)
+                dsigner = decrypter.decrypt(cipher=cipher, transferable=True)
+                signers.append(dsigner)
+                nprxs.append(encrypter.encrypt(prim=coring.Matter(qb64=dsigner.qb64)).qb64)
+
+            pubs = aid["state"]["k"]
+            if pubs != [signer.verfer.qb64 for signer in signers]:
+                raise kering.ValidationError(f"unable to rotate, validation of encrypted public keys {pubs} failed")
+
+            nnxts = []
+            for nxt in nxts:
+                nnxts.append(Controller.recrypt(nxt, decrypter, encrypter))
+
+            return dict(prxs=nprxs, nxts=nnxts)
+
+        return None
+
+    @staticmethod
+    def decrypts(decrypter, cipher, **kwa):
+        """ Returns True if cipher decrypts with decrypter """
+        try:
+            decrypter.decrypt(cipher=cipher, **kwa)
+        except ValueError:
+            return False
+        return True
 
     @staticmethod
     def recrypt(enc, decrypter: signing.Decrypter, encrypter: signing.Encrypter):
@@ -249,6 +385,15 @@ class Controller:
         return encrypter.encrypt(prim=coring.Matter(qb64=dnxt)).qb64
 
 
+# Signature-Input member of quoted fields with integer or quoted string parameters, see Authenticater.desiginput
+SigInputRex = re.compile(r'(?P<name>[a-z*][a-z0-9_.*-]*)=\((?P<fields>(?:"[^" \\]*"(?: "[^" \\]*")*)?)\)'
+                         r'(?P<params>(?:;[a-z*][a-z0-9_.*-]*=(?:-?[0-9]{1,15}|"[^";,\\]*"))*)')
+
+# Parsed Signature-Input member with the fields of keri.end.ending.Inputage, whose module is only imported for
+# headers outside the forms agents produce since it pulls in falcon and habbing
+Inputage = namedtuple("Inputage", "name fields created keyid alg expires nonce context")
+
+
 class Authenticater:
     DefaultFields = ["@method",
                      "@path",
@@ -256,6 +401,9 @@ class Authenticater:
                      "Signify-Resource",
                      "Signify-Timestamp"]
 
+    # lower cased header fields of DefaultFields looked up by signDefault
+    DefaultHeaderFields = ("content-length", "signify-resource", "signify-timestamp")
+
     def __init__(self, agent: Agent, ctrl: Controller):
         """ Create Agent Authenticator for verifying requests and signing responses
 
@@ -270,8 +418,12 @@ class Authenticater:
         self.agent = agent
         self.ctrl = ctrl
 
+        self.verifies = 0
+        self.failures = 0
+        self.verifyTime = 0.0
+
     def verify(self, rep, **kwargs):
-        url = urlparse(rep.request.url)
+        url = urlparse(str(rep.request.url))
         if "SIGNIFY-RESOURCE" not in rep.headers:
             raise kering.AuthNError("No valid signature from agent on response.")
 
@@ -280,65 +432,152 @@ class Authenticater:
             raise kering.AuthNError("No valid signature from agent on response.")
 
     def verifysig(self, headers, method, path):
-        headers = headers
-        if "SIGNATURE-INPUT" not in headers:
-            return False
+        """ Verify the agent signature over a response
 
-        siginput = headers["SIGNATURE-INPUT"]
+        Signature-Input and Signature are each parsed once, the signature base is built into one byte buffer and
+        checked with the agent's Verfer.  Counts and time spent are accumulated in verifies, failures and
+        verifyTime.
 
-        if "SIGNATURE" not in headers:
-            return False
+        Parameters:
+            headers (dict): HTTP response headers, looked up with upper case field names
+            method (str): HTTP method name of the request
+            path (str): HTTP Query path of the request
 
-        signature = headers["SIGNATURE"]
+        Returns:
+            bool: True means signature verified, False means signature headers missing
 
-        inputs = ending.desiginput(siginput.encode("utf-8"))
-        inputs = [i for i in inputs if i.name == "signify"]
+        Raises:
+            AuthNError: when the signature does not verify
 
+        """
+        start = time.perf_counter()
+        try:
+            return self._verifysig(headers, method, path)
+        except kering.AuthNError:
+            self.failures += 1
+            raise
+        finally:
+            self.verifies += 1
+            self.verifyTime += time.perf_counter() - start
+
+    def _verifysig(self, headers, method, path):
+        if "SIGNATURE-INPUT" not in headers or "SIGNATURE" not in headers:
+            return False
+
+        inputs = [i for i in self.desiginput(headers["SIGNATURE-INPUT"]) if i.name == "signify"]
         if not inputs:
             return False
 
+        markers = self.designature(headers["SIGNATURE"])
+        verfer = self.agent.verfer
+        method = method.encode("utf-8")
+        path = path.encode("utf-8")
+
         for inputage in inputs:
-            items = []
+            ser = bytearray()
             for field in inputage.fields:
-                if field.startswith("@"):
-                    if field == "@method":
-                        items.append(f'"{field}": {method}')
-                    elif field == "@path":
-                        items.append(f'"{field}": {path}')
-
+                if field == "@method":
+                    value = method
+                elif field == "@path":
+                    value = path
+                elif field.startswith("@"):
+                    continue
                 else:
                     key = field.upper()
-                    field = field.lower()
                     if key not in headers:
                         continue
 
-                    value = ending.normalize(headers[key])
-                    items.append(f'"{field}": {value}')
-
-            values = [f"({' '.join(inputage.fields)})", f"created={inputage.created}"]
-            if inputage.expires is not None:
-                values.append(f"expires={inputage.expires}")
-            if inputage.nonce is not None:
-                values.append(f"nonce={inputage.nonce}")
-            if inputage.keyid is not None:
-                values.append(f"keyid={inputage.keyid}")
-            if inputage.context is not None:
-                values.append(f"context={inputage.context}")
-            if inputage.alg is not None:
-                values.append(f"alg={inputage.alg}")
-
-            params = ';'.join(values)
-
-            items.append(f'"@signature-params: {params}"')
-            ser = "\n".join(items).encode("utf-8")
-
-            signages = ending.designature(signature)
-            cig = signages[0].markers[inputage.name]
-            if not self.agent.verfer.verify(sig=cig.raw, ser=ser):
+                    field = field.lower()
+                    value = headers[key].strip().encode("utf-8")
+
+                ser += b'"%s": %s\n' % (field.encode("utf-8"), value)
+
+            ser += b'"@signature-params: (%s);created=%d' % (" ".join(inputage.fields).encode("utf-8"),
+                                                               inputage.created)
+            for param in ("expires", "nonce", "keyid", "context", "alg"):
+                value = getattr(inputage, param)
+                if value is not None:
+                    ser += f";{param}={value}".encode("utf-8")
+            ser += b'"'
+
+            cig = markers[0][inputage.name]
+            if not verfer.verify(sig=cig.raw, ser=bytes(ser)):
                 raise kering.AuthNError(f"Signature for {inputage} invalid")
 
         return True
 
+    @staticmethod
+    def desiginput(value):
+        """ Parse Signature-Input header value into list of Inputage
+
+        Handles the inner list of quoted field names followed by integer or quoted string parameters that agents
+        produce with a single scan, falling back to the full structured field parser of ending.desiginput for
+        anything else.
+
+        Parameters:
+            value (str): Signature-Input header value
+
+        Returns:
+            list: Inputage for each signature input in value
+
+        """
+        inputs = []
+        for member in value.split(","):
+            match = SigInputRex.fullmatch(member.strip())
+            if match is None:
+                from keri.end import ending
+                return [Inputage(*inputage) for inputage in ending.desiginput(value.encode("utf-8"))]
+
+            params = dict(expires=None, nonce=None, alg=None, keyid=None, context=None)
+            for param in match.group("params").split(";")[1:]:
+                key, val = param.split("=", 1)
+                params[key] = val[1:-1] if val.startswith('"') else int(val)
+
+            created = params.pop("created", None)
+            if created is None:
+                raise ValueError("missing required `created` field from signature input")
+
+            fields = [field[1:-1] for field in match.group("fields").split(" ") if field]
+            inputs.append(Inputage(name=match.group("name"), fields=fields, created=created,
+                                   expires=params["expires"], nonce=params["nonce"], alg=params["alg"],
+                                   keyid=params["keyid"], context=params["context"]))
+
+        return inputs
+
+    @staticmethod
+    def designature(value):
+        """ Parse Signature header value into the markers of each signage
+
+        Unindexed CESR signatures, the form agents produce, are parsed directly into Cigars.  Anything else falls back
+        to ending.designature.
+
+        Parameters:
+            value (str): Signature header value
+
+        Returns:
+            list: dict of marker name to Cigar or Siger for each signage in value
+
+        """
+        signages = []
+        for group in value.replace(" ", "").split(","):
+            items = dict()
+            for item in group.split(";"):
+                key, val = item.split("=", 1)
+                items[key] = val.strip('"')
+
+            indexed = items.pop("indexed", None)
+            if indexed != "?0" or any(key in items for key in ("signer", "ordinal", "digest", "kind")):
+                from keri.end import ending
+                return [signage.markers for signage in ending.designature(value)]
+
+            signages.append({name: coring.Cigar(qb64=qb64) for name, qb64 in items.items()})
+
+        return signages
+
+    def stats(self):
+        """ Returns dict of response verification counters, verifies, failures and seconds spent verifying """
+        return dict(verifies=self.verifies, failures=self.failures, seconds=self.verifyTime)
+
     def sign(self, headers, method, path, fields=None):
         """ Generate and add Signature Input and Signature fields to headers
 
@@ -353,8 +592,10 @@ class Authenticater:
 
         """
 
-        if fields is None:
-            fields = self.DefaultFields
+        if fields is None or fields == self.DefaultFields:
+            return self.signDefault(headers, method, path)
+
+        from keri.end import ending
 
         header, qsig = ending.siginput("signify", method, path, headers, fields=fields, signers=[self.ctrl.signer],
                                        alg="ed25519", keyid=self.ctrl.pre)
@@ -367,3 +608,37 @@ class Authenticater:
             headers[key] = val
 
         return headers
+
+    def signDefault(self, headers, method, path):
+        """ Add Signature Input and Signature fields over DefaultFields to headers
+
+        Builds the signature base and header values directly as strings instead of through the structured field
+        and Signage objects of ending.siginput and ending.signature.  The resulting headers are identical.
+
+        Parameters:
+            headers (dict): HTTP header to sign, looked up with lower case field names
+            method (str): HTTP method name of request/response
+            path (str): HTTP Query path of request/response
+
+        Returns:
+            headers (dict): Modified headers with new Signature and Signature Input fields
+
+        """
+        ifields = ["@method", "@path"]
+        base = [f'"@method": {method}', f'"@path": {path}']
+        for field in self.DefaultHeaderFields:
+            if field in headers:
+                ifields.append(field)
+                base.append(f'"{field}": {str(headers[field]).strip()}')
+
+        created = int(helping.nowUTC().timestamp())
+        pre = self.ctrl.pre
+        base.append(f'"@signature-params: ({" ".join(ifields)});created={created};keyid={pre};alg=ed25519"')
+
+        cigar = self.ctrl.signer.sign("\n".join(base).encode("utf-8"))
+
+        quoted = " ".join([f'"{field}"' for field in ifields])
+        headers["Signature-Input"] = f'signify=({quoted});created={created};keyid="{pre}";alg="ed25519"'
+        headers["Signature"] = f'indexed="?0";signify="{cigar.qb64}"'
+
+        return headers
@@ -22,4 +22,161 @@ def parseRangeHeader(header: str, typ: str) -> Tuple[int, int, int]:
     values = data.split("/")
     rng = values[0].split("-")
 
-    return int(rng[0]), int(rng[1]), int(values[1])
\ No newline at end of file
+    return int(rng[0]), int(rng[1]), int(values[1])
+
+
+class Paginator:
+    """ Lazy iterator over every item of a Range header paginated list endpoint
+
+    Pages of size items are requested with a ``Range: typ=start-end`` header until the total reported in the
+    Content-Range response header has been reached.  While the items of one page are being consumed the next page
+    is fetched in a background thread so iteration proceeds at the speed of the consumer rather than the agent.
+    Only the current and next page are held in memory.
+
+    """
+
+    def __init__(self, fetch, typ, size=25, prefetch=True):
+        """ Create paginator over a list endpoint
+
+        Parameters:
+            fetch (Callable): function called with a headers keyword argument that returns the HTTP response
+            typ (str): range type of the endpoint, for example aids or notes
+            size (int): number of items requested per page
+            prefetch (bool): True means fetch the next page in the background
+
+        """
+        if size < 1:
+            raise ValueError(f"invalid page size={size}")
+
+        self.fetch = fetch
+        self.typ = typ
+        self.size = size
+        self.prefetch = prefetch
+
+    def page(self, start):
+        """ Fetch the page beginning at start
+
+        Returns:
+            (items, total): tuple of list of items on the page and total number of items in the list
+
+        """
+        headers = dict(Range=f"{self.typ}={start}-{start + self.size - 1}")
+        res = self.fetch(headers=headers)
+        return self.parse(res, start)
+
+    def parse(self, res, start):
+        items = res.json()
+        if not items:
+            return items, start
+
+        _, _, total = parseRangeHeader(res.headers["content-range"], self.typ)
+        return items, total
+
+    def __iter__(self):
+        pool = None
+        start = 0
+        items, total = self.page(start)
+        try:
+            while items:
+                start += len(items)
+                nxt = None
+                if start < total and self.prefetch:
+                    if pool is None:
+                        from concurrent import futures
+                        pool = futures.ThreadPoolExecutor(max_workers=1)
+                    nxt = pool.submit(self.page, start)
+
+                yield from items
+
+                if start >= total:
+                    break
+
+                items, total = nxt.result() if nxt is not None else self.page(start)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncPaginator(Paginator):
+    """ Lazy async iterator over every item of a Range header paginated list endpoint, see Paginator
+
+    fetch must be a coroutine function and the next page is prefetched in a task on the running event loop.
+
+    """
+
+    async def page(self, start):
+        headers = dict(Range=f"{self.typ}={start}-{start + self.size - 1}")
+        res = await self.fetch(headers=headers)
+        return self.parse(res, start)
+
+    def __iter__(self):
+        raise TypeError("AsyncPaginator must be iterated with async for")
+
+    async def __aiter__(self):
+        import asyncio
+
+        start = 0
+        nxt = None
+        items, total = await self.page(start)
+        try:
+            while items:
+                start += len(items)
+                nxt = None
+                if start < total and self.prefetch:
+                    nxt = asyncio.ensure_future(self.page(start))
+
+                for item in items:
+                    yield item
+
+                if start >= total:
+                    break
+
+                items, total = await nxt if nxt is not None else await self.page(start)
+                nxt = None
+        finally:
+            if nxt is not None:
+                nxt.cancel()
+
+
+class QueryPaginator(Paginator):
+    """ Lazy iterator over every item of a list endpoint paged with skip and limit in the request body
+
+    Such endpoints report no total so a page shorter than size ends the list.  The next page is fetched, decoded and
+    transformed in a background thread while the current one is consumed, see Paginator.
+
+    """
+
+    def __init__(self, fetch, size=25, prefetch=True, transform=None):
+        """ Create paginator over a query endpoint
+
+        Parameters:
+            fetch (Callable): function called with skip and limit keyword arguments that returns the HTTP response
+            size (int): number of items requested per page
+            prefetch (bool): True means fetch the next page in the background
+            transform (Callable): optional function applied to every item as its page is decoded
+
+        """
+        super(QueryPaginator, self).__init__(fetch, None, size=size, prefetch=prefetch)
+        self.transform = transform
+
+    def page(self, start):
+        return self.parse(self.fetch(skip=start, limit=self.size), start)
+
+    def parse(self, res, start):
+        items = res.json()
+        if self.transform is not None:
+            items = [self.transform(item) for item in items]
+
+        # a full page may be followed by more items
+        return items, start + len(items) + (1 if len(items) == self.size else 0)
+
+
+class AsyncQueryPaginator(QueryPaginator, AsyncPaginator):
+    """ Lazy async iterator over every item of a skip and limit query endpoint, see QueryPaginator
+
+    fetch must be a coroutine function and the next page is prefetched in a task on the running event loop.
+
+    """
+
+    async def page(self, start):
+        return self.parse(await self.fetch(skip=start, limit=self.size), start)
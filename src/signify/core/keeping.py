@@ -7,6 +7,9 @@ signify.core.keeping module
 
 
 import importlib
+import threading
+import time
+from collections import OrderedDict
 
 from keri import kering
 from keri.app import keeping
@@ -14,10 +17,137 @@ from keri.core import coring, signing
 from keri.core.coring import Tiers, MtrDex
 
 
+class SignerCache:
+    """
+    Bounded LRU cache of derived Signers for salty keepers.  Deriving signers from an AID salt requires a full
+    key stretch for every signature, so hot AIDs can opt in to keeping their current signing seeds in memory for a
+    limited time.  Entries are keyed by (prefix, pidx, kidx, sxlt, transferable) so any rotation or re-encryption of
+    the AID salt results in a new key and the stale entry ages out.
+
+    Seeds are held in mutable buffers that are overwritten with zeros when an entry is evicted, expires or the cache
+    is cleared.  Each hit returns newly created Signer instances so eviction never invalidates a signer in use.
+
+    """
+
+    def __init__(self, size=128, ttl=300.0):
+        """ Create a signer cache
+
+        Parameters:
+            size (int): maximum number of cached entries, least recently used entries are evicted first
+            ttl (float): number of seconds a cached entry remains valid after it is added
+
+        """
+        if size < 1:
+            raise ValueError(f"invalid signer cache size={size}, must be at least 1")
+
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """ Return signers for key or None if not present or expired
+
+        Parameters:
+            key (tuple): cache key of (prefix, pidx, kidx, sxlt, transferable)
+
+        Returns:
+            list: Signer instances created from the cached seeds or None
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, seeds = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                self.zeroize(seeds)
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return [signing.Signer(raw=bytes(raw), code=code, transferable=transferable)
+                    for code, raw, transferable in seeds]
+
+    def put(self, key, signers):
+        """ Add seeds of signers to the cache under key, evicting least recently used entries as needed
+
+        Parameters:
+            key (tuple): cache key of (prefix, pidx, kidx, sxlt, transferable)
+            signers (list): Signer instances derived for key
+
+        """
+        seeds = [(signer.code, bytearray(signer.raw), signer.verfer.transferable) for signer in signers]
+        with self._lock:
+            if key in self._entries:
+                _, old = self._entries.pop(key)
+                self.zeroize(old)
+
+            self._entries[key] = (time.monotonic() + self.ttl, seeds)
+            while len(self._entries) > self.size:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.evictions += 1
+                self.zeroize(evicted)
+
+    def clear(self):
+        """ Remove and zeroize all cached seeds """
+        with self._lock:
+            while self._entries:
+                _, (_, seeds) = self._entries.popitem(last=False)
+                self.zeroize(seeds)
+
+    def stats(self):
+        """ Get cache statistics
+
+        Returns:
+            dict: size, hits, misses and evictions of this cache
+
+        """
+        with self._lock:
+            return dict(size=len(self._entries), hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+    @staticmethod
+    def zeroize(seeds):
+        """ Overwrite cached seed buffers with zeros in place
+
+        Parameters:
+            seeds (list): (code, bytearray, transferable) tuples of cached key material
+
+        """
+        for _, raw, _ in seeds:
+            raw[:] = bytes(len(raw))
+
+
 class Manager:
 
-    def __init__(self, salter, extern_modules=None):
+    def __init__(self, salter, extern_modules=None, cache=None):
+        """ Create key manager for the keepers of all AIDs of a SignifyClient
+
+        Parameters:
+            salter (Salter): passcode salter used for encrypting AID key material
+            extern_modules (list): external key management module configurations
+            cache (SignerCache): optional cache of derived salty signers, None disables caching
+
+        """
         self.salter = salter
+        self.cache = cache
+        self._aeid = None
+        self._encrypter = None
+        self._decrypter = None
+        self._lock = threading.Lock()
+
         extern_modules = extern_modules if extern_modules is not None else []
         self.modules = dict()
         for module in extern_modules:
@@ -30,16 +160,48 @@ class Manager:
 
             self.modules[typ] = mod
 
+    @property
+    def aeid(self):
+        """ qb64 non-transferable public key derived from the passcode used to encrypt AID key material """
+        self._derive()
+        return self._aeid
+
+    @property
+    def encrypter(self):
+        """ Encrypter for AID key material derived once from the passcode """
+        self._derive()
+        return self._encrypter
+
+    @property
+    def decrypter(self):
+        """ Decrypter for AID key material derived once from the passcode """
+        self._derive()
+        return self._decrypter
+
+    def _derive(self):
+        """ Stretch the passcode into the encryption key pair on first use and share it with all keepers """
+        if self._aeid is not None:
+            return
+
+        with self._lock:
+            if self._aeid is None:
+                signer = self.salter.signer(transferable=False)
+                self._encrypter = signing.Encrypter(verkey=signer.verfer.qb64)
+                self._decrypter = signing.Decrypter(seed=signer.qb64)
+                self._aeid = signer.verfer.qb64
+
     def new(self, algo, pidx, **kwargs):
         match algo:
             case keeping.Algos.salty:
-                return SaltyKeeper(salter=self.salter, pidx=pidx, **kwargs)
+                return SaltyKeeper(salter=self.salter, pidx=pidx, aeid=self.aeid, encrypter=self.encrypter,
+                                   decrypter=self.decrypter, **kwargs)
 
             case keeping.Algos.group:
                 return GroupKeeper(mgr=self, **kwargs)
 
             case keeping.Algos.randy:
-                return RandyKeeper(salter=self.salter, **kwargs)
+                return RandyKeeper(salter=self.salter, aeid=self.aeid, encrypter=self.encrypter,
+                                   decrypter=self.decrypter, **kwargs)
 
             case keeping.Algos.extern:
                 typ = kwargs["extern_type"]
@@ -56,11 +218,16 @@ class Manager:
             kwargs = aid[keeping.Algos.salty]
             if "pidx" not in kwargs:
                 raise kering.ConfigurationError(f"missing pidx in {kwargs}")
-            return SaltyKeeper(salter=self.salter, **kwargs)
+            if self.cache is not None:
+                return SaltyKeeper(salter=self.salter, aeid=self.aeid, encrypter=self.encrypter,
+                                   decrypter=self.decrypter, cache=self.cache, pre=aid["prefix"], **kwargs)
+            return SaltyKeeper(salter=self.salter, aeid=self.aeid, encrypter=self.encrypter,
+                               decrypter=self.decrypter, **kwargs)
 
         elif keeping.Algos.randy in aid:
             kwargs = aid[keeping.Algos.randy]
-            return RandyKeeper(salter=self.salter, transferable=pre.transferable, **kwargs)
+            return RandyKeeper(salter=self.salter, aeid=self.aeid, encrypter=self.encrypter,
+                               decrypter=self.decrypter, transferable=pre.transferable, **kwargs)
 
         elif keeping.Algos.group in aid:
             kwargs = aid[keeping.Algos.group]
@@ -90,6 +257,27 @@ class BaseKeeper:
         else:
             return keeping.Algos.extern
 
+    @staticmethod
+    def crypt(salter, aeid=None, encrypter=None, decrypter=None):
+        """ Return passcode encryption material, stretching the passcode only when it was not provided
+
+        Parameters:
+            salter (Salter): passcode salter
+            aeid (str): qb64 passcode derived public encryption key
+            encrypter (Encrypter): passcode derived encrypter
+            decrypter (Decrypter): passcode derived decrypter
+
+        Returns:
+            tuple: (aeid, encrypter, decrypter)
+
+        """
+        if aeid is not None and encrypter is not None and decrypter is not None:
+            return aeid, encrypter, decrypter
+
+        signer = salter.signer(transferable=False)
+        aeid = signer.verfer.qb64
+        return aeid, signing.Encrypter(verkey=aeid), signing.Decrypter(seed=signer.qb64)
+
     @staticmethod
     def __sign__(ser, signers, indexed=False, indices=None, ondices=None):
         if indexed:
@@ -137,7 +325,8 @@ class SaltyKeeper(BaseKeeper):
 
     def __init__(self, salter, pidx, kidx=0, tier=Tiers.low, transferable=False, stem=None,
                  code=MtrDex.Ed25519_Seed, count=1, icodes=None, ncode=MtrDex.Ed25519_Seed,
-                 ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, bran=None, sxlt=None):
+                 ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, bran=None, sxlt=None, cache=None, pre=None,
+                 aeid=None, encrypter=None, decrypter=None):
         """
         Create an instance of a SaltyKeeper for managing keys for a single AID.  This can be created from
         data saved externally to recreate keys at a given point in time or with values for a new AID.  The sxlt
@@ -161,6 +350,11 @@ class SaltyKeeper(BaseKeeper):
             dcode (str): derivation code for hashing algorithm for next key digests
             bran (str): AID specific salt to use for key generate for this AID inception
             sxlt (str): qualified base64 of cipher of AID salt.
+            cache (SignerCache): optional cache of derived signers shared across keepers
+            pre (str): qb64 prefix of the AID, required to use cache
+            aeid (str): qb64 passcode derived public encryption key shared from the Manager
+            encrypter (Encrypter): passcode derived encrypter shared from the Manager
+            decrypter (Decrypter): passcode derived decrypter shared from the Manager
         """
 
         if not icodes:  # if not codes make list len count of same code
@@ -169,10 +363,7 @@ class SaltyKeeper(BaseKeeper):
             ncodes = [ncode] * ncount
 
         # Salter is the entered passcode and used for enc/dec of salts for each AID
-        signer = salter.signer(transferable=False)
-        self.aeid = signer.verfer.qb64
-        self.encrypter = signing.Encrypter(verkey=self.aeid)
-        self.decrypter = signing.Decrypter(seed=signer.qb64)
+        self.aeid, self.encrypter, self.decrypter = self.crypt(salter, aeid, encrypter, decrypter)
 
         self.tier = tier
         self.icodes = icodes
@@ -181,16 +372,18 @@ class SaltyKeeper(BaseKeeper):
         self.pidx = pidx
         self.kidx = kidx
         self.transferable = transferable
+        self.cache = cache if pre is not None else None
+        self.pre = pre
         stem = stem if stem is not None else self.stem
 
         # sxlt is encrypted salt for this AID or None if incepting
         if bran is not None:
             bran = coring.MtrDex.Salt_128 + 'A' + bran[:21]
             self.creator = keeping.SaltyCreator(salt=bran, stem=stem, tier=tier)
-            self.sxlt = self.encrypter.encrypt(ser=self.creator.salt).qb64
+            self.sxlt = self.encrypter.encrypt(prim=coring.Matter(qb64=self.creator.salt)).qb64
         elif sxlt is None:
             self.creator = keeping.SaltyCreator(stem=stem, tier=tier)
-            self.sxlt = self.encrypter.encrypt(ser=self.creator.salt).qb64
+            self.sxlt = self.encrypter.encrypt(prim=coring.Matter(qb64=self.creator.salt)).qb64
         else:
             self.sxlt = sxlt
             ciph = signing.Cipher(qb64=self.sxlt)
@@ -271,15 +464,24 @@ class SaltyKeeper(BaseKeeper):
             list: qualified b64 CESR encoded signatures
 
         """
-        signers = self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
-                                      transferable=self.transferable)
+        if self.cache is None:
+            signers = self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
+                                          transferable=self.transferable)
+        else:
+            key = (self.pre, self.pidx, self.kidx, self.sxlt, self.transferable)
+            signers = self.cache.get(key)
+            if signers is None:
+                signers = self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
+                                              transferable=self.transferable)
+                self.cache.put(key, signers)
 
         return self.__sign__(ser, signers=signers, indexed=indexed, indices=indices, ondices=ondices)
 
 
 class RandyKeeper(BaseKeeper):
     def __init__(self, salter, code=MtrDex.Ed25519_Seed, count=1, icodes=None, transferable=False,
-                 ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, prxs=None, nxts=None):
+                 ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, prxs=None, nxts=None,
+                 aeid=None, encrypter=None, decrypter=None):
 
         self.salter = salter
         if not icodes:  # if not codes make list len count of same code
@@ -287,10 +489,7 @@ class RandyKeeper(BaseKeeper):
         if not ncodes:
             ncodes = [ncode] * ncount
 
-        signer = salter.signer(transferable=False)
-        self.aeid = signer.verfer.qb64
-        self.encrypter = signing.Encrypter(verkey=self.aeid)
-        self.decrypter = signing.Decrypter(seed=signer.qb64)
+        self.aeid, self.encrypter, self.decrypter = self.crypt(salter, aeid, encrypter, decrypter)
 
         self.prxs = prxs
         self.nxts = nxts
@@ -335,7 +534,7 @@ class RandyKeeper(BaseKeeper):
         return verfers, digers
 
     def sign(self, ser, indexed=True, indices=None, ondices=None, **_):
-        signers = [self.decrypter.decrypt(ser=signing.Cipher(qb64=prx).qb64b, transferable=self.transferable)
+        signers = [self.decrypter.decrypt(cipher=signing.Cipher(qb64=prx), transferable=self.transferable)
                    for prx in self.prxs]
         return self.__sign__(ser, signers=signers, indexed=indexed, indices=indices, ondices=ondices)
 
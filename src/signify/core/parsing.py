@@ -0,0 +1,252 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.parsing module
+
+Incremental parsing of text domain CESR streams such as credential exports
+
+Sources are read through a window that only ever holds the message being parsed plus one read chunk, so exports
+of any size are parsed in constant memory.  Buffer protocol sources such as bytes and mmap regions are walked in
+place without copying.
+
+    with open("creds.cesr", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as region:
+        for acdc, tel, anchor, atc in parsing.credentials(region):
+            ...
+
+"""
+import re
+from collections import OrderedDict, namedtuple
+
+from keri import kering
+from keri.core import coring, counting, serdering
+
+# Message parsed from a stream, its raw attachments and the stream offset it started at
+Eventage = namedtuple("Eventage", "serder attachments offset")
+
+# Exported credential, its TEL event, the KEL event anchoring the TEL event and the attachments of the credential
+Exportage = namedtuple("Exportage", "acdc tel anchor attachments")
+
+# TEL message types, everything else in a KERI stream is a KEL message
+TelIlks = ("vcp", "vrt", "iss", "rev", "bis", "brv")
+
+# First character not of the Base64 alphabet ends the attachments of a text domain message
+Unattached = re.compile(rb"[^A-Za-z0-9_\-]")
+
+Whitespace = b" \t\r\n"
+
+
+class Reader:
+    """ Window over a CESR source, reading chunks only as parsing needs them
+
+    Sources may be anything supporting the buffer protocol (bytes, bytearray, memoryview, mmap), objects with
+    readinto, recv_into or read (files, sockets, raw HTTP responses), objects with iter_content (streamed requests
+    responses) or any iterable of byte chunks.
+
+    """
+
+    def __init__(self, source, chunk_size=65536):
+        """
+
+        Parameters:
+            source: CESR source, see class docstring
+            chunk_size (int): number of bytes read from unbuffered sources at a time
+        """
+        self.start = 0
+        self.offset = 0
+
+        try:
+            self.buf = memoryview(source).cast("B")
+            self.chunks = None
+        except TypeError:
+            self.buf = bytearray()
+            self.chunks = self.reads(source, chunk_size)
+
+    @staticmethod
+    def reads(source, size):
+        """ Generator of the byte chunks read from source """
+        into = getattr(source, "readinto", None) or getattr(source, "recv_into", None)
+        if into is not None:
+            view = memoryview(bytearray(size))
+            while n := into(view):
+                yield view[:n]
+        elif hasattr(source, "read"):
+            while chunk := source.read(size):
+                yield chunk
+        elif hasattr(source, "iter_content"):
+            yield from source.iter_content(chunk_size=size)
+        else:
+            yield from source
+
+    def fill(self, size):
+        """ Returns True when at least size unparsed bytes are buffered, reading from the source as needed """
+        while len(self.buf) - self.start < size:
+            if self.chunks is None:
+                return False
+
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.chunks = None
+                return False
+
+            if self.start > len(self.buf) // 2:  # drop parsed bytes before growing
+                del self.buf[:self.start]
+                self.start = 0
+            self.buf.extend(chunk)
+
+        return True
+
+    def peek(self, size):
+        return bytes(self.buf[self.start:self.start + size])
+
+    def take(self, size):
+        data = bytes(self.buf[self.start:self.start + size])
+        self.start += len(data)
+        self.offset += len(data)
+        return data
+
+    def scan(self, rex, seen=0):
+        """ Returns number of unparsed bytes before the first match of rex at or after seen, or all of them at the
+        end of stream """
+        while True:
+            match = rex.search(self.buf, self.start + seen)
+            if match is not None:
+                return match.start() - self.start
+
+            seen = len(self.buf) - self.start
+            if not self.fill(seen + 1):
+                return len(self.buf) - self.start
+
+    def attachments(self):
+        """ Returns the size of the attachments of the message just taken """
+        if not self.fill(1):
+            return 0
+
+        if self.peek(1)[0] >> 5 == kering.ColdDex.CtOpB2:
+            raise kering.ColdStartError(f"binary domain attachments at offset {self.offset} are not supported")
+
+        size = 0
+        self.fill(8)
+        head = self.peek(8)
+        if head.startswith((b"-V", b"-0V")):  # pipelined group gives its own size
+            ctr = counting.Counter(qb64b=head, gvrsn=kering.Vrsn_1_0)
+            size = len(ctr.qb64b) + ctr.count * 4
+            if not self.fill(size):
+                raise kering.ShortageError(f"stream ended in attachment group at offset {self.offset}")
+
+        return self.scan(Unattached, size)
+
+
+def messages(source, chunk_size=65536):
+    """ Generator of Eventage tuples of the messages of the text domain CESR stream read from source
+
+    Parameters:
+        source: CESR source, see Reader
+        chunk_size (int): number of bytes read from unbuffered sources at a time
+
+    """
+    reader = Reader(source, chunk_size)
+    while True:
+        while reader.fill(1) and reader.peek(1) in Whitespace:
+            reader.take(1)
+
+        if not reader.fill(1):
+            return
+
+        offset = reader.offset
+        if kering.sniff(bytearray(reader.peek(1))) != kering.Colds.msg:
+            raise kering.ColdStartError(f"expected message at offset {offset}, got {reader.peek(8)}")
+
+        reader.fill(kering.SMELLSIZE)
+        smellage = kering.smell(reader.peek(kering.SMELLSIZE))
+        if not reader.fill(smellage.size):
+            raise kering.ShortageError(f"stream ended in message at offset {offset}")
+
+        raw = reader.take(smellage.size)
+        if smellage.proto == kering.Protocols.acdc:
+            serder = serdering.SerderACDC(raw=raw)
+        else:
+            serder = serdering.SerderKERI(raw=raw)
+
+        yield Eventage(serder, reader.take(reader.attachments()), offset)
+
+
+def seals(atc):
+    """ Returns (couples, triples) of the seal source attachments of a message
+
+    Couples are (sn, said) and triples (pre, sn, said).  Parsing stops at the first group of any other kind.
+
+    Parameters:
+        atc (bytes): qb64 attachments
+
+    """
+    ims = bytearray(atc)
+    couples, triples = [], []
+    while ims:
+        ctr = counting.Counter(qb64b=ims, strip=True, gvrsn=kering.Vrsn_1_0)
+        if ctr.code in (counting.CtrDex_1_0.AttachmentGroup, counting.CtrDex_1_0.BigAttachmentGroup):
+            continue
+
+        if ctr.code == counting.CtrDex_1_0.SealSourceCouples:
+            for _ in range(ctr.count):
+                seqner = coring.Seqner(qb64b=ims, strip=True)
+                couples.append((seqner.sn, coring.Diger(qb64b=ims, strip=True).qb64))
+        elif ctr.code == counting.CtrDex_1_0.SealSourceTriples:
+            for _ in range(ctr.count):
+                prefixer = coring.Prefixer(qb64b=ims, strip=True)
+                seqner = coring.Seqner(qb64b=ims, strip=True)
+                triples.append((prefixer.qb64, seqner.sn, coring.Diger(qb64b=ims, strip=True).qb64))
+        else:
+            break
+
+    return couples, triples
+
+
+class Window(OrderedDict):
+    """ Mapping keeping only its most recently set size items """
+
+    def __init__(self, size):
+        super(Window, self).__init__()
+        self.size = size
+
+    def __setitem__(self, key, value):
+        super(Window, self).__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.size:
+            self.popitem(last=False)
+
+
+def credentials(source, chunk_size=65536, window=4096):
+    """ Generator of Exportage tuples of the credentials in a CESR export read from source
+
+    Exports list the issuer KEL and the TEL events of each credential ahead of it, the TEL event of a credential is
+    the one its seal source triple points at, or the latest seen for the credential, and its anchor the KEL event
+    its seal source couple points at.  Either is None when not in the stream.  Only the last window KEL and TEL
+    events are remembered so memory stays constant however long the stream is.
+
+    Parameters:
+        source: CESR source, see Reader
+        chunk_size (int): number of bytes read from unbuffered sources at a time
+        window (int): number of KEL and TEL events remembered for matching credentials
+
+    """
+    kels, tels, latest = Window(window), Window(window), Window(window)
+    for serder, atc, _ in messages(source, chunk_size):
+        if serder.proto == kering.Protocols.acdc:
+            _, triples = seals(atc)
+            tel = next((tels[said] for _, _, said in triples if said in tels), None)
+            if tel is None:
+                tel = latest.get(serder.said)
+
+            anchor = None
+            if tel is not None:
+                tel, couples = tel
+                anchor = next((kels[said] for _, said in couples if said in kels), None)
+
+            yield Exportage(serder, tel, anchor, atc)
+
+        elif serder.ilk in TelIlks:
+            couples, _ = seals(atc)
+            tels[serder.said] = latest[serder.pre] = (serder, couples)
+
+        else:
+            kels[serder.said] = serder
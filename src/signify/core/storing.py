@@ -0,0 +1,72 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.storing module
+
+Local LMDB store of key events already fetched from the agent
+
+"""
+import json
+
+from keri.db import dbing, subing
+
+
+class KelStore(dbing.LMDBer):
+    """
+    LMDB store of the key event logs of identifiers keyed by prefix and sequence number, so KeyEvents only fetches
+    events it has not seen and serves reads locally when the agent is unreachable.  Events are stored as returned
+    by the agent.  Storing an event at a sequence number already stored replaces it, as happens when a recovery
+    rotation supersedes events.
+
+        store = KelStore(name="signify")
+        client = SignifyClient(passcode=bran, kel_store=store)
+
+    """
+    TailDirPath = "keri/signify"
+    AltTailDirPath = ".signify/kels"
+    TempPrefix = "signify_kels_"
+
+    def __init__(self, name="kels", headDirPath=None, reopen=True, **kwa):
+        """ Create and open the store
+
+        Parameters:
+            name (str): directory name of the store, use one name per client controller
+            headDirPath (str): optional head directory pathname, defaults to LMDBer.HeadDirPath
+            reopen (bool): True means open the store now
+
+        """
+        self.evts = None
+        super(KelStore, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
+
+    def reopen(self, **kwa):
+        super(KelStore, self).reopen(**kwa)
+        self.evts = subing.OnSuber(db=self, subkey="evts.")
+        return self.env
+
+    @staticmethod
+    def ked(event):
+        """ Returns the key event dict of event, agents return bare events or {"ked", "atc"} maps """
+        return event["ked"] if "ked" in event else event
+
+    def put(self, pre, events):
+        """ Store events of pre in order, replacing events at the same sequence numbers """
+        for event in events:
+            self.evts.pinOn(keys=pre, on=int(self.ked(event)["s"], 16), val=json.dumps(event))
+
+    def events(self, pre, sn=0):
+        """ Returns the stored events of pre from sequence number sn on """
+        return [json.loads(val) for val in self.evts.getOnIter(keys=pre, on=sn)]
+
+    def last(self, pre):
+        """ Returns the last stored event of pre or None when none are stored """
+        count = self.evts.cntOn(keys=pre)
+        if count == 0:
+            return None
+
+        val = self.evts.getOn(keys=pre, on=count - 1)
+        return json.loads(val) if val is not None else None
+
+    def remove(self, pre, sn=0):
+        """ Remove the stored events of pre from sequence number sn on """
+        for on in range(sn, sn + self.evts.cntOn(keys=pre, on=sn)):
+            self.evts.remOn(keys=pre, on=on)
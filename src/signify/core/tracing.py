@@ -0,0 +1,441 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.tracing module
+
+Per request phase timing and latency histograms for SignifyClient
+
+"""
+import contextlib
+import contextvars
+import threading
+import time
+
+# Span of the request in flight in this thread or task, None when the client is not traced
+Current = contextvars.ContextVar("signify_span", default=None)
+
+# Shared context manager returned for every request of an untraced client
+Untraced = contextlib.nullcontext()
+
+# Route templates of the KERIA admin interface, {} segments match any value
+Routes = (
+    "/agent/{caid}",
+    "/salt/{caid}",
+    "/identifiers",
+    "/identifiers/{name}",
+    "/identifiers/{name}/events",
+    "/identifiers/{name}/endroles",
+    "/identifiers/{name}/endroles/{role}",
+    "/identifiers/{name}/oobis",
+    "/identifiers/{name}/members",
+    "/identifiers/{name}/registries",
+    "/identifiers/{name}/registries/{registry}",
+    "/identifiers/{name}/credentials",
+    "/identifiers/{name}/exchanges",
+    "/identifiers/{name}/ipex/admit",
+    "/identifiers/{name}/ipex/grant",
+    "/identifiers/{name}/multisig/join",
+    "/identifiers/{name}/multisig/request",
+    "/endroles/{aid}",
+    "/endroles/{aid}/{role}",
+    "/multisig/request/{said}",
+    "/credentials/query",
+    "/credentials/{said}",
+    "/operations/{name}",
+    "/oobis",
+    "/states",
+    "/events",
+    "/queries",
+    "/notifications",
+    "/notifications/{nid}",
+    "/exchanges/{said}",
+    "/challenges",
+    "/challenges_verify/{source}",
+    "/contacts",
+    "/escrows/rpy",
+)
+
+
+def current():
+    """ Returns the Span of the request in flight, None when there is none """
+    return Current.get()
+
+
+class Router:
+    """ Maps request paths to the route templates of Routes so histograms are kept per route rather than per AID
+    name or SAID
+
+    Literal segments take precedence over {} segments.  Paths matching no template are reported by their first
+    segment followed by /* when longer.
+
+    """
+
+    def __init__(self, routes=Routes, size=4096):
+        """
+
+        Parameters:
+            routes (Iterable): route templates
+            size (int): maximum number of paths cached
+        """
+        self.tree = dict()
+        for route in routes:
+            node = self.tree
+            for segment in route.strip("/").split("/"):
+                key = "*" if segment.startswith("{") else segment
+                node = node.setdefault(key, dict())
+            node[None] = route
+
+        self.size = size
+        self.cache = dict()
+
+    def route(self, path):
+        route = self.cache.get(path)
+        if route is not None:
+            return route
+
+        route = self.match(path)
+        if len(self.cache) >= self.size:
+            self.cache.clear()
+        self.cache[path] = route
+        return route
+
+    def match(self, path):
+        path = path.split("?", 1)[0]
+        segments = path.strip("/").split("/")
+        route = self.walk(self.tree, segments)
+        if route is not None:
+            return route
+
+        return f"/{segments[0]}/*" if len(segments) > 1 else f"/{segments[0]}"
+
+    def walk(self, node, segments):
+        if not segments:
+            return node.get(None)
+
+        segment, rest = segments[0], segments[1:]
+        if segment in node:
+            route = self.walk(node[segment], rest)
+            if route is not None:
+                return route
+
+        if "*" in node and segment:
+            return self.walk(node["*"], rest)
+
+        return None
+
+
+class Histogram:
+    """ Log linear latency histogram in the manner of HdrHistogram
+
+    Values are recorded in integer microseconds into buckets whose width doubles every power of two while each
+    power of two is split into sub buckets fine enough to keep digits significant decimal digits.  Recording is
+    constant time and memory is bounded by the number of powers of two spanned, whatever the number of values.
+
+    """
+
+    def __init__(self, digits=2):
+        """
+
+        Parameters:
+            digits (int): number of significant decimal digits kept, 1 to 5
+        """
+        if not 1 <= digits <= 5:
+            raise ValueError(f"invalid significant digits={digits}")
+
+        self.digits = digits
+        self.bits = (2 * 10 ** digits - 1).bit_length()
+        self.half = 1 << (self.bits - 1)
+        self.counts = dict()
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def index(self, value):
+        shift = max(value.bit_length() - self.bits, 0)
+        return shift * self.half + (value >> shift)
+
+    def bounds(self, index):
+        """ Returns (lowest, highest) microsecond values counted in bucket index """
+        shift = max(index // self.half - 1, 0)
+        sub = index - shift * self.half
+        return sub << shift, ((sub + 1) << shift) - 1
+
+    def record(self, seconds):
+        """ Record one latency of seconds """
+        value = max(round(seconds * 1e6), 0)
+        index = self.index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """ Add the values recorded by other, which must keep the same number of digits """
+        if other.digits != self.digits:
+            raise ValueError(f"cannot merge histograms of {other.digits} and {self.digits} digits")
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def sum(self):
+        """ Sum of recorded latencies in seconds """
+        return self.total / 1e6
+
+    def quantile(self, q):
+        """ Returns the latency in seconds at quantile q, 0.0 to 1.0, or None when nothing was recorded """
+        if self.count == 0:
+            return None
+
+        rank = max(int(q * self.count + 0.5), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bounds(index)[1], self.max) / 1e6
+
+        return self.max / 1e6
+
+    def cumulative(self, les):
+        """ Returns counts of recorded latencies at or below each bound of les, in seconds and ascending, to within
+        the resolution of the buckets
+
+        """
+        counts = []
+        indices = sorted(self.counts)
+        seen = 0
+        i = 0
+        for le in les:
+            limit = le * 1e6
+            while i < len(indices) and self.bounds(indices[i])[1] <= limit:
+                seen += self.counts[indices[i]]
+                i += 1
+            counts.append(seen)
+
+        return counts
+
+
+class Span:
+    """ Timing of one request split into the phases of Tracer.Phases
+
+    A span is entered by the client around each HTTP call and made current for its thread or task so the request
+    signing auth and response verification hook can mark the end of their phase.  Each mark records the time since
+    the previous one under the phase named.
+
+    """
+    __slots__ = ("tracer", "method", "path", "route", "status", "phases", "start", "last", "duration", "token")
+
+    def __init__(self, tracer, method, path):
+        self.tracer = tracer
+        self.method = method
+        self.path = path
+        self.route = None
+        self.status = None
+        self.phases = dict()
+        self.start = None
+        self.last = None
+        self.duration = None
+        self.token = None
+
+    def __enter__(self):
+        self.start = self.last = time.perf_counter()
+        self.token = Current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.mark("receive")
+        self.duration = self.last - self.start
+        Current.reset(self.token)
+        self.token = None
+        self.tracer.finish(self)
+        return False
+
+    def mark(self, phase):
+        """ Record the time since the previous mark as phase """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def respond(self, rep):
+        """ Record the status of response rep and time JSON decoding of its body when read """
+        self.status = rep.status_code
+
+        decode = rep.json
+        tracer = self.tracer
+
+        def json(**kwargs):
+            start = time.perf_counter()
+            try:
+                return decode(**kwargs)
+            finally:
+                tracer.record(self.method, self.route or tracer.route(self.path), "decode",
+                              time.perf_counter() - start)
+
+        rep.json = json
+
+
+class Tracer:
+    """ Collects per route and phase latency histograms of the requests of one or more clients
+
+    Given to SignifyClient or AsyncSignifyClient as tracer, every request is timed in the phases:
+
+        serialize  building the request, URL, headers and JSON body, up to signing
+        sign       adding the Signify signature headers
+        send       sending the request and waiting for the response headers, agent time included
+        verify     verifying the agent signature on the response
+        receive    reading the response body
+        decode     decoding the JSON response body, recorded when the caller decodes it
+        total      the whole request, serialize to receive
+
+    Finished spans are passed to every callback, which run in the requesting thread or task and must be quick.
+    Subclasses may override finish to forward spans elsewhere.  Untraced clients only pay for a None check and a
+    shared null context per request.
+
+    Class Attributes:
+        Phases (tuple): phases recorded per request
+        Buckets (tuple): histogram bucket bounds in seconds exported by prometheus
+        Quantiles (tuple): quantiles exported by prometheus
+
+    """
+    Phases = ("serialize", "sign", "send", "verify", "receive", "decode", "total")
+    Buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    Quantiles = (0.5, 0.9, 0.99, 0.999)
+
+    def __init__(self, digits=2, callbacks=None, router=None):
+        """
+
+        Parameters:
+            digits (int): significant decimal digits kept by histograms
+            callbacks (list): callables given every finished Span
+            router (Router): maps paths to route templates, defaults to a Router of Routes
+        """
+        self.digits = digits
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        self.router = router if router is not None else Router()
+        self.histograms = dict()
+        self.statuses = dict()
+        self.lock = threading.Lock()
+
+    def span(self, method, path):
+        """ Returns a new Span for a request of method to path """
+        return Span(self, method, path)
+
+    def route(self, path):
+        return self.router.route(path)
+
+    def record(self, method, route, phase, seconds):
+        """ Record seconds spent in phase by a request of method to route """
+        key = (method, route, phase)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(digits=self.digits)
+            histogram.record(seconds)
+
+    def finish(self, span):
+        """ Record the phases and total of finished span and pass it to the callbacks """
+        span.route = route = self.route(span.path)
+        for phase, seconds in span.phases.items():
+            self.record(span.method, route, phase, seconds)
+        self.record(span.method, route, "total", span.duration)
+
+        key = (span.method, route, span.status)
+        with self.lock:
+            self.statuses[key] = self.statuses.get(key, 0) + 1
+
+        for callback in self.callbacks:
+            callback(span)
+
+    def histogram(self, method, route, phase="total"):
+        """ Returns the Histogram of phase for method and route, None when no request was recorded """
+        return self.histograms.get((method, route, phase))
+
+    def snapshot(self):
+        """ Returns a copy of the histograms and status counts taken under the lock
+
+        Returns:
+            tuple: (dict of (method, route, phase) to Histogram, dict of (method, route, status) to count)
+
+        """
+        with self.lock:
+            histograms = dict()
+            for key, histogram in self.histograms.items():
+                copy = Histogram(digits=self.digits)
+                copy.merge(histogram)
+                histograms[key] = copy
+            return histograms, dict(self.statuses)
+
+    def reset(self):
+        """ Forget every recorded request """
+        with self.lock:
+            self.histograms = dict()
+            self.statuses = dict()
+
+    def prometheus(self, prefix="signify"):
+        """ Returns a snapshot of the recorded requests in the Prometheus text exposition format
+
+        Phase latencies are exported as a histogram with the Buckets bounds and as a summary with the Quantiles
+        taken from the full resolution histograms, responses are counted by status.
+
+        Parameters:
+            prefix (str): metric name prefix
+
+        Returns:
+            str: exposition text ending with a newline
+
+        """
+        histograms, statuses = self.snapshot()
+        keys = sorted(histograms, key=lambda k: (k[1], k[0], self.order(k[2])))
+
+        name = f"{prefix}_request_duration_seconds"
+        lines = [f"# HELP {name} Signify client request latency by phase",
+                 f"# TYPE {name} histogram"]
+        for key in keys:
+            histogram = histograms[key]
+            labels = self.labels(key)
+            for le, count in zip(self.Buckets, histogram.cumulative(self.Buckets)):
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        name = f"{prefix}_request_latency_seconds"
+        lines += [f"# HELP {name} Signify client request latency quantiles by phase",
+                  f"# TYPE {name} summary"]
+        for key in keys:
+            histogram = histograms[key]
+            labels = self.labels(key)
+            for q in self.Quantiles:
+                lines.append(f'{name}{{{labels},quantile="{q}"}} {histogram.quantile(q)}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        name = f"{prefix}_responses_total"
+        lines += [f"# HELP {name} Signify client responses by status",
+                  f"# TYPE {name} counter"]
+        for (method, route, status), count in sorted(statuses.items(), key=lambda i: (i[0][1], i[0][0], str(i[0][2]))):
+            status = "" if status is None else status
+            lines.append(f'{name}{{method="{method}",route="{self.escape(route)}",status="{status}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+    def order(self, phase):
+        return self.Phases.index(phase) if phase in self.Phases else len(self.Phases)
+
+    def labels(self, key):
+        method, route, phase = key
+        return f'method="{method}",route="{self.escape(route)}",phase="{phase}"'
+
+    @staticmethod
+    def escape(value):
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -114,3 +114,39 @@ class Exchanges:
 
         res = self.client.get(f"/exchanges/{said}")
         return res.json()
+
+
+class AsyncExchanges(Exchanges):
+    """ Asyncio domain class for peer-to-peer exn messages, see Exchanges for parameters and results
+
+    Message signing runs in a worker thread so it does not block the event loop.
+
+    """
+
+    async def send(self, name, topic, sender, route, payload, embeds, recipients, dig=None):
+        exn, sigs, atc = await self.createExchangeMessage(sender, route, payload, embeds, dig=dig)
+        json = await self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc, recipients=recipients)
+
+        return exn, sigs, json
+
+    async def createExchangeMessage(self, sender, route, payload, embeds, dig=None, dt=None):
+        import asyncio
+
+        return await asyncio.to_thread(super(AsyncExchanges, self).createExchangeMessage, sender, route, payload,
+                                       embeds, dig=dig, dt=dt)
+
+    async def sendFromEvents(self, name, topic, exn, sigs, atc, recipients):
+        body = dict(
+            tpc=topic,
+            exn=exn.ked,
+            sigs=sigs,
+            atc=atc,
+            rec=recipients
+        )
+
+        res = await self.client.post(f"/identifiers/{name}/exchanges", json=body)
+        return res.json()
+
+    async def get(self, said):
+        res = await self.client.get(f"/exchanges/{said}")
+        return res.json()
@@ -16,4 +16,5 @@ class SignifyState:
     controller: dict = None
     agent : dict = None
     ridx: int = None
-    pidx: int = None
\ No newline at end of file
+    pidx: int = None
+    sxlt: str = None
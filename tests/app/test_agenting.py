@@ -0,0 +1,213 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.test_agenting module
+
+Testing the in-process agent stand-in end to end with signed requests and responses
+"""
+import asyncio
+import io
+
+import pytest
+
+BRAN = "0123456789abcdefghijk"
+SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+
+def connect(agency, bran=BRAN):
+    from signify.app.clienting import SignifyClient
+
+    client = SignifyClient(passcode=bran, adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    return client
+
+
+def test_agency_connect():
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+
+    agent = agency.agents[client.controller]
+    assert client.agent.pre == agent.pre
+    assert client.agent.delpre == client.controller
+    assert agent.cstate["s"] == "1"  # delegation approved
+
+    # reconnecting does not approve the delegation again
+    from signify.app.clienting import SignifyClient
+    client = SignifyClient(passcode=BRAN, adapter=agency.adapter())
+    client.connect("http://agent")
+    assert client.ctrl.serder.sn == 1
+    assert agent.cstate["s"] == "1"
+
+
+def test_agency_identifiers():
+    from signify.app.agenting import Agency
+
+    agency = Agency(pending=2)
+    client = connect(agency)
+    ids = client.identifiers()
+    operations = client.operations()
+
+    _, _, op = ids.create("aid1")
+    assert op["done"] is False
+    assert operations.wait(op, interval=0.0)["done"] is True
+    agency.pending = 0
+
+    serder, _, op = ids.interact("aid1", data=[dict(a=1)])
+    assert op["response"]["d"] == serder.said
+    serder, _, _ = ids.rotate("aid1")
+    ids.create("aid2")
+
+    hab = ids.get("aid1")
+    assert hab["state"]["s"] == "2"
+    assert hab["state"]["d"] == serder.said
+    assert hab["state"]["k"] == serder.ked["k"]
+    assert ids.get(hab["prefix"])["name"] == "aid1"
+
+    assert ids.list()["total"] == 2
+    assert [aid["name"] for aid in ids.list_all(size=1)] == ["aid1", "aid2"]
+    assert client.keyStates().get(hab["prefix"])[0]["s"] == "2"
+    assert len(client.keyEvents().get(hab["prefix"])) == 3
+
+    ids.rename("aid2", "aid3")
+    assert ids.get("aid3")["name"] == "aid3"
+
+    stats = client.authn.stats()
+    assert stats["verifies"] > 0 and stats["failures"] == 0
+
+
+def test_agency_rejects_stale_event():
+    from requests import HTTPError
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    ids.create("aid1")
+
+    hab = ids.get("aid1")
+    ids.interact("aid1")
+
+    # event built from state that is no longer current
+    _, _, json = ids.makeInteraction(hab, data=[])
+    with pytest.raises(HTTPError, match="400 Client Error"):
+        client.post("/identifiers/aid1/events", json=json)
+
+
+def test_agency_authentication():
+    from keri import kering
+    from keri.core import signing
+    from requests import HTTPError
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+
+    # unauthenticated requests are refused without a signed response, like KERIA
+    auth = client.session.auth
+    client.session.auth = None
+    with pytest.raises(kering.AuthNError):
+        client.get("/identifiers")
+
+    client.session.hooks = dict()
+    with pytest.raises(HTTPError, match="401 Client Error"):
+        client.get("/identifiers")
+    client.session.hooks = dict(response=client.authn.verify)
+
+    client.session.auth = auth
+    agency.agents[client.controller].authn.ctrl.signer = signing.Signer(transferable=True)
+    with pytest.raises(kering.AuthNError):
+        client.get("/identifiers")
+
+
+def test_agency_credentials():
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    ids.create("aid1")
+
+    registries = client.registries()
+    _, _, _, op = registries.create(ids.get("aid1"), "reg")
+    assert op["done"] is True
+    registry = registries.get("aid1", "reg")
+
+    credentials = client.credentials()
+    hab = ids.get("aid1")
+    creder, _, _, _, op = credentials.create(hab, registry, data=dict(LEI="5493001KJTIIGC8Y1R17"), schema=SCHEMA,
+                                             recipient=hab["prefix"])
+    assert op["response"]["ced"]["d"] == creder.said
+
+    creds = credentials.list(filtr={"-s": SCHEMA})
+    assert [cred["sad"]["d"] for cred in creds] == [creder.said]
+    assert credentials.list(filtr={"-s": "other"}) == []
+    assert list(credentials.iter_query(filtr={"-s": SCHEMA}, fields=["-d"])) == [{"-d": creder.said}]
+    export = credentials.export(creder.said)
+    assert export.startswith(b'{"v":"KERI10JSON')
+    assert creder.raw + b"-IAB" + op["response"]["ced"]["d"].encode("utf-8") in export
+
+
+def test_agency_notifications_and_exchanges():
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    ids.create("aid1")
+
+    agent = agency.agents[client.controller]
+    notes = [agent.notify("/exn/ipex/grant", d=str(i)) for i in range(5)]
+
+    notifications = client.notifications()
+    assert [note["i"] for note in notifications.list_all(size=2)] == [note["i"] for note in notes]
+    notifications.markAsRead(notes[0]["i"])
+    notifications.delete(notes[1]["i"])
+    out = notifications.list()
+    assert out["total"] == 4
+    assert out["notes"][0]["r"] is True
+
+    hab = ids.get("aid1")
+    exchanges = client.exchanges()
+    exn, _, _ = exchanges.send("aid1", "test", hab, "/test", dict(a=1), dict(), [hab["prefix"]])
+    assert exchanges.get(exn.said)["exn"]["d"] == exn.said
+
+    assert len(client.challenges().generate()) == 12
+
+
+def test_agency_async():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+
+    agency = Agency()
+
+    async def run():
+        client = AsyncSignifyClient(passcode=BRAN, adapter=agency.transport())
+        agency.boot(client.ctrl)
+        async with client.connected("http://agent"):
+            ids = client.identifiers()
+            await ids.create("aid1")
+            await ids.interact("aid1")
+            return await ids.get("aid1")
+
+    hab = asyncio.run(run())
+    assert hab["state"]["s"] == "1"
+
+
+def test_agency_wsgi():
+    import json
+    from signify.app.agenting import Agency
+    from signify.core import authing
+
+    agency = Agency()
+    ctrl = authing.Controller(bran=BRAN, tier="low")
+    agent = agency.boot(ctrl)
+
+    statuses = []
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": f"/agent/{ctrl.pre}", "wsgi.input": io.BytesIO(b"")}
+    body = b"".join(agency(environ, lambda status, headers: statuses.append(status)))
+
+    assert statuses == ["200 Ok"]
+    assert json.loads(body)["agent"]["i"] == agent.pre
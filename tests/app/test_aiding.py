@@ -7,6 +7,7 @@ Testing aiding with unit tests
 """
 
 import pytest
+import requests
 from mockito import mock, verify, verifyNoUnwantedInteractions, unstub, expect
 
 
@@ -507,3 +508,222 @@ def test_aiding_make_end_role():
 
     verifyNoUnwantedInteractions()
     unstub()
+
+
+async def resolved(value):
+    return value
+
+
+def test_async_aiding_create_reserves_pidx():
+    import asyncio
+    from signify.core import keeping
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+
+    from mockito import kwargs
+    from keri.core import eventing, serdering
+    for pidx in (0, 1):
+        mock_keeper = mock({'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
+        expect(mock_manager, times=1).new('salty', pidx, **kwargs).thenReturn(mock_keeper)
+        keys = [f'verfer {pidx}']
+        expect(mock_keeper, times=1).incept(transferable=True).thenReturn((keys, ['next digest']))
+        mock_serder = mock({'raw': b'raw bytes', 'ked': {'a': pidx}}, spec=serdering.SerderKERI, strict=True)
+        expect(eventing, times=1).incept(keys=keys, isith='1', nsith='1', ndigs=['next digest'], code='E', wits=[],
+                                         toad='0', cnfg=[], data=[]).thenReturn(mock_serder)
+        expect(mock_keeper, times=1).sign(mock_serder.raw).thenReturn([f'signature {pidx}'])
+
+    from signify.app.clienting import AsyncSignifyClient
+    mock_client = mock({'pidx': 0}, spec=AsyncSignifyClient, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+
+    from signify.app.aiding import AsyncIdentifiers
+    ids = AsyncIdentifiers(client=mock_client)  # type: ignore
+
+    from httpx import Response
+    resp = Response(202, json={'post': 'success'})
+    from mockito import ANY
+    expect(mock_client, times=2).post('/identifiers', json=ANY).thenAnswer(lambda *a, **kw: resolved(resp))
+
+    async def run():
+        return await asyncio.gather(ids.create(name='aid0'), ids.create(name='aid1'))
+
+    out = asyncio.run(run())
+
+    assert mock_client.pidx == 2
+    assert sorted(sigs[0] for _, sigs, _ in out) == ['signature 0', 'signature 1']
+    assert out[0][2] == {'post': 'success'}
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_async_aiding_interact():
+    import asyncio
+    from signify.app.clienting import AsyncSignifyClient
+    mock_client = mock(spec=AsyncSignifyClient, strict=True)
+
+    from signify.core import keeping
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+
+    from signify.app.aiding import AsyncIdentifiers
+    ids = AsyncIdentifiers(client=mock_client)  # type: ignore
+
+    from httpx import Response
+    mock_hab = {'prefix': 'hab prefix', 'name': 'aid1', 'state': {'s': '0', 'd': 'hab digest'}}
+    expect(mock_client, times=1).get('/identifiers/aid1').thenAnswer(
+        lambda *a, **kw: resolved(Response(200, json=mock_hab)))
+
+    from keri.core import eventing, serdering
+    mock_serder = mock({'ked': {'a': 'key event dictionary'}, 'raw': b'serder raw bytes'}, spec=serdering.SerderKERI,
+                       strict=True)
+    expect(eventing, times=1).interact('hab prefix', sn=1, data=[{'some': 'data'}], dig='hab digest').thenReturn(
+        mock_serder)
+
+    mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=1).get(aid=mock_hab).thenReturn(mock_keeper)
+    expect(mock_keeper, times=1).sign(ser=mock_serder.raw).thenReturn(['a signature'])
+
+    expected_data = {
+        'ixn': {'a': 'key event dictionary'},
+        'sigs': ['a signature'],
+        'salty': {'keeper': 'params'}
+    }
+    expect(mock_client, times=1).post('/identifiers/aid1/events', json=expected_data).thenAnswer(
+        lambda *a, **kw: resolved(Response(200, json={'success': 'yay'})))
+
+    serder, sigs, op = asyncio.run(ids.interact(name='aid1', data=[{'some': 'data'}]))
+
+    assert serder is mock_serder
+    assert sigs == ['a signature']
+    assert op == {'success': 'yay'}
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_aiding_iter():
+    from signify.app.clienting import SignifyClient
+    mock_client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app.aiding import Identifiers
+    ids = Identifiers(client=mock_client)  # type: ignore
+
+    from requests import Response
+    page1 = mock({'headers': {'content-range': 'aids 0-1/3'}, 'json': lambda: ['aid1', 'aid2']}, spec=Response)
+    page2 = mock({'headers': {'content-range': 'aids 2-2/3'}, 'json': lambda: ['aid3']}, spec=Response)
+    expect(mock_client, times=1).get('/identifiers', headers=dict(Range="aids=0-1")).thenReturn(page1)
+    expect(mock_client, times=1).get('/identifiers', headers=dict(Range="aids=2-3")).thenReturn(page2)
+
+    assert list(ids.iter(size=2)) == ['aid1', 'aid2', 'aid3']
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_async_aiding_list_all():
+    import asyncio
+    from signify.app.clienting import AsyncSignifyClient
+    mock_client = mock(spec=AsyncSignifyClient, strict=True)
+
+    from signify.app.aiding import AsyncIdentifiers
+    ids = AsyncIdentifiers(client=mock_client)  # type: ignore
+
+    from httpx import Response
+    page1 = Response(200, json=['aid1', 'aid2'], headers={'content-range': 'aids 0-1/3'})
+    page2 = Response(200, json=['aid3'], headers={'content-range': 'aids 2-2/3'})
+    expect(mock_client, times=1).get('/identifiers', headers=dict(Range="aids=0-1")).thenAnswer(
+        lambda *a, **kw: resolved(page1))
+    expect(mock_client, times=1).get('/identifiers', headers=dict(Range="aids=2-3")).thenAnswer(
+        lambda *a, **kw: resolved(page2))
+
+    assert asyncio.run(ids.list_all(size=2)) == ['aid1', 'aid2', 'aid3']
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_aiding_identifier_cache():
+    import asyncio
+    from signify.app.agenting import Agency
+    from signify.app.aiding import IdentifierCache
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+    from signify.core.tracing import Tracer
+
+    bran = "0123456789abcdefghijk"
+    agency = Agency()
+    tracer = Tracer()
+    cache = IdentifierCache()
+    client = SignifyClient(passcode=bran, adapter=agency.adapter(), tracer=tracer, identifier_cache=cache)
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    ids = client.identifiers()
+    ids.create("aid1")
+
+    spans = []
+    tracer.callbacks.append(spans.append)
+
+    def sent():
+        methods = [span.method for span in spans]
+        spans.clear()
+        return methods
+
+    # the first event reads the identifier, back to back events only submit
+    ids.interact("aid1", data=[dict(a=1)])
+    assert sent() == ["GET", "POST"]
+    ids.rotate("aid1")
+    ids.interact("aid1", data=[dict(a=2)])
+    ids.addEndRole("aid1", eid=client.agent.pre)
+    assert sent() == ["POST", "POST", "POST"]
+    hab = cache.get("aid1")
+    assert dict(hab["state"], dt=None) == dict(ids.get("aid1")["state"], dt=None)
+    assert hab["salty"]["kidx"] == 1
+    assert cache.find(hab["prefix"]) is cache.get("aid1")
+    sent()
+
+    # events submitted around the cache are caught by the agent and the event is built again
+    client.registries().create(ids.get("aid1"), "reg")
+    sent()
+    serder, _, _ = ids.interact("aid1", data=[dict(a=3)])
+    assert serder.sn == 5
+    assert sent() == ["POST", "GET", "POST"]
+
+    # connection failures drop the identifier, the agent may have accepted the event
+    post = client.post
+
+    def lost(path, json=None, **kwa):
+        post(path, json=json, **kwa)
+        raise requests.ConnectionError("connection reset")
+
+    client.post = lost
+    with pytest.raises(requests.ConnectionError):
+        ids.interact("aid1", data=[dict(a=4)])
+    client.post = post
+    assert cache.get("aid1") is None
+    serder, _, _ = ids.interact("aid1", data=[dict(a=5)])
+    assert serder.sn == 7
+    sent()
+
+    # multisig notifications clear the cache
+    cache.notify([dict(a=dict(r="/multisig/rot", d="E"))])
+    assert len(cache) == 0
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=bran, adapter=agency.transport(), tracer=tracer,
+                                     identifier_cache=IdentifierCache())
+        async with aclient.connected("http://agent"):
+            aids = aclient.identifiers()
+            await aids.interact("aid1", data=[dict(a=6)])
+            await aids.rotate("aid1")
+            sigs = await aids.sign("aid1", serder)
+            return sigs, aclient.identifier_cache.stats()
+
+    spans.clear()
+    sigs, stats = asyncio.run(run())
+    assert len(sigs) == 1
+    assert stats["hits"] == 2
+    assert [span.method for span in spans if span.route.startswith("/identifiers")] == ["GET", "POST", "POST"]
+    assert ids.get("aid1")["state"]["s"] == "9"
+
+    cache.put(ids.get("aid1"))
+    ids.delete("aid1")
+    assert cache.get("aid1") is None
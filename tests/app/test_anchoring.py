@@ -0,0 +1,240 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.test_anchoring module
+
+Testing coalescing of anchors into shared interaction events against the in-process agent stand-in
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+BRAN = "0123456789abcdefghijk"
+SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+
+def connect(agency):
+    from signify.app.clienting import SignifyClient
+
+    client = SignifyClient(passcode=BRAN, adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    client.identifiers().create("aid1")
+    return client
+
+
+def test_anchorer_batches():
+    from signify.app.agenting import Agency
+    from signify.app.anchoring import Anchorer
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    hab = ids.get("aid1")
+
+    anchorer = client.anchorer(hab, window=5.0, size=4)
+    assert client.anchorer(hab) is anchorer
+    registries = client.registries()
+    results = [None] * 4
+
+    def create(idx):
+        results[idx] = registries.create(hab, f"reg{idx}", nonce=f"0AAAAAAAAAAAAAAAAAAAAAA{idx}", anchorer=anchorer)
+
+    threads = [threading.Thread(target=create, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # a full batch is anchored at once by one event carrying every seal
+    assert anchorer.events == 1
+    ixn = results[0][1]
+    assert all(serder.said == ixn.said for _, serder, _, _ in results)
+    assert sorted(seal["i"] for seal in ixn.ked["a"]) == sorted(regser.pre for regser, _, _, _ in results)
+    assert all(op["done"] for _, _, _, op in results)
+    assert ids.get("aid1")["state"]["s"] == "1"
+
+    registry = registries.get("aid1", "reg0")
+    anchorer.window = 0.05
+    credentials = client.credentials()
+    creds = [None] * 6
+
+    def issue(idx):
+        creds[idx] = credentials.create(hab, registry, data=dict(LEI=str(idx)), schema=SCHEMA,
+                                        recipient=hab["prefix"], anchorer=anchorer)
+
+    threads = [threading.Thread(target=issue, args=(idx,)) for idx in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 3 <= anchorer.events <= 7
+    ancs = {anc.said for _, _, anc, _, _ in creds}
+    assert len(ancs) == anchorer.events - 1
+    assert sum(len(anc.ked["a"]) for anc in {anc.said: anc for _, _, anc, _, _ in creds}.values()) == 6
+    assert all(op["response"]["ced"]["d"] == creder.said for creder, _, _, _, op in creds)
+    assert ids.get("aid1")["state"]["s"] == f"{1 + len(ancs):x}"
+
+    with pytest.raises(ValueError):
+        Anchorer(client, hab, size=0)
+
+
+def test_anchorer_failure():
+    from requests import HTTPError
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    hab = ids.get("aid1")
+    registries = client.registries()
+
+    anchorer = client.anchorer(hab, window=0.0, size=1)
+    registries.create(hab, "reg", anchorer=anchorer)
+
+    # events sent around the anchorer leave its state stale, a rejected event is signed again after the read state
+    ids.interact("aid1", data=[dict(a=1)])
+    _, ixn, _, op = registries.create(hab, "reg2", anchorer=anchorer)
+    assert ixn.sn == 3
+    assert op["done"] is True
+    assert anchorer.events == 2
+
+    # a submission at fault fails only its caller
+    with pytest.raises(HTTPError, match="already in use"):
+        registries.create(hab, "reg2", nonce="0AAAAAAAAAAAAAAAAAAAAAA1", anchorer=anchorer)
+    assert anchorer.state["s"] == "3"
+    assert anchorer.events == 2
+
+
+def test_anchorer_leader_failure():
+    from requests import HTTPError
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    ids = client.identifiers()
+    hab = ids.get("aid1")
+    registries = client.registries()
+    registries.create(hab, "reg")
+
+    anchorer = client.anchorer(hab, window=5.0, size=3)
+    results = dict()
+
+    def create(rname, idx):
+        try:
+            results[rname] = registries.create(hab, rname, nonce=f"0AAAAAAAAAAAAAAAAAAAAAA{idx}", anchorer=anchorer)
+        except HTTPError as ex:
+            results[rname] = ex
+
+    # the duplicate registry leads the batch so its submission is the one sent alone with the event
+    leader = threading.Thread(target=create, args=("reg", 1))
+    leader.start()
+    while len(anchorer.batch) < 1:
+        time.sleep(0.001)
+    threads = [threading.Thread(target=create, args=(rname, idx)) for idx, rname in ((2, "reg2"), (3, "reg3"))]
+    for thread in threads:
+        thread.start()
+    for thread in [leader] + threads:
+        thread.join()
+
+    assert isinstance(results["reg"], HTTPError)
+    _, ixn, _, op = results["reg2"]
+    assert results["reg3"][1].said == ixn.said
+    assert sorted(seal["i"] for seal in ixn.ked["a"]) == sorted(results[rname][0].pre for rname in ("reg2", "reg3"))
+    assert op["done"] is True
+    assert anchorer.events == 1
+    assert ids.get("aid1")["state"]["d"] == ixn.said
+
+
+def test_async_anchorer():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    hab = client.identifiers().get("aid1")
+    client.registries().create(hab, "reg")
+    registry = client.registries().get("aid1", "reg")
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=BRAN, adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            hab = await aclient.identifiers().get("aid1")
+            anchorer = aclient.anchorer(hab, window=0.05, size=3)
+            credentials = aclient.credentials()
+            creds = await asyncio.gather(*[credentials.create(hab, registry, data=dict(LEI=str(idx)),
+                                                              schema=SCHEMA, recipient=hab["prefix"],
+                                                              anchorer=anchorer) for idx in range(5)])
+            return anchorer, creds
+
+    anchorer, creds = asyncio.run(run())
+    assert anchorer.events == 2
+    assert sorted(len(anc.ked["a"]) for _, _, anc, _, _ in creds) == [2, 2, 3, 3, 3]
+    assert client.identifiers().get("aid1")["state"]["s"] == "3"
+
+
+def test_async_anchorer_cancelled_leader():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    hab = client.identifiers().get("aid1")
+    client.registries().create(hab, "reg")
+    registry = client.registries().get("aid1", "reg")
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=BRAN, adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            hab = await aclient.identifiers().get("aid1")
+            anchorer = aclient.anchorer(hab, window=0.05, size=10)
+            credentials = aclient.credentials()
+            tasks = [asyncio.ensure_future(credentials.create(hab, registry, data=dict(LEI=str(idx)), schema=SCHEMA,
+                                                              anchorer=anchorer)) for idx in range(3)]
+            await asyncio.sleep(0.01)
+            tasks[0].cancel()  # the caller that opened the batch goes away during the window
+
+            creds = await asyncio.wait_for(asyncio.gather(*tasks[1:]), timeout=5)
+            assert tasks[0].cancelled()
+            return anchorer, creds
+
+    anchorer, creds = asyncio.run(run())
+    assert anchorer.events == 1
+    assert [len(anc.ked["a"]) for _, _, anc, _, _ in creds] == [3, 3]
+    assert client.identifiers().get("aid1")["state"]["s"] == "2"
+
+
+def test_async_anchorer_leader_failure():
+    from requests import HTTPError
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    hab = client.identifiers().get("aid1")
+    client.registries().create(hab, "reg")
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=BRAN, adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            hab = await aclient.identifiers().get("aid1")
+            anchorer = aclient.anchorer(hab, window=0.05, size=3)
+            client.identifiers().interact("aid1", data=[dict(a=1)])  # leaves the anchorer state stale
+
+            # the duplicate registry leads the batch so its submission is the one sent alone with the event
+            registries = aclient.registries()
+            results = await asyncio.gather(*[registries.create(hab, rname, nonce=f"0AAAAAAAAAAAAAAAAAAAAAA{idx}",
+                                                               anchorer=anchorer)
+                                             for idx, rname in enumerate(("reg", "reg1", "reg2"))],
+                                           return_exceptions=True)
+            return anchorer, results
+
+    anchorer, results = asyncio.run(run())
+    assert anchorer.events == 1
+    assert isinstance(results[0], HTTPError) and "already in use" in str(results[0])
+    assert results[1][1].said == results[2][1].said
+    assert results[1][1].sn == 3
+    assert client.identifiers().get("aid1")["state"]["d"] == results[1][1].said
@@ -20,6 +20,7 @@ def test_signify_client_defaults():
     from keri.core.coring import Tiers
     assert client.tier == Tiers.low
     assert client.extern_modules is None
+    assert client.signer_cache is None
 
     from signify.core.authing import Controller
     assert isinstance(client.ctrl, Controller)
@@ -42,6 +43,7 @@ def test_signify_client_bad_passcode_length():
 
 def test_signify_client_connect_no_delegation():
     from signify.core import authing
+    from signify.core.authing import Controller
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
     expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
@@ -52,6 +54,8 @@ def test_signify_client_connect_no_delegation():
     import requests
     mock_session = mock(spec=requests.Session, strict=True)
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=1).mount('http://', ANY)
+    expect(mock_session, times=1).mount('https://', ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -65,20 +69,21 @@ def test_signify_client_connect_no_delegation():
     mock_serder = mock({'sn': 1}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=Controller, strict=True)
+    client.ctrl = mock_controller
+    expect(mock_controller, times=1).restate(mock_state.controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, cache=None).thenReturn(mock_manager)
 
     from signify.core import authing
     mock_authenticator = mock({'verify': lambda: {'hook1': 'hook1 info', 'hook2': 'hook2 info'}}, spec=authing.Authenticater, strict=True)
     expect(authing, times=1).Authenticater(agent=mock_agent, ctrl=ANY).thenReturn(mock_authenticator)
 
-    from signify.app import clienting
-    mock_signify_auth = mock(spec=clienting.SignifyAuth, strict=True)
-    expect(clienting, times=1).SignifyAuth(mock_authenticator).thenReturn(mock_signify_auth)
+    from signify.core import adapting
+    mock_signify_auth = mock(spec=adapting.SignifyAuth, strict=True)
+    expect(adapting, times=1).SignifyAuth(mock_authenticator).thenReturn(mock_signify_auth)
 
     client.connect('http://example.com')
 
@@ -92,6 +97,7 @@ def test_signify_client_connect_no_delegation():
 def test_signify_client_connect_delegation():
     # setup for client init
     from signify.core import authing
+    from signify.core.authing import Controller
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
     expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
@@ -103,6 +109,8 @@ def test_signify_client_connect_delegation():
     import requests
     mock_session = mock(spec=requests.Session, strict=True)
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=1).mount('http://', ANY)
+    expect(mock_session, times=1).mount('https://', ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -116,13 +124,13 @@ def test_signify_client_connect_delegation():
     mock_serder = mock({'sn': 0}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    # when(authing.Controller).thenReturn(mock_controller)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=Controller, strict=True)
+    client.ctrl = mock_controller
+    expect(mock_controller, times=1).restate(mock_state.controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, cache=None).thenReturn(mock_manager)
 
     expect(client, times=1).approveDelegation()
 
@@ -130,9 +138,9 @@ def test_signify_client_connect_delegation():
     mock_authenticator = mock({'verify': lambda: {'hook1': 'hook1 info', 'hook2': 'hook2 info'}}, spec=authing.Authenticater, strict=True)
     expect(authing, times=1).Authenticater(agent=mock_agent, ctrl=ANY).thenReturn(mock_authenticator)
 
-    from signify.app import clienting
-    mock_signify_auth = mock(spec=clienting.SignifyAuth, strict=True)
-    expect(clienting, times=1).SignifyAuth(mock_authenticator).thenReturn(mock_signify_auth)
+    from signify.core import adapting
+    mock_signify_auth = mock(spec=adapting.SignifyAuth, strict=True)
+    expect(adapting, times=1).SignifyAuth(mock_authenticator).thenReturn(mock_signify_auth)
 
     client.connect('http://example.com')
 
@@ -149,6 +157,7 @@ def test_signify_client_connect_bad_scheme():
 
 def test_signify_client_connect_bad_delegation():
     from signify.core import authing
+    from signify.core.authing import Controller
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
     expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
@@ -159,6 +168,8 @@ def test_signify_client_connect_bad_delegation():
     import requests
     mock_session = mock(spec=requests.Session, strict=True)
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=1).mount('http://', ANY)
+    expect(mock_session, times=1).mount('https://', ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -172,12 +183,13 @@ def test_signify_client_connect_bad_delegation():
     mock_serder = mock({'sn': 1}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a different prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock({'pre': 'a different prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=Controller, strict=True)
+    client.ctrl = mock_controller
+    expect(mock_controller, times=1).restate(mock_state.controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, cache=None).thenReturn(mock_manager)
 
     from keri.kering import ConfigurationError
     with pytest.raises(ConfigurationError, match='commitment to controller AID missing in agent inception event'):
@@ -391,6 +403,30 @@ def test_signify_client_get():
     verifyNoUnwantedInteractions()
     unstub()
 
+def test_signify_client_get_stream():
+    from signify.core import authing
+    from keri.core.coring import Tiers
+    mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+
+    from signify.app.clienting import SignifyClient
+    client = SignifyClient(passcode='abcdefghijklmnop01234', timeouts=dict(get=(1.0, 2.0)))
+    client.base = 'http://example.com'
+
+    import requests
+    mock_session = mock(spec=requests.Session, strict=True)
+    client.session = mock_session # type: ignore
+
+    mock_response = mock({'ok': True}, spec=requests.Response, strict=True)
+    expect(mock_session).get('http://example.com/my_path', headers={'a': 'header'}, stream=True,
+                             timeout=(1.0, 2.0)).thenReturn(mock_response)
+
+    out = client.get('my_path', headers={'a': 'header'}, stream=True)
+    assert out == mock_response
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
 def test_signify_client_get_not_ok():
     from signify.core import authing
     from keri.core.coring import Tiers
@@ -764,3 +800,205 @@ def test_signify_auth():
 
     unstub()
     verifyNoUnwantedInteractions()
+
+def test_async_signify_client_requests():
+    import asyncio
+    import httpx
+    import requests
+    from signify.core import authing
+    from keri.core.coring import Tiers
+    mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+
+    from signify.app.clienting import AsyncSignifyClient
+    client = AsyncSignifyClient(passcode='abcdefghijklmnop01234', url='http://example.com')
+    assert client.url == 'http://example.com'
+    assert client.session is None
+    client.base = 'http://example.com'
+
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, request.url.query, request.content))
+        if request.url.path == '/bad':
+            return httpx.Response(400, json={'title': 'bad request'})
+        return httpx.Response(200, json={'a': 'response'})
+
+    async def run():
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        res = await client.get('my_path', params={'a': 'param'}, headers={'a': 'header'})
+        assert res.json() == {'a': 'response'}
+        await client.post('my_path', json={'a': 'body'})
+        await client.put('my_path', json={'a': 'body'})
+        await client.delete('my_path')
+
+        with pytest.raises(requests.HTTPError, match="400 Client Error: bad request for url: http://example.com/bad"):
+            await client.get('bad')
+
+        await client.close()
+        assert client.session is None
+
+    asyncio.run(run())
+
+    assert seen == [
+        ('GET', '/my_path', b'a=param', b''),
+        ('POST', '/my_path', b'', b'{"a":"body"}'),
+        ('PUT', '/my_path', b'', b'{"a":"body"}'),
+        ('DELETE', '/my_path', b'', b''),
+        ('GET', '/bad', b'', b''),
+    ]
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+def test_async_signify_client_stream():
+    import asyncio
+    import httpx
+    from signify.core import authing
+    from keri.core.coring import Tiers
+    mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+
+    from signify.app.clienting import AsyncSignifyClient
+    client = AsyncSignifyClient(passcode='abcdefghijklmnop01234')
+    client.base = 'http://example.com'
+
+    body = b": keep alive\n\nid: 1\nevent: note\ndata: first\ndata: line\n\nretry: 10\n\ndata: second\n\n"
+
+    def handler(request):
+        assert request.headers['accept'] == 'text/event-stream'
+        return httpx.Response(200, content=body)
+
+    async def run():
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return [event async for event in client.stream('my_path')]
+
+    events = asyncio.run(run())
+    assert [(e.id, e.event, e.data) for e in events] == [('1', 'note', 'first\nline'), (None, 'message', 'second')]
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+def test_async_signify_client_connect_bad_scheme():
+    import asyncio
+    from keri import kering
+    from signify.app.clienting import AsyncSignifyClient
+    client = AsyncSignifyClient(passcode='abcdefghijklmnop01234', url='ftp://example.com')
+
+    with pytest.raises(kering.ConfigurationError, match='invalid scheme foo for SignifyClient'):
+        asyncio.run(client.connect('foo://example.com'))
+
+def test_async_signify_client_domains():
+    from signify.app.clienting import AsyncSignifyClient
+    client = AsyncSignifyClient(passcode='abcdefghijklmnop01234')
+
+    from signify.app.aiding import AsyncIdentifiers
+    from signify.app.coring import AsyncOperations, AsyncOobis, AsyncKeyStates, AsyncKeyEvents
+    from signify.app.credentialing import AsyncCredentials, AsyncRegistries, AsyncIpex
+    from signify.app.notifying import AsyncNotifications
+    from signify.peer.exchanging import AsyncExchanges
+    assert type(client.identifiers()) is AsyncIdentifiers
+    assert type(client.operations()) is AsyncOperations
+    assert type(client.oobis()) is AsyncOobis
+    assert type(client.keyStates()) is AsyncKeyStates
+    assert type(client.keyEvents()) is AsyncKeyEvents
+    assert type(client.credentials()) is AsyncCredentials
+    assert type(client.registries()) is AsyncRegistries
+    assert type(client.ipex()) is AsyncIpex
+    assert type(client.notifications()) is AsyncNotifications
+    assert type(client.exchanges()) is AsyncExchanges
+    assert client.identifiers().client == client
+
+def test_async_signify_auth():
+    import httpx
+    from signify.core import authing
+    mock_controller = mock({'pre': 'a prefix'}, spec=authing.Controller, strict=True)
+    mock_authenticator = mock({'ctrl': mock_controller}, spec=authing.Authenticater, strict=True)
+
+    from signify.app.clienting import AsyncSignifyAuth
+    signify_auth = AsyncSignifyAuth(mock_authenticator)
+
+    request = httpx.Request('POST', 'http://example.com/my_path', json={'a': 'body'})
+
+    from keri.help import helping
+    expect(helping).nowIso8601().thenReturn('now ISO8601!')
+    expect(mock_authenticator, times=1).sign(request.headers, 'POST', '/my_path').thenReturn(request.headers)
+
+    out = signify_auth(request)
+    assert out is request
+    assert out.headers['Signify-Resource'] == 'a prefix'
+    assert out.headers['Signify-Timestamp'] == 'now ISO8601!'
+    assert out.headers['Content-Length'] == '12'
+
+    unstub()
+    verifyNoUnwantedInteractions()
+
+def test_signify_client_http_options():
+    from signify.app.clienting import SignifyClient
+    client = SignifyClient(passcode='abcdefghijklmnop01234', pool_maxsize=32, timeouts=dict(get=5.0))
+
+    assert client.pool_connections == 10
+    assert client.pool_maxsize == 32
+    assert client.keep_alive is True
+    assert client.timeouts['get'] == 5.0
+    assert client.timeouts['post'] == SignifyClient.Timeouts['post']
+    assert client.timeouts['stream'][1] is None
+    assert client.retries is SignifyClient.Retries
+
+    client.configure(keep_alive=False, timeouts=dict(post=(1.0, 2.0)), retries=5)
+    assert client.keep_alive is False
+    assert client.timeouts['get'] == 5.0
+    assert client.timeouts['post'] == (1.0, 2.0)
+    assert client.retries == 5
+    assert client.pool_maxsize == 32
+
+def test_signify_client_connect_http_options():
+    from signify.app.clienting import SignifyClient, SignifyAdapter
+    client = SignifyClient(passcode='abcdefghijklmnop01234')
+
+    class Stop(Exception):
+        pass
+
+    def states():
+        raise Stop()
+
+    client.states = states
+    with pytest.raises(Stop):
+        client.connect('http://example.com', pool_maxsize=4, keep_alive=False, retries=2)
+
+    adapter = client.session.get_adapter('http://example.com')
+    assert isinstance(adapter, SignifyAdapter)
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert client.session.get_adapter('https://example.com') is adapter
+    assert client.session.headers['Connection'] == 'close'
+
+def test_signify_adapter_timeouts(monkeypatch):
+    import requests
+    from requests.adapters import HTTPAdapter
+    from signify.app.clienting import SignifyAdapter
+
+    sent = []
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda self, request, stream=False, timeout=None, **kwargs:
+                        sent.append((request.method, stream, timeout)))
+
+    adapter = SignifyAdapter(timeouts=dict(get=(1, 2), post=(3, 4), stream=(5, None)))
+    adapter.send(requests.Request('GET', 'http://example.com').prepare())
+    adapter.send(requests.Request('POST', 'http://example.com').prepare())
+    adapter.send(requests.Request('GET', 'http://example.com').prepare(), stream=True)
+    adapter.send(requests.Request('POST', 'http://example.com').prepare(), timeout=9)
+    adapter.send(requests.Request('PATCH', 'http://example.com').prepare())
+
+    assert sent == [('GET', False, (1, 2)), ('POST', False, (3, 4)), ('GET', True, (5, None)),
+                    ('POST', False, 9), ('PATCH', False, None)]
+
+def test_async_signify_client_timeout():
+    from signify.app.clienting import AsyncSignifyClient
+    client = AsyncSignifyClient(passcode='abcdefghijklmnop01234', timeouts=dict(delete=7.0))
+
+    timeout = client.timeout('get')
+    assert timeout.connect == 3.05
+    assert timeout.read == 30.0
+    assert client.timeout('stream').read is None
+    assert client.timeout('delete').read == 7.0
@@ -131,3 +131,295 @@ def test_key_events():
 
     verifyNoUnwantedInteractions()
     unstub()
+
+def test_operations_wait():
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client) # type: ignore
+
+    done = {'name': 'op1', 'done': True}
+    assert ops.wait(done) is done
+
+    expect(ops, times=2).get('op1').thenReturn({'name': 'op1', 'done': False}).thenReturn({'name': 'op1', 'done': True, 'response': 'yay'})
+
+    import time
+    delays = []
+    expect(time, times=2).sleep(...).thenAnswer(lambda d: delays.append(d))
+
+    op = ops.wait({'name': 'op1', 'done': False}, interval=0.1, maxInterval=0.15)
+    assert op == {'name': 'op1', 'done': True, 'response': 'yay'}
+    assert 0.05 <= delays[0] <= 0.1
+    assert 0.075 <= delays[1] <= 0.15
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+def test_operations_wait_timeout():
+    import pytest
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client) # type: ignore
+
+    expect(ops).get('op1').thenReturn({'name': 'op1', 'done': False})
+
+    with pytest.raises(TimeoutError, match='operation op1 not done before deadline'):
+        ops.wait({'name': 'op1', 'done': False}, timeout=0.05, interval=0.01)
+
+    unstub()
+
+def test_operations_wait_all():
+    import time
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client) # type: ignore
+
+    polls = dict(op1=0, op2=0)
+
+    def get(name):
+        polls[name] += 1
+        return {'name': name, 'done': name == 'op1' or polls[name] > 3}
+
+    ops.get = get
+
+    start = time.monotonic()
+    out = ops.wait_all([{'name': 'op0', 'done': True}, {'name': 'op1', 'done': False}, {'name': 'op2', 'done': False}],
+                       interval=0.01)
+    assert time.monotonic() - start < 1.0
+
+    assert [op['name'] for op in out] == ['op0', 'op1', 'op2']
+    assert all(op['done'] for op in out)
+    assert polls == dict(op1=1, op2=4)
+
+def test_async_operations_wait_all():
+    import asyncio
+    from signify.app.clienting import AsyncSignifyClient
+    client = mock(spec=AsyncSignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.AsyncOperations(client=client) # type: ignore
+
+    polls = dict(op1=0, op2=0)
+
+    async def get(name):
+        polls[name] += 1
+        return {'name': name, 'done': polls[name] > 1}
+
+    ops.get = get
+
+    out = asyncio.run(ops.wait_all([{'name': 'op1', 'done': False}, {'name': 'op2', 'done': False}], interval=0.01))
+
+    assert [op['name'] for op in out] == ['op1', 'op2']
+    assert polls == dict(op1=2, op2=2)
+
+def test_key_state_cache():
+    import pytest
+    from signify.app.coring import KeyStateCache
+
+    with pytest.raises(ValueError):
+        KeyStateCache(size=0)
+
+    cache = KeyStateCache(size=2)
+    cache.put(dict(i="pre1", s="2"))
+    assert cache.get("pre1")["s"] == "2"
+    assert cache.get("pre1", sn=2)["s"] == "2"
+    assert cache.get("pre1", sn=3) is None
+
+    # states never roll back and invalidation only drops states before sn
+    cache.put(dict(i="pre1", s="1"))
+    assert cache.get("pre1")["s"] == "2"
+    cache.invalidate("pre1", sn=2)
+    assert cache.get("pre1")["s"] == "2"
+    cache.invalidate("pre1", sn=3)
+    assert cache.get("pre1") is None
+
+    cache.put(dict(i="pre1", s="0"))
+    cache.put(dict(i="pre2", s="0"))
+    cache.get("pre1")
+    cache.put(dict(i="pre3", s="0"))
+    assert cache.get("pre2") is None
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+    cache.invalidate("pre1")
+    assert cache.get("pre1") is None
+
+    cache = KeyStateCache(ttl=0.0)
+    cache.put(dict(i="pre1", s="0"))
+    assert cache.get("pre1") is None
+    cache.put(dict(i="pre1", s="0"))
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_key_states_list_chunks():
+    import asyncio
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+    from signify.app.coring import KeyStateCache
+    from signify.core.tracing import Tracer
+
+    bran = "0123456789abcdefghijk"
+    agency = Agency()
+    tracer = Tracer()
+    client = SignifyClient(passcode=bran, adapter=agency.adapter(), tracer=tracer, state_cache=KeyStateCache())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+
+    ids = client.identifiers()
+    pres = [ids.create(f"aid{i}")[0].pre for i in range(3)]
+    unknown = "E" + "A" * 43
+
+    def requests():
+        histogram = tracer.histogram("GET", "/states")
+        return histogram.count if histogram is not None else 0
+
+    ks = client.keyStates()
+    ks.MaxQuery = 100  # two prefixes per request
+    states = ks.list([pres[0], pres[1], unknown, pres[2], pres[0]])
+    assert [state["i"] for state in states] == pres
+    assert requests() == 2
+
+    # known states are cached and only the unknown prefix is asked for again
+    assert [state["i"] for state in client.keyStates().list(pres + [unknown])] == pres
+    assert requests() == 3
+    assert client.keyStates().get(pres[0])[0]["s"] == "0"
+    assert requests() == 3
+
+    # queries drop stale states and cache the state they complete with
+    ids.interact("aid0", data=[dict(a=1)])
+    op = client.keyStates().query(pres[0], sn=1)
+    assert op["done"] is True
+    assert client.keyStates().get(pres[0])[0]["s"] == "1"
+    assert requests() == 3
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=bran, adapter=agency.transport(), tracer=tracer)
+        async with aclient.connected("http://agent"):
+            aks = aclient.keyStates()
+            aks.MaxQuery = 100
+            return await aks.list(pres + [unknown])
+
+    assert [state["i"] for state in asyncio.run(run())] == pres
+    assert requests() == 5
+
+def test_key_events_since():
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ke = coring.KeyEvents(client=client) # type: ignore
+
+    import requests
+    mock_response = mock(spec=requests.Response, strict=True)
+    expect(client, times=1).get('/events?pre=my_prefix').thenReturn(mock_response)
+    expect(mock_response, times=1).json().thenReturn([{'s': '1'}, {'s': '2'}, {'ked': {'s': 'a'}}])
+
+    # the agent returns the whole log, trimmed locally
+    assert ke.get("my_prefix", sn=2) == [{'s': '2'}, {'ked': {'s': 'a'}}]
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+def test_key_events_sync():
+    import asyncio
+    import pytest
+    from keri import kering
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+    from signify.core.storing import KelStore
+    from signify.core.tracing import Tracer
+
+    bran = "0123456789abcdefghijk"
+    agency = Agency()
+    tracer = Tracer()
+    store = KelStore(name="test", temp=True)
+    try:
+        client = SignifyClient(passcode=bran, adapter=agency.adapter(), tracer=tracer, kel_store=store)
+        agency.boot(client.ctrl)
+        client.connect("http://agent")
+
+        ids = client.identifiers()
+        pre = ids.create("aid1")[0].pre
+        ids.interact("aid1", data=[dict(a=1)])
+
+        def fetched():
+            return [span.path for span in spans if span.route == "/events"]
+
+        spans = []
+        tracer.callbacks.append(spans.append)
+
+        kes = client.keyEvents()
+        assert [event["s"] for event in kes.sync(pre)] == ["0", "1"]
+        assert fetched() == [f"/events?pre={pre}"]
+
+        # up to date logs only cost a states request, otherwise the full log is fetched and only new events kept
+        assert kes.sync(pre) == []
+        ids.interact("aid1", data=[dict(a=2)])
+        ids.rotate("aid1")
+        assert [event["t"] for event in kes.sync(pre)] == ["ixn", "rot"]
+        assert fetched() == [f"/events?pre={pre}", f"/events?pre={pre}"]
+        assert [event["s"] for event in kes.local(pre)] == ["0", "1", "2", "3"]
+
+        # logs that no longer follow the stored one are replaced from the same fetch
+        store.put(pre, [dict(store.last(pre), d="Eforked")])
+        assert len(kes.sync(pre)) == 4
+        assert len(fetched()) == 3
+        assert kes.local(pre, sn=3)[0]["d"] == ids.get("aid1")["state"]["d"]
+
+        with pytest.raises(kering.ConfigurationError):
+            SignifyClient(passcode=bran).keyEvents().local(pre)
+
+        async def run():
+            aclient = AsyncSignifyClient(passcode=bran, adapter=agency.transport(), kel_store=store)
+            async with aclient.connected("http://agent"):
+                ids.interact("aid1", data=[dict(a=3)])
+                return await aclient.keyEvents().sync(pre)
+
+        assert [event["s"] for event in asyncio.run(run())] == ["4"]
+    finally:
+        store.close(clear=True)
+
+
+def test_key_events_sync_with_state_cache():
+    import asyncio
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+    from signify.app.coring import KeyStateCache
+    from signify.core.storing import KelStore
+
+    bran = "0123456789abcdefghijk"
+    agency = Agency()
+    store = KelStore(name="test", temp=True)
+    cache = KeyStateCache(ttl=3600.0)
+    try:
+        client = SignifyClient(passcode=bran, adapter=agency.adapter(), kel_store=store, state_cache=cache)
+        agency.boot(client.ctrl)
+        client.connect("http://agent")
+
+        ids = client.identifiers()
+        pre = ids.create("aid1")[0].pre
+        kes = client.keyEvents()
+        assert [event["s"] for event in kes.sync(pre)] == ["0"]
+        assert client.keyStates().get(pre)[0]["s"] == "0"  # served from the cache from here on
+
+        # an event within the cache ttl is still synced, and refreshes the cached state
+        ids.interact("aid1", data=[dict(a=1)])
+        assert [event["s"] for event in kes.sync(pre)] == ["1"]
+        assert cache.get(pre)["s"] == "1"
+
+        async def run():
+            aclient = AsyncSignifyClient(passcode=bran, adapter=agency.transport(), kel_store=store,
+                                         state_cache=cache)
+            async with aclient.connected("http://agent"):
+                ids.interact("aid1", data=[dict(a=2)])
+                return await aclient.keyEvents().sync(pre)
+
+        assert [event["s"] for event in asyncio.run(run())] == ["2"]
+    finally:
+        store.close(clear=True)
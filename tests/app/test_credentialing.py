@@ -5,6 +5,7 @@ signify.app.test_credentialing module
 
 Testing credentialing with unit tests
 """
+import pytest
 from keri.core import eventing, coring
 from keri.peer import exchanging
 from keri.vdr import eventing as veventing
@@ -76,7 +77,7 @@ def test_credentials_list():
     mock_response = mock({'json': lambda: {}}, spec=Response, strict=True)
     expect(mock_client, times=1).post('/credentials/query',
                                       json={'filter': {'genre': 'horror'},
-                                            'sort': ['updside down'], 'skip': 10, 'limt': 10}).thenReturn(mock_response)
+                                            'sort': ['updside down'], 'skip': 10, 'limit': 10}).thenReturn(mock_response)
 
     from signify.app.credentialing import Credentials
     Credentials(client=mock_client).list(filtr={'genre': 'horror'}, sort=['updside down'], skip=10,
@@ -88,6 +89,72 @@ def test_credentials_list():
     unstub()
 
 
+def test_credentials_iter_query():
+    from signify.app.clienting import SignifyClient
+    mock_client = mock(spec=SignifyClient, strict=True)
+
+    from requests import Response
+    creds = [dict(sad=dict(d=f"E{i}", a=dict(i="Eholder", LEI=str(i))), status=dict(s="0")) for i in range(5)]
+    for skip, page in ((0, creds[:2]), (2, creds[2:4]), (4, creds[4:])):
+        mock_response = mock({'json': lambda page=page: page}, spec=Response, strict=True)
+        expect(mock_client, times=1).post('/credentials/query',
+                                          json={'filter': {'-s': 'Eschema'}, 'sort': ['-a-LEI'], 'skip': skip,
+                                                'limit': 2}).thenReturn(mock_response)
+
+    from signify.app.credentialing import Credentials
+    creds = Credentials(client=mock_client).iter_query(filtr={'-s': 'Eschema'}, sort=['-a-LEI'], page_size=2,
+                                                        fields=['-d', '-a-LEI', '-e-x'])
+    assert list(creds) == [{'-d': f'E{i}', '-a-LEI': str(i), '-e-x': None} for i in range(5)]
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_credentials_iter_query_full_pages():
+    from signify.app.clienting import SignifyClient
+    mock_client = mock(spec=SignifyClient, strict=True)
+
+    from requests import Response
+    for skip, page in ((0, [dict(sad=dict(d="E0")), dict(sad=dict(d="E1"))]), (2, [])):
+        mock_response = mock({'json': lambda page=page: page}, spec=Response, strict=True)
+        expect(mock_client, times=1).post('/credentials/query',
+                                          json={'filter': {}, 'sort': [], 'skip': skip,
+                                                'limit': 2}).thenReturn(mock_response)
+
+    from signify.app.credentialing import Credentials
+    creds = Credentials(client=mock_client).iter_query(page_size=2, prefetch=False)
+    assert [cred["sad"]["d"] for cred in creds] == ["E0", "E1"]
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_async_credentials_iter_query():
+    import asyncio
+    from signify.app.credentialing import AsyncCredentials
+
+    creds = [dict(sad=dict(d=f"E{i}")) for i in range(3)]
+    queries = []
+
+    class Response:
+        def __init__(self, page):
+            self.page = page
+
+        def json(self):
+            return self.page
+
+    class Client:
+        async def post(self, path, json):
+            queries.append((path, json["skip"], json["limit"]))
+            return Response(creds[json["skip"]:json["skip"] + json["limit"]])
+
+    async def run():
+        return [cred async for cred in AsyncCredentials(client=Client()).iter_query(page_size=2, fields=["-d"])]
+
+    assert asyncio.run(run()) == [{"-d": "E0"}, {"-d": "E1"}, {"-d": "E2"}]
+    assert queries == [("/credentials/query", 0, 2), ("/credentials/query", 2, 2)]
+
+
 def test_credentials_export():
     from signify.app.clienting import SignifyClient
     mock_client = mock(spec=SignifyClient, strict=True)
@@ -281,3 +348,335 @@ def test_submit_grant():
     assert rep == dict(b='c')
 
     unstub()
+
+
+def test_credentials_export_many(tmp_path):
+    import io
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+
+    agency = Agency()
+    client = SignifyClient(passcode="0123456789abcdefghijk", adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    client.identifiers().create("aid1")
+    hab = client.identifiers().get("aid1")
+    client.registries().create(hab, "reg")
+    registry = client.registries().get("aid1", "reg")
+
+    credentials = client.credentials()
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    creders = []
+    for i in range(4):
+        hab = client.identifiers().get("aid1")  # each issuance anchors with an interaction event
+        creders.append(credentials.create(hab, registry, data=dict(LEI=str(i)), schema=schema,
+                                          recipient=hab["prefix"])[0])
+    saids = [creder.said for creder in creders]
+    raws = {creder.said: credentials.export(creder.said) for creder in creders}
+
+    out = io.BytesIO()
+    stats = credentials.export_many(saids + ["Emissing"], out, workers=3, chunk_size=64)
+    assert stats["count"] == 4
+    assert stats["bytes"] == sum(len(raw) for raw in raws.values()) == len(out.getvalue())
+    assert list(stats["failed"]) == ["Emissing"]
+    assert stats["bytes_per_second"] > 0 and stats["credentials_per_second"] > 0
+
+    # each credential stream is written whole
+    data = out.getvalue()
+    assert all(data.count(raw) == 1 for raw in raws.values())
+
+    path = tmp_path / "creds.cesr"
+    stats = credentials.export_many(iter(saids), str(path), workers=2)
+    assert stats["count"] == 4
+    assert path.stat().st_size == stats["bytes"]
+
+    import asyncio
+    from signify.app.clienting import AsyncSignifyClient
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode="0123456789abcdefghijk", adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            aout = io.BytesIO()
+            return aout, await aclient.credentials().export_many(saids + ["Emissing"], aout, workers=3,
+                                                                 chunk_size=64)
+
+    aout, stats = asyncio.run(run())
+    assert stats["count"] == 4
+    assert list(stats["failed"]) == ["Emissing"]
+    assert sorted(aout.getvalue()) == sorted(data)
+
+
+def test_credentials_export_truncates_partial_stream():
+    import io
+    import pytest
+    from signify.app.credentialing import Credentials
+
+    def chunks():
+        yield b"abc"
+        raise OSError("connection reset")
+
+    out = io.BytesIO(b"kept")
+    out.seek(0, io.SEEK_END)
+    with pytest.raises(OSError):
+        Credentials.drain(chunks(), out)
+    assert out.getvalue() == b"kept"
+
+
+def test_credentials_create_many():
+    import asyncio
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+
+    agency = Agency()
+    client = SignifyClient(passcode="0123456789abcdefghijk", adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    ids = client.identifiers()
+    ids.create("aid1")
+    hab = ids.get("aid1")
+    client.registries().create(hab, "reg")
+    registry = client.registries().get("aid1", "reg")
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+    items = (dict(data=dict(LEI=str(i)), recipient=hab["prefix"]) for i in range(20))
+    issuages = list(client.credentials().create_many(hab, registry, items, schema=schema, workers=8, batch=5))
+
+    assert sorted(issuage.index for issuage in issuages) == list(range(20))
+    assert all(issuage.error is None for issuage in issuages)
+    ancs = {issuage.result[2].said: issuage.result[2] for issuage in issuages}
+    assert all(len(anc.ked["a"]) <= 5 for anc in ancs.values())
+    assert len(ancs) < 20
+    assert ids.get("aid1")["state"]["s"] == f"{1 + len(ancs):x}"
+    assert client.anchorer(hab).events == len(ancs)  # anchored by the shared queue of the AID
+    assert len(client.credentials().list(limit=50)) == 20
+
+    # failures are reported per credential
+    dt = "2026-01-01T00:00:00.000000+00:00"
+    items = [dict(data=dict(LEI="x"), timestamp=dt), dict(data=dict(LEI="x"), timestamp=dt)]
+    issuages = list(client.credentials().create_many(hab, registry, items, schema=schema))
+    assert sorted(issuage.error is None for issuage in issuages) == [False, True]
+    assert [issuage.result for issuage in issuages if issuage.error is not None] == [None]
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode="0123456789abcdefghijk", adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            items = (dict(data=dict(LEI=f"a{i}")) for i in range(7))
+            return [issuage async for issuage in aclient.credentials().create_many(hab, registry, items,
+                                                                                  schema=schema, workers=4)]
+
+    issuages = asyncio.run(run())
+    assert sorted(issuage.index for issuage in issuages) == list(range(7))
+    assert all(issuage.error is None for issuage in issuages)
+    assert len({issuage.result[2].said for issuage in issuages}) < 7
+
+
+def test_credentials_revoke():
+    import asyncio
+    from keri import kering
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+
+    agency = Agency()
+    client = SignifyClient(passcode="0123456789abcdefghijk", adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    ids = client.identifiers()
+    ids.create("aid1")
+    hab = ids.get("aid1")
+    client.registries().create(hab, "reg")
+    registry = client.registries().get("aid1", "reg")
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    creds = client.credentials()
+    client.anchorer(hab, window=0.05, size=4)  # the queue of the AID shared by create_many and revoke_many
+
+    items = (dict(data=dict(LEI=str(i))) for i in range(12))
+    saids = [issuage.result[0].said for issuage in creds.create_many(hab, registry, items, schema=schema)]
+
+    hab = ids.get("aid1")
+    status = creds.get(saids[0])["status"]
+    rserder, anc, sigs, op = creds.revoke(hab, saids[0])
+    assert rserder.ked["t"] == "rev"
+    assert rserder.ked["p"] == status["d"]
+    assert anc.ked["a"] == [dict(i=saids[0], s="1", d=rserder.said)]
+    assert op["name"] == f"credential.{saids[0]}.1"
+    assert creds.get(saids[0])["status"]["et"] == "rev"
+    assert ids.get("aid1")["state"]["s"] == anc.ked["s"]
+
+    with pytest.raises(kering.ValidationError, match="is not issued"):
+        creds.revoke(ids.get("aid1"), saids[0])
+
+    # the shared anchorer of the AID issued the credentials, the revocation above left its state stale
+    events = client.anchorer(hab).events
+    revokages = list(creds.revoke_many(hab, saids[1:8] + [saids[0]], workers=8))
+    assert sorted(revokage.said for revokage in revokages) == sorted(saids[:8])
+    assert [revokage.said for revokage in revokages if revokage.error is not None] == [saids[0]]
+    ancs = {revokage.result[1].said: revokage.result[1] for revokage in revokages if revokage.error is None}
+    assert all(len(anc.ked["a"]) <= 4 for anc in ancs.values())
+    assert len(ancs) < 7
+    assert client.anchorer(hab).events == events + len(ancs)
+    assert all(creds.get(said)["status"]["et"] == "rev" for said in saids[:8])
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode="0123456789abcdefghijk", adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            acreds = aclient.credentials()
+            hab = await aclient.identifiers().get("aid1")
+            rserder, _, _, _ = await acreds.revoke(hab, saids[8])
+            return rserder, [revokage async for revokage in acreds.revoke_many(hab, saids[9:], workers=4)]
+
+    rserder, revokages = asyncio.run(run())
+    assert rserder.ked["i"] == saids[8]
+    assert sorted(revokage.said for revokage in revokages) == sorted(saids[9:])
+    assert all(revokage.error is None for revokage in revokages)
+    assert all(creds.get(said)["status"]["et"] == "rev" for said in saids)
+
+
+def test_credentials_make_revocation():
+    from keri import kering
+    from signify.app.credentialing import Credentials
+
+    regk = "EHyKQS68x_oWy8_vNmYubA5Y0Tse4XMPFggMfoPoERaM"
+    said = "EElymNmgs1u0mSaoCeOtSsNOROLuqOz103V3-4E-ClXH"
+    iss = "EIpgyKVF0z0Pcn2_HgbWhEKmJhOXFeD4SA62SrxYXOLt"
+    cred = dict(sad=dict(d=said), status=dict(ri=regk, s="0", d=iss, et="bis"))
+    registry = dict(regk=regk, state=dict(s="2", d="EDzYvnYkVsX32DDb4mdOEFMhHvNL94OK10AK-nhA7_2i"))
+
+    with pytest.raises(kering.ConfigurationError, match="with backers is required"):
+        Credentials.makeRevocation(cred)
+
+    brv = Credentials.makeRevocation(cred, registry=registry, timestamp="2026-01-01T00:00:00.000000+00:00")
+    assert brv.ked["t"] == "brv"
+    assert brv.ked["p"] == iss
+    assert brv.ked["ra"] == dict(i=regk, s="2", d=registry["state"]["d"])
+    assert brv.ked["dt"] == "2026-01-01T00:00:00.000000+00:00"
+
+    cred["status"].update(et="iss")
+    rev = Credentials.makeRevocation(cred)
+    assert rev.ked["t"] == "rev"
+    assert rev.ked["ri"] == regk
+
+
+def test_credentials_make_issuance_no_backers():
+    from keri.core import coring
+    from keri.vdr import eventing
+    from keri.vdr.eventing import TraitDex
+    from signify.app.credentialing import Credentials
+
+    issuer = "EHpD0-CDWOdu5RJ8jHBSUkOqBZ3cXeDVHWNb_Ul89VI7"
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    dt = "2026-01-01T00:00:00.000000+00:00"
+
+    # registries incepted by current keri carry NRB, older ones NB, both issue without backers
+    for trait in (TraitDex.NoRegistrarBackers, "NB"):
+        vcp = eventing.incept(issuer, baks=[], toad=0, nonce="", cnfg=[trait], code=coring.MtrDex.Blake3_256)
+        registry = dict(regk=vcp.pre, pre=issuer, state=dict(c=[trait], s="0", d=vcp.said))
+        creder, iserder = Credentials.makeIssuance(registry, dict(LEI="5493001KJTIIGC8Y1R17"), schema,
+                                                   timestamp=dt)
+        assert iserder.ked["t"] == "iss"
+        assert iserder.ked["ri"] == vcp.pre
+        assert iserder.ked["i"] == creder.said
+
+
+def test_registry_tracker():
+    import asyncio
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient, SignifyClient
+    from signify.app.credentialing import AsyncRegistryTracker, RegistryTracker
+
+    agency = Agency()
+    client = SignifyClient(passcode="0123456789abcdefghijk", adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    ids = client.identifiers()
+    ids.create("aid1")
+    hab = ids.get("aid1")
+    client.registries().create(hab, "reg", noBackers=False)
+    registry = client.registries().get("aid1", "reg")
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    creds = client.credentials()
+
+    tracker = RegistryTracker(client, hab, registry)
+    assert tracker.backers is True
+    items = (dict(data=dict(LEI=str(i))) for i in range(10))
+    issuages = list(creds.create_many(hab, tracker, items, schema=schema, workers=4))
+    assert all(issuage.error is None for issuage in issuages)
+    assert {issuage.result[1].ked["t"] for issuage in issuages} == {"bis"}
+    assert {issuage.result[1].ked["ra"]["d"] for issuage in issuages} == {registry["state"]["d"]}
+    assert tracker.events == 10
+    assert tracker.reads == 1  # only once all issuances completed
+
+    # backers rotated elsewhere, events built from the old state are rejected and built again once
+    reg = agency.agents[client.controller].registries[("aid1", "reg")]
+    reg["state"] = dict(reg["state"], s="1", d="EDzYvnYkVsX32DDb4mdOEFMhHvNL94OK10AK-nhA7_2i", et="vrt")
+    items = (dict(data=dict(LEI=f"r{i}")) for i in range(6))
+    issuages = list(creds.create_many(hab, registry, items, schema=schema, workers=3))
+    assert all(issuage.error is None for issuage in issuages)
+    assert {issuage.result[1].ked["ra"]["s"] for issuage in issuages} == {"1"}
+
+    saids = [issuage.result[0].said for issuage in issuages]
+    revokages = list(creds.revoke_many(hab, saids[:3], registries=[tracker]))
+    assert all(revokage.error is None for revokage in revokages)
+    assert {revokage.result[0].ked["ra"]["s"] for revokage in revokages} == {"1"}
+    assert tracker.reads == 2
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode="0123456789abcdefghijk", adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            atracker = AsyncRegistryTracker(aclient, hab, registry)
+            revokages = [revokage async for revokage in aclient.credentials().revoke_many(hab, saids[3:],
+                                                                                          registries=[atracker])]
+            return atracker, revokages
+
+    atracker, revokages = asyncio.run(run())
+    assert all(revokage.error is None for revokage in revokages)
+    assert atracker.reads == 1
+    assert atracker.registry["state"]["s"] == "1"
+
+
+def test_credentials_pipeline_bound():
+    import asyncio
+    import threading
+    from signify.app.credentialing import AsyncCredentials, Credentials
+
+    lock = threading.Lock()
+    flight = dict(now=0, most=0, done=0)
+    read = []
+
+    def args():
+        for idx in range(20):
+            read.append(idx)
+            yield idx,
+
+    def enter():
+        with lock:
+            flight["now"] += 1
+            flight["most"] = max(flight["most"], flight["now"])
+            assert len(read) - flight["done"] <= 3  # items read but not done
+
+    def leave():
+        with lock:
+            flight["now"] -= 1
+            flight["done"] += 1
+
+    def work(idx):
+        enter()
+        threading.Event().wait(0.01)
+        leave()
+        return idx
+
+    assert sorted(Credentials.pipeline(work, args(), workers=3)) == list(range(20))
+    assert flight["most"] <= 3
+
+    async def awork(idx):
+        enter()
+        await asyncio.sleep(0.01)
+        leave()
+        return idx
+
+    async def run():
+        return [idx async for idx in AsyncCredentials.pipeline(awork, args(), workers=3)]
+
+    read.clear()
+    flight.update(now=0, most=0, done=0)
+    assert sorted(asyncio.run(run())) == list(range(20))
+    assert flight["most"] == 3
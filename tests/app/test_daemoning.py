@@ -0,0 +1,129 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.test_daemoning module
+
+Testing the sigpy daemon against the in-process agent stand-in
+"""
+import os
+import threading
+
+import pytest
+
+BRAN = "0123456789abcdefghijk"
+
+
+@pytest.fixture()
+def daemon(tmp_path):
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+    from signify.app.daemoning import Daemon
+
+    agency = Agency()
+    connects = []
+
+    def factory(url, passcode, tier):
+        client = SignifyClient(passcode=passcode, tier=tier, adapter=agency.adapter())
+        if client.controller not in agency.agents:
+            agency.boot(client.ctrl)
+        client.connect(url)
+        connects.append(client.controller)
+        return client
+
+    server = Daemon(path=str(tmp_path / "run" / "sigpy.sock"), factory=factory)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, connects
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_daemon_calls(daemon):
+    from keri import kering
+    from requests import HTTPError
+    from signify.app.daemoning import DaemonClient
+
+    server, connects = daemon
+    assert os.stat(server.path).st_mode & 0o077 == 0
+    assert os.stat(os.path.dirname(server.path)).st_mode & 0o077 == 0
+
+    client = DaemonClient(path=server.path, url="http://agent", passcode=BRAN)
+    ids = client.identifiers()
+    serder, sigs, op = ids.create("aid1")
+    assert serder["t"] == "icp"
+    assert len(sigs) == 1
+    assert op["done"] is True
+
+    serder, _, _ = ids.interact("aid1", data=[dict(a=1)])
+    assert serder["s"] == "1"
+    assert ids.get("aid1")["state"]["s"] == "1"
+    assert [aid["name"] for aid in ids.list_all()] == ["aid1"]
+    client.close()
+
+    # later processes reuse the connected client by passcode or controller AID
+    again = DaemonClient(path=server.path, url="http://agent", passcode=BRAN.encode("utf-8"))
+    assert again.controller == client.controller
+    assert DaemonClient(path=server.path, caid=client.controller).identifiers().get("aid1")["name"] == "aid1"
+    assert connects == [client.controller]
+
+    with pytest.raises(HTTPError, match="404"):
+        again.identifiers().get("missing")
+    with pytest.raises(kering.KeriError, match="invalid client domain"):
+        again.call("passcodes", "rotate", "x" * 21)
+    with pytest.raises(kering.KeriError, match="invalid identifiers method"):
+        again.call("identifiers", "__init__")
+    with pytest.raises(kering.KeriError, match="no client for controller"):
+        DaemonClient(path=server.path, caid="Eunknown").identifiers().list()
+
+    assert again.send(dict(op="list"))["clients"] == [dict(caid=client.controller, url="http://agent")]
+    again.send(dict(op="remove", caid=client.controller))
+    assert again.send(dict(op="list"))["clients"] == []
+
+
+def test_daemon_connect(daemon, monkeypatch):
+    from signify.app import daemoning
+    from signify.app.clienting import SignifyClient
+
+    server, connects = daemon
+
+    # scripts and commands run through the daemon whenever SIGPY_SOCK is set
+    monkeypatch.setenv(daemoning.SockEnv, server.path)
+    client = daemoning.connect(url="http://agent", passcode=BRAN)
+    assert isinstance(client, daemoning.DaemonClient)
+    assert client.identifiers().list()["aids"] == []
+    assert connects == [client.controller]
+    client.close()
+
+    monkeypatch.delenv(daemoning.SockEnv)
+    assert isinstance(daemoning.connect(url=None, passcode=BRAN), SignifyClient)
+
+
+def test_daemon_socket(daemon):
+    from keri import kering
+    from signify.app import daemoning
+
+    server, _ = daemon
+    with pytest.raises(kering.ConfigurationError, match="already listening"):
+        daemoning.Daemon(path=server.path)
+
+    assert daemoning.sockpath("/x.sock") == "/x.sock"
+    assert daemoning.unpack(daemoning.pack([b"\x00", dict(a=(1, 2))])) == [b"\x00", dict(a=[1, 2])]
+
+
+def test_daemon_stop(tmp_path):
+    from signify.app.daemoning import Daemon, DaemonClient
+
+    path = str(tmp_path / "sigpy.sock")
+    open(path, "w").close()  # stale socket file of a dead daemon
+
+    server = Daemon(path=path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = DaemonClient(path=path, caid="E")
+    client.send(dict(op="stop"))
+    thread.join(timeout=5)
+    server.server_close()
+    assert not thread.is_alive()
+    assert not os.path.exists(path)
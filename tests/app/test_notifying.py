@@ -79,3 +79,22 @@ def test_noticiation_delete():
 
     verifyNoUnwantedInteractions()
     unstub()
+
+
+def test_notification_iter():
+    from signify.app.clienting import SignifyClient
+    mock_client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app.notifying import Notifications
+    notes = Notifications(client=mock_client) # type: ignore
+
+    from requests import Response
+    page1 = mock({'headers': {'content-range': 'notes 0-1/3'}, 'json': lambda: ['note1', 'note2']}, spec=Response)
+    page2 = mock({'headers': {'content-range': 'notes 2-2/3'}, 'json': lambda: ['note3']}, spec=Response)
+    expect(mock_client, times=1).get('/notifications', headers=dict(Range="notes=0-1")).thenReturn(page1)
+    expect(mock_client, times=1).get('/notifications', headers=dict(Range="notes=2-3")).thenReturn(page2)
+
+    assert notes.list_all(size=2) == ['note1', 'note2', 'note3']
+
+    verifyNoUnwantedInteractions()
+    unstub()
@@ -0,0 +1,179 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.test_passcoding module
+
+Testing paged passcode rotation against the in-process agent stand-in
+"""
+import asyncio
+
+import pytest
+from requests import HTTPError
+
+OLD = "0123456789abcdefghijk"
+NEW = "abcdefghijk0123456789"
+
+
+def connect(agency, bran=OLD, boot=True):
+    from signify.app.clienting import SignifyClient
+
+    client = SignifyClient(passcode=bran, adapter=agency.adapter())
+    if boot:
+        agency.boot(client.ctrl)
+    client.connect("http://agent")
+    return client
+
+
+def incept(client, count):
+    from keri.app.keeping import Algos
+
+    ids = client.identifiers()
+    for i in range(count):
+        ids.create(f"aid{i}", algo=Algos.randy if i % 3 == 0 else Algos.salty)
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_passcodes_rotate(workers):
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    incept(client, 3)
+
+    stats = client.passcodes().rotate(NEW, size=2, workers=workers)
+    assert stats == dict(recrypted=3, skipped=0, pages=2)
+    assert agency.agents[client.controller].salt is None
+    assert agency.agents[client.controller].cstate["et"] == "rot"
+
+    # signing continues with the recrypted key material
+    ids = client.identifiers()
+    for i in range(3):
+        ids.interact(f"aid{i}")
+
+
+def test_passcodes_rotate_single_request():
+    from signify.app.agenting import Agency
+    from signify.core.tracing import Tracer
+
+    agency = Agency()
+    client = connect(agency)
+    client.tracer = tracer = Tracer()
+    incept(client, 5)
+
+    spans = []
+    tracer.callbacks.append(spans.append)
+    client.passcodes().rotate(NEW, size=2, workers=0)
+
+    # every recrypted key is sent with the controller rotation, the agent deletes the old salt
+    puts = [span.path for span in spans if span.method == "PUT"]
+    assert puts == [f"/salt/{client.controller}", f"/agent/{client.controller}"]
+    agent = agency.agents[client.controller]
+    assert agent.salt is None
+
+    # the agent rejects rotations without key material
+    data, _, _, _ = client.ctrl.rotation(OLD)
+    with pytest.raises(HTTPError, match="requires keys"):
+        client.put(f"/agent/{client.controller}", json=data)
+
+
+def test_passcodes_resume():
+    from signify.app.agenting import Agency
+
+    agency = Agency()
+    client = connect(agency)
+    incept(client, 5)
+    sxlt = client.ctrl.sxlt(client.ctrl.encrypter(NEW))
+    client.passcodes().rotate(NEW, size=2, workers=0)
+
+    # the rotation reached the agent but the saved salt was left behind
+    agent = agency.agents[client.controller]
+    agent.salt = sxlt
+
+    # a new client still derives the controller AID from the old passcode
+    client = connect(agency, boot=False)
+    stats = client.passcodes().resume(NEW, size=2, workers=0)
+    assert stats == dict(recrypted=0, skipped=5, pages=3)
+    assert agent.salt is None
+    assert client.passcodes().resume(NEW) is None
+
+    ids = client.identifiers()
+    for i in range(5):
+        ids.interact(f"aid{i}")
+
+
+def test_passcodes_resume_before_rotation(monkeypatch):
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    incept(client, 2)
+
+    # old salt saved but the controller rotation never reached the agent
+    put = SignifyClient.put
+
+    def fail(self, path, json, **kwa):
+        if path.startswith("/agent/"):
+            raise ConnectionError("agent went away")
+        return put(self, path, json, **kwa)
+
+    monkeypatch.setattr(SignifyClient, "put", fail)
+    with pytest.raises(ConnectionError):
+        client.passcodes().rotate(NEW, workers=0)
+    monkeypatch.setattr(SignifyClient, "put", put)
+    assert agency.agents[client.controller].salt is not None
+
+    # resuming starts the rotation again
+    client = connect(agency, boot=False)
+    assert client.passcodes().resume(NEW, workers=0) == dict(recrypted=2, skipped=0, pages=1)
+    assert agency.agents[client.controller].cstate["et"] == "rot"
+    client.identifiers().interact("aid1")
+
+
+def test_passcodes_rotate_rejected(monkeypatch):
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    incept(client, 2)
+    ctrl = client.ctrl
+    serder, bran, salter, signer = ctrl.serder, ctrl.bran, ctrl.salter, ctrl.signer
+
+    put = SignifyClient.put
+
+    def fail(self, path, json, **kwa):
+        if path.startswith("/agent/"):
+            raise HTTPError("500 Server Error: rotation failed")
+        return put(self, path, json, **kwa)
+
+    monkeypatch.setattr(SignifyClient, "put", fail)
+    with pytest.raises(HTTPError, match="rotation failed"):
+        client.passcodes().rotate(NEW, workers=0)
+    monkeypatch.setattr(SignifyClient, "put", put)
+
+    # the controller keeps the old passcode until the agent accepts the rotation, so requests are still signed
+    # with keys the agent knows and the same client resumes the rotation
+    assert (ctrl.serder, ctrl.bran, ctrl.salter, ctrl.signer) == (serder, bran, salter, signer)
+    client.identifiers().interact("aid1")
+    assert client.passcodes().resume(NEW, workers=0) == dict(recrypted=2, skipped=0, pages=1)
+    assert ctrl.serder.ked["t"] == "rot"
+    client.identifiers().interact("aid1")
+
+
+def test_passcodes_async():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+
+    agency = Agency()
+    client = connect(agency)
+    incept(client, 3)
+
+    async def run():
+        aclient = AsyncSignifyClient(passcode=OLD, adapter=agency.transport())
+        async with aclient.connected("http://agent"):
+            stats = await aclient.passcodes().rotate(NEW, size=2, workers=0)
+            await aclient.identifiers().interact("aid1")
+            return stats
+
+    assert asyncio.run(run()) == dict(recrypted=3, skipped=0, pages=2)
@@ -161,6 +161,40 @@ def test_controller_derive():
                           b'A3jjXxqYawLcV"],"bt":"0","br":[],"ba":[],"a":[]}')
 
 
+def test_controller_restate():
+    from signify.core.authing import Controller
+    ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)
+    signer = ctrl.signer
+    nsigner = ctrl.nsigner
+    icp = ctrl.serder
+
+    from keri.core import coring
+    e1 = dict(v=versify(kind=Kinds.json, size=0),
+              t="ixn",
+              d="",
+              i="EMPYj-h2OoCyPGQoUUd1tLUYe62YD_8A3jjXxqYawLcV",
+              s="1",
+              p="EMPYj-h2OoCyPGQoUUd1tLUYe62YD_8A3jjXxqYawLcV",
+              a=[]
+              )
+    _, e1 = coring.Saider.saidify(sad=e1)
+
+    from keri.app import keeping
+    expect(keeping, times=0).SaltyCreator(...)
+
+    ctrl.restate(state={"ee": e1})
+    assert ctrl.serder.said == e1['d']
+    assert ctrl.serder.sn == 1
+    assert ctrl.signer is signer
+    assert ctrl.nsigner is nsigner
+
+    ctrl.restate(state={"ee": {"s": "0"}})
+    assert ctrl.serder.raw == icp.raw
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
 def test_approve_delegation():
     from signify.core.authing import Controller
     ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)
@@ -307,4 +341,75 @@ def test_controller_rotate_salty():
     # from signify.core import keeping
     # expect(keeping, times=1).SaltyCreator(salt='salter qb64', stem='signify:controller', tier=Tiers.low).thenReturn(mock_ncreator)
 
-    # ctrl.rotate(nbran="0123456789abcdefghijk", aids=["aid_one"],) 
\ No newline at end of file
+    # ctrl.rotate(nbran="0123456789abcdefghijk", aids=["aid_one"],) 
+
+@pytest.mark.parametrize("headers", [
+    {'Content-Length': '14', 'Signify-Resource': 'EAbc', 'Signify-Timestamp': '2022-09-24T00:05:48.196795+00:00'},
+    {'Signify-Resource': 'EAbc', 'Signify-Timestamp': '2022-09-24T00:05:48.196795+00:00'},
+    {},
+])
+def test_authenticater_sign_default_fields(mockHelpingNowUTC, headers):
+    from requests.structures import CaseInsensitiveDict
+    from keri.end import ending
+    from signify.core.authing import Authenticater, Controller
+
+    ctrl = Controller(bran="0123456789abcdefghijk", tier=Tiers.low)
+    authn = Authenticater(agent=mock(), ctrl=ctrl)
+
+    # Original structured field path through keri.end.ending
+    expected = CaseInsensitiveDict(headers)
+    header, qsig = ending.siginput("signify", "POST", "/identifiers/aid1", expected, fields=Authenticater.DefaultFields,
+                                   signers=[ctrl.signer], alg="ed25519", keyid=ctrl.pre)
+    expected.update(header)
+    signage = ending.Signage(markers=dict(signify=qsig), indexed=False, signer=None, ordinal=None, digest=None,
+                             kind=None)
+    expected.update(ending.signature([signage]))
+
+    out = authn.sign(CaseInsensitiveDict(headers), "POST", "/identifiers/aid1")
+    assert dict(out) == dict(expected)
+
+    # Signature verifies against the controller key when read back as the agent would
+    authn.agent = mock({'verfer': ctrl.signer.verfer})
+    assert authn.verifysig(out, "POST", "/identifiers/aid1") is True
+
+
+def test_authenticater_verifysig_counters(mockHelpingNowUTC):
+    from requests.structures import CaseInsensitiveDict
+    from signify.core.authing import Authenticater, Controller
+
+    ctrl = Controller(bran="0123456789abcdefghijk", tier=Tiers.low)
+    authn = Authenticater(agent=mock({'verfer': ctrl.signer.verfer}), ctrl=ctrl)
+    assert authn.stats() == dict(verifies=0, failures=0, seconds=0.0)
+
+    headers = authn.sign(CaseInsensitiveDict({'Content-Length': '2', 'Signify-Resource': ctrl.pre,
+                                              'Signify-Timestamp': '2022-09-24T00:05:48.196795+00:00'}),
+                         "GET", "/operations/op1")
+
+    assert authn.verifysig(headers, "GET", "/operations/op1") is True
+    assert authn.verifysig(CaseInsensitiveDict(), "GET", "/operations/op1") is False
+
+    with pytest.raises(kering.AuthNError, match="Signature for .* invalid"):
+        authn.verifysig(headers, "GET", "/operations/op2")
+
+    headers['Signify-Timestamp'] = '2022-09-24T00:05:49.196795+00:00'
+    with pytest.raises(kering.AuthNError):
+        authn.verifysig(headers, "GET", "/operations/op1")
+
+    stats = authn.stats()
+    assert stats['verifies'] == 4
+    assert stats['failures'] == 2
+    assert stats['seconds'] > 0.0
+
+
+@pytest.mark.parametrize("value", [
+    'signify=("@method" "@path" "signify-resource" "signify-timestamp");created=1609459200;keyid="EABC";alg="ed25519"',
+    'signify=();created=1',
+    'signify=("@method");created=1;nonce="a;b"',
+    'signify=("@method");created=1;keyid=token',
+    'other=("x");created=2;expires=5, signify=("@path");created=3;context="c"',
+])
+def test_authenticater_desiginput(value):
+    from keri.end import ending
+    from signify.core.authing import Authenticater
+
+    assert Authenticater.desiginput(value) == ending.desiginput(value.encode("utf-8"))
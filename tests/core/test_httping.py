@@ -8,3 +8,68 @@ def test_parseRangeHeader():
     assert out[0] == 0
     assert out[1] == 1
     assert out[2] == 2
+
+
+class FakeResponse:
+    def __init__(self, items, header):
+        self.items = items
+        self.headers = {'content-range': header}
+
+    def json(self):
+        return self.items
+
+
+def fakeList(total, typ="aids"):
+    calls = []
+
+    def fetch(headers):
+        calls.append(headers['Range'])
+        start, end = (int(v) for v in headers['Range'].split("=")[1].split("-"))
+        items = list(range(start, min(end + 1, total)))
+        return FakeResponse(items, f"{typ} {start}-{start + len(items) - 1}/{total}")
+
+    return fetch, calls
+
+
+def test_paginator():
+    fetch, calls = fakeList(7)
+    pages = httping.Paginator(fetch, "aids", size=3)
+
+    assert list(pages) == list(range(7))
+    assert calls == ["aids=0-2", "aids=3-5", "aids=6-8"]
+
+    fetch, calls = fakeList(6)
+    assert list(httping.Paginator(fetch, "aids", size=3, prefetch=False)) == list(range(6))
+    assert calls == ["aids=0-2", "aids=3-5"]
+
+
+def test_paginator_empty_and_close():
+    import pytest
+
+    fetch, calls = fakeList(0)
+    assert list(httping.Paginator(fetch, "aids", size=3)) == []
+    assert calls == ["aids=0-2"]
+
+    fetch, calls = fakeList(100)
+    it = iter(httping.Paginator(fetch, "aids", size=10, prefetch=False))
+    assert [next(it) for _ in range(12)] == list(range(12))
+    it.close()
+    assert calls == ["aids=0-9", "aids=10-19"]
+
+    with pytest.raises(ValueError, match="invalid page size=0"):
+        httping.Paginator(fetch, "aids", size=0)
+
+
+def test_async_paginator():
+    import asyncio
+
+    fetch, calls = fakeList(5, typ="notes")
+
+    async def afetch(headers):
+        return fetch(headers=headers)
+
+    async def run():
+        return [item async for item in httping.AsyncPaginator(afetch, "notes", size=2)]
+
+    assert asyncio.run(run()) == list(range(5))
+    assert calls == ["notes=0-1", "notes=2-3", "notes=4-5"]
@@ -30,10 +30,22 @@ def test_keeping_manager_new_salty():
     from signify.core.keeping import Manager
     manager = Manager(salter=mock_salter)
 
+    from keri.core.signing import Signer, Encrypter, Decrypter
+    from keri.core.coring import Verfer
+    mock_verfer = mock({'qb64': 'verfer qb64'}, spec=Verfer, strict=True)
+    mock_signer = mock({'verfer': mock_verfer, 'qb64': 'signer qb64'}, spec=Signer, strict=True)
+    expect(mock_salter, times=1).signer(transferable=False).thenReturn(mock_signer)
+
+    from keri.core import signing
+    mock_encrypter = mock(spec=Encrypter, strict=True)
+    expect(signing, times=1).Encrypter(verkey='verfer qb64').thenReturn(mock_encrypter)
+    mock_decrypter = mock(spec=Decrypter, strict=True)
+    expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
+
     from signify.core import keeping
     mock_keeper = mock(spec=keeping.SaltyKeeper, strict=True)
     from mockito import kwargs
-    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, pidx=0, **kwargs).thenReturn(mock_keeper)
+    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, pidx=0, aeid='verfer qb64', encrypter=mock_encrypter, decrypter=mock_decrypter, **kwargs).thenReturn(mock_keeper)
     actual = manager.new('salty', 0)
 
     assert actual is mock_keeper
@@ -48,10 +60,22 @@ def test_keeping_manager_new_randy():
     from signify.core.keeping import Manager
     manager = Manager(salter=mock_salter)
 
+    from keri.core.signing import Signer, Encrypter, Decrypter
+    from keri.core.coring import Verfer
+    mock_verfer = mock({'qb64': 'verfer qb64'}, spec=Verfer, strict=True)
+    mock_signer = mock({'verfer': mock_verfer, 'qb64': 'signer qb64'}, spec=Signer, strict=True)
+    expect(mock_salter, times=1).signer(transferable=False).thenReturn(mock_signer)
+
+    from keri.core import signing
+    mock_encrypter = mock(spec=Encrypter, strict=True)
+    expect(signing, times=1).Encrypter(verkey='verfer qb64').thenReturn(mock_encrypter)
+    mock_decrypter = mock(spec=Decrypter, strict=True)
+    expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
+
     from signify.core import keeping
     mock_keeper = mock(spec=keeping.RandyKeeper, strict=True)
     from mockito import kwargs
-    expect(keeping, times=1).RandyKeeper(salter=mock_salter, **kwargs).thenReturn(mock_keeper)
+    expect(keeping, times=1).RandyKeeper(salter=mock_salter, aeid='verfer qb64', encrypter=mock_encrypter, decrypter=mock_decrypter, **kwargs).thenReturn(mock_keeper)
     actual = manager.new('randy', 0)
 
     assert actual is mock_keeper
@@ -121,6 +145,18 @@ def test_keeping_manager_get_salty():
     from signify.core.keeping import Manager
     manager = Manager(salter=mock_salter)
 
+    from keri.core.signing import Signer, Encrypter, Decrypter
+    from keri.core.coring import Verfer
+    mock_verfer = mock({'qb64': 'verfer qb64'}, spec=Verfer, strict=True)
+    mock_signer = mock({'verfer': mock_verfer, 'qb64': 'signer qb64'}, spec=Signer, strict=True)
+    expect(mock_salter, times=1).signer(transferable=False).thenReturn(mock_signer)
+
+    from keri.core import signing
+    mock_encrypter = mock(spec=Encrypter, strict=True)
+    expect(signing, times=1).Encrypter(verkey='verfer qb64').thenReturn(mock_encrypter)
+    mock_decrypter = mock(spec=Decrypter, strict=True)
+    expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
+
     from keri.core.coring import Prefixer
     mock_prefixer = mock(spec=Prefixer, strict=True)
 
@@ -129,7 +165,7 @@ def test_keeping_manager_get_salty():
 
     from signify.core import keeping
     mock_keeper = mock(spec=keeping.SaltyKeeper, strict=True)
-    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, pidx=0, dcode='E').thenReturn(mock_keeper)
+    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, aeid='verfer qb64', encrypter=mock_encrypter, decrypter=mock_decrypter, pidx=0, dcode='E').thenReturn(mock_keeper)
 
     actual = manager.get({'prefix': 'aid1 prefix', 'salty': {'dcode': 'E', 'pidx': 0}})
 
@@ -165,6 +201,18 @@ def test_keeping_manager_get_randy():
     from signify.core.keeping import Manager
     manager = Manager(salter=mock_salter)
 
+    from keri.core.signing import Signer, Encrypter, Decrypter
+    from keri.core.coring import Verfer
+    mock_verfer = mock({'qb64': 'verfer qb64'}, spec=Verfer, strict=True)
+    mock_signer = mock({'verfer': mock_verfer, 'qb64': 'signer qb64'}, spec=Signer, strict=True)
+    expect(mock_salter, times=1).signer(transferable=False).thenReturn(mock_signer)
+
+    from keri.core import signing
+    mock_encrypter = mock(spec=Encrypter, strict=True)
+    expect(signing, times=1).Encrypter(verkey='verfer qb64').thenReturn(mock_encrypter)
+    mock_decrypter = mock(spec=Decrypter, strict=True)
+    expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
+
     from signify.core import keeping
     mock_keeper = mock(spec=keeping.RandyKeeper, strict=True)
 
@@ -174,7 +222,8 @@ def test_keeping_manager_get_randy():
     from keri.core import coring
     expect(coring, times=1).Prefixer(qb64='aid1 prefix').thenReturn(mock_prefixer)
 
-    expect(keeping, times=1).RandyKeeper(salter=mock_salter, transferable=True, dcode='E').thenReturn(mock_keeper)
+    expect(keeping, times=1).RandyKeeper(salter=mock_salter, aeid='verfer qb64', encrypter=mock_encrypter, decrypter=mock_decrypter,
+                                         transferable=True, dcode='E').thenReturn(mock_keeper)
     actual = manager.get({'prefix': 'aid1 prefix', 'randy': {'dcode': 'E'}})
 
     assert actual is mock_keeper
@@ -234,7 +283,10 @@ def test_salty_keeper():
 
     from keri.core.signing import Cipher
     mock_cipher = mock({'qb64': 'cipher qb64'}, spec=Cipher, strict=True)
-    expect(mock_encrypter, times=1).encrypt(ser='creator salt').thenReturn(mock_cipher)
+    from keri.core import coring
+    mock_salt = mock(spec=coring.Matter, strict=True)
+    expect(coring, times=1).Matter(qb64='creator salt').thenReturn(mock_salt)
+    expect(mock_encrypter, times=1).encrypt(prim=mock_salt).thenReturn(mock_cipher)
 
     # test
     from signify.core.keeping import SaltyKeeper
@@ -277,7 +329,10 @@ def test_salty_keeper_bran():
 
     from keri.core.signing import Cipher
     mock_cipher = mock({'qb64': 'cipher qb64'}, spec=Cipher, strict=True)
-    expect(mock_encrypter, times=1).encrypt(ser='creator salt').thenReturn(mock_cipher)
+    from keri.core import coring
+    mock_salt = mock(spec=coring.Matter, strict=True)
+    expect(coring, times=1).Matter(qb64='creator salt').thenReturn(mock_salt)
+    expect(mock_encrypter, times=1).encrypt(prim=mock_salt).thenReturn(mock_cipher)
 
     # test
     from signify.core.keeping import SaltyKeeper
@@ -361,7 +416,10 @@ def test_salty_keeper_incept():
 
     from keri.core.signing import Cipher
     mock_cipher = mock({'qb64': 'cipher qb64'}, spec=Cipher, strict=True)
-    expect(mock_encrypter, times=1).encrypt(ser='creator salt').thenReturn(mock_cipher)
+    from keri.core import coring
+    mock_salt = mock(spec=coring.Matter, strict=True)
+    expect(coring, times=1).Matter(qb64='creator salt').thenReturn(mock_salt)
+    expect(mock_encrypter, times=1).encrypt(prim=mock_salt).thenReturn(mock_cipher)
 
     # incept mocks
     mock_incept_verfer = mock({'qb64': 'incept verfer qb64'}, spec=Verfer, strict=True)
@@ -417,7 +475,10 @@ def test_salty_keeper_rotate():
 
     from keri.core.signing import Cipher
     mock_cipher = mock({'qb64': 'cipher qb64'}, spec=Cipher, strict=True)
-    expect(mock_encrypter, times=1).encrypt(ser='creator salt').thenReturn(mock_cipher)
+    from keri.core import coring
+    mock_salt = mock(spec=coring.Matter, strict=True)
+    expect(coring, times=1).Matter(qb64='creator salt').thenReturn(mock_salt)
+    expect(mock_encrypter, times=1).encrypt(prim=mock_salt).thenReturn(mock_cipher)
 
     # rotate mocks
     mock_rotate_verfer = mock({'qb64': 'rotate verfer qb64'}, spec=Verfer, strict=True)
@@ -475,7 +536,10 @@ def test_salty_keeper_sign():
 
     from keri.core.signing import Cipher
     mock_cipher = mock({'qb64': 'cipher qb64'}, spec=Cipher, strict=True)
-    expect(mock_encrypter, times=1).encrypt(ser='creator salt').thenReturn(mock_cipher)
+    from keri.core import coring
+    mock_salt = mock(spec=coring.Matter, strict=True)
+    expect(coring, times=1).Matter(qb64='creator salt').thenReturn(mock_salt)
+    expect(mock_encrypter, times=1).encrypt(prim=mock_salt).thenReturn(mock_cipher)
 
     # sign mock
     expect(mock_creator, times=1).create(codes=['A'], pidx=0, kidx=0, transferable=False).thenReturn([mock_signer])
@@ -701,14 +765,14 @@ def test_randy_keeper_sign():
     expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
 
     from keri.core.signing import Cipher
-    mock_prx_cipher = mock({'qb64b': b'cipher qb64b'}, spec=Cipher, strict=True)
+    mock_prx_cipher = mock(spec=Cipher, strict=True)
     expect(signing, times=1).Cipher(qb64='prx qb64').thenReturn(mock_prx_cipher)
 
     from keri.core.coring import Verfer
     from keri.core.signing import Signer
     mock_verfer = mock({'qb64': 'signer verfer qb64'}, spec=Verfer, strict=True)
     mock_signer = mock({'verfer': mock_verfer}, spec=Signer, strict=True)
-    expect(mock_decrypter, times=1).decrypt(ser=b'cipher qb64b', transferable=False).thenReturn(mock_signer)
+    expect(mock_decrypter, times=1).decrypt(cipher=mock_prx_cipher, transferable=False).thenReturn(mock_signer)
 
     # test
     from signify.core.keeping import RandyKeeper
@@ -869,4 +933,212 @@ def test_base_keeper_sign_indexed_boom(indexed, indices, ondices, expected):
     mock_signer_one = mock(spec=Signer, strict=True)
 
     with pytest.raises(ValueError, match=expected):
-        BaseKeeper.__sign__(b'ser bytes', [mock_signer_one], indexed=indexed, indices=indices, ondices=ondices)
\ No newline at end of file
+        BaseKeeper.__sign__(b'ser bytes', [mock_signer_one], indexed=indexed, indices=indices, ondices=ondices)
+
+def test_signer_cache():
+    from keri.core import signing
+    from signify.core.keeping import SignerCache
+
+    with pytest.raises(ValueError, match='invalid signer cache size=0'):
+        SignerCache(size=0)
+
+    cache = SignerCache(size=2, ttl=60.0)
+    assert cache.get(('pre', 0, 0, 'sxlt', True)) is None
+
+    signer1 = signing.Signer(transferable=True)
+    signer2 = signing.Signer(transferable=False)
+    signer3 = signing.Signer(transferable=True)
+    cache.put(('pre1', 0, 0, 'sxlt1', True), [signer1])
+    cache.put(('pre2', 1, 0, 'sxlt2', False), [signer2])
+
+    signers = cache.get(('pre1', 0, 0, 'sxlt1', True))
+    assert [signer.qb64 for signer in signers] == [signer1.qb64]
+    assert signers[0].verfer.qb64 == signer1.verfer.qb64
+    assert signers[0] is not signer1
+
+    signers = cache.get(('pre2', 1, 0, 'sxlt2', False))
+    assert signers[0].verfer.qb64 == signer2.verfer.qb64
+    assert not signers[0].verfer.transferable
+
+    # pre1 is least recently used so it is evicted and its seed wiped
+    seeds = cache._entries[('pre1', 0, 0, 'sxlt1', True)][1]
+    cache.put(('pre3', 2, 0, 'sxlt3', True), [signer3])
+    assert len(cache) == 2
+    assert seeds[0][1] == bytearray(32)
+    assert cache.get(('pre1', 0, 0, 'sxlt1', True)) is None
+
+    # signers handed out before eviction remain usable
+    cigar = signers[0].sign(b'abc')
+    assert signer2.verfer.verify(cigar.raw, b'abc')
+
+    assert cache.stats() == dict(size=2, hits=2, misses=2, evictions=1)
+
+    seeds = [entry[1] for entry in cache._entries.values()]
+    cache.clear()
+    assert len(cache) == 0
+    assert all(seed[0][1] == bytearray(32) for seed in seeds)
+
+
+def test_signer_cache_ttl():
+    from keri.core import signing
+    from signify.core.keeping import SignerCache
+    import time
+
+    cache = SignerCache(size=4, ttl=10.0)
+    now = time.monotonic()
+    expect(time, times=1).monotonic().thenReturn(now)
+    cache.put(('pre', 0, 0, 'sxlt', True), [signing.Signer()])
+    seeds = cache._entries[('pre', 0, 0, 'sxlt', True)][1]
+
+    expect(time, times=1).monotonic().thenReturn(now + 11.0)
+    assert cache.get(('pre', 0, 0, 'sxlt', True)) is None
+    assert len(cache) == 0
+    assert seeds[0][1] == bytearray(32)
+    assert cache.stats() == dict(size=0, hits=0, misses=1, evictions=1)
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_keeping_manager_get_salty_cache():
+    from keri.core.signing import Salter
+    mock_salter = mock(spec=Salter, strict=True)
+
+    from signify.core.keeping import Manager, SignerCache
+    cache = SignerCache()
+    manager = Manager(salter=mock_salter, cache=cache)
+
+    from keri.core.signing import Signer, Encrypter, Decrypter
+    from keri.core.coring import Verfer
+    mock_verfer = mock({'qb64': 'verfer qb64'}, spec=Verfer, strict=True)
+    mock_signer = mock({'verfer': mock_verfer, 'qb64': 'signer qb64'}, spec=Signer, strict=True)
+    expect(mock_salter, times=1).signer(transferable=False).thenReturn(mock_signer)
+
+    from keri.core import signing
+    mock_encrypter = mock(spec=Encrypter, strict=True)
+    expect(signing, times=1).Encrypter(verkey='verfer qb64').thenReturn(mock_encrypter)
+    mock_decrypter = mock(spec=Decrypter, strict=True)
+    expect(signing, times=1).Decrypter(seed='signer qb64').thenReturn(mock_decrypter)
+
+    assert manager.cache is cache
+
+    from keri.core.coring import Prefixer
+    mock_prefixer = mock(spec=Prefixer, strict=True)
+
+    from keri.core import coring
+    expect(coring, times=1).Prefixer(qb64='aid1 prefix').thenReturn(mock_prefixer)
+
+    from signify.core import keeping
+    mock_keeper = mock(spec=keeping.SaltyKeeper, strict=True)
+    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, aeid='verfer qb64', encrypter=mock_encrypter,
+                                         decrypter=mock_decrypter, cache=cache, pre='aid1 prefix', pidx=0,
+                                         dcode='E').thenReturn(mock_keeper)
+
+    actual = manager.get({'prefix': 'aid1 prefix', 'salty': {'dcode': 'E', 'pidx': 0}})
+
+    assert actual is mock_keeper
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_salty_keeper_sign_cache():
+    from keri.core.signing import Salter
+    from signify.core.keeping import SaltyKeeper, SignerCache
+
+    from keri.core import coring, signing
+    salter = Salter(raw=b'0123456789abcdef')
+    cache = SignerCache()
+    sk = SaltyKeeper(salter, pidx=0, cache=cache, pre='a prefix')
+    keys, _ = sk.incept(transferable=True)
+
+    # recreate the keeper from stored parameters like Manager.get
+    params = sk.params()
+    encrypter = signing.Encrypter(verkey=salter.signer(transferable=False).verfer.qb64)
+    params['sxlt'] = encrypter.encrypt(prim=coring.Matter(qb64=sk.creator.salt)).qb64
+    sk = SaltyKeeper(salter, cache=cache, pre='a prefix', **params)
+    sigs = sk.sign(b'abcdef')
+    assert cache.stats() == dict(size=1, hits=0, misses=1, evictions=0)
+
+    assert sk.sign(b'abcdef') == sigs
+    assert cache.stats() == dict(size=1, hits=1, misses=1, evictions=0)
+
+    from keri.core import indexing
+    siger = indexing.Siger(qb64=sigs[0])
+    assert coring.Verfer(qb64=keys[0]).verify(siger.raw, b'abcdef')
+
+    # without prefix the keeper does not use the cache
+    sk = SaltyKeeper(salter, cache=cache, **params)
+    assert sk.cache is None
+
+
+def test_keeping_manager_derives_passcode_once():
+    from keri.core.signing import Salter
+    from signify.core.keeping import Manager, SaltyKeeper
+
+    salter = Salter(raw=b'0123456789abcdef')
+    manager = Manager(salter=salter)
+    assert manager._aeid is None
+
+    signer = salter.signer(transferable=False)
+    assert manager.aeid == signer.verfer.qb64
+
+    from keri.core import signing
+    expect(signing, times=0).Encrypter(...)
+    expect(signing, times=0).Decrypter(...)
+    expect(salter, times=0).signer(...)
+
+    salty = manager.new('salty', 0)
+    randy = manager.new('randy', 0)
+    assert salty.aeid == randy.aeid == manager.aeid
+    assert salty.encrypter is randy.encrypter is manager.encrypter
+    assert salty.decrypter is randy.decrypter is manager.decrypter
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+    # shared material round trips AID salts
+    from keri.core import coring
+    keeper = SaltyKeeper(salter, pidx=0)
+    sxlt = manager.encrypter.encrypt(prim=coring.Matter(qb64=keeper.creator.salt)).qb64
+    keeper = manager.get({'prefix': 'BAzUCcD85Cs62fLeBEk6ewziVohx2kXnzuANqspIcwS2',
+                          'salty': dict(keeper.params(), sxlt=sxlt)})
+    assert keeper.decrypter is manager.decrypter
+
+
+def test_randy_keeper_sign_decrypts_keys():
+    from keri.core.signing import Salter
+    from signify.core.keeping import Manager
+
+    manager = Manager(salter=Salter(raw=b'0123456789abcdef'))
+    keeper = manager.new('randy', 0)
+    keys, _ = keeper.incept(transferable=True)
+
+    # agents return only the encrypted keys, the keeper decrypts them with the passcode to sign
+    params = keeper.params()
+    params.pop("transferable")
+    keeper = manager.get({'prefix': 'EAzUCcD85Cs62fLeBEk6ewziVohx2kXnzuANqspIcwS2', 'state': {'k': keys},
+                          'randy': params})
+    sigs = keeper.sign(b'my ser')
+
+    from keri.core import coring, indexing
+    siger = indexing.Siger(qb64=sigs[0])
+    assert coring.Verfer(qb64=keys[0]).verify(siger.raw, b'my ser')
+
+
+def test_salty_keeper_sign_after_reload():
+    from keri.core.signing import Salter
+    from signify.core.keeping import Manager
+
+    manager = Manager(salter=Salter(raw=b'0123456789abcdef'))
+    keeper = manager.new('salty', 0)
+    keys, _ = keeper.incept(transferable=True)
+
+    # agents return the AID salt encrypted by the keeper, it must decrypt back to the salt to sign
+    keeper = manager.get({'prefix': 'EAzUCcD85Cs62fLeBEk6ewziVohx2kXnzuANqspIcwS2', 'state': {'k': keys},
+                          'salty': keeper.params()})
+    sigs = keeper.sign(b'my ser')
+
+    from keri.core import coring, indexing
+    siger = indexing.Siger(qb64=sigs[0])
+    assert coring.Verfer(qb64=keys[0]).verify(siger.raw, b'my ser')
@@ -0,0 +1,128 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.test_parsing module
+
+Testing incremental parsing of CESR credential exports
+"""
+import io
+import mmap
+import socket
+import threading
+
+import pytest
+
+BRAN = "0123456789abcdefghijk"
+SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+
+
+@pytest.fixture(scope="module")
+def export():
+    """ Returns (creders, export bytes) of three credentials issued through the agent stand-in """
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+
+    agency = Agency()
+    client = SignifyClient(passcode=BRAN, adapter=agency.adapter())
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+    ids = client.identifiers()
+    ids.create("aid1")
+    client.registries().create(ids.get("aid1"), "reg")
+    registry = client.registries().get("aid1", "reg")
+
+    credentials = client.credentials()
+    creders = []
+    for i in range(3):
+        hab = ids.get("aid1")
+        creders.append(credentials.create(hab, registry, data=dict(LEI=str(i)), schema=SCHEMA,
+                                          recipient=hab["prefix"])[0])
+    return creders, b"".join(credentials.export(creder.said) for creder in creders)
+
+
+def check(creders, exportages):
+    assert [exportage.acdc.said for exportage in exportages] == [creder.said for creder in creders]
+    for creder, (acdc, tel, anchor, atc) in zip(creders, exportages):
+        assert acdc.raw == creder.raw
+        assert tel.ilk == "iss" and tel.pre == creder.said
+        assert anchor.ilk == "ixn"
+        assert anchor.ked["a"][0]["d"] == tel.said
+        assert atc.endswith(tel.said.encode("utf-8"))
+        assert b"-IAB" + tel.pre.encode("utf-8") in atc
+
+
+def test_parse_sources(export, tmp_path):
+    from signify.core import parsing
+
+    creders, raw = export
+    check(creders, list(parsing.credentials(raw)))
+    check(creders, list(parsing.credentials(io.BytesIO(raw), chunk_size=7)))
+    check(creders, list(parsing.credentials(raw[i:i + 5] for i in range(0, len(raw), 5))))
+
+    path = tmp_path / "creds.cesr"
+    path.write_bytes(raw)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as region:
+        check(creders, list(parsing.credentials(region)))
+
+    left, right = socket.socketpair()
+    writer = threading.Thread(target=lambda: (right.sendall(raw), right.close()))
+    writer.start()
+    try:
+        check(creders, list(parsing.credentials(left, chunk_size=100)))
+    finally:
+        writer.join()
+        left.close()
+
+
+def test_parse_messages(export):
+    from keri import kering
+    from signify.core import parsing
+
+    creders, raw = export
+    eventages = list(parsing.messages(raw))
+    assert [serder.ilk for serder, _, _ in eventages[:3]] == ["ixn", "iss", None]
+    assert eventages[0].attachments.startswith(b"-AAB")
+    assert [raw[offset:offset + 1] for _, _, offset in eventages] == [b"{"] * 9
+
+    couples, triples = parsing.seals(eventages[1].attachments)
+    assert couples == [(eventages[0].serder.sn, eventages[0].serder.said)]
+    assert triples == []
+
+    # pipelined groups and separating newlines
+    pipelined = raw.replace(b"-IAB", b"-VAd-IAB").replace(b'{"v"', b'\r\n{"v"')
+    check(creders, list(parsing.credentials(pipelined)))
+
+    # chunks are only read as messages are parsed
+    reads = []
+
+    def chunks(data):
+        for i in range(0, len(data), 256):
+            reads.append(i)
+            yield data[i:i + 256]
+
+    stream = parsing.messages(chunks(raw * 50))
+    assert next(stream).serder.ilk == "ixn"
+    assert len(reads) <= 3
+    assert sum(1 for _ in stream) == 449
+
+    with pytest.raises(kering.ShortageError):
+        list(parsing.messages(raw[:-len(creders[-1].raw) - 100]))
+    with pytest.raises(kering.ColdStartError):
+        list(parsing.messages(b"-AAB" + raw))
+
+    # credentials without their TEL and KEL events in the stream
+    acdc, tel, anchor, atc = next(parsing.credentials(creders[0].raw))
+    assert (acdc.said, tel, anchor, atc) == (creders[0].said, None, None, b"")
+
+
+def test_parse_window(export):
+    from signify.core import parsing
+
+    creders, raw = export
+    exportages = list(parsing.credentials(raw, window=1))
+    assert [tel.said for _, tel, _, _ in exportages] == [tel.said for _, tel, _, _ in parsing.credentials(raw)]
+
+    window = parsing.Window(2)
+    for key in "abc":
+        window[key] = key
+    assert list(window) == ["b", "c"]
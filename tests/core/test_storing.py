@@ -0,0 +1,35 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.test_storing module
+
+Testing the local key event store
+"""
+
+
+def test_kel_store():
+    from signify.core.storing import KelStore
+
+    store = KelStore(name="test", temp=True)
+    try:
+        pre = "EAbc"
+        assert store.last(pre) is None
+        assert store.events(pre) == []
+
+        store.put(pre, [dict(s="0", d="E0"), dict(s="1", d="E1", p="E0")])
+        store.put("EAbd", [dict(ked=dict(s="0", d="F0"), atc="-AAB")])
+        assert [event["d"] for event in store.events(pre)] == ["E0", "E1"]
+        assert store.last(pre)["d"] == "E1"
+        assert store.last("EAbd") == dict(ked=dict(s="0", d="F0"), atc="-AAB")
+
+        # later events at the same sequence number replace stored ones
+        store.put(pre, [dict(s="1", d="E1x", p="E0")])
+        assert [event["d"] for event in store.events(pre, sn=1)] == ["E1x"]
+
+        store.remove(pre, sn=1)
+        assert [event["d"] for event in store.events(pre)] == ["E0"]
+        store.remove(pre)
+        assert store.last(pre) is None
+        assert len(store.events("EAbd")) == 1
+    finally:
+        store.close(clear=True)
@@ -0,0 +1,149 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.test_tracing module
+
+Testing request phase timing and latency histograms
+"""
+import asyncio
+
+import pytest
+
+BRAN = "0123456789abcdefghijk"
+
+
+def test_router():
+    from signify.core.tracing import Router
+
+    router = Router()
+    assert router.route("/identifiers") == "/identifiers"
+    assert router.route("/identifiers/aid1") == "/identifiers/{name}"
+    assert router.route("/identifiers/aid1/events") == "/identifiers/{name}/events"
+    assert router.route("/identifiers/aid1/registries/reg") == "/identifiers/{name}/registries/{registry}"
+    assert router.route("/credentials/query") == "/credentials/query"
+    assert router.route("/credentials/EBfdlu8R27Fbx") == "/credentials/{said}"
+    assert router.route("/states?pre=EAbc&pre=EDef") == "/states"
+    assert router.route("/unknown/thing/deep") == "/unknown/*"
+    assert router.route("/unknown") == "/unknown"
+
+    router = Router(size=1)
+    router.route("/identifiers/a")
+    router.route("/identifiers/b")
+    assert list(router.cache) == ["/identifiers/b"]
+
+
+def test_histogram():
+    from signify.core.tracing import Histogram
+
+    with pytest.raises(ValueError):
+        Histogram(digits=0)
+
+    histogram = Histogram(digits=2)
+    assert histogram.quantile(0.5) is None
+
+    for us in range(1, 10001):
+        histogram.record(us / 1e6)
+
+    assert histogram.count == 10000
+    assert histogram.min == 1 and histogram.max == 10000
+    assert histogram.sum == pytest.approx(50.005)
+    assert histogram.quantile(0.5) == pytest.approx(0.005, rel=0.01)
+    assert histogram.quantile(0.99) == pytest.approx(0.0099, rel=0.01)
+    assert histogram.quantile(1.0) == 0.01
+
+    # every bucket holds the values that index into it
+    for value in (0, 1, 255, 256, 257, 1000, 123456789):
+        low, high = histogram.bounds(histogram.index(value))
+        assert low <= value <= high
+        assert high - low <= max(value // 100, 1)
+
+    assert histogram.cumulative((0.001, 0.005, 1.0)) == pytest.approx([1000, 5000, 10000], rel=0.01)
+
+    other = Histogram(digits=2)
+    other.record(2.0)
+    histogram.merge(other)
+    assert histogram.count == 10001
+    assert histogram.max == 2000000
+    with pytest.raises(ValueError):
+        histogram.merge(Histogram(digits=3))
+
+
+def test_tracer_client():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import SignifyClient
+    from signify.core.tracing import Tracer
+
+    spans = []
+    tracer = Tracer(callbacks=[spans.append])
+    agency = Agency()
+    client = SignifyClient(passcode=BRAN, adapter=agency.adapter(), tracer=tracer)
+    agency.boot(client.ctrl)
+    client.connect("http://agent")
+
+    ids = client.identifiers()
+    ids.create("aid1")
+    ids.create("aid2")
+    ids.get("aid1")
+    ids.get("aid2")["prefix"]
+
+    histogram = tracer.histogram("GET", "/identifiers/{name}")
+    assert histogram.count == 2
+    for phase in ("serialize", "sign", "send", "verify", "receive", "decode"):
+        assert tracer.histogram("GET", "/identifiers/{name}", phase).count == 2
+    assert tracer.histogram("POST", "/identifiers").count == 2
+
+    span = spans[-1]
+    assert (span.method, span.path, span.route, span.status) == ("GET", "/identifiers/aid2", "/identifiers/{name}",
+                                                                 200)
+    assert span.duration == pytest.approx(sum(span.phases.values()))
+
+    text = tracer.prometheus()
+    labels = 'method="GET",route="/identifiers/{name}",phase="total"'
+    assert "# TYPE signify_request_duration_seconds histogram" in text
+    assert f'signify_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"signify_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'signify_request_latency_seconds{{{labels},quantile="0.99"}}' in text
+    assert 'signify_responses_total{method="GET",route="/identifiers/{name}",status="200"} 2' in text
+    assert text.endswith("\n")
+
+    # failed requests are recorded with their status and leave no span current
+    from requests import HTTPError
+    from signify.core import tracing
+    with pytest.raises(HTTPError):
+        ids.get("missing")
+    assert tracing.current() is None
+    assert spans[-1].status == 404
+
+    tracer.reset()
+    assert tracer.histogram("GET", "/identifiers/{name}") is None
+
+    # untraced clients install the plain verification hook
+    client = SignifyClient(passcode=BRAN, adapter=agency.adapter())
+    client.connect("http://agent")
+    assert client.session.hooks == dict(response=client.authn.verify)
+    assert client.trace("GET", "/identifiers") is tracing.Untraced
+
+
+def test_tracer_async_client():
+    from signify.app.agenting import Agency
+    from signify.app.clienting import AsyncSignifyClient
+    from signify.core.tracing import Tracer
+
+    tracer = Tracer()
+    agency = Agency()
+
+    async def run():
+        client = AsyncSignifyClient(passcode=BRAN, adapter=agency.transport(), tracer=tracer)
+        agency.boot(client.ctrl)
+        async with client.connected("http://agent"):
+            ids = client.identifiers()
+            await ids.create("aid1")
+            await asyncio.gather(*[ids.get("aid1") for _ in range(3)])
+
+    asyncio.run(run())
+
+    assert tracer.histogram("GET", "/identifiers/{name}").count == 3
+    for phase in ("serialize", "sign", "send", "verify", "receive", "decode"):
+        assert tracer.histogram("GET", "/identifiers/{name}", phase).count == 3
+    histograms, statuses = tracer.snapshot()
+    assert statuses[("GET", "/identifiers/{name}", 200)] == 3
@@ -0,0 +1,64 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.test_importing module
+
+Import regression tests run with -X importtime in a fresh interpreter.  They assert which modules an import loads
+rather than how long it takes, so they hold on slow CI machines and still fail when a heavy dependency creeps back.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def importtime(stmt):
+    """ Returns dict of module name to cumulative import time in milliseconds of running stmt """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt], env=env, capture_output=True, text=True,
+                         check=True)
+
+    times = dict()
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+@pytest.mark.parametrize("module, lazy", [
+    ("signify.app.clienting", ("asyncio", "sseclient", "falcon", "keri", "hio", "lmdb", "requests", "urllib3",
+                               "concurrent.futures")),
+    ("signify.app.aiding", ("asyncio", "falcon", "keri.end.ending")),
+    ("signify.app.cli.sigpy", ("signify.app.clienting", "keri.core", "keri.app.directing", "requests")),
+    ("signify.app.daemoning", ("keri", "requests")),
+])
+def test_import_lazy(module, lazy):
+    times = importtime(f"import {module}")
+
+    assert module in times
+    assert [name for name in lazy if name in times] == []
+
+
+def test_import_clienting_modules():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    stmt = ("import sys, signify.app.clienting; "
+            "print(sorted(name for name in ('requests', 'keri.app.keeping', 'keri.core') if name in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", stmt], env=env, capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+    stmt = "import sys; from signify.app.clienting import SignifyAdapter; print('requests' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", stmt], env=env, capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "True"
+
+
+def test_import_signify():
+    times = importtime("import signify")
+
+    assert [name for name in times if name.startswith("keri") or name == "requests"] == []